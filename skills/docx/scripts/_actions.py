@@ -5,12 +5,14 @@ skills/docx/scripts/, NOT under office/) so the cross-skill replication
 boundary in CLAUDE.md §2 is preserved.
 
 This module owns F2 (part walker), F4 (replace), F5 (insert-after), F6
-(delete-paragraph). docx_replace.py owns F1 (pre-flight), F7 (CLI
+(delete-paragraph), F9 (--batch: many replace / delete-paragraph
+actions over one parse). docx_replace.py owns F1 (pre-flight), F7 (CLI
 orchestration), F8 (post-validate).
 """
 from __future__ import annotations
 
 import copy
+import json
 import subprocess
 import sys
 from pathlib import Path
@@ -27,6 +29,8 @@ _SAFE_PARSER = etree.XMLParser(
 )
 
 from _app_errors import (
+    _AppError,
+    AnchorNotFound,
     EmptyInsertSource,
     LastParagraphCannotBeDeleted,
     Md2DocxFailed,
@@ -34,11 +38,14 @@ from _app_errors import (
     Md2DocxOutputInvalid,
 )
 from docx_anchor import (
+    _AnchorIndex,
+    _concat_paragraph_text,
     _merge_adjacent_runs,
     _replace_in_run,
     _find_paragraphs_containing_anchor,
 )
 import _relocator  # docx-008: asset relocator for --insert-after
+from office.package import Package, edit_in_place  # type: ignore
 
 
 # ---------------------------------------------------------------------------
@@ -58,97 +65,113 @@ _WP_CONTENT_TYPES = {
 
 
 def _fallback_glob_parts(
-    tree_root: Path, parts_by_role: dict[str, list[Path]],
+    pkg: Package, parts_by_role: dict[str, list[str]],
 ) -> None:
-    """Populate parts_by_role by globbing word/ directory."""
-    word = tree_root / "word"
-    if not word.is_dir():
-        return
-    doc = word / "document.xml"
-    if doc.is_file():
-        parts_by_role["document"].append(doc)
-    parts_by_role["header"].extend(sorted(word.glob("header*.xml")))
-    parts_by_role["footer"].extend(sorted(word.glob("footer*.xml")))
-    fn = word / "footnotes.xml"
-    if fn.is_file():
-        parts_by_role["footnotes"].append(fn)
-    en = word / "endnotes.xml"
-    if en.is_file():
-        parts_by_role["endnotes"].append(en)
+    """Populate parts_by_role by globbing the word/ directory."""
+    word = [n for n in pkg.names() if n.count("/") == 1 and n.startswith("word/")]
+    if "word/document.xml" in word:
+        parts_by_role["document"].append("word/document.xml")
+    base = [n.split("/", 1)[1] for n in word]
+    parts_by_role["header"].extend(
+        f"word/{n}" for n in sorted(base)
+        if n.startswith("header") and n.endswith(".xml")
+    )
+    parts_by_role["footer"].extend(
+        f"word/{n}" for n in sorted(base)
+        if n.startswith("footer") and n.endswith(".xml")
+    )
+    for role in ("footnotes", "endnotes"):
+        if f"word/{role}.xml" in word:
+            parts_by_role[role].append(f"word/{role}.xml")
 
 
-def _iter_searchable_parts(
-    tree_root: Path,
+def _searchable_parts(
+    pkg: Package,
     scope: "set[str] | None" = None,
-) -> Iterator[tuple[Path, etree._Element]]:
-    """Yield (part_path, root_element) for every searchable XML part
-    in tree_root, in deterministic order (R5.g):
-    document -> headers (sorted) -> footers (sorted) -> footnotes -> endnotes.
-
-    Primary enumeration source = [Content_Types].xml Override entries
-    (ARCH MIN-3). Filesystem glob is a fallback only if Content_Types
-    is missing or malformed (stderr warning).
-
-    `scope` (docx-6.7) restricts which roles are yielded. `None` = all
-    roles (back-compat with pre-docx-6.7 callers). Otherwise must be a
-    subset of {"document", "header", "footer", "footnotes", "endnotes"};
-    parts whose role is not in the set are silently skipped. Order WITHIN
-    the requested set is preserved.
-    """
-    ct_path = tree_root / "[Content_Types].xml"
-    parts_by_role: dict[str, list[Path]] = {
+) -> Iterator[tuple[str, etree._Element]]:
+    """Package-level walker behind `_iter_searchable_parts`; yields
+    (part_name, root_element)."""
+    ct_name = "[Content_Types].xml"
+    parts_by_role: dict[str, list[str]] = {
         "document": [], "header": [], "footer": [],
         "footnotes": [], "endnotes": [],
     }
-    if ct_path.is_file():
+    if ct_name in pkg:
         try:
-            ct_tree = etree.parse(str(ct_path), _SAFE_PARSER)
+            ct_root = pkg.xml(ct_name)
             ns = {"ct": "http://schemas.openxmlformats.org/package/2006/content-types"}
-            for ov in ct_tree.iterfind(".//ct:Override", ns):
+            for ov in ct_root.iterfind(".//ct:Override", ns):
                 ct_value = ov.get("ContentType", "")
                 role = _WP_CONTENT_TYPES.get(ct_value)
                 if role is None:
                     continue
                 pname = ov.get("PartName", "")
-                rel = pname.lstrip("/")
-                parts_by_role[role].append(tree_root / rel)
+                parts_by_role[role].append(pname.lstrip("/"))
         except etree.XMLSyntaxError as exc:
             print(
                 f"[docx_replace] WARNING: [Content_Types].xml parse failed "
                 f"({exc}); falling back to filesystem glob.",
                 file=sys.stderr,
             )
-            _fallback_glob_parts(tree_root, parts_by_role)
+            _fallback_glob_parts(pkg, parts_by_role)
     else:
         print(
             "[docx_replace] WARNING: [Content_Types].xml missing; "
             "falling back to filesystem glob.",
             file=sys.stderr,
         )
-        _fallback_glob_parts(tree_root, parts_by_role)
+        _fallback_glob_parts(pkg, parts_by_role)
 
     # If CT parsed cleanly but yielded no document.xml entry, fall back to
     # glob. Covers "sanitised Content_Types" / "non-Word OOXML producer" cases.
-    if not parts_by_role["document"] and (tree_root / "word" / "document.xml").is_file():
+    if not parts_by_role["document"] and "word/document.xml" in pkg:
         print(
             "[docx_replace] WARNING: [Content_Types].xml has no WordprocessingML "
             "document Override; falling back to filesystem glob.",
             file=sys.stderr,
         )
-        _fallback_glob_parts(tree_root, parts_by_role)
+        _fallback_glob_parts(pkg, parts_by_role)
 
     # Sort headers/footers by part name — lexicographic (R5.g).
-    parts_by_role["header"].sort(key=lambda p: p.name)
-    parts_by_role["footer"].sort(key=lambda p: p.name)
+    parts_by_role["header"].sort(key=lambda n: n.rsplit("/", 1)[-1])
+    parts_by_role["footer"].sort(key=lambda n: n.rsplit("/", 1)[-1])
 
     for role in ("document", "header", "footer", "footnotes", "endnotes"):
         if scope is not None and role not in scope:
             continue  # docx-6.7: skip roles not in --scope set
-        for p in parts_by_role[role]:
-            if not p.is_file():
+        for name in parts_by_role[role]:
+            if name not in pkg:
                 continue  # corrupt-package tolerance
-            root = etree.parse(str(p), _SAFE_PARSER).getroot()
-            yield (p, root)
+            yield (name, pkg.xml(name))
+
+
+def _iter_searchable_parts(
+    tree_root: "Path | Package",
+    scope: "set[str] | None" = None,
+) -> Iterator[tuple["Path | str", etree._Element]]:
+    """Yield (part, root_element) for every searchable XML part
+    in tree_root, in deterministic order (R5.g):
+    document -> headers (sorted) -> footers (sorted) -> footnotes -> endnotes.
+
+    `tree_root` is an unpacked tree (parts yielded as filesystem Paths)
+    or an open `office.package.Package` (parts yielded as member names).
+
+    Primary enumeration source = [Content_Types].xml Override entries
+    (ARCH MIN-3). Filesystem glob is a fallback only if Content_Types
+    is missing or malformed (stderr warning).
+
+    `scope` (docx-6.7) restricts which roles are yielded. `None` = all
+    roles (back-compat with pre-docx-6.7 callers). Otherwise must be a
+    subset of {"document", "header", "footer", "footnotes", "endnotes"};
+    parts whose role is not in the set are silently skipped. Order WITHIN
+    the requested set is preserved.
+    """
+    if isinstance(tree_root, Package):
+        yield from _searchable_parts(tree_root, scope)
+        return
+    with edit_in_place(tree_root) as pkg:
+        for name, root in _searchable_parts(pkg, scope):
+            yield (tree_root / name, root)
 
 
 # ---------------------------------------------------------------------------
@@ -156,7 +179,7 @@ def _iter_searchable_parts(
 # ---------------------------------------------------------------------------
 
 def _do_replace(
-    tree_root: Path,
+    tree_root: "Path | Package",
     anchor: str,
     replacement: str,
     *,
@@ -171,26 +194,23 @@ def _do_replace(
     subset (see `_iter_searchable_parts`).
     """
     total = 0
-    for part_path, part_root in _iter_searchable_parts(tree_root, scope=scope):
-        modified = False
-        part_count = 0
-        for p in part_root.iter(qn("w:p")):
-            _merge_adjacent_runs(p)
-            n = _replace_in_run(p, anchor, replacement, anchor_all=anchor_all)
-            if n > 0:
-                modified = True
-                part_count += n
+    with edit_in_place(tree_root) as pkg:
+        for part_name, part_root in _searchable_parts(pkg, scope=scope):
+            modified = False
+            part_count = 0
+            for p in part_root.iter(qn("w:p")):
+                _merge_adjacent_runs(p)
+                n = _replace_in_run(p, anchor, replacement, anchor_all=anchor_all)
+                if n > 0:
+                    modified = True
+                    part_count += n
+                    if not anchor_all:
+                        break  # first-match wins within this part
+            if modified:
+                pkg.mark_dirty(part_name)
+                total += part_count
                 if not anchor_all:
-                    break  # first-match wins within this part
-        if modified:
-            with part_path.open("wb") as f:
-                f.write(etree.tostring(
-                    part_root, xml_declaration=True,
-                    encoding="UTF-8", standalone=True,
-                ))
-            total += part_count
-            if not anchor_all:
-                return total  # first-match wins across all parts
+                    return total  # first-match wins across all parts
     return total
 
 
@@ -294,7 +314,7 @@ def _extract_insert_paragraphs(
 
 
 def _do_insert_after(
-    tree_root: Path,
+    tree_root: "Path | Package",
     anchor: str,
     insert_paragraphs: "list[etree._Element]",
     *,
@@ -311,31 +331,21 @@ def _do_insert_after(
     subset (see `_iter_searchable_parts`).
     """
     match_count = 0
-    for part_path, part_root in _iter_searchable_parts(tree_root, scope=scope):
-        matches = _find_paragraphs_containing_anchor(part_root, anchor)
-        if not matches:
-            continue
-        for matched_p in matches:
-            # Deep-clone the insert list per match (no shared refs).
-            clones = [_deep_clone(p) for p in insert_paragraphs]
-            # Insert AFTER matched_p: walk reversed and call addnext.
-            for clone in reversed(clones):
-                matched_p.addnext(clone)
-            match_count += 1
-            if not anchor_all:
-                # Write this part and return.
-                with part_path.open("wb") as f:
-                    f.write(etree.tostring(
-                        part_root, xml_declaration=True,
-                        encoding="UTF-8", standalone=True,
-                    ))
-                return match_count
-        # All matches in this part processed; write back.
-        with part_path.open("wb") as f:
-            f.write(etree.tostring(
-                part_root, xml_declaration=True,
-                encoding="UTF-8", standalone=True,
-            ))
+    with edit_in_place(tree_root) as pkg:
+        for part_name, part_root in _searchable_parts(pkg, scope=scope):
+            matches = _find_paragraphs_containing_anchor(part_root, anchor)
+            if not matches:
+                continue
+            pkg.mark_dirty(part_name)
+            for matched_p in matches:
+                # Deep-clone the insert list per match (no shared refs).
+                clones = [_deep_clone(p) for p in insert_paragraphs]
+                # Insert AFTER matched_p: walk reversed and call addnext.
+                for clone in reversed(clones):
+                    matched_p.addnext(clone)
+                match_count += 1
+                if not anchor_all:
+                    return match_count
     return match_count
 
 
@@ -375,7 +385,7 @@ def _safe_remove_paragraph(
 
 
 def _do_delete_paragraph(
-    tree_root: Path,
+    tree_root: "Path | Package",
     anchor: str,
     *,
     anchor_all: bool,
@@ -390,23 +400,153 @@ def _do_delete_paragraph(
     subset (see `_iter_searchable_parts`).
     """
     deleted = 0
-    for part_path, part_root in _iter_searchable_parts(tree_root, scope=scope):
-        matches = _find_paragraphs_containing_anchor(part_root, anchor)
-        if not matches:
-            continue
-        for matched_p in matches:  # snapshot — safe to mutate tree
-            _safe_remove_paragraph(matched_p, part_root, anchor=anchor)
-            deleted += 1
-            if not anchor_all:
-                with part_path.open("wb") as f:
-                    f.write(etree.tostring(
-                        part_root, xml_declaration=True,
-                        encoding="UTF-8", standalone=True,
-                    ))
-                return deleted
-        with part_path.open("wb") as f:
-            f.write(etree.tostring(
-                part_root, xml_declaration=True,
-                encoding="UTF-8", standalone=True,
-            ))
+    with edit_in_place(tree_root) as pkg:
+        for part_name, part_root in _searchable_parts(pkg, scope=scope):
+            matches = _find_paragraphs_containing_anchor(part_root, anchor)
+            if not matches:
+                continue
+            for matched_p in matches:  # snapshot — safe to mutate tree
+                _safe_remove_paragraph(matched_p, part_root, anchor=anchor)
+                pkg.mark_dirty(part_name)
+                deleted += 1
+                if not anchor_all:
+                    return deleted
     return deleted
+
+
+# ---------------------------------------------------------------------------
+# F9: --batch (many actions, one parse, one write)
+# ---------------------------------------------------------------------------
+
+def _load_batch(path: Path, *, default_all: bool = False) -> list[dict]:
+    """Read and validate a --batch JSON file.
+
+    The file holds a list of objects, each with a non-empty `anchor`
+    and exactly one of `replace` (string) or `delete_paragraph` (true);
+    `all` (bool) is optional and defaults to the CLI `--all` flag.
+    Returns normalised dicts for `_do_batch`. Raises
+    `_AppError(UsageError, code=2)` on any malformed entry.
+    """
+    try:
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise _AppError(
+            f"--batch: {path} is not valid JSON: {exc}",
+            code=2, error_type="UsageError",
+            details={"path": str(path)},
+        )
+    if not isinstance(raw, list) or not raw:
+        raise _AppError(
+            "--batch file must hold a non-empty JSON list of actions",
+            code=2, error_type="UsageError",
+            details={"path": str(path)},
+        )
+    actions: list[dict] = []
+    for i, entry in enumerate(raw):
+        def bad(reason: str, i: int = i) -> _AppError:
+            return _AppError(
+                f"--batch entry {i}: {reason}",
+                code=2, error_type="UsageError",
+                details={"path": str(path), "entry": i},
+            )
+
+        if not isinstance(entry, dict):
+            raise bad("must be an object")
+        anchor = entry.get("anchor")
+        if not isinstance(anchor, str) or not anchor:
+            raise bad("'anchor' must be a non-empty string")
+        unknown = set(entry) - {"anchor", "replace", "delete_paragraph", "all"}
+        if unknown:
+            # insert_after is deliberately not batchable: each entry
+            # would need its own md2docx run + asset relocation.
+            raise bad(f"unsupported key(s): {sorted(unknown)}")
+        anchor_all = entry.get("all", default_all)
+        if not isinstance(anchor_all, bool):
+            raise bad("'all' must be a boolean")
+        action = {"anchor": anchor, "all": anchor_all}
+        has_replace = "replace" in entry
+        has_delete = bool(entry.get("delete_paragraph"))
+        if has_replace == has_delete:
+            raise bad("needs exactly one of 'replace' or 'delete_paragraph'")
+        if has_replace:
+            if not isinstance(entry["replace"], str):
+                raise bad("'replace' must be a string")
+            action["replace"] = entry["replace"]
+        else:
+            action["delete_paragraph"] = True
+        actions.append(action)
+    return actions
+
+
+def _do_batch(
+    tree_root: "Path | Package",
+    actions: "list[dict]",
+    *,
+    scope: "set[str] | None" = None,
+) -> list[int]:
+    """Apply `actions` in order; return the per-action match counts.
+
+    Each action is a dict with `anchor`, `all` and either `replace`
+    (str) or `delete_paragraph` (True) — the shape `_load_batch`
+    produces. The searchable parts are parsed once and indexed once
+    (`docx_anchor._AnchorIndex`); each action then only visits the
+    paragraphs that can hold its anchor instead of re-walking every
+    part, so N actions over P paragraphs cost ~O(P + hits) instead of
+    O(N × P). Results match running the actions one by one: every
+    candidate is confirmed with the single-action helpers, and later
+    actions see the text earlier ones produced.
+
+    Runs are merged once per paragraph, on first visit. An action that
+    matches nothing raises AnchorNotFound for the whole batch before
+    anything is written (library mode included).
+    """
+    counts: list[int] = []
+    with edit_in_place(tree_root) as pkg:
+        index = _AnchorIndex(
+            list(_searchable_parts(pkg, scope=scope)),
+            [a["anchor"] for a in actions],
+        )
+        merged: set[etree._Element] = set()
+        for aid, action in enumerate(actions):
+            anchor, anchor_all = action["anchor"], action["all"]
+            count = 0
+            if "replace" in action:
+                for part_name, _root, p in index.candidates(aid):
+                    if p not in merged:
+                        for q in p.iter(qn("w:p")):
+                            _merge_adjacent_runs(q)
+                            merged.add(q)
+                    n = _replace_in_run(
+                        p, anchor, action["replace"], anchor_all=anchor_all,
+                    )
+                    if n > 0:
+                        pkg.mark_dirty(part_name)
+                        index.rescan(p)
+                        count += n
+                        if not anchor_all:
+                            break
+            else:
+                # Snapshot first, like _do_delete_paragraph.
+                matches = [
+                    (part_name, part_root, p)
+                    for part_name, part_root, p in index.candidates(aid)
+                    if anchor in _concat_paragraph_text(p)
+                ]
+                for part_name, part_root, p in matches:
+                    _safe_remove_paragraph(p, part_root, anchor=anchor)
+                    pkg.mark_dirty(part_name)
+                    count += 1
+                    if not anchor_all:
+                        break
+            counts.append(count)
+        missing = [i for i, n in enumerate(counts) if n == 0]
+        if missing:
+            anchors = [actions[i]["anchor"] for i in missing]
+            raise AnchorNotFound(
+                f"Anchor not found for {len(missing)} of {len(actions)} "
+                f"batch action(s): {anchors[0]!r}"
+                + (f" (+{len(missing) - 1} more)" if len(missing) > 1 else ""),
+                code=2, error_type="AnchorNotFound",
+                details={"actions": missing, "anchors": anchors},
+            )
+    return counts
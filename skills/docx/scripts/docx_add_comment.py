@@ -9,10 +9,10 @@ the `<w:comments>` part, the inline `<w:commentRangeStart/End>`
 markers, the `<w:commentReference>` run, and (for replies) the
 `<w15:commentEx w15:paraIdParent=…>` linkage in
 `commentsExtended.xml` all need to be wired together by hand. We
-unpack the .docx (`office.unpack`), edit the relevant XML parts via
-lxml, and repack (`office.pack`) — the same pattern
-`docx_fill_template.py` uses. Library mode skips the unpack/pack
-when the caller already has a tree.
+open the .docx in memory (`office.package.Package`), edit the
+relevant XML parts via lxml, and save — only the parts we touched
+are re-serialised, every other member is copied raw from the input.
+Library mode runs the same edits against the caller's unpacked tree.
 
 Usage:
     docx_add_comment.py INPUT.docx OUTPUT.docx \\
@@ -28,6 +28,9 @@ Usage:
     docx_add_comment.py --unpacked-dir DIR \\
         --anchor-text "..." --comment "..." [--parent N]
 
+    docx_add_comment.py INPUT.docx OUTPUT.docx --batch comments.json \\
+        [--author "Reviewer Bot"] [--date ...] [--all]
+
 `--anchor-text` must occur within a single `<w:t>` element of one
 paragraph (after the same run-merge pass `docx_fill_template`
 performs). When Word splits text across runs with different
@@ -43,6 +46,14 @@ Word's review pane via `<w15:commentEx w15:paraIdParent=…>` in
 and `commentsExtensible.xml` so Word 2016+ keeps stable cross-
 document references.
 
+`--batch FILE.json` adds many comments in one run: a JSON list of
+objects with the same keys as the flags (`anchor_text`, `comment`,
+`parent`, `author`, `initials`, `date`, `all`; the CLI values are the
+defaults). The document is parsed once and indexed for every anchor
+(`docx_anchor._AnchorIndex`), entries are applied in order, and the
+output is written once. Any entry whose anchor matches nothing aborts
+the whole batch before anything is written.
+
 `--unpacked-dir DIR` operates on an already-unpacked tree in-place
 (no zip I/O, no encryption check, no same-path check). Useful when
 chaining comment insertion into a larger pipeline that already
@@ -87,10 +98,10 @@ import _venv_bootstrap  # self-bootstrap into scripts/.venv (TASK 019; replicate
 _venv_bootstrap.reexec_into_venv(requires=("docx",), _file=__file__)
 
 import argparse
+import json
 import random
 import re
 import sys
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -98,18 +109,14 @@ from docx.oxml.ns import qn  # type: ignore
 from lxml import etree  # type: ignore
 
 from _errors import add_json_errors_argument, report_error
-
-# Hardened XML parser — mirrors office/validators/base.py; defangs XXE /
-# external-entity expansion + DTD-based attacks (CWE-611). Used for every
-# etree.parse() call on caller-supplied XML in this module.
-_SAFE_PARSER = etree.XMLParser(
-    resolve_entities=False, no_network=True, load_dtd=False,
+from docx_anchor import (
+    _AnchorIndex, _is_simple_text_run, _merge_adjacent_runs, _rpr_key,
 )
-from docx_anchor import _is_simple_text_run, _merge_adjacent_runs, _rpr_key
 from office._encryption import EncryptedFileError, assert_not_encrypted
 from office._macros import warn_if_macros_will_be_dropped
-from office.pack import pack
-from office.unpack import unpack
+# Parts are parsed by Package's hardened parser (no entities / network /
+# DTD — CWE-611); this module never calls etree.parse() itself.
+from office.package import Package, edit_in_place
 
 
 W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
@@ -121,6 +128,10 @@ R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
 PR_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
 
+DOCUMENT_PART = "/word/document.xml"
+DOCUMENT_RELS_PART = "/word/_rels/document.xml.rels"
+CONTENT_TYPES_PART = "/[Content_Types].xml"
+
 COMMENTS_PART = "/word/comments.xml"
 COMMENTS_REL_TYPE = (
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments"
@@ -246,63 +257,45 @@ def _build_comment_element(
     return comment
 
 
-def _ensure_comments_part(
-    tree_root: Path,
-) -> tuple[Path, etree._ElementTree]:
-    """Return (path-to-comments.xml, parsed-tree). Create an empty one
-    if the document doesn't have comments yet."""
-    path = tree_root / "word" / "comments.xml"
-    if path.is_file():
-        return path, etree.parse(str(path), _SAFE_PARSER)
+def _ensure_comments_part(pkg: Package) -> etree._Element:
+    """Return the root of word/comments.xml. Create an empty one if the
+    document doesn't have comments yet."""
+    if COMMENTS_PART in pkg:
+        return pkg.xml(COMMENTS_PART)
 
-    path.parent.mkdir(parents=True, exist_ok=True)
     root = etree.Element(qn("w:comments"), nsmap={"w": W_NS, "w14": W14_NS})
-    tree = etree.ElementTree(root)
-    tree.write(str(path), xml_declaration=True,
-               encoding="UTF-8", standalone=True)
-    return path, tree
+    pkg.set_xml(COMMENTS_PART, root)
+    return root
 
 
 def _ensure_extra_part(
-    tree_root: Path,
+    pkg: Package,
     *,
     part_name: str,
     root_qname: str,
     nsmap: dict[str, str],
     rel_type: str,
     content_type: str,
-) -> tuple[Path, etree._ElementTree]:
+) -> etree._Element:
     """Generic helper for the three Word-2016+ comment side-parts
     (commentsExtended / commentsIds / commentsExtensible). Idempotent:
-    creates the file with the right root element if missing, then wires
-    relationship + content-type override."""
-    path = tree_root / part_name.lstrip("/")
-    if path.is_file():
-        tree = etree.parse(str(path), _SAFE_PARSER)
+    creates the part with the right root element if missing, then wires
+    relationship + content-type override. Returns the part's root."""
+    if part_name in pkg:
+        root = pkg.xml(part_name)
     else:
-        path.parent.mkdir(parents=True, exist_ok=True)
         root = etree.Element(root_qname, nsmap=nsmap)
-        tree = etree.ElementTree(root)
-        tree.write(str(path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
+        pkg.set_xml(part_name, root)
 
     target = Path(part_name.lstrip("/")).relative_to("word").as_posix()
-    _ensure_relationship(
-        tree_root / "word" / "_rels" / "document.xml.rels",
-        rel_type=rel_type, target=target,
-    )
-    _ensure_content_type(
-        tree_root / "[Content_Types].xml",
-        part_name=part_name, content_type=content_type,
-    )
-    return path, tree
+    _ensure_relationship(pkg, rel_type=rel_type, target=target)
+    _ensure_content_type(pkg, part_name=part_name, content_type=content_type)
+    return root
 
 
-def _ensure_comments_extended_part(
-    tree_root: Path,
-) -> tuple[Path, etree._ElementTree]:
+def _ensure_comments_extended_part(pkg: Package) -> etree._Element:
     return _ensure_extra_part(
-        tree_root,
+        pkg,
         part_name=COMMENTS_EXT_PART,
         root_qname=f"{{{W15_NS}}}commentsEx",
         nsmap={"w15": W15_NS},
@@ -311,11 +304,9 @@ def _ensure_comments_extended_part(
     )
 
 
-def _ensure_comments_ids_part(
-    tree_root: Path,
-) -> tuple[Path, etree._ElementTree]:
+def _ensure_comments_ids_part(pkg: Package) -> etree._Element:
     return _ensure_extra_part(
-        tree_root,
+        pkg,
         part_name=COMMENTS_IDS_PART,
         root_qname=f"{{{W16CID_NS}}}commentsIds",
         nsmap={"w16cid": W16CID_NS},
@@ -324,11 +315,9 @@ def _ensure_comments_ids_part(
     )
 
 
-def _ensure_comments_extensible_part(
-    tree_root: Path,
-) -> tuple[Path, etree._ElementTree]:
+def _ensure_comments_extensible_part(pkg: Package) -> etree._Element:
     return _ensure_extra_part(
-        tree_root,
+        pkg,
         part_name=COMMENTS_CEX_PART,
         root_qname=f"{{{W16CEX_NS}}}commentsExtensible",
         nsmap={"w16cex": W16CEX_NS},
@@ -338,14 +327,15 @@ def _ensure_comments_extensible_part(
 
 
 def _ensure_relationship(
-    rels_path: Path, *, rel_type: str, target: str,
+    pkg: Package, *, rel_type: str, target: str,
 ) -> None:
     """Make sure document.xml.rels has an entry of the given type pointing
     at the given target. Idempotent."""
-    if not rels_path.is_file():
-        raise RuntimeError(f"missing relationships file: {rels_path}")
-    tree = etree.parse(str(rels_path), _SAFE_PARSER)
-    root = tree.getroot()
+    if DOCUMENT_RELS_PART not in pkg:
+        raise RuntimeError(
+            f"missing relationships file: {DOCUMENT_RELS_PART.lstrip('/')}"
+        )
+    root = pkg.xml(DOCUMENT_RELS_PART)
     for rel in root.findall(f"{{{PR_NS}}}Relationship"):
         if rel.get("Type") == rel_type and rel.get("Target") == target:
             return  # already wired
@@ -360,24 +350,21 @@ def _ensure_relationship(
     new.set("Id", f"rId{n}")
     new.set("Type", rel_type)
     new.set("Target", target)
-    tree.write(str(rels_path), xml_declaration=True,
-               encoding="UTF-8", standalone=True)
+    pkg.mark_dirty(DOCUMENT_RELS_PART)
 
 
 def _ensure_content_type(
-    content_types_path: Path, *, part_name: str, content_type: str,
+    pkg: Package, *, part_name: str, content_type: str,
 ) -> None:
     """Make sure [Content_Types].xml has an Override for the given part."""
-    tree = etree.parse(str(content_types_path), _SAFE_PARSER)
-    root = tree.getroot()
+    root = pkg.xml(CONTENT_TYPES_PART)
     for ovr in root.findall(f"{{{CT_NS}}}Override"):
         if ovr.get("PartName") == part_name:
             return
     new = etree.SubElement(root, f"{{{CT_NS}}}Override")
     new.set("PartName", part_name)
     new.set("ContentType", content_type)
-    tree.write(str(content_types_path), xml_declaration=True,
-               encoding="UTF-8", standalone=True)
+    pkg.mark_dirty(CONTENT_TYPES_PART)
 
 
 def _append_comment_extended(
@@ -626,7 +613,7 @@ def _clone(elem: etree._Element) -> etree._Element:
 
 
 def _add_top_level_comment(
-    tree_root: Path,
+    pkg: Package,
     *,
     anchor_text: str,
     body: str,
@@ -636,16 +623,14 @@ def _add_top_level_comment(
     anchor_all: bool,
 ) -> int:
     """Anchor-wrap path. Returns count of comments created (0 on no-match)."""
-    doc_path = tree_root / "word" / "document.xml"
-    if not doc_path.is_file():
+    if DOCUMENT_PART not in pkg:
         raise RuntimeError(
             "input is not a wordprocessing document (missing "
             "word/document.xml)"
         )
-    doc_tree = etree.parse(str(doc_path), _SAFE_PARSER)
+    doc_root = pkg.xml(DOCUMENT_PART)
 
-    comments_path, comments_tree = _ensure_comments_part(tree_root)
-    comments_root = comments_tree.getroot()
+    comments_root = _ensure_comments_part(pkg)
     next_id = _next_comment_id(comments_root)
 
     # Reserve paraId/durableId per match upfront so we can write them
@@ -655,7 +640,7 @@ def _add_top_level_comment(
     new_durable_ids: list[str] = []
 
     matches = 0
-    for paragraph in doc_tree.iter(qn("w:p")):
+    for paragraph in doc_root.iter(qn("w:p")):
         _merge_adjacent_runs(paragraph)
         n_in_p = _wrap_anchors_in_paragraph(
             paragraph, anchor_text, next_id + matches,
@@ -678,41 +663,31 @@ def _add_top_level_comment(
     if matches == 0:
         return 0
 
-    doc_tree.write(str(doc_path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
-    comments_tree.write(str(comments_path), xml_declaration=True,
-                        encoding="UTF-8", standalone=True)
+    pkg.mark_dirty(DOCUMENT_PART)
+    pkg.mark_dirty(COMMENTS_PART)
 
     # Wire side-parts so future replies can thread; also keeps Word
     # 2016+ happy (it gets confused if comments.xml has w14:paraId
     # but no commentsIds.xml partner).
-    ext_path, ext_tree = _ensure_comments_extended_part(tree_root)
-    ids_path, ids_tree = _ensure_comments_ids_part(tree_root)
-    cex_path, cex_tree = _ensure_comments_extensible_part(tree_root)
+    ext_root = _ensure_comments_extended_part(pkg)
+    ids_root = _ensure_comments_ids_part(pkg)
+    cex_root = _ensure_comments_extensible_part(pkg)
     for para_id, durable_id in zip(new_para_ids, new_durable_ids):
         _append_comment_extended(
-            ext_tree.getroot(), para_id=para_id, parent_para_id=None,
+            ext_root, para_id=para_id, parent_para_id=None,
         )
         _append_comment_id(
-            ids_tree.getroot(), para_id=para_id, durable_id=durable_id,
+            ids_root, para_id=para_id, durable_id=durable_id,
         )
         _append_comment_extensible(
-            cex_tree.getroot(), durable_id=durable_id, date_iso=date_iso,
+            cex_root, durable_id=durable_id, date_iso=date_iso,
         )
-    ext_tree.write(str(ext_path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
-    ids_tree.write(str(ids_path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
-    cex_tree.write(str(cex_path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
-
-    _ensure_relationship(
-        tree_root / "word" / "_rels" / "document.xml.rels",
-        rel_type=COMMENTS_REL_TYPE, target="comments.xml",
-    )
+    for part in (COMMENTS_EXT_PART, COMMENTS_IDS_PART, COMMENTS_CEX_PART):
+        pkg.mark_dirty(part)
+
+    _ensure_relationship(pkg, rel_type=COMMENTS_REL_TYPE, target="comments.xml")
     _ensure_content_type(
-        tree_root / "[Content_Types].xml",
-        part_name=COMMENTS_PART, content_type=COMMENTS_CT,
+        pkg, part_name=COMMENTS_PART, content_type=COMMENTS_CT,
     )
     return matches
 
@@ -727,7 +702,7 @@ class _ParentRangeNotFound(Exception):
 
 
 def _add_reply(
-    tree_root: Path,
+    pkg: Package,
     *,
     parent_id: int,
     body: str,
@@ -737,17 +712,14 @@ def _add_reply(
 ) -> int:
     """Reply path. Returns 1 on success, raises _ParentNotFound /
     _ParentRangeNotFound otherwise."""
-    doc_path = tree_root / "word" / "document.xml"
-    if not doc_path.is_file():
+    if DOCUMENT_PART not in pkg:
         raise RuntimeError(
             "input is not a wordprocessing document (missing "
             "word/document.xml)"
         )
-    doc_tree = etree.parse(str(doc_path), _SAFE_PARSER)
-    doc_root = doc_tree.getroot()
+    doc_root = pkg.xml(DOCUMENT_PART)
 
-    comments_path, comments_tree = _ensure_comments_part(tree_root)
-    comments_root = comments_tree.getroot()
+    comments_root = _ensure_comments_part(pkg)
 
     parent_el = _find_comment_element(comments_root, parent_id)
     if parent_el is None:
@@ -776,54 +748,198 @@ def _add_reply(
     )
     comments_root.append(reply_comment)
 
-    doc_tree.write(str(doc_path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
-    comments_tree.write(str(comments_path), xml_declaration=True,
-                        encoding="UTF-8", standalone=True)
+    pkg.mark_dirty(DOCUMENT_PART)
+    pkg.mark_dirty(COMMENTS_PART)
 
-    ext_path, ext_tree = _ensure_comments_extended_part(tree_root)
-    ids_path, ids_tree = _ensure_comments_ids_part(tree_root)
-    cex_path, cex_tree = _ensure_comments_extensible_part(tree_root)
+    ext_root = _ensure_comments_extended_part(pkg)
+    ids_root = _ensure_comments_ids_part(pkg)
+    cex_root = _ensure_comments_extensible_part(pkg)
     # Flatten reply chains: if --parent points at a comment that is itself
     # a reply, walk up to the root of the conversation. Word's review
     # pane displays a single flat thread under the root regardless of
     # how the disk shape was nested, and writing chained paraIdParents
     # is what causes Word's "Reply" button to mis-target the next click.
-    root_parent_para_id = _resolve_root_para_id(
-        ext_tree.getroot(), parent_para_id,
-    )
+    root_parent_para_id = _resolve_root_para_id(ext_root, parent_para_id)
     _append_comment_extended(
-        ext_tree.getroot(),
+        ext_root,
         para_id=reply_para_id, parent_para_id=root_parent_para_id,
     )
     _append_comment_id(
-        ids_tree.getroot(),
+        ids_root,
         para_id=reply_para_id, durable_id=reply_durable_id,
     )
     _append_comment_extensible(
-        cex_tree.getroot(),
+        cex_root,
         durable_id=reply_durable_id, date_iso=date_iso,
     )
-    ext_tree.write(str(ext_path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
-    ids_tree.write(str(ids_path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
-    cex_tree.write(str(cex_path), xml_declaration=True,
-                   encoding="UTF-8", standalone=True)
-
-    _ensure_relationship(
-        tree_root / "word" / "_rels" / "document.xml.rels",
-        rel_type=COMMENTS_REL_TYPE, target="comments.xml",
-    )
+    for part in (COMMENTS_EXT_PART, COMMENTS_IDS_PART, COMMENTS_CEX_PART):
+        pkg.mark_dirty(part)
+
+    _ensure_relationship(pkg, rel_type=COMMENTS_REL_TYPE, target="comments.xml")
     _ensure_content_type(
-        tree_root / "[Content_Types].xml",
-        part_name=COMMENTS_PART, content_type=COMMENTS_CT,
+        pkg, part_name=COMMENTS_PART, content_type=COMMENTS_CT,
     )
     return 1
 
 
+class _BatchAnchorsNotFound(Exception):
+    """One or more --batch entries matched nothing; args[0] lists their
+    indices. Raised inside the edit so library mode writes nothing."""
+
+
+def _add_comments_batch(pkg: Package, entries: list[dict]) -> list[int]:
+    """Apply normalised batch `entries` (see `_load_batch`) in order;
+    return the per-entry comment count.
+
+    Same per-entry behaviour as `_add_top_level_comment` / `_add_reply`,
+    but document.xml is indexed once for every anchor, each paragraph's
+    runs are merged once (before its first wrap, so later entries never
+    re-merge runs across earlier comment markers), comment ids come from
+    a running counter, and the side-parts are wired once.
+    """
+    if DOCUMENT_PART not in pkg:
+        raise RuntimeError(
+            "input is not a wordprocessing document (missing "
+            "word/document.xml)"
+        )
+    doc_root = pkg.xml(DOCUMENT_PART)
+    comments_root = _ensure_comments_part(pkg)
+    index = _AnchorIndex(
+        [(DOCUMENT_PART, doc_root)],
+        [e["anchor_text"] or "" for e in entries],
+    )
+    merged: set[etree._Element] = set()
+    next_id = _next_comment_id(comments_root)
+    side_parts = None
+    counts: list[int] = []
+    for aid, e in enumerate(entries):
+        if e["parent"] is not None:
+            counts.append(_add_reply(
+                pkg, parent_id=e["parent"], body=e["comment"],
+                author=e["author"], initials=e["initials"],
+                date_iso=e["date"],
+            ))
+            next_id += 1
+            continue
+        matches = 0
+        for _part, _root, paragraph in index.candidates(aid):
+            if paragraph not in merged:
+                _merge_adjacent_runs(paragraph)
+                merged.add(paragraph)
+            n_in_p = _wrap_anchors_in_paragraph(
+                paragraph, e["anchor_text"], next_id + matches,
+                anchor_all=e["all"],
+            )
+            matches += n_in_p
+            if not e["all"] and matches:
+                break
+        counts.append(matches)
+        if not matches:
+            continue
+        if side_parts is None:
+            side_parts = (
+                _ensure_comments_extended_part(pkg),
+                _ensure_comments_ids_part(pkg),
+                _ensure_comments_extensible_part(pkg),
+            )
+        ext_root, ids_root, cex_root = side_parts
+        for cid in range(next_id, next_id + matches):
+            para_id = _random_hex_id()
+            durable_id = _random_hex_id()
+            comments_root.append(_build_comment_element(
+                cid, e["comment"], e["author"], e["initials"], e["date"],
+                para_id=para_id,
+            ))
+            _append_comment_extended(
+                ext_root, para_id=para_id, parent_para_id=None,
+            )
+            _append_comment_id(
+                ids_root, para_id=para_id, durable_id=durable_id,
+            )
+            _append_comment_extensible(
+                cex_root, durable_id=durable_id, date_iso=e["date"],
+            )
+        next_id += matches
+
+    missing = [i for i, n in enumerate(counts) if n == 0]
+    if missing:
+        raise _BatchAnchorsNotFound(missing)
+    for part in (DOCUMENT_PART, COMMENTS_PART, COMMENTS_EXT_PART,
+                 COMMENTS_IDS_PART, COMMENTS_CEX_PART):
+        if part in pkg:
+            pkg.mark_dirty(part)
+    _ensure_relationship(pkg, rel_type=COMMENTS_REL_TYPE, target="comments.xml")
+    _ensure_content_type(
+        pkg, part_name=COMMENTS_PART, content_type=COMMENTS_CT,
+    )
+    return counts
+
+
+def add_comments(
+    tree_root: "Path | Package", entries: list[dict],
+) -> list[int]:
+    """Batch counterpart of `add_comment`: apply every entry (dicts
+    shaped by `_load_batch`) over one parse; returns per-entry counts.
+    Raises `_BatchAnchorsNotFound` (nothing written) if any anchor
+    entry matched nothing."""
+    with edit_in_place(tree_root) as pkg:
+        return _add_comments_batch(pkg, entries)
+
+
+def _load_batch(
+    path: Path,
+    *,
+    author: str,
+    initials: str | None,
+    date_iso: str,
+    anchor_all: bool,
+) -> list[dict]:
+    """Read a --batch JSON list; fill per-entry defaults from the CLI.
+    Raises ValueError with the offending entry index on bad input."""
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(raw, list) or not raw:
+        raise ValueError("--batch file must hold a non-empty JSON list")
+    keys = {"anchor_text", "comment", "parent", "author", "initials",
+            "date", "all"}
+    entries: list[dict] = []
+    for i, item in enumerate(raw):
+        if not isinstance(item, dict):
+            raise ValueError(f"--batch entry {i}: must be an object")
+        unknown = set(item) - keys
+        if unknown:
+            raise ValueError(
+                f"--batch entry {i}: unsupported key(s): {sorted(unknown)}"
+            )
+        if not isinstance(item.get("comment"), str):
+            raise ValueError(f"--batch entry {i}: 'comment' must be a string")
+        parent = item.get("parent")
+        if parent is not None and (
+            not isinstance(parent, int) or isinstance(parent, bool)
+        ):
+            raise ValueError(f"--batch entry {i}: 'parent' must be an integer")
+        anchor_text = item.get("anchor_text")
+        if parent is None and (not isinstance(anchor_text, str) or not anchor_text):
+            raise ValueError(
+                f"--batch entry {i}: 'anchor_text' is required when "
+                f"'parent' is not set"
+            )
+        entry_author = item.get("author", author)
+        entries.append({
+            "anchor_text": anchor_text if parent is None else None,
+            "comment": item["comment"],
+            "parent": parent,
+            "author": entry_author,
+            "initials": item.get("initials")
+                        or (initials if "author" not in item else None)
+                        or _initials_from_author(entry_author),
+            "date": item.get("date", date_iso),
+            "all": bool(item.get("all", anchor_all)),
+        })
+    return entries
+
+
 def add_comment(
-    tree_root: Path,
+    tree_root: "Path | Package",
     *,
     body: str,
     author: str,
@@ -835,20 +951,24 @@ def add_comment(
 ) -> int:
     """Top-level dispatch: anchor-wrap a new comment OR thread a reply
     onto an existing one. Returns count of comments added (0/1 for
-    replies, 0..N for anchor mode)."""
-    if parent_id is not None:
-        return _add_reply(
-            tree_root,
-            parent_id=parent_id,
-            body=body, author=author, initials=initials, date_iso=date_iso,
-        )
-    if not anchor_text:
+    replies, 0..N for anchor mode).
+
+    `tree_root` is an unpacked tree (edited parts are written back in
+    place) or an open `office.package.Package` (the caller saves)."""
+    if parent_id is None and not anchor_text:
         raise ValueError("anchor_text is required when parent_id is not set")
-    return _add_top_level_comment(
-        tree_root,
-        anchor_text=anchor_text, body=body, author=author,
-        initials=initials, date_iso=date_iso, anchor_all=anchor_all,
-    )
+    with edit_in_place(tree_root) as pkg:
+        if parent_id is not None:
+            return _add_reply(
+                pkg,
+                parent_id=parent_id,
+                body=body, author=author, initials=initials, date_iso=date_iso,
+            )
+        return _add_top_level_comment(
+            pkg,
+            anchor_text=anchor_text, body=body, author=author,
+            initials=initials, date_iso=date_iso, anchor_all=anchor_all,
+        )
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -866,8 +986,9 @@ def main(argv: list[str] | None = None) -> int:
                              "(must fit within a single run after the "
                              "automatic adjacent-run merge). Required "
                              "unless --parent is given.")
-    parser.add_argument("--comment", required=True,
-                        help="Comment body text (plain).")
+    parser.add_argument("--comment", default=None,
+                        help="Comment body text (plain). Required unless "
+                             "--batch is given.")
     parser.add_argument("--parent", type=int, default=None,
                         help="Reply to existing comment with this id. "
                              "Inherits the parent's anchor range; "
@@ -885,6 +1006,14 @@ def main(argv: list[str] | None = None) -> int:
                         help="Comment every occurrence of --anchor-text. "
                              "Default: comment only the first match. "
                              "Ignored when --parent is given.")
+    parser.add_argument("--batch", type=Path, default=None,
+                        metavar="FILE.json",
+                        help="Add every comment listed in a JSON file "
+                             "(objects with anchor_text / comment / parent "
+                             "/ author / initials / date / all; the flags "
+                             "above are the defaults). One parse, one "
+                             "write. Mutually exclusive with --anchor-text, "
+                             "--comment and --parent.")
     add_json_errors_argument(parser)
     args = parser.parse_args(argv)
     je = args.json_errors
@@ -903,11 +1032,25 @@ def main(argv: list[str] | None = None) -> int:
                 code=2, error_type="UsageError", json_mode=je,
             )
 
-    if args.parent is None and not args.anchor_text:
-        return report_error(
-            "--anchor-text is required when --parent is not given",
-            code=2, error_type="UsageError", json_mode=je,
-        )
+    if args.batch is not None:
+        if (args.anchor_text is not None or args.comment is not None
+                or args.parent is not None):
+            return report_error(
+                "--batch is mutually exclusive with --anchor-text, "
+                "--comment and --parent",
+                code=2, error_type="UsageError", json_mode=je,
+            )
+    else:
+        if args.comment is None:
+            return report_error(
+                "--comment is required (or use --batch)",
+                code=2, error_type="UsageError", json_mode=je,
+            )
+        if args.parent is None and not args.anchor_text:
+            return report_error(
+                "--anchor-text is required when --parent is not given",
+                code=2, error_type="UsageError", json_mode=je,
+            )
 
     initials = args.initials or _initials_from_author(args.author)
     if args.date:
@@ -917,8 +1060,32 @@ def main(argv: list[str] | None = None) -> int:
             "%Y-%m-%dT%H:%M:%SZ"
         )
 
-    def _do_add(tree_root: Path) -> int:
-        """Run add_comment; raise translated errors. Returns count."""
+    entries = None
+    if args.batch is not None:
+        try:
+            entries = _load_batch(
+                args.batch, author=args.author, initials=args.initials,
+                date_iso=date_iso, anchor_all=args.anchor_all,
+            )
+        except OSError as exc:
+            return report_error(
+                f"cannot read --batch file: {exc}", code=1,
+                error_type="FileNotFound" if isinstance(exc, FileNotFoundError)
+                else "IOError",
+                details={"path": str(args.batch)}, json_mode=je,
+            )
+        except ValueError as exc:  # includes json.JSONDecodeError
+            return report_error(
+                f"invalid --batch file {args.batch}: {exc}",
+                code=2, error_type="UsageError",
+                details={"path": str(args.batch)}, json_mode=je,
+            )
+
+    def _do_add(tree_root: "Path | Package") -> int:
+        """Run add_comment (or add_comments for --batch); raise
+        translated errors. Returns count."""
+        if entries is not None:
+            return sum(add_comments(tree_root, entries))
         return add_comment(
             tree_root,
             anchor_text=args.anchor_text,
@@ -930,6 +1097,19 @@ def main(argv: list[str] | None = None) -> int:
             parent_id=args.parent,
         )
 
+    def _batch_not_found(exc: _BatchAnchorsNotFound) -> int:
+        missing = exc.args[0]
+        anchors = [entries[i]["anchor_text"] for i in missing]
+        return report_error(
+            f"anchor text not found for {len(missing)} batch entr"
+            f"{'y' if len(missing) == 1 else 'ies'}: {anchors[0]!r}"
+            + (f" (+{len(missing) - 1} more)" if len(missing) > 1 else "")
+            + " — nothing written",
+            code=2, error_type="AnchorNotFound",
+            details={"entries": missing, "anchor_texts": anchors},
+            json_mode=je,
+        )
+
     if library_mode:
         tree_root = args.unpacked_dir.resolve()
         if not (tree_root / "word" / "document.xml").is_file():
@@ -955,6 +1135,8 @@ def main(argv: list[str] | None = None) -> int:
                 code=2, error_type="ParentRangeNotFound",
                 details={"parent_id": int(str(exc))}, json_mode=je,
             )
+        except _BatchAnchorsNotFound as exc:
+            return _batch_not_found(exc)
         except etree.XMLSyntaxError as exc:
             return report_error(
                 f"OOXML parse error in input tree: {exc}",
@@ -972,7 +1154,10 @@ def main(argv: list[str] | None = None) -> int:
                 code=2, error_type="AnchorNotFound",
                 details={"anchor_text": args.anchor_text}, json_mode=je,
             )
-        if args.parent is not None:
+        if entries is not None:
+            print(f"{tree_root}: added {n} comment(s) "
+                  f"from {len(entries)} batch entries")
+        elif args.parent is not None:
             print(f"{tree_root}: added {n} reply(s) "
                   f"to comment {args.parent} (author={args.author!r})")
         else:
@@ -1015,11 +1200,9 @@ def main(argv: list[str] | None = None) -> int:
     warn_if_macros_will_be_dropped(args.input, args.output, sys.stderr)
 
     try:
-        with tempfile.TemporaryDirectory(prefix="docx_add_comment-") as td:
-            tree_root = Path(td) / "tree"
-            unpack(args.input, tree_root)
+        with Package.open(args.input, apply_docx_helpers=True) as package:
             try:
-                n = _do_add(tree_root)
+                n = _do_add(package)
             except _ParentNotFound as exc:
                 return report_error(
                     f"parent comment {exc} not found in word/comments.xml",
@@ -1034,6 +1217,8 @@ def main(argv: list[str] | None = None) -> int:
                     code=2, error_type="ParentRangeNotFound",
                     details={"parent_id": int(str(exc))}, json_mode=je,
                 )
+            except _BatchAnchorsNotFound as exc:
+                return _batch_not_found(exc)
             if n == 0:
                 return report_error(
                     f"anchor text not found: {args.anchor_text!r} "
@@ -1043,14 +1228,17 @@ def main(argv: list[str] | None = None) -> int:
                     details={"anchor_text": args.anchor_text},
                     json_mode=je,
                 )
-            pack(tree_root, args.output)
+            package.save(args.output)
     except (RuntimeError, ValueError, OSError) as exc:
         return report_error(
             f"add-comment failed: {exc}", code=1,
             error_type=type(exc).__name__, json_mode=je,
         )
 
-    if args.parent is not None:
+    if entries is not None:
+        print(f"{args.output}: added {n} comment(s) "
+              f"from {len(entries)} batch entries")
+    elif args.parent is not None:
         print(f"{args.output}: added {n} reply(s) "
               f"to comment {args.parent} (author={args.author!r})")
     else:
@@ -173,3 +173,118 @@ def _find_paragraphs_containing_anchor(
         if anchor in _concat_paragraph_text(p):
             matches.append(p)
     return matches
+
+
+# === batch index (many anchors, one pass) ===
+
+class _AnchorAutomaton:
+    """Aho-Corasick automaton over a fixed set of anchors.
+
+    `search(text)` reports which anchors occur anywhere in `text` in one
+    left-to-right pass — cost is O(len(text) + hits), independent of how
+    many anchors were compiled in. Overlapping and nested anchors are all
+    reported (a plain regex alternation would miss them).
+    """
+
+    def __init__(self, anchors: "list[str]") -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[set[int]] = [set()]
+        for aid, anchor in enumerate(anchors):
+            if not anchor:
+                continue  # empty anchor would match everywhere (see above)
+            state = 0
+            for ch in anchor:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._out.append(set())
+                    self._goto[state][ch] = nxt
+                state = nxt
+            self._out[state].add(aid)
+        # BFS: failure links, with each state's output set folded in from
+        # its failure target so `search` never walks the fail chain for
+        # outputs.
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> set[int]:
+        """Ids of the anchors occurring in `text`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+        return found
+
+
+class _AnchorIndex:
+    """Paragraph index over one or more parts for a batch of anchors.
+
+    Built once: every `<w:p>` of every part gets a document-order
+    ordinal, and its raw text (`itertext()`, the same super-set the
+    `_find_paragraphs_containing_anchor` pre-filter uses) is scanned by
+    one `_AnchorAutomaton`. `candidates(aid)` then returns only the
+    paragraphs that may hold anchor `aid`, in document order — callers
+    still confirm each hit with the single-anchor helpers above, so
+    match semantics are unchanged. After an edit that can ADD text
+    (a replacement), `rescan(p)` refreshes `p` and its enclosing /
+    nested paragraphs so later anchors see the new text; edits that
+    only remove text need no rescan.
+    """
+
+    def __init__(
+        self,
+        parts: "list[tuple[str, etree._Element]]",
+        anchors: "list[str]",
+    ) -> None:
+        self._automaton = _AnchorAutomaton(anchors)
+        self._hits: list[set[int]] = [set() for _ in anchors]
+        self._paragraphs: list[tuple[str, etree._Element, etree._Element]] = []
+        self._ordinal: dict[etree._Element, int] = {}
+        for part_name, part_root in parts:
+            for p in part_root.iter(qn("w:p")):
+                self._ordinal[p] = len(self._paragraphs)
+                self._paragraphs.append((part_name, part_root, p))
+                self._scan(p)
+
+    def _scan(self, p: etree._Element) -> None:
+        ordinal = self._ordinal.get(p)
+        if ordinal is None:
+            return  # created after indexing (e.g. an empty cell placeholder)
+        for aid in self._automaton.search("".join(p.itertext())):
+            self._hits[aid].add(ordinal)
+
+    def candidates(
+        self, aid: int,
+    ) -> "list[tuple[str, etree._Element, etree._Element]]":
+        """(part_name, part_root, paragraph) for every still-attached
+        paragraph whose text may contain anchor `aid`, document order."""
+        found = []
+        for ordinal in sorted(self._hits[aid]):
+            part_name, part_root, p = self._paragraphs[ordinal]
+            # A removed element keeps its lxml document, so "attached"
+            # means part_root is still among its ancestors.
+            if any(a is part_root for a in p.iterancestors()):
+                found.append((part_name, part_root, p))
+        return found
+
+    def rescan(self, p: etree._Element) -> None:
+        """Re-index `p` plus the paragraphs around and inside it."""
+        for q in p.iterancestors(qn("w:p")):
+            self._scan(q)
+        for q in p.iter(qn("w:p")):
+            self._scan(q)
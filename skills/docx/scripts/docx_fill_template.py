@@ -13,12 +13,27 @@ Conditionals and loops are NOT supported — this script does plain
 variable substitution. For complex templating use docxtpl or write
 your own DOCX assembler via python-docx.
 
+Mail merge: `CompiledTemplate` does the run merge and placeholder scan
+once per template and then renders each record by splicing the values
+into the pre-serialised parts (see its docstring), so filling tens of
+thousands of letters does not re-open and re-normalise the template
+per letter. `--records data.jsonl` drives it from the CLI: one JSON
+object per line, one output document per record, streamed and — with
+`--jobs N` — rendered in N worker processes.
+
 Usage:
     python docx_fill_template.py template.docx data.json output.docx
+    python docx_fill_template.py template.docx --records data.jsonl \\
+        --out-dir letters/ [--name-key customer.id] [--jobs N] [--strict]
 
 Exit codes:
     0 — filled successfully
-    1 — missing file, invalid JSON, or unresolved required placeholder
+    1 — missing file, invalid JSON / record, or unresolved required
+        placeholder (with --records: in any record)
+    2 — usage error (mixing single-document and --records arguments)
+    3 — template is password-protected or legacy CFB
+    6 — OUTPUT (or a --records output name) resolves to the template
+        (cross-7 H1 SelfOverwriteRefused parity)
 """
 
 from __future__ import annotations
@@ -28,23 +43,29 @@ _venv_bootstrap.reexec_into_venv(requires=("docx",), _file=__file__)
 
 import argparse
 import json
+import posixpath
 import re
 import sys
+import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from docx import Document  # type: ignore
 from docx.oxml.ns import qn  # type: ignore
 from lxml import etree  # type: ignore
 
 from _errors import add_json_errors_argument, report_error
 from office._encryption import EncryptedFileError, assert_not_encrypted
 from office._macros import warn_if_macros_will_be_dropped
+from office.package import Package
 
 
 PLACEHOLDER_RE = re.compile(r"\{\{\s*([A-Za-z0-9_.]+)\s*\}\}")
 
 W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
 
 
 def _rpr_key(run_element: etree._Element) -> bytes:
@@ -115,84 +136,394 @@ def _resolve(data: dict[str, Any], key_path: str) -> str | None:
     return "" if value is None else str(value)
 
 
-def _fill_paragraph(paragraph_elem: etree._Element, data: dict[str, Any], unresolved: set[str]) -> None:
-    _merge_adjacent_runs(paragraph_elem)
-    for text_elem in paragraph_elem.iter(qn("w:t")):
-        original = text_elem.text or ""
-        if "{{" not in original:
-            continue
+# Characters XML 1.0 cannot carry; lxml refuses them on assignment and
+# the compiled renderer never builds elements, so it checks itself.
+_XML_ILLEGAL_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff\ud800-\udfff]")
 
-        def replace(match: re.Match[str]) -> str:
-            key = match.group(1)
-            value = _resolve(data, key)
-            if value is None:
-                unresolved.add(key)
-                return match.group(0)
-            return value
-
-        new_text = PLACEHOLDER_RE.sub(replace, original)
-        if new_text != original:
-            text_elem.text = new_text
-            # Protect leading/trailing whitespace in substituted text.
-            if new_text != new_text.strip():
-                text_elem.set(
-                    "{http://www.w3.org/XML/1998/namespace}space",
-                    "preserve",
-                )
 
+def _xml_text(value: str) -> str:
+    """Escape `value` for use as element text."""
+    if _XML_ILLEGAL_RE.search(value):
+        raise ValueError(
+            "All strings must be XML compatible: Unicode or ASCII, "
+            "no NULL bytes or control characters"
+        )
+    return (
+        value.replace("&", "&amp;").replace("<", "&lt;")
+        .replace(">", "&gt;").replace("\r", "&#13;")
+    )
 
-def fill_template(template: Path, data: dict[str, Any], output: Path) -> set[str]:
-    doc = Document(str(template))
-    unresolved: set[str] = set()
-
-    # Body paragraphs (including those nested inside tables).
-    for paragraph in doc.paragraphs:
-        _fill_paragraph(paragraph._p, data, unresolved)
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    _fill_paragraph(paragraph._p, data, unresolved)
-
-    # Headers and footers.
-    for section in doc.sections:
-        for part in (section.header, section.footer, section.first_page_header,
-                     section.first_page_footer, section.even_page_header, section.even_page_footer):
-            if part is None:
+
+def _part_target(target: str) -> str:
+    """document.xml.rels Target → member name (`header1.xml` → `word/header1.xml`)."""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join("word", target))
+
+
+class CompiledTemplate:
+    """A template parsed, run-normalised and sliced once, then rendered
+    once per record.
+
+    Compiling visits the same paragraphs `fill_template` always has —
+    body paragraphs, paragraphs of top-level table cells, and the
+    paragraphs of every header / footer part the sections reference —
+    merges their adjacent runs, and records each `<w:t>` that holds a
+    `{{placeholder}}` as a slot at (part, paragraph, run) position
+    (`self.slots`). Each slot's text is pre-split into literal and
+    placeholder segments, and each part holding slots is serialised
+    once and cut at the slots. `render()` therefore only resolves keys,
+    escapes the values and joins strings: no ZIP inflate, no XML parse
+    and no run merge per record. Parts without slots are copied raw
+    from the template archive (`office.package`).
+    """
+
+    def __init__(self, template: Path) -> None:
+        self.template = Path(template)
+        self._pkg = Package.open(self.template)
+        self.slots: list[tuple[str, int, int]] = []
+        # text segments per slot: literal str | (key, original match)
+        self._texts: list[list["str | tuple[str, str]"]] = []
+        # per part: serialised literal chunks, slot index between each pair
+        self._plans: dict[str, tuple[list[str], list[int]]] = {}
+        try:
+            for part, paragraphs in self._target_paragraphs():
+                self._compile_part(part, paragraphs)
+        except BaseException:
+            self._pkg.close()
+            raise
+
+    @classmethod
+    def compile(cls, template: "Path | str") -> "CompiledTemplate":
+        return cls(Path(template))
+
+    def close(self) -> None:
+        self._pkg.close()
+
+    def __enter__(self) -> "CompiledTemplate":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @property
+    def keys(self) -> set[str]:
+        """Every placeholder key path the template uses."""
+        return {seg[0] for text in self._texts for seg in text
+                if isinstance(seg, tuple)}
+
+    def _target_paragraphs(self) -> Iterator[tuple[str, list[etree._Element]]]:
+        doc_name = "word/document.xml"
+        if doc_name not in self._pkg:
+            raise ValueError(f"{self.template} has no word/document.xml")
+        doc = self._pkg.xml(doc_name)
+        body = doc.find(qn("w:body"))
+        paragraphs: list[etree._Element] = []
+        for child in ([] if body is None else body):
+            if child.tag == qn("w:p"):
+                paragraphs.append(child)
+            elif child.tag == qn("w:tbl"):
+                for tc in child.iterfind(f"{qn('w:tr')}/{qn('w:tc')}"):
+                    paragraphs.extend(tc.findall(qn("w:p")))
+        yield doc_name, paragraphs
+
+        rels_name = "word/_rels/document.xml.rels"
+        targets: dict[str, str] = {}
+        if rels_name in self._pkg:
+            for rel in self._pkg.xml(rels_name):
+                if rel.get("TargetMode") != "External" and rel.get("Id"):
+                    targets[rel.get("Id")] = _part_target(rel.get("Target", ""))
+        seen: set[str] = set()
+        for ref in doc.iter(qn("w:headerReference"), qn("w:footerReference")):
+            name = targets.get(ref.get(f"{{{R_NS}}}id", ""))
+            if name is None or name in seen or name not in self._pkg:
                 continue
-            for paragraph in part.paragraphs:
-                _fill_paragraph(paragraph._p, data, unresolved)
+            seen.add(name)
+            yield name, self._pkg.xml(name).findall(qn("w:p"))
+
+    def _compile_part(self, part: str, paragraphs: list[etree._Element]) -> None:
+        token = uuid.uuid4().hex
+        marked = 0
+        for p_index, paragraph in enumerate(paragraphs):
+            _merge_adjacent_runs(paragraph)
+            for t_index, text_elem in enumerate(paragraph.iter(qn("w:t"))):
+                original = text_elem.text or ""
+                if "{{" not in original:
+                    continue
+                segments: list["str | tuple[str, str]"] = []
+                cursor = 0
+                for match in PLACEHOLDER_RE.finditer(original):
+                    if match.start() > cursor:
+                        segments.append(original[cursor:match.start()])
+                    segments.append((match.group(1), match.group(0)))
+                    cursor = match.end()
+                if cursor == 0:
+                    continue  # "{{" without a well-formed placeholder
+                if cursor < len(original):
+                    segments.append(original[cursor:])
+                slot = len(self._texts)
+                self._texts.append(segments)
+                self.slots.append((part, p_index, t_index))
+                text_elem.text = f"{token}:{slot}:"
+                # Values may start or end with spaces; preserve up front
+                # since the attribute is fixed once the part is sliced.
+                text_elem.set(XML_SPACE, "preserve")
+                marked += 1
+        if not marked:
+            return
+        root = self._pkg.xml(part)
+        xml = etree.tostring(
+            root.getroottree(), xml_declaration=True,
+            encoding="UTF-8", standalone=True,
+        ).decode("utf-8")
+        pieces = re.split(f"{token}:(\\d+):", xml)
+        self._plans[part] = (pieces[0::2], [int(i) for i in pieces[1::2]])
+
+    def render(self, data: dict[str, Any], output: Path) -> set[str]:
+        """Fill every slot from `data`, write `output`; return the keys
+        that did not resolve (left in place as `{{key}}`)."""
+        unresolved: set[str] = set()
+        values: list[str] = []
+        for segments in self._texts:
+            out: list[str] = []
+            for seg in segments:
+                if isinstance(seg, str):
+                    out.append(seg)
+                    continue
+                value = _resolve(data, seg[0])
+                if value is None:
+                    unresolved.add(seg[0])
+                    value = seg[1]
+                out.append(value)
+            values.append(_xml_text("".join(out)))
+        for part, (chunks, order) in self._plans.items():
+            joined = [chunks[0]]
+            for slot, chunk in zip(order, chunks[1:]):
+                joined.append(values[slot])
+                joined.append(chunk)
+            self._pkg.write(part, "".join(joined).encode("utf-8"))
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        self._pkg.save(output)
+        return unresolved
+
+
+def fill_template(template: Path, data: dict[str, Any], output: Path) -> set[str]:
+    """Fill one document. To fill many from the same template, compile
+    it once (`CompiledTemplate`) and call `render` per record."""
+    with CompiledTemplate.compile(template) as compiled:
+        return compiled.render(data, output)
+
+
+# --- --records mode ---------------------------------------------------------
+
+_WORKER_TEMPLATE: CompiledTemplate | None = None
+
+
+def _init_worker(template: Path) -> None:
+    """Pool initializer: compile the template once per worker process."""
+    global _WORKER_TEMPLATE
+    _WORKER_TEMPLATE = CompiledTemplate.compile(template)
+
 
-    output.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(str(output))
+def _render_in_worker(data: dict[str, Any], output: Path) -> set[str]:
+    assert _WORKER_TEMPLATE is not None
+    return _WORKER_TEMPLATE.render(data, output)
+
+
+class RecordError(ValueError):
+    """A --records line is not a JSON object, or cannot be named."""
+
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(f"{message} (line {line})")
+        self.line = line
+
+
+class TemplateOverwriteError(RecordError):
+    """A --records output name resolves to the template itself."""
+
+
+def _same_path(a: Path, b: Path) -> bool:
+    try:
+        return a.resolve(strict=False) == b.resolve(strict=False)
+    except OSError:
+        return a == b
+
+
+def _record_name(record: dict[str, Any], line: int, name_key: str | None,
+                 suffix: str) -> str:
+    if name_key is None:
+        return f"{line:06d}{suffix}"
+    value = _resolve(record, name_key)
+    if not value or value in {".", ".."} or "/" in value or "\\" in value:
+        raise RecordError(
+            line, f"--name-key {name_key!r} must resolve to a plain file "
+                  f"name, got {value!r}",
+        )
+    return value if value.lower().endswith(suffix) else value + suffix
+
+
+def _iter_records(
+    path: Path, out_dir: Path, name_key: str | None, template: Path,
+) -> Iterator[tuple[int, dict[str, Any], Path]]:
+    """Stream (line number, record, output path) from a JSONL file.
+    Blank lines are skipped; duplicate output names, and names that
+    would overwrite the template, are refused."""
+    suffix = template.suffix.lower()
+    names: set[str] = set()
+    with open(path, encoding="utf-8") as fh:
+        for line, text in enumerate(fh, start=1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as exc:
+                raise RecordError(line, f"invalid JSON: {exc}") from None
+            if not isinstance(record, dict):
+                raise RecordError(line, "record must be a JSON object")
+            name = _record_name(record, line, name_key, suffix)
+            if name in names:
+                raise RecordError(line, f"duplicate output name {name!r}")
+            names.add(name)
+            output = out_dir / name
+            if _same_path(output, template):
+                raise TemplateOverwriteError(
+                    line, f"output {name!r} would overwrite the template {template}",
+                )
+            yield line, record, output
+
+
+def fill_records(
+    template: Path,
+    records: Path,
+    out_dir: Path,
+    *,
+    name_key: str | None = None,
+    jobs: int = 1,
+) -> dict[int, set[str]]:
+    """Render one document per JSONL record into `out_dir`.
+
+    The template is compiled once (once per worker with `jobs > 1`);
+    records are streamed, with at most `2 * jobs` in flight. Output
+    files are named by the record's `name_key` value, or by line number
+    (`000001.docx`, …). Returns {line: unresolved keys} for each record
+    that left placeholders unfilled; raises `RecordError` on a bad line
+    and `TemplateOverwriteError` on a name that resolves to the template
+    (documents of the earlier lines are already written).
+    """
+    template = Path(template)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stream = _iter_records(records, out_dir, name_key, template)
+    unresolved: dict[int, set[str]] = {}
+    if jobs <= 1:
+        with CompiledTemplate.compile(template) as compiled:
+            for line, record, output in stream:
+                missing = compiled.render(record, output)
+                if missing:
+                    unresolved[line] = missing
+        return unresolved
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(template,),
+    ) as pool:
+        pending: deque[tuple[int, Future]] = deque()
+        try:
+            for line, record, output in stream:
+                pending.append(
+                    (line, pool.submit(_render_in_worker, record, output))
+                )
+                if len(pending) >= 2 * jobs:
+                    done_line, future = pending.popleft()
+                    missing = future.result()
+                    if missing:
+                        unresolved[done_line] = missing
+            while pending:
+                done_line, future = pending.popleft()
+                missing = future.result()
+                if missing:
+                    unresolved[done_line] = missing
+        finally:
+            for _line, future in pending:
+                future.cancel()
     return unresolved
 
 
+def _jobs_type(value: str) -> int:
+    """Argparse `type=` callable for `--jobs`: a positive integer."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(
+            f"--jobs must be a positive integer; got {value!r}"
+        )
+    return n
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
     parser.add_argument("template", type=Path, help="Source .docx template with {{placeholders}}")
-    parser.add_argument("data", type=Path, help="JSON file with key/value substitutions")
-    parser.add_argument("output", type=Path, help="Destination .docx file")
+    parser.add_argument("data", type=Path, nargs="?",
+                        help="JSON file with key/value substitutions (omit with --records)")
+    parser.add_argument("output", type=Path, nargs="?",
+                        help="Destination .docx file (omit with --records)")
     parser.add_argument(
         "--strict",
         action="store_true",
         help="Exit non-zero if any placeholder remains unresolved (default: warn, continue)",
     )
+    parser.add_argument("--records", type=Path, default=None, metavar="DATA.jsonl",
+                        help="Mail merge: one JSON object per line, one "
+                             "output document per record (needs --out-dir).")
+    parser.add_argument("--out-dir", type=Path, default=None, metavar="DIR",
+                        help="--records output directory (created if missing).")
+    parser.add_argument("--name-key", default=None, metavar="KEY",
+                        help="Dotted key whose value names each --records "
+                             "output file (default: line number, 000001.docx).")
+    parser.add_argument("--jobs", type=_jobs_type, default=1, metavar="N",
+                        help="Render --records in N worker processes, each "
+                             "compiling the template once (default: 1).")
     add_json_errors_argument(parser)
     args = parser.parse_args(argv)
     je = args.json_errors
 
+    records_mode = args.records is not None
+    if records_mode:
+        if args.data is not None or args.output is not None:
+            return report_error(
+                "--records replaces the DATA and OUTPUT positionals",
+                code=2, error_type="UsageError", json_mode=je,
+            )
+        if args.out_dir is None:
+            return report_error(
+                "--records needs --out-dir", code=2,
+                error_type="UsageError", json_mode=je,
+            )
+    else:
+        if args.data is None or args.output is None:
+            return report_error(
+                "DATA and OUTPUT are required (or use --records)",
+                code=2, error_type="UsageError", json_mode=je,
+            )
+        if args.out_dir is not None or args.name_key is not None or args.jobs != 1:
+            return report_error(
+                "--out-dir, --name-key and --jobs only apply to --records",
+                code=2, error_type="UsageError", json_mode=je,
+            )
+
     if not args.template.is_file():
         return report_error(
             f"Template not found: {args.template}",
             code=1, error_type="FileNotFound",
             details={"path": str(args.template)}, json_mode=je,
         )
-    if not args.data.is_file():
+    data_path = args.records if records_mode else args.data
+    if not data_path.is_file():
         return report_error(
-            f"Data file not found: {args.data}",
+            f"Data file not found: {data_path}",
             code=1, error_type="FileNotFound",
-            details={"path": str(args.data)}, json_mode=je,
+            details={"path": str(data_path)}, json_mode=je,
         )
     try:
         assert_not_encrypted(args.template)
@@ -202,6 +533,20 @@ def main(argv: list[str] | None = None) -> int:
             details={"path": str(args.template)}, json_mode=je,
         )
 
+    if records_mode:
+        return _main_records(args, je)
+
+    if _same_path(args.template, args.output):
+        return report_error(
+            f"TEMPLATE and OUTPUT resolve to the same path: "
+            f"{args.template.resolve(strict=False)} (would corrupt the "
+            f"template on a save-time crash)",
+            code=6, error_type="SelfOverwriteRefused",
+            details={"input": str(args.template),
+                     "output": str(args.output)},
+            json_mode=je,
+        )
+
     warn_if_macros_will_be_dropped(args.template, args.output, sys.stderr)
 
     try:
@@ -234,5 +579,49 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+def _main_records(args: argparse.Namespace, je: bool) -> int:
+    """`--records` branch of `main`: render, then report unresolved keys."""
+    try:
+        unresolved = fill_records(
+            args.template, args.records, args.out_dir,
+            name_key=args.name_key, jobs=args.jobs,
+        )
+    except TemplateOverwriteError as exc:
+        return report_error(
+            f"Refusing record in {args.records}: {exc}",
+            code=6, error_type="SelfOverwriteRefused",
+            details={"input": str(args.template),
+                     "path": str(args.records), "line": exc.line},
+            json_mode=je,
+        )
+    except RecordError as exc:
+        return report_error(
+            f"Invalid record in {args.records}: {exc}",
+            code=1, error_type="InvalidJSON",
+            details={"path": str(args.records), "line": exc.line},
+            json_mode=je,
+        )
+    except (ValueError, OSError, etree.XMLSyntaxError) as exc:
+        return report_error(
+            f"fill failed: {exc}", code=1,
+            error_type=type(exc).__name__, json_mode=je,
+        )
+    if unresolved:
+        keys = sorted(set().union(*unresolved.values()))
+        lines = sorted(unresolved)
+        message = (
+            f"Unresolved placeholders in {len(lines)} record(s) "
+            f"(first: line {lines[0]}): {', '.join(keys)}"
+        )
+        if args.strict:
+            return report_error(
+                message, code=1, error_type="UnresolvedPlaceholders",
+                details={"placeholders": keys, "lines": lines},
+                json_mode=je,
+            )
+        print(message, file=sys.stderr)
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -3,14 +3,21 @@
 
 Why direct OOXML editing instead of `python-docx`: python-docx's
 public API does not expose body-tree concatenation across documents
-with style-id remapping. We unpack each input via `office.unpack`,
-append body content from the extras into the base, copy missing
-style definitions, and repack via `office.pack`.
+with style-id remapping. We open each input as an in-memory
+`office.package.Package`, append body content from the extras into
+the base, copy missing style definitions, and save the base once.
+
+Cost is O(total input): `MergeSession` parses each base part the
+merge touches once, keeps it in memory across every extra, and runs
+the rId / bookmark-id / numbering-id counters forward instead of
+rescanning the growing base per extra. Members of the first input
+the merge does not touch are copied raw into the output.
 
 Usage:
     docx_merge.py OUTPUT.docx INPUT1.docx INPUT2.docx [...]
         [--page-break-between]   # insert a page break before each appended doc
         [--no-merge-styles]      # keep base styles only; don't import from extras
+        [--jobs N]               # prepare extras in N worker processes
         [--json-errors]
 
 Honest scope (v1):
@@ -45,10 +52,13 @@ import _venv_bootstrap  # self-bootstrap into scripts/.venv (TASK 019; replicate
 _venv_bootstrap.reexec_into_venv(requires=("docx",), _file=__file__)
 
 import argparse
+import io
 import re
 import sys
-import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from docx.oxml.ns import qn  # type: ignore
 from lxml import etree  # type: ignore
@@ -56,8 +66,7 @@ from lxml import etree  # type: ignore
 from _errors import add_json_errors_argument, report_error
 from office._encryption import EncryptedFileError, assert_not_encrypted
 from office._macros import warn_if_macros_will_be_dropped
-from office.pack import pack
-from office.unpack import unpack
+from office.package import Package, edit_in_place
 
 
 W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
@@ -65,6 +74,13 @@ R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 PR_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
 CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
 
+DOCUMENT_PART = "word/document.xml"
+RELS_PART = "word/_rels/document.xml.rels"
+NUMBERING_PART = "word/numbering.xml"
+STYLES_PART = "word/styles.xml"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+MEDIA_PREFIX = "word/media/"
+
 # Relationship types we DO carry over from extra into base. Anything not
 # listed here (theme, footnotes, header, footer, settings, fontTable,
 # webSettings, styles, numbering — those are merged via dedicated parts
@@ -82,8 +98,8 @@ _MERGEABLE_REL_TYPES = frozenset({
 })
 
 
-def _body(doc_tree: etree._ElementTree) -> etree._Element:
-    body = doc_tree.getroot().find(qn("w:body"))
+def _body(doc_root: etree._Element) -> etree._Element:
+    body = doc_root.find(qn("w:body"))
     if body is None:
         raise RuntimeError("document.xml has no <w:body>")
     return body
@@ -93,7 +109,7 @@ def _section_pr(body: etree._Element) -> etree._Element | None:
     """The trailing `<w:sectPr>` — section properties for the document.
     All appended content goes BEFORE it (otherwise the appended pages
     inherit the prior section break and column layout breaks)."""
-    last = list(body)[-1] if len(body) else None
+    last = body[-1] if len(body) else None
     if last is not None and last.tag == qn("w:sectPr"):
         return last
     return None
@@ -109,36 +125,13 @@ def _make_page_break_paragraph() -> etree._Element:
     return p
 
 
-def _merge_styles(base_styles_path: Path, extra_styles_path: Path) -> int:
-    """Copy `<w:style>` definitions from extra into base when the
-    `w:styleId` is not already present. Returns count of styles
-    appended."""
-    if not base_styles_path.is_file() or not extra_styles_path.is_file():
-        return 0
-    base_tree = etree.parse(str(base_styles_path))
-    extra_tree = etree.parse(str(extra_styles_path))
-    base_root = base_tree.getroot()
-    extra_root = extra_tree.getroot()
-
-    existing = {
-        s.get(qn("w:styleId"))
-        for s in base_root.findall(qn("w:style"))
-        if s.get(qn("w:styleId"))
-    }
-    appended = 0
-    for s in extra_root.findall(qn("w:style")):
-        sid = s.get(qn("w:styleId"))
-        if sid and sid not in existing:
-            base_root.append(_clone(s))
-            existing.add(sid)
-            appended += 1
-    if appended:
-        base_tree.write(str(base_styles_path), xml_declaration=True,
-                        encoding="UTF-8", standalone=True)
-    return appended
-
-
 def _clone(elem: etree._Element) -> etree._Element:
+    """Detached copy carrying every in-scope namespace declaration.
+
+    A plain move would keep only the namespaces the element's own
+    tags and attributes use; prefixes referenced by value
+    (`mc:Ignorable="w14 wp14"`, `mc:Choice Requires="wps"`) must
+    survive the graft into a base root that may not declare them."""
     return etree.fromstring(etree.tostring(elem))
 
 
@@ -155,92 +148,6 @@ def _max_existing_rid(rels_root: etree._Element) -> int:
     return biggest
 
 
-def _copy_extra_media(
-    base_dir: Path, extra_dir: Path, extra_index: int,
-) -> dict[str, str]:
-    """Copy `extra/word/media/*` into `base/word/media/` with a unique
-    prefix per extra to avoid filename collisions across inputs. Return
-    a {old_target_relative: new_target_relative} map keyed by the value
-    we'll find in extra's relationships (`Target="media/..."`)."""
-    src_dir = extra_dir / "word" / "media"
-    if not src_dir.is_dir():
-        return {}
-    dst_dir = base_dir / "word" / "media"
-    dst_dir.mkdir(parents=True, exist_ok=True)
-    rename_map: dict[str, str] = {}
-    for src in sorted(src_dir.iterdir()):
-        if not src.is_file():
-            continue
-        new_name = f"extra{extra_index}_{src.name}"
-        # Loop in the unlikely case of double-merge with the same prefix.
-        n = 1
-        while (dst_dir / new_name).exists():
-            n += 1
-            new_name = f"extra{extra_index}_{n}_{src.name}"
-        dst = dst_dir / new_name
-        dst.write_bytes(src.read_bytes())
-        rename_map[f"media/{src.name}"] = f"media/{new_name}"
-    return rename_map
-
-
-def _merge_relationships(
-    base_rels_path: Path,
-    extra_rels_path: Path,
-    media_rename: dict[str, str],
-    rid_offset: int,
-) -> dict[str, str]:
-    """Append extra's image / hyperlink / chart / OLE relationships to
-    base's `word/_rels/document.xml.rels`. Returns
-    {old_extra_rId: new_rId_in_base} so the caller can rewrite refs in
-    extra's body before the body is grafted into base.
-
-    Non-mergeable rel types (theme, footnotes, header, footer, settings,
-    fontTable, webSettings, styles, numbering) are dropped — those are
-    either base-owned or merged via dedicated passes."""
-    if not extra_rels_path.is_file():
-        return {}
-    extra_tree = etree.parse(str(extra_rels_path))
-    extra_root = extra_tree.getroot()
-
-    base_tree = etree.parse(str(base_rels_path))
-    base_root = base_tree.getroot()
-
-    existing_ids = {
-        rel.get("Id")
-        for rel in base_root.findall(f"{{{PR_NS}}}Relationship")
-        if rel.get("Id")
-    }
-    rid_map: dict[str, str] = {}
-    next_n = rid_offset
-    for rel in extra_root.findall(f"{{{PR_NS}}}Relationship"):
-        rtype = rel.get("Type") or ""
-        if rtype not in _MERGEABLE_REL_TYPES:
-            continue
-        old_id = rel.get("Id") or ""
-        # Compute a fresh Id that doesn't collide with base.
-        next_n += 1
-        new_id = f"rId{next_n}"
-        while new_id in existing_ids:
-            next_n += 1
-            new_id = f"rId{next_n}"
-        existing_ids.add(new_id)
-        rid_map[old_id] = new_id
-
-        new_rel = etree.SubElement(base_root, f"{{{PR_NS}}}Relationship")
-        new_rel.set("Id", new_id)
-        new_rel.set("Type", rtype)
-        target = rel.get("Target") or ""
-        if rtype == f"{R_NS}/image" and target in media_rename:
-            target = media_rename[target]
-        new_rel.set("Target", target)
-        target_mode = rel.get("TargetMode")
-        if target_mode is not None:
-            new_rel.set("TargetMode", target_mode)
-    base_tree.write(str(base_rels_path), xml_declaration=True,
-                    encoding="UTF-8", standalone=True)
-    return rid_map
-
-
 # Attributes whose value is a single rId reference. We rewrite all of
 # them in extra's body via the rid_map. Sourced from ECMA-376 Part 1
 # §17 (WordprocessingML) — `r:embed`, `r:link`, `r:id` are the common
@@ -305,8 +212,8 @@ def _strip_paragraph_section_breaks(body: etree._Element) -> int:
     removed = 0
     # Only paragraph-level sectPr — the body-tail sectPr (if any) is the
     # extra body's whole-document section properties and is dropped via
-    # the existing `if child.tag == qn("w:sectPr"): continue` filter in
-    # merge_into_base.
+    # the `if child.tag == qn("w:sectPr"): continue` filter in
+    # MergeSession.append.
     for ppr in body.iter(qn("w:pPr")):
         sect_pr = ppr.find(qn("w:sectPr"))
         if sect_pr is not None:
@@ -332,260 +239,491 @@ def _remap_bookmark_ids(body: etree._Element, offset: int) -> int:
     return count
 
 
-def _merge_numbering(
-    base_dir: Path, extra_dir: Path, extra_body: etree._Element,
-) -> int:
-    """Merge `<w:abstractNum>` and `<w:num>` from extra's numbering.xml
-    into base's, with abstractNumId / numId offsets applied so extra's
-    list definitions don't collide with base's. References inside
-    extra's body (`<w:numId w:val="N">`) are bumped in-place.
-
-    If base has no numbering.xml but extra does, copy extra's whole
-    numbering.xml into base/word/, add the Override + Relationship.
-    Returns count of `<w:num>` defs appended to base."""
-    extra_path = extra_dir / "word" / "numbering.xml"
-    if not extra_path.is_file():
-        return 0
-    extra_root = etree.parse(str(extra_path)).getroot()
-    extra_nums = extra_root.findall(qn("w:num"))
-    extra_anums = extra_root.findall(qn("w:abstractNum"))
-    if not extra_nums and not extra_anums:
-        return 0
+def _max_int(values: "Iterable[str | None]") -> int:
+    biggest = -1
+    for v in values:
+        try:
+            biggest = max(biggest, int(v))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+    return biggest
+
 
-    base_path = base_dir / "word" / "numbering.xml"
-
-    if not base_path.is_file():
-        # Base has no numbering — we can simply install extra's whole
-        # numbering.xml as base's. We still need to wire it in
-        # [Content_Types].xml + word/_rels/document.xml.rels.
-        base_path.parent.mkdir(parents=True, exist_ok=True)
-        base_path.write_bytes(extra_path.read_bytes())
-        _ensure_numbering_part(base_dir)
-        return len(extra_nums)
-
-    base_root = etree.parse(str(base_path)).getroot()
-
-    base_anum_ids = {
-        a.get(qn("w:abstractNumId"))
-        for a in base_root.findall(qn("w:abstractNum"))
-        if a.get(qn("w:abstractNumId"))
-    }
-    base_num_ids = {
-        n.get(qn("w:numId"))
-        for n in base_root.findall(qn("w:num"))
-        if n.get(qn("w:numId"))
-    }
-
-    def _max_int(strs: set[str]) -> int:
-        biggest = -1
-        for s in strs:
+def _xml_or_none(pkg: "Package | _PreparedExtra", name: str) -> etree._Element | None:
+    """Parsed part, or None when it is missing or not well-formed."""
+    if name not in pkg:
+        return None
+    try:
+        return pkg.xml(name)
+    except etree.XMLSyntaxError:
+        return None
+
+
+class MergeSession:
+    """The base document, held in memory while extras are appended.
+
+    Every base part the merge touches (document body, its rels,
+    numbering, styles, `[Content_Types].xml`) is parsed once. The id
+    counters (rId, bookmark id, abstractNumId / numId) and the name
+    sets (rel Ids, styleIds, media names, Default extensions) run
+    forward across extras rather than being rescanned from the growing
+    base, so each `append` costs O(extra). Parts are only marked dirty
+    — the caller writes the package once, via `base.save(...)`.
+
+    `totals` accumulates the per-extra stats dicts `append` returns.
+    """
+
+    def __init__(
+        self, base: Package, *, page_break_before: bool, merge_styles: bool,
+    ) -> None:
+        if DOCUMENT_PART not in base:
+            raise RuntimeError(
+                "input is not a wordprocessing document (missing "
+                "word/document.xml)"
+            )
+        self.base = base
+        self.page_break_before = page_break_before
+        self.merge_styles = merge_styles
+        self.totals: dict[str, int] = {
+            "body_children": 0, "styles": 0, "media": 0,
+            "rels": 0, "rid_rewrites": 0,
+            "bookmark_rewrites": 0, "numbering": 0,
+            "sectpr_stripped": 0,
+        }
+
+        self._body = _body(base.xml(DOCUMENT_PART))
+        # All appended content goes before base's trailing sectPr.
+        self._sect_pr = _section_pr(self._body)
+        self._bookmark_max = _max_bookmark_id(self._body)
+
+        self._rels = _xml_or_none(base, RELS_PART)
+        self._rel_ids: set[str] = set()
+        self._rid_max = 0
+        if self._rels is not None:
+            self._rel_ids = {
+                rel.get("Id")
+                for rel in self._rels.findall(f"{{{PR_NS}}}Relationship")
+                if rel.get("Id")
+            }
+            self._rid_max = _max_existing_rid(self._rels)
+
+        self._media = {n for n in base.names() if n.startswith(MEDIA_PREFIX)}
+
+        self._ct = _xml_or_none(base, CONTENT_TYPES_PART)
+        self._ct_exts = set() if self._ct is None else {
+            d.get("Extension", "").lower()
+            for d in self._ct.findall(f"{{{CT_NS}}}Default")
+        }
+
+        self._styles: etree._Element | None = None
+        self._style_ids: set[str] = set()
+        if merge_styles:
+            self._styles = _xml_or_none(base, STYLES_PART)
+            if self._styles is not None:
+                self._style_ids = {
+                    s.get(qn("w:styleId"))
+                    for s in self._styles.findall(qn("w:style"))
+                    if s.get(qn("w:styleId"))
+                }
+
+        # Numbering state is loaded on the first extra that has lists.
+        self._numbering: etree._Element | None = None
+        self._anum_max = self._num_max = -1
+        self._first_num: etree._Element | None = None
+        self._last_num: etree._Element | None = None
+        self._num_cleanup: etree._Element | None = None
+
+    def append(
+        self, extra: "Package | _PreparedExtra", extra_index: int,
+    ) -> dict[str, int]:
+        """Append extra's body content into the base with full reference
+        relocation:
+
+        1. Copy `word/media/*` into the base with a unique prefix
+           (`extra<i>_…`) so filename collisions don't overwrite base
+           assets.
+        2. Append extra's image / hyperlink / chart / OLE relationships
+           to base's `document.xml.rels` with fresh rIds; build an
+           old-rId → new-rId map.
+        3. Rewrite extra's body's `r:embed`/`r:link`/`r:id`/diagram refs
+           through the rId map.
+        4. Bump every `<w:bookmarkStart/End w:id>` in extra's body past
+           the highest id in the base so far, to avoid Word's "couldn't
+           read content" diagnostic on duplicate numeric ids.
+        5. Merge `<w:abstractNum>` and `<w:num>` from extra's
+           numbering.xml into base's, with abstractNumId / numId
+           offsets, and rewrite `<w:numId w:val>` references in extra's
+           body in the same pass.
+        6. Append extra's body children into base's body (before base's
+           `<w:sectPr>`), with optional hard page-break.
+        7. Merge missing style definitions if `merge_styles`."""
+        if DOCUMENT_PART not in extra:
+            raise RuntimeError(
+                "input is not a wordprocessing document (missing "
+                "word/document.xml)"
+            )
+        extra_body = _body(extra.xml(DOCUMENT_PART))
+
+        # 1+2. Copy media + extend relationships, getting an rId remap.
+        # Also pull in any missing <Default Extension> entries from extra's
+        # Content_Types so PNG/GIF/etc. media types we just imported have a
+        # MIME mapping (Word's "couldn't read content" diagnostic fires when
+        # a media file has no Default and no Override in [Content_Types].xml).
+        media_rename = self._copy_media(extra, extra_index)
+        if media_rename:
+            self._merge_content_types_defaults(extra)
+        rid_map = self._merge_relationships(extra, media_rename)
+
+        # 3. Strip paragraph-level <w:sectPr> from extra body. Each carries
+        # <w:headerReference>/<w:footerReference> r:id refs to extra's own
+        # header/footer parts which we deliberately don't merge — leaving
+        # them in place makes Word read them as references to base's rels
+        # (different content type) and report "couldn't read content".
+        sectpr_stripped = _strip_paragraph_section_breaks(extra_body)
+
+        # 4. Apply rId remap to extra's body before insertion.
+        rid_rewrites = _remap_rids_in_subtree(extra_body, rid_map)
+
+        # 5. Bump bookmark ids beyond the base's running max.
+        bookmark_rewrites = _remap_bookmark_ids(extra_body, self._bookmark_max + 1)
+        self._bookmark_max = max(self._bookmark_max, _max_bookmark_id(extra_body))
+
+        # 5. Merge numbering definitions and rewrite body numId refs.
+        num_added = self._merge_numbering(extra, extra_body)
+
+        # 6. Graft body children. The extra's own sectPr is skipped.
+        appended = 0
+        grafted = [_clone(c) for c in extra_body if c.tag != qn("w:sectPr")]
+        if self.page_break_before:
+            grafted.insert(0, _make_page_break_paragraph())
+        for child in grafted:
+            if self._sect_pr is not None:
+                self._sect_pr.addprevious(child)
+            else:
+                self._body.append(child)
+            appended += 1
+        self.base.mark_dirty(DOCUMENT_PART)
+
+        # 7. Styles.
+        style_count = self._merge_styles(extra) if self.merge_styles else 0
+
+        stats = {
+            "body_children": appended,
+            "styles": style_count,
+            "media": len(media_rename),
+            "rels": len(rid_map),
+            "rid_rewrites": rid_rewrites,
+            "bookmark_rewrites": bookmark_rewrites,
+            "numbering": num_added,
+            "sectpr_stripped": sectpr_stripped,
+        }
+        for k, v in stats.items():
+            self.totals[k] = self.totals.get(k, 0) + v
+        return stats
+
+    # -- relocation passes -------------------------------------------------
+
+    def _copy_media(self, extra: "Package | _PreparedExtra", extra_index: int) -> dict[str, str]:
+        """Copy extra's `word/media/*` into the base with a unique prefix
+        per extra to avoid filename collisions across inputs. Return a
+        {old_target_relative: new_target_relative} map keyed by the value
+        we'll find in extra's relationships (`Target="media/..."`)."""
+        rename_map: dict[str, str] = {}
+        for name in sorted(extra.names()):
+            if not name.startswith(MEDIA_PREFIX) or "/" in name[len(MEDIA_PREFIX):]:
+                continue
+            leaf = name[len(MEDIA_PREFIX):]
+            new_name = f"extra{extra_index}_{leaf}"
+            # Loop in the unlikely case of double-merge with the same prefix.
+            n = 1
+            while MEDIA_PREFIX + new_name in self._media:
+                n += 1
+                new_name = f"extra{extra_index}_{n}_{leaf}"
+            self._media.add(MEDIA_PREFIX + new_name)
+            self.base.write(MEDIA_PREFIX + new_name, extra.read(name))
+            rename_map[f"media/{leaf}"] = f"media/{new_name}"
+        return rename_map
+
+    def _merge_relationships(
+        self, extra: "Package | _PreparedExtra", media_rename: dict[str, str],
+    ) -> dict[str, str]:
+        """Append extra's image / hyperlink / chart / OLE relationships to
+        base's `word/_rels/document.xml.rels`. Returns
+        {old_extra_rId: new_rId_in_base} so the caller can rewrite refs in
+        extra's body before the body is grafted into base.
+
+        Non-mergeable rel types (theme, footnotes, header, footer, settings,
+        fontTable, webSettings, styles, numbering) are dropped — those are
+        either base-owned or merged via dedicated passes."""
+        extra_root = _xml_or_none(extra, RELS_PART)
+        if extra_root is None:
+            return {}
+        rid_map: dict[str, str] = {}
+        for rel in extra_root.findall(f"{{{PR_NS}}}Relationship"):
+            rtype = rel.get("Type") or ""
+            if rtype not in _MERGEABLE_REL_TYPES:
+                continue
+            old_id = rel.get("Id") or ""
+            new_id = self._next_rid()
+            rid_map[old_id] = new_id
+
+            new_rel = etree.SubElement(self._rels_root(), f"{{{PR_NS}}}Relationship")
+            new_rel.set("Id", new_id)
+            new_rel.set("Type", rtype)
+            target = rel.get("Target") or ""
+            if rtype == f"{R_NS}/image" and target in media_rename:
+                target = media_rename[target]
+            new_rel.set("Target", target)
+            target_mode = rel.get("TargetMode")
+            if target_mode is not None:
+                new_rel.set("TargetMode", target_mode)
+        if rid_map:
+            self.base.mark_dirty(RELS_PART)
+        return rid_map
+
+    def _rels_root(self) -> etree._Element:
+        if self._rels is None:
+            self._rels = etree.Element(
+                f"{{{PR_NS}}}Relationships", nsmap={None: PR_NS},
+            )
+            self.base.set_xml(RELS_PART, self._rels)
+        return self._rels
+
+    def _next_rid(self) -> str:
+        """A fresh `rId<N>` past every numeric rId in the base so far."""
+        self._rid_max += 1
+        while f"rId{self._rid_max}" in self._rel_ids:
+            self._rid_max += 1
+        new_id = f"rId{self._rid_max}"
+        self._rel_ids.add(new_id)
+        return new_id
+
+    def _merge_content_types_defaults(self, extra: "Package | _PreparedExtra") -> int:
+        """Copy `<Default Extension>` entries from extra's `[Content_Types].xml`
+        that don't exist in base. Without this, media files we copy from
+        extra (e.g. .png when base only had .jpeg) have no MIME mapping →
+        Word reports "unreadable content" and refuses to render the image.
+
+        Returns the count of Default entries appended."""
+        extra_root = _xml_or_none(extra, CONTENT_TYPES_PART)
+        if self._ct is None or extra_root is None:
+            return 0
+        appended = 0
+        for d in extra_root.findall(f"{{{CT_NS}}}Default"):
+            ext = (d.get("Extension") or "").lower()
+            if ext and ext not in self._ct_exts:
+                new = etree.SubElement(self._ct, f"{{{CT_NS}}}Default")
+                new.set("Extension", d.get("Extension") or ext)
+                new.set("ContentType", d.get("ContentType") or "")
+                self._ct_exts.add(ext)
+                appended += 1
+        if appended:
+            self.base.mark_dirty(CONTENT_TYPES_PART)
+        return appended
+
+    def _load_numbering(self) -> etree._Element:
+        if self._numbering is None:
+            root = self.base.xml(NUMBERING_PART)
+            self._anum_max = _max_int(
+                a.get(qn("w:abstractNumId")) for a in root.findall(qn("w:abstractNum"))
+            )
+            nums = root.findall(qn("w:num"))
+            self._num_max = _max_int(n.get(qn("w:numId")) for n in nums)
+            self._first_num = nums[0] if nums else None
+            self._last_num = nums[-1] if nums else None
+            self._num_cleanup = root.find(qn("w:numIdMacAtCleanup"))
+            self._numbering = root
+        return self._numbering
+
+    def _merge_numbering(
+        self, extra: "Package | _PreparedExtra", extra_body: etree._Element,
+    ) -> int:
+        """Merge `<w:abstractNum>` and `<w:num>` from extra's numbering.xml
+        into base's, with abstractNumId / numId offsets applied so extra's
+        list definitions don't collide with base's. References inside
+        extra's body (`<w:numId w:val="N">`) are bumped in-place.
+
+        If base has no numbering.xml but extra does, install extra's whole
+        numbering.xml as base's and add the Override + Relationship.
+        Returns count of `<w:num>` defs appended to base."""
+        extra_root = _xml_or_none(extra, NUMBERING_PART)
+        if extra_root is None:
+            return 0
+        extra_nums = extra_root.findall(qn("w:num"))
+        extra_anums = extra_root.findall(qn("w:abstractNum"))
+        if not extra_nums and not extra_anums:
+            return 0
+
+        if NUMBERING_PART not in self.base:
+            # Base has no numbering — we can simply install extra's whole
+            # numbering.xml as base's. We still need to wire it in
+            # [Content_Types].xml + word/_rels/document.xml.rels.
+            self.base.write(NUMBERING_PART, extra.read(NUMBERING_PART))
+            self._ensure_numbering_part()
+            return len(extra_nums)
+
+        root = self._load_numbering()
+        anum_offset = self._anum_max + 1
+        num_offset = self._num_max + 1
+
+        # ECMA-376 §17.9.20 element order: every <w:abstractNum> MUST
+        # precede every <w:num>, and <w:numIdMacAtCleanup> is the optional
+        # tail. Naïve `.append()` on the root puts new abstractNums AFTER
+        # base's existing nums → schema violation → Word auto-repairs at
+        # open time, and during the repair pass it may rebind base's list
+        # references to the wrong abstract definitions (observed: base's
+        # headings rendered as bulleted "o" markers post-repair).
+        #
+        # Fix: insert each new abstractNum right BEFORE the first <w:num>,
+        # and each new <w:num> right AFTER the last <w:num> but before
+        # <w:numIdMacAtCleanup>. The anchors are kept across extras.
+        for a in extra_anums:
+            try:
+                new = int(a.get(qn("w:abstractNumId"))) + anum_offset
+            except (TypeError, ValueError):
+                continue
+            a = _clone(a)
+            a.set(qn("w:abstractNumId"), str(new))
+            self._anum_max = max(self._anum_max, new)
+            if self._first_num is not None:
+                self._first_num.addprevious(a)
+            elif self._num_cleanup is not None:
+                self._num_cleanup.addprevious(a)
+            else:
+                root.append(a)
+
+        appended = 0
+        num_id_remap: dict[str, str] = {}
+        for n in extra_nums:
+            old_num = n.get(qn("w:numId"))
+            anum_ref = n.find(qn("w:abstractNumId"))
+            if old_num is None or anum_ref is None:
+                continue
             try:
-                biggest = max(biggest, int(s))
+                new_num = int(old_num) + num_offset
+                new_anum_ref = int(anum_ref.get(qn("w:val"), "")) + anum_offset
             except ValueError:
                 continue
-        return biggest
-
-    anum_offset = _max_int(base_anum_ids) + 1
-    num_offset = _max_int(base_num_ids) + 1
-
-    # ECMA-376 §17.9.20 element order: every <w:abstractNum> MUST
-    # precede every <w:num>, and <w:numIdMacAtCleanup> is the optional
-    # tail. Naïve `.append()` on the root puts new abstractNums AFTER
-    # base's existing nums → schema violation → Word auto-repairs at
-    # open time, and during the repair pass it may rebind base's list
-    # references to the wrong abstract definitions (observed: base's
-    # headings rendered as bulleted "o" markers post-repair).
-    #
-    # Fix: insert each new abstractNum BEFORE the first base <w:num>,
-    # and each new <w:num> right AFTER the last base <w:num> but
-    # before <w:numIdMacAtCleanup>.
-    children = list(base_root)
-    first_num_idx = next(
-        (i for i, c in enumerate(children) if c.tag == qn("w:num")),
-        len(children),
-    )
-    cleanup_idx = next(
-        (i for i, c in enumerate(children)
-         if c.tag == qn("w:numIdMacAtCleanup")),
-        None,
-    )
-    last_num_idx = max(
-        (i for i, c in enumerate(children) if c.tag == qn("w:num")),
-        default=first_num_idx - 1,
-    )
-    # Where to insert new <w:num>: right after the last existing num,
-    # which is also (when cleanup exists) right before cleanup.
-    num_insert_idx = (cleanup_idx if cleanup_idx is not None
-                      else last_num_idx + 1)
-
-    # Pass 1: insert abstractNum defs at first_num_idx, advancing as we
-    # go so each new one lands AFTER the previous insertion (preserving
-    # extra's relative order and keeping all of them before any <w:num>).
-    insert_at = first_num_idx
-    for a in extra_anums:
-        old = a.get(qn("w:abstractNumId"))
-        try:
-            new = int(old) + anum_offset
-        except (TypeError, ValueError):
-            continue
-        cloned = _clone(a)
-        cloned.set(qn("w:abstractNumId"), str(new))
-        base_root.insert(insert_at, cloned)
-        insert_at += 1
-        # Each insert before first_num_idx pushes num_insert_idx right.
-        num_insert_idx += 1
-
-    # Pass 2: insert num defs at num_insert_idx with both id-shifts.
-    appended = 0
-    num_id_remap: dict[str, str] = {}
-    for n in extra_nums:
-        old_num = n.get(qn("w:numId"))
-        anum_ref = n.find(qn("w:abstractNumId"))
-        if old_num is None or anum_ref is None:
-            continue
-        try:
-            new_num = int(old_num) + num_offset
-            new_anum_ref = int(anum_ref.get(qn("w:val"), "")) + anum_offset
-        except ValueError:
-            continue
-        cloned = _clone(n)
-        cloned.set(qn("w:numId"), str(new_num))
-        cloned.find(qn("w:abstractNumId")).set(qn("w:val"), str(new_anum_ref))
-        base_root.insert(num_insert_idx, cloned)
-        num_insert_idx += 1
-        num_id_remap[old_num] = str(new_num)
-        appended += 1
-
-    # Pass 3: rewrite extra's body's `<w:numId w:val="N">` references.
-    for num_id_el in extra_body.iter(qn("w:numId")):
-        old = num_id_el.get(qn("w:val"))
-        if old in num_id_remap:
-            num_id_el.set(qn("w:val"), num_id_remap[old])
-
-    # Persist
-    base_tree = etree.ElementTree(base_root)
-    base_tree.write(str(base_path), xml_declaration=True,
-                    encoding="UTF-8", standalone=True)
-    return appended
-
-
-def _merge_content_types_defaults(
-    base_dir: Path, extra_dir: Path,
-) -> int:
-    """Copy `<Default Extension>` entries from extra's `[Content_Types].xml`
-    that don't exist in base. Without this, media files we copy from
-    extra (e.g. .png when base only had .jpeg) have no MIME mapping →
-    Word reports "unreadable content" and refuses to render the image.
-
-    Returns the count of Default entries appended."""
-    base_ct_path = base_dir / "[Content_Types].xml"
-    extra_ct_path = extra_dir / "[Content_Types].xml"
-    if not base_ct_path.is_file() or not extra_ct_path.is_file():
-        return 0
-    base_tree = etree.parse(str(base_ct_path))
-    extra_tree = etree.parse(str(extra_ct_path))
-    base_root = base_tree.getroot()
-    extra_root = extra_tree.getroot()
-
-    base_exts = {
-        d.get("Extension", "").lower()
-        for d in base_root.findall(f"{{{CT_NS}}}Default")
-    }
-    appended = 0
-    for d in extra_root.findall(f"{{{CT_NS}}}Default"):
-        ext = (d.get("Extension") or "").lower()
-        if ext and ext not in base_exts:
-            new = etree.SubElement(base_root, f"{{{CT_NS}}}Default")
-            new.set("Extension", d.get("Extension") or ext)
-            new.set("ContentType", d.get("ContentType") or "")
-            base_exts.add(ext)
+            n = _clone(n)
+            n.set(qn("w:numId"), str(new_num))
+            n.find(qn("w:abstractNumId")).set(qn("w:val"), str(new_anum_ref))
+            self._num_max = max(self._num_max, new_num)
+            if self._num_cleanup is not None:
+                self._num_cleanup.addprevious(n)
+            elif self._last_num is not None:
+                self._last_num.addnext(n)
+            else:
+                root.append(n)
+            self._last_num = n
+            if self._first_num is None:
+                self._first_num = n
+            num_id_remap[old_num] = str(new_num)
             appended += 1
-    if appended:
-        base_tree.write(str(base_ct_path), xml_declaration=True,
-                        encoding="UTF-8", standalone=True)
-    return appended
-
-
-def _ensure_numbering_part(base_dir: Path) -> None:
-    """Wire word/numbering.xml into [Content_Types].xml + document
-    relationships, idempotently. Mirrors docx_add_comment's
-    _ensure_content_type / _ensure_relationship pattern."""
-    ct_path = base_dir / "[Content_Types].xml"
-    if ct_path.is_file():
-        ct_tree = etree.parse(str(ct_path))
-        ct_root = ct_tree.getroot()
-        if not any(o.get("PartName") == "/word/numbering.xml"
-                   for o in ct_root.findall(f"{{{CT_NS}}}Override")):
-            ovr = etree.SubElement(ct_root, f"{{{CT_NS}}}Override")
-            ovr.set("PartName", "/word/numbering.xml")
+
+        # Rewrite extra's body's `<w:numId w:val="N">` references.
+        for num_id_el in extra_body.iter(qn("w:numId")):
+            old = num_id_el.get(qn("w:val"))
+            if old in num_id_remap:
+                num_id_el.set(qn("w:val"), num_id_remap[old])
+
+        self.base.mark_dirty(NUMBERING_PART)
+        return appended
+
+    def _ensure_numbering_part(self) -> None:
+        """Wire word/numbering.xml into [Content_Types].xml + document
+        relationships, idempotently. Mirrors docx_add_comment's
+        _ensure_content_type / _ensure_relationship pattern."""
+        if self._ct is not None and not any(
+            o.get("PartName") == "/" + NUMBERING_PART
+            for o in self._ct.findall(f"{{{CT_NS}}}Override")
+        ):
+            ovr = etree.SubElement(self._ct, f"{{{CT_NS}}}Override")
+            ovr.set("PartName", "/" + NUMBERING_PART)
             ovr.set("ContentType",
                     "application/vnd.openxmlformats-officedocument."
                     "wordprocessingml.numbering+xml")
-            ct_tree.write(str(ct_path), xml_declaration=True,
-                          encoding="UTF-8", standalone=True)
+            self.base.mark_dirty(CONTENT_TYPES_PART)
 
-    rels_path = base_dir / "word" / "_rels" / "document.xml.rels"
-    if rels_path.is_file():
-        rels_tree = etree.parse(str(rels_path))
-        rels_root = rels_tree.getroot()
         rtype = f"{R_NS}/numbering"
-        if not any(r.get("Type") == rtype
-                   for r in rels_root.findall(f"{{{PR_NS}}}Relationship")):
-            existing = {
-                r.get("Id")
-                for r in rels_root.findall(f"{{{PR_NS}}}Relationship")
-            }
+        if self._rels is not None and not any(
+            r.get("Type") == rtype
+            for r in self._rels.findall(f"{{{PR_NS}}}Relationship")
+        ):
             n = 1
-            while f"rId{n}" in existing:
+            while f"rId{n}" in self._rel_ids:
                 n += 1
-            new = etree.SubElement(rels_root,
-                                   f"{{{PR_NS}}}Relationship")
+            self._rel_ids.add(f"rId{n}")
+            self._rid_max = max(self._rid_max, n)
+            new = etree.SubElement(self._rels, f"{{{PR_NS}}}Relationship")
             new.set("Id", f"rId{n}")
             new.set("Type", rtype)
             new.set("Target", "numbering.xml")
-            rels_tree.write(str(rels_path), xml_declaration=True,
-                            encoding="UTF-8", standalone=True)
-
-
-def _count_children(path: Path, child_local_name: str) -> int:
-    """Count direct children of an XML root with the given w:-namespaced
-    local name. Returns 0 if the file is missing or unparseable."""
-    if not path.is_file():
-        return 0
-    try:
-        root = etree.parse(str(path)).getroot()
-    except etree.XMLSyntaxError:
+            self.base.mark_dirty(RELS_PART)
+
+    def _merge_styles(self, extra: "Package | _PreparedExtra") -> int:
+        """Copy `<w:style>` definitions from extra into base when the
+        `w:styleId` is not already present. Returns count of styles
+        appended."""
+        extra_root = _xml_or_none(extra, STYLES_PART)
+        if self._styles is None or extra_root is None:
+            return 0
+        appended = 0
+        for s in extra_root.findall(qn("w:style")):
+            sid = s.get(qn("w:styleId"))
+            if sid and sid not in self._style_ids:
+                self._styles.append(_clone(s))
+                self._style_ids.add(sid)
+                appended += 1
+        if appended:
+            self.base.mark_dirty(STYLES_PART)
+        return appended
+
+
+def _count_children(pkg: Package, name: str, child_local_name: str) -> int:
+    """Count direct children of an XML part's root with the given
+    w:-namespaced local name. Returns 0 if the part is missing or
+    unparseable."""
+    root = _xml_or_none(pkg, name)
+    if root is None:
         return 0
     return len(root.findall(qn(f"w:{child_local_name}")))
 
 
+def _has_word_parts(pkg: Package, stem: str) -> bool:
+    """Whether `word/<stem>*.xml` exists (headers, footers)."""
+    prefix = f"word/{stem}"
+    return any(
+        n.startswith(prefix) and n.endswith(".xml") and n.count("/") == 1
+        for n in pkg.names()
+    )
+
+
 def _warn_unsupported_parts(
-    extra_root: Path, label: str, stderr: object,
+    extra: Package, label: str, stderr: object,
 ) -> None:
     """Warn only for parts that actually carry user content AND are
     NOT handled by the iter-2 reloc passes (media + relationships +
     numbering + bookmark ids are merged; footnotes / endnotes /
     headers / footers / comments are still v1-honest-scope drops)."""
-    word = extra_root / "word"
     flags = []
 
     # footnotes.xml: Word ships 2 boilerplate footnotes (separator +
     # continuation-separator), id 0 and 1. Real footnotes start at id 2.
-    if _count_children(word / "footnotes.xml", "footnote") > 2:
+    if _count_children(extra, "word/footnotes.xml", "footnote") > 2:
         flags.append("footnotes.xml (only base file's footnotes kept)")
-    if _count_children(word / "endnotes.xml", "endnote") > 2:
+    if _count_children(extra, "word/endnotes.xml", "endnote") > 2:
         flags.append("endnotes.xml (only base file's endnotes kept)")
 
     # comments.xml: empty container ships routinely; only warn if it
     # actually contains comments.
-    if _count_children(word / "comments.xml", "comment") > 0:
+    if _count_children(extra, "word/comments.xml", "comment") > 0:
         flags.append("comments.xml (id-collision risk; not merged)")
 
     # Headers/footers are per-section and have their own rels graph;
     # we don't try to merge them in v2.
-    if any(word.glob("header*.xml")):
+    if _has_word_parts(extra, "header"):
         flags.append("headers (only base file's headers kept)")
-    if any(word.glob("footer*.xml")):
+    if _has_word_parts(extra, "footer"):
         flags.append("footers (only base file's footers kept)")
 
     if flags:
@@ -594,6 +732,122 @@ def _warn_unsupported_parts(
               file=stderr)
 
 
+# Hardened XML parser for `_PreparedExtra` — same settings as
+# office.package (no entities, no network, no DTD; CWE-611).
+_SAFE_PARSER = etree.XMLParser(
+    resolve_entities=False, no_network=True, load_dtd=False,
+)
+
+# Parts `MergeSession.append` reads from an extra, besides word/media/*.
+_APPEND_PARTS = frozenset({
+    DOCUMENT_PART, RELS_PART, NUMBERING_PART, STYLES_PART,
+    CONTENT_TYPES_PART,
+})
+
+
+class _PreparedExtra:
+    """One extra as a `--jobs` worker hands it back: the parts
+    `MergeSession.append` reads, as bytes, behind the read side of
+    `Package` (`names`, `in`, `read`, `xml`)."""
+
+    def __init__(self, parts: dict[str, bytes]) -> None:
+        self._parts = parts
+        self._trees: dict[str, etree._Element] = {}
+
+    def names(self) -> list[str]:
+        return list(self._parts)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._parts
+
+    def read(self, name: str) -> bytes:
+        return self._parts[name]
+
+    def xml(self, name: str) -> etree._Element:
+        root = self._trees.get(name)
+        if root is None:
+            root = self._trees[name] = etree.fromstring(self._parts[name], _SAFE_PARSER)
+        return root
+
+
+def _prepare_extra(path: Path) -> tuple[dict[str, bytes], str]:
+    """`--jobs` worker: unzip one extra, run the docx helpers (run merge,
+    redline simplification) on its body and collect the parts the
+    parent's `append` needs, plus the unsupported-part warning text.
+
+    Everything that depends on earlier inputs (rId, bookmark and
+    numbering offsets, media names) stays in the parent, which applies
+    it in input order — so the output is the serial run's, byte for
+    byte."""
+    warnings = io.StringIO()
+    with Package.open(path, apply_docx_helpers=True) as extra:
+        _warn_unsupported_parts(extra, str(path), warnings)
+        parts = {
+            name: extra.read(name) for name in extra.names()
+            if name in _APPEND_PARTS or name.startswith(MEDIA_PREFIX)
+        }
+    return parts, warnings.getvalue()
+
+
+def _iter_extras(
+    paths: "list[Path]", jobs: int, stderr: object,
+) -> "Iterator[Package | _PreparedExtra]":
+    """Yield the extras in input order, each after its warnings are
+    printed. With `jobs > 1` they are prepared `jobs` at a time in a
+    process pool; at most `2 * jobs` prepared extras wait in memory."""
+    if jobs <= 1 or len(paths) < 2:
+        for path in paths:
+            with Package.open(path, apply_docx_helpers=True) as extra:
+                _warn_unsupported_parts(extra, str(path), stderr)
+                yield extra
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        pending: deque[Future] = deque(
+            pool.submit(_prepare_extra, path) for path in paths[:2 * jobs]
+        )
+        queued = len(pending)
+        try:
+            while pending:
+                parts, warnings = pending.popleft().result()
+                if queued < len(paths):
+                    pending.append(pool.submit(_prepare_extra, paths[queued]))
+                    queued += 1
+                if warnings:
+                    print(warnings, end="", file=stderr)
+                yield _PreparedExtra(parts)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def merge_files(
+    inputs: "list[Path]",
+    output: Path,
+    *,
+    page_break_before: bool,
+    merge_styles: bool,
+    stderr: object = None,
+    jobs: int = 1,
+) -> dict[str, int]:
+    """Merge `inputs` (the first is the base) into `output` in one pass.
+
+    The base stays in memory for the whole run; each extra is opened,
+    appended and released in turn, and `output` is written once.
+    `jobs > 1` prepares the extras in that many worker processes
+    (`_prepare_extra`); the appends still run in input order here.
+    Returns the accumulated `MergeSession.totals`."""
+    stderr = sys.stderr if stderr is None else stderr
+    with Package.open(inputs[0], apply_docx_helpers=True) as base:
+        session = MergeSession(
+            base, page_break_before=page_break_before,
+            merge_styles=merge_styles,
+        )
+        for i, extra in enumerate(_iter_extras(inputs[1:], jobs, stderr), start=1):
+            session.append(extra, i)
+        base.save(output)
+    return session.totals
+
+
 def merge_into_base(
     base_dir: Path,
     extra_dir: Path,
@@ -602,116 +856,29 @@ def merge_into_base(
     page_break_before: bool,
     merge_styles: bool,
 ) -> dict[str, int]:
-    """Append extra's body content into base's `word/document.xml`
-    with full reference relocation:
-
-    1. Copy `extra/word/media/*` into `base/word/media/` with a unique
-       prefix (`extra<i>_…`) so filename collisions don't overwrite
-       base assets.
-    2. Append extra's image / hyperlink / chart / OLE relationships to
-       base's `document.xml.rels` with rId-shifted ids; build an
-       old-rId → new-rId map.
-    3. Rewrite extra's body's `r:embed`/`r:link`/`r:id`/diagram refs
-       through the rId map BEFORE the body is grafted into base.
-    4. Bump every `<w:bookmarkStart/End w:id>` in extra's body by
-       `max_existing_in_base + 1` to avoid Word's "couldn't read
-       content" diagnostic on duplicate numeric ids.
-    5. Merge `<w:abstractNum>` and `<w:num>` from extra's numbering.xml
-       into base's, with abstractNumId / numId offsets, and rewrite
-       `<w:numId w:val>` references in extra's body in the same pass.
-    6. Append extra's body children into base's body (before
-       base's `<w:sectPr>`), with optional hard page-break.
-    7. Merge missing style definitions if `merge_styles`."""
-    base_doc_path = base_dir / "word" / "document.xml"
-    extra_doc_path = extra_dir / "word" / "document.xml"
-    if not base_doc_path.is_file() or not extra_doc_path.is_file():
-        raise RuntimeError(
-            "input is not a wordprocessing document (missing "
-            "word/document.xml)"
+    """Append one unpacked extra tree into an unpacked base tree, in
+    place. Library form of a single `MergeSession.append`; to merge
+    many documents, use `merge_files` (or one `MergeSession`) so the
+    base is parsed and written once rather than once per extra."""
+    with edit_in_place(base_dir) as base, Package.open(extra_dir) as extra:
+        session = MergeSession(
+            base, page_break_before=page_break_before,
+            merge_styles=merge_styles,
         )
+        return session.append(extra, extra_index)
 
-    base_tree = etree.parse(str(base_doc_path))
-    extra_tree = etree.parse(str(extra_doc_path))
-
-    base_body = _body(base_tree)
-    extra_body = _body(extra_tree)
-
-    # 1+2. Copy media + extend relationships, getting an rId remap.
-    # Also pull in any missing <Default Extension> entries from extra's
-    # Content_Types so PNG/GIF/etc. media types we just imported have a
-    # MIME mapping (Word's "couldn't read content" diagnostic fires when
-    # a media file has no Default and no Override in [Content_Types].xml).
-    base_rels_path = base_dir / "word" / "_rels" / "document.xml.rels"
-    extra_rels_path = extra_dir / "word" / "_rels" / "document.xml.rels"
-    media_rename = _copy_extra_media(base_dir, extra_dir, extra_index)
-    if media_rename:
-        _merge_content_types_defaults(base_dir, extra_dir)
-    base_rels_root = etree.parse(str(base_rels_path)).getroot() \
-        if base_rels_path.is_file() else None
-    rid_offset = _max_existing_rid(base_rels_root) if base_rels_root is not None else 0
-    rid_map = _merge_relationships(
-        base_rels_path, extra_rels_path, media_rename, rid_offset,
-    )
 
-    # 3. Strip paragraph-level <w:sectPr> from extra body. Each carries
-    # <w:headerReference>/<w:footerReference> r:id refs to extra's own
-    # header/footer parts which we deliberately don't merge — leaving
-    # them in place makes Word read them as references to base's rels
-    # (different content type) and report "couldn't read content".
-    sectpr_stripped = _strip_paragraph_section_breaks(extra_body)
-
-    # 4. Apply rId remap to the in-memory extra body before insertion.
-    rid_rewrites = _remap_rids_in_subtree(extra_body, rid_map)
-
-    # 5. Bump bookmark ids beyond base's max to avoid duplicates.
-    bookmark_offset = _max_bookmark_id(base_body) + 1
-    bookmark_rewrites = _remap_bookmark_ids(extra_body, bookmark_offset)
-
-    # 5. Merge numbering definitions and rewrite body numId refs.
-    num_added = _merge_numbering(base_dir, extra_dir, extra_body)
-
-    # 6. Graft body children. The extra's own sectPr is skipped.
-    sect_pr = _section_pr(base_body)
-    insert_before = sect_pr if sect_pr is not None else None
-    appended = 0
-    if page_break_before:
-        pb = _make_page_break_paragraph()
-        if insert_before is not None:
-            insert_before.addprevious(pb)
-        else:
-            base_body.append(pb)
-        appended += 1
-    for child in list(extra_body):
-        if child.tag == qn("w:sectPr"):
-            continue
-        cloned = _clone(child)
-        if insert_before is not None:
-            insert_before.addprevious(cloned)
-        else:
-            base_body.append(cloned)
-        appended += 1
-
-    base_tree.write(str(base_doc_path), xml_declaration=True,
-                    encoding="UTF-8", standalone=True)
-
-    # 7. Styles.
-    style_count = 0
-    if merge_styles:
-        style_count = _merge_styles(
-            base_dir / "word" / "styles.xml",
-            extra_dir / "word" / "styles.xml",
+def _jobs_type(value: str) -> int:
+    """Argparse `type=` callable for `--jobs`: a positive integer."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(
+            f"--jobs must be a positive integer; got {value!r}"
         )
-
-    return {
-        "body_children": appended,
-        "styles": style_count,
-        "media": len(media_rename),
-        "rels": len(rid_map),
-        "rid_rewrites": rid_rewrites,
-        "bookmark_rewrites": bookmark_rewrites,
-        "numbering": num_added,
-        "sectpr_stripped": sectpr_stripped,
-    }
+    return n
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -729,6 +896,11 @@ def main(argv: list[str] | None = None) -> int:
                         help="Skip copying missing style definitions "
                              "from later inputs into the base. Useful "
                              "when you want strict base-only styling.")
+    parser.add_argument("--jobs", type=_jobs_type, default=1, metavar="N",
+                        help="Unzip and normalise the extras in N worker "
+                             "processes (default: 1 = serial). Appending "
+                             "still happens in input order; the output is "
+                             "byte-identical to the serial run.")
     add_json_errors_argument(parser)
     args = parser.parse_args(argv)
     je = args.json_errors
@@ -786,30 +958,13 @@ def main(argv: list[str] | None = None) -> int:
     warn_if_macros_will_be_dropped(args.inputs[0], args.output, sys.stderr)
 
     try:
-        with tempfile.TemporaryDirectory(prefix="docx_merge-") as td:
-            tdp = Path(td)
-            base_dir = tdp / "base"
-            unpack(args.inputs[0], base_dir)
-
-            totals = {
-                "body_children": 0, "styles": 0, "media": 0,
-                "rels": 0, "rid_rewrites": 0,
-                "bookmark_rewrites": 0, "numbering": 0,
-            }
-            for i, extra in enumerate(args.inputs[1:], start=1):
-                extra_dir = tdp / f"extra_{i}"
-                unpack(extra, extra_dir)
-                _warn_unsupported_parts(extra_dir, str(extra), sys.stderr)
-                stats = merge_into_base(
-                    base_dir, extra_dir, extra_index=i,
-                    page_break_before=args.page_break_between,
-                    merge_styles=not args.no_merge_styles,
-                )
-                for k, v in stats.items():
-                    totals[k] = totals.get(k, 0) + v
-
-            pack(base_dir, args.output)
-    except (RuntimeError, ValueError, OSError) as exc:
+        totals = merge_files(
+            args.inputs, args.output,
+            page_break_before=args.page_break_between,
+            merge_styles=not args.no_merge_styles,
+            jobs=args.jobs,
+        )
+    except (RuntimeError, ValueError, OSError, etree.XMLSyntaxError) as exc:
         return report_error(
             f"merge failed: {exc}", code=1,
             error_type=type(exc).__name__, json_mode=je,
@@ -12,6 +12,11 @@ empty <w:body> — the last body paragraph is never deleted (R10.c).
 
 UC-4 (--unpacked-dir): library mode — operate on an already-unpacked tree.
 Lands in task-006-07b.
+
+UC-5 (--batch FILE.json): apply a list of replace / delete-paragraph
+actions in order over one parse of the document, then write once.
+The parts are indexed for all anchors up front (`_actions._do_batch`),
+so 1,000 edits do not cost 1,000 full-document scans + re-packs.
 """
 from __future__ import annotations
 
@@ -21,9 +26,9 @@ _venv_bootstrap.reexec_into_venv(requires=("lxml",), _file=__file__)
 import argparse
 import contextlib
 import errno
+import multiprocessing
 import os
 import shutil
-import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -44,19 +49,24 @@ from _app_errors import (
     SelfOverwriteRefused,
 )
 from _actions import (
+    _do_batch,
     _do_replace,
     _materialise_md_source,
     _extract_insert_paragraphs,
     _do_insert_after,
     _do_delete_paragraph,
     _iter_searchable_parts,
+    _load_batch,
     _deep_clone,
     _safe_remove_paragraph,
     _WP_CONTENT_TYPES,
     _fallback_glob_parts,
 )
 from office.unpack import unpack  # type: ignore
-from office.pack import pack  # type: ignore
+from office.package import Package  # type: ignore
+from office.validate import (  # type: ignore
+    exit_code as validate_exit_code, format_report, validate_file,
+)
 from office._encryption import assert_not_encrypted, EncryptedFileError  # type: ignore
 from office._macros import warn_if_macros_will_be_dropped  # type: ignore
 
@@ -161,38 +171,103 @@ def _post_validate_enabled() -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def _run_post_validate(output: Path, scripts_dir: Path) -> None:
-    """subprocess.run([sys.executable, '-m', 'office.validate', OUTPUT]).
-    Non-zero → unlink(output); raise PostValidateFailed (exit 7).
+_POST_VALIDATE_TIMEOUT = 60  # seconds per OUTPUT
+
+# (process, parent end of its pipe) of the long-lived validator worker.
+_VALIDATE_WORKER: tuple[multiprocessing.Process, object] | None = None
 
-    Subprocess uses cwd=output.parent (known-clean tmpdir we own; Security
-    follow-up post-VDD-Multi) + PYTHONPATH=scripts_dir so `office.validate`
-    resolves from the codebase, not from whatever cwd the user invoked us
-    in. Mitigates the MED-Security finding about a too-broad cwd."""
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(scripts_dir) + os.pathsep + env.get("PYTHONPATH", "")
+
+def _serve_validate(conn) -> None:
+    """Worker loop: validate each path received, send back
+    ("ok", report) or ("error", message). Runs until the pipe closes."""
+    while True:
+        try:
+            path = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send(("ok", validate_file(Path(path))))
+        except Exception as exc:  # noqa: BLE001 — reported, worker lives on
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+def _stop_validate_worker() -> None:
+    global _VALIDATE_WORKER
+    if _VALIDATE_WORKER is None:
+        return
+    proc, conn = _VALIDATE_WORKER
+    _VALIDATE_WORKER = None
+    conn.close()
+    if proc.is_alive():
+        proc.kill()
+    proc.join()
+
+
+def _validate_in_worker(output: Path, timeout: float) -> tuple[str, object]:
+    """validate_file(output) in a child process, bounded by `timeout`.
+
+    Returns ("ok", report), ("error", message) for a validator exception
+    or a dead worker, or ("timeout", None). The worker is kept between
+    calls so its compiled-schema cache stays warm; a worker that timed
+    out or died is killed and replaced on the next call. `fork` is
+    preferred so the child needs no re-import of this CLI."""
+    global _VALIDATE_WORKER
+    if _VALIDATE_WORKER is None or not _VALIDATE_WORKER[0].is_alive():
+        _stop_validate_worker()
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        parent, child = ctx.Pipe()
+        proc = ctx.Process(target=_serve_validate, args=(child,), daemon=True)
+        proc.start()
+        child.close()
+        _VALIDATE_WORKER = (proc, parent)
+    proc, conn = _VALIDATE_WORKER
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "office.validate", str(output)],
-            shell=False, timeout=60, capture_output=True, text=True,
-            cwd=str(output.parent),
-            env=env,
-        )
-    except subprocess.TimeoutExpired:
+        conn.send(str(output))
+        if not conn.poll(timeout):
+            _stop_validate_worker()
+            return "timeout", None
+        return conn.recv()
+    except (EOFError, OSError):
+        _stop_validate_worker()
+        return "error", f"validator worker exited (code {proc.exitcode})"
+
+
+def _run_post_validate(output: Path) -> None:
+    """office.validate.validate_file(OUTPUT) in a worker process, with a
+    `_POST_VALIDATE_TIMEOUT` deadline.
+    Errors → unlink(output); raise PostValidateFailed (exit 7).
+
+    Same verdict as `python -m office.validate OUTPUT` (non-strict)
+    without the interpreter + schema start-up per call (the worker is
+    reused); `details["stderr"]` carries the CLI's text report. A
+    validator crash (reason "validator-error") or overrun (reason
+    "timeout", worker killed) fails the gate the same way and never
+    touches this process's state."""
+    status, payload = _validate_in_worker(output, _POST_VALIDATE_TIMEOUT)
+    if status != "ok":
         unlink_err = _try_unlink(output)
-        details = {"output": str(output), "reason": "timeout"}
+        if status == "timeout":
+            details = {"output": str(output), "reason": "timeout"}
+            message = (f"Post-validate timeout ({_POST_VALIDATE_TIMEOUT}s) "
+                       f"on {output}")
+        else:
+            details = {"output": str(output), "reason": "validator-error",
+                       "stderr": str(payload)[:8192]}
+            message = f"Post-validate could not run on {output}"
         if unlink_err is not None:
             details["unlink_error"] = unlink_err
         raise PostValidateFailed(
-            f"Post-validate timeout (60s) on {output}",
-            code=7, error_type="PostValidateFailed",
+            message, code=7, error_type="PostValidateFailed",
             details=details,
         )
-    if result.returncode != 0:
-        snippet = (result.stderr or result.stdout or "")[:8192]
+    report = payload
+    returncode = validate_exit_code(report)
+    if returncode != 0:
         unlink_err = _try_unlink(output)
-        details = {"output": str(output), "stderr": snippet,
-                   "returncode": result.returncode}
+        details = {"output": str(output),
+                   "stderr": format_report(report)[:8192],
+                   "returncode": returncode}
         if unlink_err is not None:
             details["unlink_error"] = unlink_err
         raise PostValidateFailed(
@@ -221,14 +296,26 @@ def _try_unlink(path: Path) -> str | None:
 
 def _dispatch_action(
     args: argparse.Namespace,
-    tree_root: Path,
+    tree_root: "Path | Package",
     tmpdir: Path,
     scripts_dir: Path,
 ) -> tuple[int, str]:
-    """Dispatch to the chosen action; return (count, summary)."""
+    """Dispatch to the chosen action; return (count, summary).
+
+    `tree_root` is the unpacked tree (library mode) or the open input
+    Package (zip mode)."""
     # docx-6.7: parse --scope once per invocation. Default "all" expands
     # to the full role set (back-compat: identical to v1 behavior).
     scope = _parse_scope(getattr(args, "scope", "all"))
+    if getattr(args, "batch", None) is not None:
+        actions = _load_batch(args.batch, default_all=args.all)
+        counts = _do_batch(tree_root, actions, scope=scope)
+        replaced = sum(n for a, n in zip(actions, counts) if "replace" in a)
+        deleted = sum(counts) - replaced
+        return sum(counts), (
+            f"applied {len(actions)} batch action(s): replaced {replaced} "
+            f"anchor(s), deleted {deleted} paragraph(s)"
+        )
     if args.replace is not None:
         count = _do_replace(
             tree_root, args.anchor, args.replace, anchor_all=args.all,
@@ -263,9 +350,19 @@ def _dispatch_action(
         insert_tree_root = tmpdir / "insert_unpacked"
         insert_tree_root.mkdir()
         unpack(insert_docx, insert_tree_root)
-        insert_paragraphs, relocation_report = _extract_insert_paragraphs(
-            insert_tree_root, tree_root,
-        )
+        # The relocator merges two asset trees on disk: give it the
+        # base as a tree, then fold whatever it touched back into the
+        # Package (unchanged parts stay raw-copyable).
+        if isinstance(tree_root, Package):
+            base_tree_root = tree_root.extract(tmpdir / "base")
+            insert_paragraphs, relocation_report = _extract_insert_paragraphs(
+                insert_tree_root, base_tree_root,
+            )
+            tree_root.sync_from(base_tree_root)
+        else:
+            insert_paragraphs, relocation_report = _extract_insert_paragraphs(
+                insert_tree_root, tree_root,
+            )
         count = _do_insert_after(
             tree_root, args.anchor, insert_paragraphs,
             anchor_all=args.all, scope=scope,
@@ -324,11 +421,23 @@ def _run(args: argparse.Namespace) -> int:
     """Full zip-mode pipeline."""
     scripts_dir = Path(__file__).resolve().parent
 
+    # --batch carries its own anchors (validated per entry by
+    # _load_batch, which also runs here so a bad file fails before I/O).
+    batch = getattr(args, "batch", None)
+    if batch is not None:
+        if args.anchor is not None:
+            raise _AppError(
+                "--anchor cannot be combined with --batch "
+                "(each batch entry names its own anchor)",
+                code=2, error_type="UsageError",
+                details={"prog": "docx_replace.py"},
+            )
+        _load_batch(batch)
     # Universal anchor validation — applies to both zip and library mode.
     # Empty anchor causes infinite loops in _replace_in_run and matches
     # every paragraph in _find_paragraphs_containing_anchor (DoS / silent
     # corruption). Reject before any I/O is attempted.
-    if args.anchor is None or not args.anchor:
+    elif args.anchor is None or not args.anchor:
         raise _AppError(
             "--anchor must be a non-empty string",
             code=2, error_type="UsageError",
@@ -375,26 +484,21 @@ def _run(args: argparse.Namespace) -> int:
     assert_not_encrypted(input_path)
     # Step 5: cross-4 macro warning.
     warn_if_macros_will_be_dropped(input_path, output_path, sys.stderr)
-    # Step 6: unpack → dispatch → pack → post-validate → atomic move.
-    # 2026-05-12 scratch-leak fix: tree_root MUST be a dedicated
-    # sub-directory, not the tempdir root itself. Previously
-    # `tree_root = tmpdir` aliased both; `_dispatch_action` then wrote
-    # `tmpdir/insert.docx` and `tmpdir/insert_unpacked/` into the same
-    # directory that `pack()` walks. `pack()` archives every file under
-    # the tree root, so those scratch artefacts ended up INSIDE the
-    # final .docx ZIP. Microsoft Word's open-time check refuses
-    # packages with extra members ("не удалось прочитать");
-    # LibreOffice and our validator both tolerated them silently.
-    # Solution: scratch / { base/, work/, packed.docx }.
-    with _tempdir() as scratch:
-        base_dir = scratch / "base"
-        base_dir.mkdir()
-        unpack(input_path, base_dir)
-        tree_root = base_dir
+    # Step 6: open in memory → dispatch → save → post-validate → atomic
+    # move. The input is never unpacked: parts are parsed on demand and
+    # only the edited ones are re-serialised; every other member is
+    # copied raw from the source ZIP (office.package). Scratch artefacts
+    # (insert.docx, insert_unpacked/, the relocator's base/ tree) live
+    # under work/ and never reach the Package's member list — the
+    # 2026-05-12 scratch-leak (extra ZIP members Word refuses to open)
+    # cannot recur.
+    with _tempdir() as scratch, Package.open(
+        input_path, apply_docx_helpers=True,
+    ) as package:
         work_dir = scratch / "work"
         work_dir.mkdir()
         count, action_summary = _dispatch_action(
-            args, tree_root, work_dir, scripts_dir,
+            args, package, work_dir, scripts_dir,
         )
         if count == 0:
             raise AnchorNotFound(
@@ -402,13 +506,12 @@ def _run(args: argparse.Namespace) -> int:
                 code=2, error_type="AnchorNotFound",
                 details={"anchor": args.anchor},
             )
-        # Step 7: pack to a tmp path OUTSIDE the base tree so the output
-        # path is never seen by pack()'s directory walk.
+        # Step 7: save to a tmp path next to the scratch tree.
         tmp_out = scratch / "packed.docx"
-        pack(tree_root, tmp_out)
+        package.save(tmp_out)
         # Step 8: opt-in post-validate (operates on tmp file).
         if _post_validate_enabled():
-            _run_post_validate(tmp_out, scripts_dir)
+            _run_post_validate(tmp_out)
         # Step 9: atomic move to final destination; symlink-safe.
         # On Linux, os.replace raises EXDEV (errno 18) when tmpdir and the
         # output path are on different filesystem mounts (e.g. /tmp on tmpfs,
@@ -477,6 +580,14 @@ def build_parser() -> argparse.ArgumentParser:
                         help="Insert paragraphs from SOURCE (file or '-' for stdin) after anchor.")
     action.add_argument("--delete-paragraph", action="store_true", default=False,
                         help="Delete every paragraph containing the anchor text.")
+    action.add_argument("--batch", metavar="FILE.json", type=Path, default=None,
+                        help="Apply a JSON list of actions in order, e.g. "
+                             '[{"anchor": "A", "replace": "B"}, '
+                             '{"anchor": "C", "delete_paragraph": true, '
+                             '"all": true}]. One parse, one write; any '
+                             "entry without a match aborts the whole batch. "
+                             "--all sets the default for entries without "
+                             "'all'.")
     parser.add_argument("--all", action="store_true", default=False,
                         help="Apply action to all matching paragraphs (default: first only).")
     parser.add_argument("--unpacked-dir", metavar="DIR", type=Path, default=None,
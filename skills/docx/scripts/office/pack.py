@@ -12,10 +12,18 @@ Steps:
      so the final file matches Word's usual low-whitespace style.
 3. Write the archive with `ZIP_DEFLATED`, preserving Content Types
    ordering (`[Content_Types].xml` must be the first member per
-   ECMA-376 Part 2).
+   ECMA-376 Part 2). Already-compressed media (PNG, JPEG, GIF, EMZ…)
+   goes in as `ZIP_STORED` instead of being deflated a second time.
+4. With `--source ORIGINAL` (the archive the tree was unpacked from):
+   every member whose final bytes equal the ORIGINAL's member is
+   copied as its compressed stream, verbatim — images, fonts,
+   `vbaProject.bin` and any part left alone are never re-deflated.
+   XML parts are compared after step 2's transforms, so they only
+   match when the ORIGINAL was itself written by `pack` (unpack's
+   pretty-print changes the bytes of everything else).
 
 Usage (module):
-    python -m office.pack unpacked_dir/ output.docx
+    python -m office.pack unpacked_dir/ output.docx [--source input.docx] [--stats]
 Usage (script):
     python office/pack.py unpacked_dir/ output.docx
 """
@@ -28,6 +36,7 @@ import _venv_bootstrap  # noqa: E402  (replicated per CLAUDE.md §2)
 _venv_bootstrap.reexec_into_venv(requires=("lxml",), _file=__file__)
 
 import argparse
+import contextlib
 import sys
 import zipfile
 from pathlib import Path
@@ -40,11 +49,13 @@ if __package__ in (None, ""):
         MACRO_EXT_FOR, NON_MACRO_EXTENSIONS, VBA_PROJECT_PARTS,
         format_pack_macro_loss_warning,
     )
+    from office._zip import PackStats, is_unchanged, transfer, write_member
 else:
     from ._macros import (
         MACRO_EXT_FOR, NON_MACRO_EXTENSIONS, VBA_PROJECT_PARTS,
         format_pack_macro_loss_warning,
     )
+    from ._zip import PackStats, is_unchanged, transfer, write_member
 
 
 SMART_REVERSE = {
@@ -112,9 +123,14 @@ def pack(
     *,
     unescape_smart_quotes: bool = True,
     condense: bool = True,
-) -> None:
+    source: Path | None = None,
+) -> PackStats:
+    """Pack `input_dir` into `output_path`; return what was copied raw
+    from `source` vs (re)compressed vs stored."""
     if not input_dir.is_dir():
         raise ValueError(f"Not a directory: {input_dir}")
+    if source is not None and not zipfile.is_zipfile(str(source)):
+        raise ValueError(f"Not a ZIP-based OOXML container: {source}")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     out_suffix = output_path.suffix.lower()
@@ -130,8 +146,16 @@ def pack(
         sys.stderr.flush()
 
     members = _ordered_members(input_dir)
+    stats = PackStats()
 
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+    with contextlib.ExitStack() as stack:
+        original = (
+            stack.enter_context(zipfile.ZipFile(str(source)))
+            if source is not None else None
+        )
+        archive = stack.enter_context(zipfile.ZipFile(
+            output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=6,
+        ))
         for member in members:
             relative = member.relative_to(input_dir).as_posix()
             data = member.read_bytes()
@@ -140,7 +164,24 @@ def pack(
                     data = _unescape_smart(data)
                 if condense:
                     data = _condense_xml(data)
-            archive.writestr(relative, data)
+            info = _source_info(original, relative)
+            if info is not None and is_unchanged(original, info, data):
+                transfer(original, archive, info, stats)
+            else:
+                write_member(archive, relative, data, stats)
+    return stats
+
+
+def _source_info(
+    original: zipfile.ZipFile | None, name: str,
+) -> zipfile.ZipInfo | None:
+    if original is None:
+        return None
+    try:
+        info = original.getinfo(name)
+    except KeyError:
+        return None
+    return None if info.is_dir() else info
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -149,21 +190,28 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("output", type=Path, help="Destination .docx/.xlsx/.pptx file")
     parser.add_argument("--no-unescape-quotes", action="store_true", help="Keep smart-quote entities as-is")
     parser.add_argument("--no-condense", action="store_true", help="Preserve whitespace in XML parts")
+    parser.add_argument("--source", type=Path, default=None,
+                        help="Archive the tree was unpacked from; unchanged members are copied raw")
+    parser.add_argument("--stats", action="store_true",
+                        help="Print bytes copied raw vs recompressed vs stored to stderr")
     args = parser.parse_args(argv)
 
     if not args.input_dir.is_dir():
         print(f"Input directory not found: {args.input_dir}", file=sys.stderr)
         return 1
     try:
-        pack(
+        stats = pack(
             args.input_dir,
             args.output,
             unescape_smart_quotes=not args.no_unescape_quotes,
             condense=not args.no_condense,
+            source=args.source,
         )
     except Exception as exc:
         print(f"Pack failed: {exc}", file=sys.stderr)
         return 1
+    if args.stats:
+        print(f"{args.output.name}: {stats.summary()}", file=sys.stderr)
     return 0
 
 
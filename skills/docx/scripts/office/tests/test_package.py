@@ -0,0 +1,229 @@
+"""Unit tests for `office.package.Package` and `office._zip.copy_raw`.
+
+Fixtures are tiny OOXML-shaped ZIPs built in a temp dir; no Office
+application needed.
+
+Run:
+    cd skills/docx/scripts
+    ./.venv/bin/python -m unittest office.tests.test_package
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from lxml import etree  # type: ignore
+
+HERE = Path(__file__).resolve().parent
+SCRIPTS = HERE.parent.parent  # skills/<skill>/scripts
+sys.path.insert(0, str(SCRIPTS))
+
+from office._zip import _read_compressed  # noqa: E402
+from office.package import Package, edit_in_place  # noqa: E402
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+CT = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    b'<Default Extension="xml" ContentType="application/xml"/></Types>'
+)
+DOC = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:document xmlns:w="{W}"><w:body>'
+    f'<w:p><w:r><w:t>Hello </w:t></w:r><w:r><w:t>world</w:t></w:r></w:p>'
+    f'</w:body></w:document>'
+).encode()
+# Deliberately odd formatting: any re-serialisation would change it.
+STYLES = b'<?xml version="1.0"?>\n<styles   a="1" >\n\n  <s/>\n</styles>\n'
+
+
+def _make_docx(path: Path, *, extra: dict[str, bytes] | None = None) -> Path:
+    members = {
+        "word/document.xml": DOC,
+        "[Content_Types].xml": CT,  # not first on purpose
+        "word/styles.xml": STYLES,
+        "word/media/image1.png": b"\x89PNG" + bytes(range(256)) * 8,
+    }
+    members.update(extra or {})
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, data in members.items():
+            z.writestr(name, data)
+    return path
+
+
+def _read(path: Path, name: str) -> bytes:
+    with zipfile.ZipFile(path) as z:
+        return z.read(name)
+
+
+def _raw(path: Path, name: str) -> bytes:
+    with zipfile.ZipFile(path) as z:
+        return _read_compressed(z, z.getinfo(name))
+
+
+class TestPackageZip(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        self.src = _make_docx(self.tmp / "in.docx")
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_untouched_members_are_copied_raw(self) -> None:
+        out = self.tmp / "out.docx"
+        with Package.open(self.src) as pkg:
+            root = pkg.xml("/word/document.xml")
+            root.find(f".//{{{W}}}t").text = "Goodbye "
+            pkg.mark_dirty("word/document.xml")
+            stats = pkg.save(out)
+        self.assertEqual((stats.copied, stats.recompressed, stats.stored), (3, 1, 0))
+        self.assertEqual(stats.bytes_recompressed, len(_read(out, "word/document.xml")))
+        for name in ("word/styles.xml", "word/media/image1.png", "[Content_Types].xml"):
+            self.assertEqual(_raw(out, name), _raw(self.src, name), name)
+        with zipfile.ZipFile(out) as z:
+            self.assertIsNone(z.testzip())
+            self.assertEqual(z.namelist()[0], "[Content_Types].xml")
+            self.assertIn(b"Goodbye ", z.read("word/document.xml"))
+            self.assertEqual(z.read("word/styles.xml"), STYLES)
+
+    def test_parts_are_parsed_lazily(self) -> None:
+        src = _make_docx(self.tmp / "bad.docx",
+                         extra={"word/broken.xml": b"<not-closed"})
+        out = self.tmp / "out.docx"
+        with Package.open(src) as pkg:
+            pkg.save(out)
+        with zipfile.ZipFile(out) as z:
+            self.assertEqual(z.read("word/broken.xml"), b"<not-closed")
+
+    def test_parsed_but_unmarked_part_is_not_rewritten(self) -> None:
+        out = self.tmp / "out.docx"
+        with Package.open(self.src) as pkg:
+            pkg.xml("word/styles.xml").set("a", "2")
+            self.assertFalse(pkg.is_modified())
+            pkg.save(out)
+        self.assertEqual(_raw(out, "word/styles.xml"), _raw(self.src, "word/styles.xml"))
+
+    def test_add_replace_delete(self) -> None:
+        out = self.tmp / "out.docx"
+        with Package.open(self.src) as pkg:
+            pkg.write("word/new.bin", b"\x00\x01")
+            pkg.write("word/styles.xml", b"<styles/>")
+            pkg.delete("word/media/image1.png")
+            self.assertNotIn("word/media/image1.png", pkg)
+            self.assertTrue(pkg.is_modified("word/styles.xml"))
+            pkg.save(out)
+        with zipfile.ZipFile(out) as z:
+            self.assertEqual(
+                z.namelist(),
+                ["[Content_Types].xml", "word/document.xml",
+                 "word/styles.xml", "word/new.bin"],
+            )
+            self.assertEqual(z.read("word/styles.xml"), b"<styles/>")
+
+    def test_docx_helpers_merge_runs_on_access(self) -> None:
+        with Package.open(self.src, apply_docx_helpers=True) as pkg:
+            texts = [t.text for t in pkg.xml("word/document.xml").iter(f"{{{W}}}t")]
+            self.assertEqual(texts, ["Hello world"])
+            self.assertTrue(pkg.is_modified("word/document.xml"))
+        # Helpers are docx-only and opt-in.
+        with Package.open(self.src) as pkg:
+            self.assertEqual(len(list(pkg.xml("word/document.xml").iter(f"{{{W}}}t"))), 2)
+
+    def test_extract_and_sync_from_mark_only_changed_parts(self) -> None:
+        out = self.tmp / "out.docx"
+        with Package.open(self.src) as pkg:
+            tree = pkg.extract(self.tmp / "tree")
+            self.assertEqual((tree / "word" / "styles.xml").read_bytes(), STYLES)
+            (tree / "word" / "document.xml").write_bytes(DOC.replace(b"world", b"there"))
+            (tree / "word" / "added.xml").write_bytes(b"<x/>")
+            (tree / "word" / "media" / "image1.png").unlink()
+            pkg.sync_from(tree)
+            self.assertEqual(
+                sorted(n for n in pkg.names() if pkg.is_modified(n)),
+                ["word/added.xml", "word/document.xml"],
+            )
+            stats = pkg.save(out)
+        # image1.png is gone; styles + content types copied, the two
+        # changed parts re-deflated.
+        self.assertEqual((stats.copied, stats.recompressed, stats.stored), (2, 2, 0))
+
+    def test_new_media_is_stored(self) -> None:
+        out = self.tmp / "out.docx"
+        with Package.open(self.src) as pkg:
+            pkg.write("word/media/image2.jpeg", b"\xff\xd8" + bytes(300))
+            stats = pkg.save(out)
+        self.assertEqual((stats.copied, stats.stored), (4, 1))
+        with zipfile.ZipFile(out) as z:
+            self.assertEqual(z.getinfo("word/media/image2.jpeg").compress_type,
+                             zipfile.ZIP_STORED)
+
+    def test_save_over_own_source(self) -> None:
+        # Larger than the reader's buffer, so the copy really re-reads
+        # the source while the destination is being written.
+        big = bytes(range(256)) * 4096
+        _make_docx(self.src, extra={"word/media/big.bin": big})
+        with Package.open(self.src) as pkg:
+            root = pkg.xml("word/document.xml")
+            root.find(f".//{{{W}}}t").text = "Bye "
+            pkg.mark_dirty("word/document.xml")
+            pkg.save(self.src)
+        self.assertIn(b"Bye ", _read(self.src, "word/document.xml"))
+        self.assertEqual(_read(self.src, "word/media/big.bin"), big)
+        self.assertEqual(sorted(p.name for p in self.tmp.iterdir()), ["in.docx"])
+
+    def test_failed_save_leaves_destination_untouched(self) -> None:
+        out = self.tmp / "out.docx"
+        out.write_bytes(b"previous")
+        with Package.open(self.src) as pkg:
+            pkg.write("word/extra.xml", b"<x/>")
+            pkg.close()  # raw copies now fail mid-write
+            with self.assertRaises(ValueError):
+                pkg.save(out)
+        self.assertEqual(out.read_bytes(), b"previous")
+        self.assertEqual(sorted(p.name for p in self.tmp.iterdir()),
+                         ["in.docx", "out.docx"])
+
+    def test_save_requires_destination_for_zip(self) -> None:
+        with Package.open(self.src) as pkg, self.assertRaises(ValueError):
+            pkg.save()
+
+    def test_rejects_non_zip(self) -> None:
+        junk = self.tmp / "junk.docx"
+        junk.write_bytes(b"not a zip")
+        with self.assertRaises(ValueError):
+            Package.open(junk)
+
+
+class TestPackageTree(unittest.TestCase):
+    def test_edit_in_place_writes_only_dirty_parts(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "word").mkdir()
+            (root / "word" / "document.xml").write_bytes(DOC)
+            (root / "word" / "styles.xml").write_bytes(STYLES)
+            with edit_in_place(root) as pkg:
+                pkg.xml("word/document.xml").find(f".//{{{W}}}t").text = "Bye "
+                pkg.mark_dirty("word/document.xml")
+                pkg.set_xml("word/comments.xml", etree.Element("comments"))
+            self.assertIn(b"Bye ", (root / "word" / "document.xml").read_bytes())
+            self.assertEqual((root / "word" / "styles.xml").read_bytes(), STYLES)
+            self.assertTrue((root / "word" / "comments.xml").is_file())
+
+    def test_edit_in_place_skips_save_on_error(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "doc.xml").write_bytes(DOC)
+            with self.assertRaises(RuntimeError), edit_in_place(root) as pkg:
+                pkg.write("doc.xml", b"<changed/>")
+                raise RuntimeError("boom")
+            self.assertEqual((root / "doc.xml").read_bytes(), DOC)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Unit tests for the validator caches in `office/validators/base.py`
+and the in-process `office.validate.validate_file` API.
+
+Covers the per-process compiled-XSD cache, the `incremental=True`
+per-part result cache (only changed parts are re-checked) and that
+`validate_file` / `format_report` / `exit_code` agree with `main()`.
+
+The test file is part of `office/` and is byte-replicated across the
+three OOXML skills, so it only uses the docx validator.
+
+Run from inside the skill:
+    cd skills/docx/scripts
+    ./.venv/bin/python -m unittest office.tests.test_validate_cache
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+SCRIPTS = HERE.parent.parent
+sys.path.insert(0, str(SCRIPTS))
+
+from office.validate import (  # noqa: E402
+    exit_code, format_report, main as validate_main, validate_file,
+)
+from office.validators import base  # noqa: E402
+from office.validators.docx import DocxValidator  # noqa: E402
+from office.tests.test_validate_package_structure import (  # noqa: E402
+    _MIN_DOCX_PARTS,
+)
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# Accepts <w:document><w:body>…</w:body></w:document> only.
+_WML_XSD = f"""<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           targetNamespace="{W_NS}" elementFormDefault="qualified">
+  <xs:element name="document">
+    <xs:complexType><xs:sequence>
+      <xs:element name="body">
+        <xs:complexType><xs:sequence>
+          <xs:any processContents="skip" minOccurs="0" maxOccurs="unbounded"/>
+        </xs:sequence></xs:complexType>
+      </xs:element>
+    </xs:sequence></xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+_DUP_BOOKMARKS = (
+    f'<w:document xmlns:w="{W_NS}"><w:body><w:p>'
+    '<w:bookmarkStart w:id="1" w:name="a"/><w:bookmarkStart w:id="1" w:name="b"/>'
+    '</w:p></w:body></w:document>'
+)
+
+
+def _write_docx(path: Path, document_xml: str | None = None) -> Path:
+    parts = dict(_MIN_DOCX_PARTS)
+    if document_xml is not None:
+        parts["word/document.xml"] = document_xml
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, body in parts.items():
+            z.writestr(name, body)
+    return path
+
+
+class TestValidatorCaches(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        self.schemas = self.tmp / "schemas"
+        self.schemas.mkdir()
+        (self.schemas / "wml.xsd").write_text(_WML_XSD, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_schema_compiled_once_per_process(self) -> None:
+        xsd = self.schemas / "wml.xsd"
+        first = base._load_schema(xsd)
+        self.assertIs(base._load_schema(xsd), first)
+        st = xsd.stat()
+        os.utime(xsd, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertIsNot(base._load_schema(xsd), first)
+
+    def test_xsd_violation_reported(self) -> None:
+        doc = _write_docx(self.tmp / "bad.docx", document_xml=(
+            f'<w:document xmlns:w="{W_NS}"><w:oops/></w:document>'
+        ))
+        report = DocxValidator(schemas_dir=self.schemas, strict=True).validate(doc)
+        self.assertTrue(any(e.startswith("word/document.xml: ") for e in report.errors),
+                        report.errors)
+
+    def test_incremental_rechecks_only_changed_parts(self) -> None:
+        validator = DocxValidator(schemas_dir=self.schemas, strict=True,
+                                  incremental=True)
+        doc = _write_docx(self.tmp / "a.docx")
+        xml_parts = sum(1 for n in _MIN_DOCX_PARTS if n.endswith(".xml"))
+        self.assertTrue(validator.validate(doc).ok)
+        self.assertEqual((validator.parts_checked, validator.parts_reused),
+                         (xml_parts, 0))
+        self.assertTrue(validator.validate(doc).ok)
+        self.assertEqual((validator.parts_checked, validator.parts_reused),
+                         (0, xml_parts))
+
+        _write_docx(doc, document_xml=_DUP_BOOKMARKS)
+        incremental = validator.validate(doc)
+        self.assertEqual((validator.parts_checked, validator.parts_reused),
+                         (1, xml_parts - 1))
+        fresh = DocxValidator(schemas_dir=self.schemas, strict=True).validate(doc)
+        self.assertEqual(incremental.to_dict(), fresh.to_dict())
+        self.assertIn("Duplicate id 'bookmarkStart:1'", " ".join(fresh.warnings))
+
+    def test_default_is_not_incremental(self) -> None:
+        validator = DocxValidator(schemas_dir=self.schemas)
+        doc = _write_docx(self.tmp / "a.docx")
+        validator.validate(doc)
+        validator.validate(doc)
+        self.assertEqual(validator.parts_reused, 0)
+
+
+class TestValidateFileApi(unittest.TestCase):
+    def test_matches_cli(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            doc = _write_docx(Path(td) / "d.docx",
+                              document_xml=_DUP_BOOKMARKS)
+            for strict in (False, True):
+                report = validate_file(doc, strict=strict)
+                out = io.StringIO()
+                argv = [str(doc)] + (["--strict"] if strict else [])
+                with redirect_stdout(out):
+                    rc = validate_main(argv)
+                self.assertEqual(rc, exit_code(report, strict=strict))
+                self.assertEqual(out.getvalue(), format_report(report) + "\n")
+            self.assertEqual(exit_code(report), 0)
+            self.assertEqual(exit_code(report, strict=True), 1)
+
+    def test_unknown_extension_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "x.odt"
+            path.write_bytes(b"PK")
+            with self.assertRaises(ValueError):
+                validate_file(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Patience diff over sequences of paragraph hashes.
+
+`RedliningValidator` aligns two documents paragraph by paragraph. A
+plain `difflib.SequenceMatcher` over the full paragraph lists is
+quadratic on the lines it cannot anchor — and real documents are full
+of repeated lines (empty paragraphs, "Signature:", table-cell
+boilerplate). Patience diff anchors on the lines that occur exactly
+once on both sides, which in prose is almost every line:
+
+1. trim the common prefix / suffix of the window;
+2. take the lines unique to both sides, keep the longest run of them
+   that is in the same order on both sides (LIS over b-positions) as
+   anchors, and recurse into the gaps between anchors;
+3. a gap with no unique common line falls back to `SequenceMatcher`
+   over that (small) gap only.
+
+Inputs are any integer sequences (`array('Q')` in practice); the
+output has the same shape as `SequenceMatcher.get_opcodes()`.
+"""
+
+from __future__ import annotations
+
+import difflib
+from bisect import bisect_left
+from collections.abc import Sequence
+
+__all__ = ["diff_opcodes", "matching_blocks"]
+
+Opcode = tuple[str, int, int, int, int]
+
+
+def _unique_positions(seq: Sequence[int], lo: int, hi: int) -> dict[int, int]:
+    """value → position for values that occur exactly once in seq[lo:hi]."""
+    pos: dict[int, int] = {}
+    dup: set[int] = set()
+    for i in range(lo, hi):
+        v = seq[i]
+        if v in pos:
+            dup.add(v)
+        else:
+            pos[v] = i
+    for v in dup:
+        del pos[v]
+    return pos
+
+
+def _anchors(a: Sequence[int], alo: int, ahi: int,
+             b: Sequence[int], blo: int, bhi: int) -> list[tuple[int, int]]:
+    """Longest same-order run of lines unique to both windows."""
+    ua = _unique_positions(a, alo, ahi)
+    if not ua:
+        return []
+    ub = _unique_positions(b, blo, bhi)
+    pairs = [(ua[v], ub[v]) for v in ua if v in ub]
+    if not pairs:
+        return []
+    pairs.sort()
+    # Patience sorting: LIS of the b-positions in a-order.
+    tails: list[int] = []           # smallest b-tail of an LIS of length k+1
+    tail_idx: list[int] = []        # index into `pairs` of that tail
+    prev: list[int] = [-1] * len(pairs)
+    for k, (_i, j) in enumerate(pairs):
+        n = bisect_left(tails, j)
+        if n == len(tails):
+            tails.append(j)
+            tail_idx.append(k)
+        else:
+            tails[n] = j
+            tail_idx[n] = k
+        prev[k] = tail_idx[n - 1] if n else -1
+    out: list[tuple[int, int]] = []
+    k = tail_idx[-1]
+    while k != -1:
+        out.append(pairs[k])
+        k = prev[k]
+    out.reverse()
+    return out
+
+
+def matching_blocks(a: Sequence[int], b: Sequence[int]) -> list[tuple[int, int, int]]:
+    """`(i, j, n)` triples with `a[i:i+n] == b[j:j+n]`, ascending and
+    merged, ending with the `(len(a), len(b), 0)` sentinel."""
+    blocks: list[tuple[int, int, int]] = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+        n = 0
+        while alo + n < ahi and blo + n < bhi and a[alo + n] == b[blo + n]:
+            n += 1
+        if n:
+            blocks.append((alo, blo, n))
+            alo += n
+            blo += n
+        n = 0
+        while alo < ahi - n and blo < bhi - n and a[ahi - 1 - n] == b[bhi - 1 - n]:
+            n += 1
+        if n:
+            blocks.append((ahi - n, bhi - n, n))
+            ahi -= n
+            bhi -= n
+        if alo == ahi or blo == bhi:
+            continue
+        anchors = _anchors(a, alo, ahi, b, blo, bhi)
+        if not anchors:
+            sm = difflib.SequenceMatcher(a=a[alo:ahi], b=b[blo:bhi], autojunk=False)
+            blocks.extend((alo + i, blo + j, size)
+                          for i, j, size in sm.get_matching_blocks() if size)
+            continue
+        for i, j in anchors:
+            blocks.append((i, j, 1))
+            stack.append((alo, i, blo, j))
+            alo, blo = i + 1, j + 1
+        stack.append((alo, ahi, blo, bhi))
+
+    blocks.sort()
+    merged: list[tuple[int, int, int]] = []
+    for i, j, n in blocks:
+        if merged:
+            pi, pj, pn = merged[-1]
+            if pi + pn == i and pj + pn == j:
+                merged[-1] = (pi, pj, pn + n)
+                continue
+        merged.append((i, j, n))
+    merged.append((len(a), len(b), 0))
+    return merged
+
+
+def diff_opcodes(a: Sequence[int], b: Sequence[int]) -> list[Opcode]:
+    """`SequenceMatcher.get_opcodes()`-shaped edit script from a to b."""
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for ai, bj, size in matching_blocks(a, b):
+        tag = ""
+        if i < ai and j < bj:
+            tag = "replace"
+        elif i < ai:
+            tag = "delete"
+        elif j < bj:
+            tag = "insert"
+        if tag:
+            opcodes.append((tag, i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(("equal", ai, i, bj, j))
+    return opcodes
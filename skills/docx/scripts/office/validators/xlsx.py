@@ -76,7 +76,7 @@ class XlsxValidator(BaseSchemaValidator):
         if "xl/workbook.xml" not in namelist:
             return
         try:
-            wb = etree.fromstring(archive.read("xl/workbook.xml"), _safe_parser())
+            wb = self._part_tree(archive, "xl/workbook.xml")
         except etree.XMLSyntaxError as exc:
             report.errors.append(f"xl/workbook.xml: parse error {exc}")
             return
@@ -262,9 +262,7 @@ class XlsxValidator(BaseSchemaValidator):
         if "xl/sharedStrings.xml" not in namelist:
             return None
         try:
-            root = etree.fromstring(
-                archive.read("xl/sharedStrings.xml"), _safe_parser()
-            )
+            root = self._part_tree(archive, "xl/sharedStrings.xml")
         except etree.XMLSyntaxError as exc:
             report.errors.append(f"xl/sharedStrings.xml: parse error {exc}")
             return None
@@ -285,9 +283,7 @@ class XlsxValidator(BaseSchemaValidator):
         if "xl/styles.xml" not in namelist:
             return None
         try:
-            root = etree.fromstring(
-                archive.read("xl/styles.xml"), _safe_parser()
-            )
+            root = self._part_tree(archive, "xl/styles.xml")
         except etree.XMLSyntaxError as exc:
             report.errors.append(f"xl/styles.xml: parse error {exc}")
             return None
@@ -314,9 +310,7 @@ class XlsxValidator(BaseSchemaValidator):
             if not sheet_part.startswith("xl/worksheets/"):
                 continue
             try:
-                doc = etree.fromstring(
-                    archive.read(sheet_part), _safe_parser()
-                )
+                doc = self._part_tree(archive, sheet_part)
             except etree.XMLSyntaxError as exc:
                 report.errors.append(f"{sheet_part}: parse error {exc}")
                 continue
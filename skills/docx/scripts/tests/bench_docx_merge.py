@@ -0,0 +1,127 @@
+"""Scaling benchmark for `docx_merge.py`: merge N synthetic chapters.
+
+Each chapter is a python-docx document with a heading, body text, a
+bulleted list (→ numbering.xml), a table, a bookmark, an external
+hyperlink and an inline PNG — every relocation pass in
+`MergeSession.append` has work to do. The benchmark times the
+in-memory merge (open → append × N-1 → save) for each N and prints
+the per-chapter cost; linear scaling shows up as a flat ms/doc column.
+The old per-extra merge re-read and rewrote the base parts on every
+extra, so its ms/doc grew with N.
+
+`build_chapter` / `build_chapters` are also the fixture builders for
+`test_docx_merge.py`.
+
+Usage (from skills/docx/scripts/):
+    ./.venv/bin/python tests/bench_docx_merge.py [--sizes 25 50 100 200] [--jobs N]
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))  # scripts/
+
+import docx  # type: ignore  # noqa: E402
+from docx.opc.constants import RELATIONSHIP_TYPE as RT  # type: ignore  # noqa: E402
+from docx.oxml import OxmlElement  # type: ignore  # noqa: E402
+from docx.oxml.ns import qn  # type: ignore  # noqa: E402
+
+
+def _png(width: int = 4, height: int = 4) -> bytes:
+    """Smallest valid RGB PNG python-docx will size."""
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+    raw = b"".join(b"\x00" + b"\x80\x40\x20" * width for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def build_chapter(path: Path, index: int, *, paragraphs: int = 20) -> Path:
+    """Write chapter `index` to `path` and return it."""
+    d = docx.Document()
+    d.add_heading(f"Chapter {index}", level=1)
+    for i in range(paragraphs):
+        d.add_paragraph(f"Chapter {index}, paragraph {i}: lorem ipsum dolor sit amet.")
+    for i in range(3):
+        d.add_paragraph(f"Point {index}.{i}", style="List Bullet")
+    table = d.add_table(rows=2, cols=2)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"{index}:{r}{c}"
+
+    p = d.add_paragraph()
+    start = OxmlElement("w:bookmarkStart")
+    start.set(qn("w:id"), "0")
+    start.set(qn("w:name"), f"ch{index}")
+    end = OxmlElement("w:bookmarkEnd")
+    end.set(qn("w:id"), "0")
+    p._p.append(start)
+    p.add_run(f"Anchor {index}")
+    p._p.append(end)
+
+    rid = d.part.relate_to(f"https://example.com/ch/{index}", RT.HYPERLINK,
+                           is_external=True)
+    link = OxmlElement("w:hyperlink")
+    link.set(qn("r:id"), rid)
+    run = OxmlElement("w:r")
+    text = OxmlElement("w:t")
+    text.text = f"link {index}"
+    run.append(text)
+    link.append(run)
+    d.add_paragraph()._p.append(link)
+
+    d.add_picture(io.BytesIO(_png()))
+    d.save(str(path))
+    return path
+
+
+def build_chapters(root: Path, count: int, **kw: int) -> list[Path]:
+    root.mkdir(parents=True, exist_ok=True)
+    return [build_chapter(root / f"ch{i:04d}.docx", i, **kw) for i in range(count)]
+
+
+def time_merge(inputs: list[Path], output: Path, *, jobs: int = 1) -> float:
+    """Seconds for one in-memory merge of `inputs` into `output`."""
+    from docx_merge import merge_files
+
+    t0 = time.perf_counter()
+    merge_files(inputs, output, page_break_before=True, merge_styles=True,
+                jobs=jobs)
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[25, 50, 100, 200])
+    parser.add_argument("--paragraphs", type=int, default=20,
+                        help="Body paragraphs per chapter (default 20).")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="docx_merge --jobs value to time (default 1).")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="bench_docx_merge-") as td:
+        chapters = build_chapters(Path(td) / "in", max(args.sizes),
+                                  paragraphs=args.paragraphs)
+        print(f"{'N':>6} {'seconds':>9} {'ms/doc':>8}")
+        for n in args.sizes:
+            elapsed = time_merge(chapters[:n], Path(td) / f"merged_{n}.docx",
+                                 jobs=args.jobs)
+            print(f"{n:>6} {elapsed:>9.2f} {elapsed * 1000 / n:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,6 +30,8 @@ except ImportError:
     # Helpers added in 006-02; tests still collectable for Red state.
     pass
 
+from docx_anchor import _AnchorAutomaton, _AnchorIndex
+
 from lxml import etree
 
 _W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
@@ -337,5 +339,62 @@ class TestFindParagraphsContainingAnchor(unittest.TestCase):
         self.assertEqual(result, [])
 
 
+class TestAnchorIndex(unittest.TestCase):
+    """Batch index behind `docx_replace --batch` / `docx_add_comment --batch`."""
+
+    def test_automaton_reports_overlapping_and_nested_anchors(self):
+        ac = _AnchorAutomaton(["he", "she", "hers", "his", "", "xyz"])
+        self.assertEqual(ac.search("ushers"), {0, 1, 2})
+        self.assertEqual(ac.search("this"), {3})
+        self.assertEqual(ac.search(""), set())
+
+    def test_automaton_agrees_with_substring_test(self):
+        anchors = ["ab", "bab", "aab", "b", "abab", "ba"]
+        ac = _AnchorAutomaton(anchors)
+        for text in ("", "a", "abab", "aaab", "babba", "xbabx", "aabab"):
+            expected = {i for i, a in enumerate(anchors) if a in text}
+            self.assertEqual(ac.search(text), expected, text)
+
+    def test_candidates_in_document_order_across_parts(self):
+        body = etree.fromstring(
+            f'<w:body {_NS}>'
+            '<w:p><w:r><w:t>Article 5 here</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>nothing</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>Art</w:t></w:r><w:r><w:t>icle 5 split</w:t></w:r></w:p>'
+            '</w:body>'
+        )
+        header = etree.fromstring(
+            f'<w:hdr {_NS}><w:p><w:r><w:t>Article 5 hdr</w:t></w:r></w:p></w:hdr>'
+        )
+        index = _AnchorIndex(
+            [("word/document.xml", body), ("word/header1.xml", header)],
+            ["Article 5", "absent"],
+        )
+        found = index.candidates(0)
+        self.assertEqual(
+            [name for name, _root, _p in found],
+            ["word/document.xml", "word/document.xml", "word/header1.xml"],
+        )
+        self.assertIs(found[0][2], body[0])
+        self.assertIs(found[1][2], body[2])
+        self.assertEqual(index.candidates(1), [])
+
+    def test_rescan_picks_up_new_text_and_detached_paragraphs_drop(self):
+        body = etree.fromstring(
+            f'<w:body {_NS}>'
+            '<w:p><w:r><w:t>old</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>keep</w:t></w:r></w:p>'
+            '</w:body>'
+        )
+        index = _AnchorIndex([("word/document.xml", body)], ["new", "keep"])
+        p0, p1 = body[0], body[1]
+        self.assertEqual(index.candidates(0), [])
+        p0.find(f'.//{{{_W}}}t').text = "new"
+        index.rescan(p0)
+        self.assertEqual([p for _n, _r, p in index.candidates(0)], [p0])
+        body.remove(p1)
+        self.assertEqual(index.candidates(1), [])
+
+
 if __name__ == "__main__":
     unittest.main()
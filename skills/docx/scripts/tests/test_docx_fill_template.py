@@ -0,0 +1,197 @@
+"""Unit tests for docx_fill_template.py — compiled template + --records.
+
+Fixtures are built with python-docx; the old per-document path (open,
+merge runs, substitute, save via python-docx) is the reference for
+what a filled document must contain.
+"""
+from __future__ import annotations
+
+import io
+import json
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stderr
+from pathlib import Path
+
+import docx  # type: ignore
+
+from docx_fill_template import (
+    CompiledTemplate, RecordError, TemplateOverwriteError, fill_records,
+    fill_template, main,
+)
+
+
+def _build_template(path: Path) -> Path:
+    d = docx.Document()
+    d.add_paragraph("Dear {{customer.name}},")
+    p = d.add_paragraph("Total: ")
+    p.add_run("{{invoice")  # split placeholder, same (empty) formatting
+    p.add_run(".total}} due {{ invoice.due }}.")
+    d.add_paragraph("No placeholder here.")
+    d.add_table(rows=1, cols=2).cell(0, 1).text = "Cell {{customer.name}}"
+    d.sections[0].header.paragraphs[0].text = "Ref {{customer.id}}"
+    d.save(str(path))
+    return path
+
+
+def _texts(path: Path) -> tuple[list[str], str, str]:
+    d = docx.Document(str(path))
+    return (
+        [p.text for p in d.paragraphs],
+        d.tables[0].cell(0, 1).text,
+        d.sections[0].header.paragraphs[0].text,
+    )
+
+
+DATA = {
+    "customer": {"name": "Acme & <Sons>", "id": "C-7"},
+    "invoice": {"total": " $5 ", "due": "2026-11-01"},
+}
+
+
+class TestCompiledTemplate(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        self.template = _build_template(self.tmp / "t.docx")
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_fills_body_table_and_header(self) -> None:
+        out = self.tmp / "out.docx"
+        self.assertEqual(fill_template(self.template, DATA, out), set())
+        body, cell, header = _texts(out)
+        self.assertEqual(body[:2], [
+            "Dear Acme & <Sons>,", "Total:  $5  due 2026-11-01.",
+        ])
+        self.assertEqual(cell, "Cell Acme & <Sons>")
+        self.assertEqual(header, "Ref C-7")
+
+    def test_slots_and_keys(self) -> None:
+        with CompiledTemplate.compile(self.template) as compiled:
+            self.assertEqual(compiled.keys, {
+                "customer.name", "customer.id", "invoice.total", "invoice.due",
+            })
+            self.assertEqual(compiled.slots, [
+                ("word/document.xml", 0, 0),
+                ("word/document.xml", 1, 0),
+                ("word/document.xml", 4, 0),  # [3] is the empty first cell
+                ("word/header1.xml", 0, 0),
+            ])
+
+    def test_render_is_per_record(self) -> None:
+        with CompiledTemplate.compile(self.template) as compiled:
+            missing = compiled.render({"customer": {"name": "A"}}, self.tmp / "a.docx")
+            compiled.render(DATA, self.tmp / "b.docx")
+        self.assertEqual(missing, {"customer.id", "invoice.total", "invoice.due"})
+        body, _cell, header = _texts(self.tmp / "a.docx")
+        self.assertEqual(body[0], "Dear A,")
+        self.assertEqual(header, "Ref {{customer.id}}")
+        self.assertEqual(_texts(self.tmp / "b.docx")[2], "Ref C-7")
+
+    def test_only_slot_parts_rewritten(self) -> None:
+        out = self.tmp / "out.docx"
+        fill_template(self.template, DATA, out)
+        with zipfile.ZipFile(self.template) as a, zipfile.ZipFile(out) as b:
+            self.assertEqual(a.namelist(), b.namelist())
+            for name in ("word/styles.xml", "word/settings.xml"):
+                self.assertEqual(a.getinfo(name).CRC, b.getinfo(name).CRC)
+
+    def test_library_fill_over_template(self) -> None:
+        # The python-docx implementation allowed this; keep it working.
+        self.assertEqual(fill_template(self.template, DATA, self.template), set())
+        self.assertEqual(_texts(self.template)[2], "Ref C-7")
+
+    def test_cli_refuses_output_resolving_to_template(self) -> None:
+        data = self.tmp / "data.json"
+        data.write_text(json.dumps(DATA), encoding="utf-8")
+        link = self.tmp / "link.docx"
+        link.symlink_to(self.template)
+        before = self.template.read_bytes()
+        for output in (self.template, link, self.tmp / "x" / ".." / "t.docx"):
+            with self.subTest(output=output), redirect_stderr(io.StringIO()):
+                self.assertEqual(
+                    main([str(self.template), str(data), str(output)]), 6)
+        self.assertEqual(self.template.read_bytes(), before)
+
+    def test_control_character_value_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            fill_template(self.template, {"customer": {"name": "a\x01"}},
+                          self.tmp / "bad.docx")
+
+
+class TestRecords(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        self.template = _build_template(self.tmp / "t.docx")
+        self.records = self.tmp / "data.jsonl"
+        rows = [
+            {"customer": {"name": f"N{i}", "id": f"id{i}"},
+             "invoice": {"total": str(i), "due": "x"}}
+            for i in range(5)
+        ]
+        del rows[3]["invoice"]
+        self.records.write_text(
+            "\n".join(json.dumps(r) for r in rows[:2]) + "\n\n"
+            + "\n".join(json.dumps(r) for r in rows[2:]) + "\n",
+            encoding="utf-8",
+        )
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_serial_and_parallel_outputs_match(self) -> None:
+        serial = fill_records(self.template, self.records, self.tmp / "s")
+        parallel = fill_records(self.template, self.records, self.tmp / "p",
+                                jobs=2)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial, {5: {"invoice.total", "invoice.due"}})
+        names = sorted(p.name for p in (self.tmp / "s").iterdir())
+        self.assertEqual(names, [f"{n:06d}.docx" for n in (1, 2, 4, 5, 6)])
+        for name in names:
+            self.assertEqual((self.tmp / "s" / name).read_bytes(),
+                             (self.tmp / "p" / name).read_bytes())
+        self.assertEqual(_texts(self.tmp / "s" / "000004.docx")[2], "Ref id2")
+
+    def test_name_key_and_duplicates(self) -> None:
+        fill_records(self.template, self.records, self.tmp / "k",
+                     name_key="customer.id")
+        self.assertTrue((self.tmp / "k" / "id4.docx").is_file())
+        with self.assertRaises(RecordError) as cm:
+            fill_records(self.template, self.records, self.tmp / "d",
+                         name_key="invoice.due")
+        self.assertEqual(cm.exception.line, 2)
+
+    def test_name_resolving_to_template_refused(self) -> None:
+        before = self.template.read_bytes()
+        self.records.write_text('{"customer": {"name": "a"}}\n'
+                                '{"customer": {"name": "t"}}\n', encoding="utf-8")
+        with self.assertRaises(TemplateOverwriteError) as cm:
+            fill_records(self.template, self.records, self.tmp,
+                         name_key="customer.name", jobs=2)
+        self.assertEqual(cm.exception.line, 2)
+        with redirect_stderr(io.StringIO()):
+            rc = main([str(self.template), "--records", str(self.records),
+                       "--out-dir", str(self.tmp), "--name-key", "customer.name"])
+        self.assertEqual(rc, 6)
+        self.assertEqual(self.template.read_bytes(), before)
+
+    def test_cli(self) -> None:
+        err = io.StringIO()
+        with redirect_stderr(err):
+            rc = main([str(self.template), "--records", str(self.records),
+                       "--out-dir", str(self.tmp / "cli"), "--jobs", "2"])
+            self.assertEqual(rc, 0)
+            self.assertIn("Unresolved placeholders in 1 record(s)", err.getvalue())
+            rc = main([str(self.template), "--records", str(self.records),
+                       "--out-dir", str(self.tmp / "cli2"), "--strict"])
+            self.assertEqual(rc, 1)
+            rc = main([str(self.template), "--records", str(self.records)])
+            self.assertEqual(rc, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Unit tests for docx_merge.py — batched in-memory merge.
+
+Fixtures are synthetic python-docx chapters from `bench_docx_merge`
+(heading, list, table, bookmark, hyperlink, inline PNG), so every
+relocation pass in `MergeSession.append` is exercised.
+"""
+from __future__ import annotations
+
+import io
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import docx  # type: ignore
+from docx.oxml.ns import qn  # type: ignore
+from lxml import etree  # type: ignore
+
+from bench_docx_merge import build_chapters, time_merge
+from docx_merge import PR_NS, R_NS, main, merge_files, merge_into_base
+from office.package import Package
+from office.unpack import unpack
+
+
+def _part(path: Path, name: str) -> etree._Element:
+    with zipfile.ZipFile(path) as z:
+        return etree.fromstring(z.read(name))
+
+
+class TestMergeFiles(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._td = tempfile.TemporaryDirectory()
+        cls.tmp = Path(cls._td.name)
+        cls.inputs = build_chapters(cls.tmp / "in", 4, paragraphs=3)
+        cls.out = cls.tmp / "merged.docx"
+        cls.totals = merge_files(cls.inputs, cls.out,
+                                 page_break_before=True, merge_styles=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._td.cleanup()
+
+    def test_body_in_input_order(self) -> None:
+        doc = _part(self.out, "word/document.xml")
+        headings = [
+            "".join(p.itertext()) for p in doc.iter(qn("w:p"))
+            if "".join(p.itertext()).startswith("Chapter ") and
+            "," not in "".join(p.itertext())
+        ]
+        self.assertEqual(headings, [f"Chapter {i}" for i in range(4)])
+        self.assertEqual(doc.find(qn("w:body"))[-1].tag, qn("w:sectPr"))
+
+    def test_bookmark_ids_unique(self) -> None:
+        doc = _part(self.out, "word/document.xml")
+        ids = [bm.get(qn("w:id")) for bm in doc.iter(qn("w:bookmarkStart"))]
+        self.assertEqual(len(ids), 4)
+        self.assertEqual(len(set(ids)), 4)
+        self.assertEqual(self.totals["bookmark_rewrites"], 6)  # 3 extras × start/end
+
+    def test_every_rid_reference_resolves(self) -> None:
+        rels = _part(self.out, "word/_rels/document.xml.rels")
+        ids = [r.get("Id") for r in rels.iter(f"{{{PR_NS}}}Relationship")]
+        self.assertEqual(len(ids), len(set(ids)))
+        targets = {r.get("Id"): r.get("Target")
+                   for r in rels.iter(f"{{{PR_NS}}}Relationship")}
+        doc = _part(self.out, "word/document.xml")
+        refs = [el.get(f"{{{R_NS}}}{a}") for el in doc.iter()
+                for a in ("embed", "id") if el.get(f"{{{R_NS}}}{a}")]
+        self.assertEqual(len(refs), 8)  # 4 × (picture + hyperlink)
+        for rid in refs:
+            self.assertIn(rid, targets)
+        with zipfile.ZipFile(self.out) as z:
+            names = set(z.namelist())
+            self.assertIsNone(z.testzip())
+        for rid in refs:
+            if targets[rid].startswith("media/"):
+                self.assertIn("word/" + targets[rid], names)
+
+    def test_numbering_ids_resolve_and_keep_schema_order(self) -> None:
+        numbering = _part(self.out, "word/numbering.xml")
+        tags = [c.tag for c in numbering if c.tag in
+                (qn("w:abstractNum"), qn("w:num"))]
+        last_anum = max(i for i, t in enumerate(tags) if t == qn("w:abstractNum"))
+        first_num = tags.index(qn("w:num"))
+        self.assertLess(last_anum, first_num)
+        num_ids = [n.get(qn("w:numId")) for n in numbering.iter(qn("w:num"))]
+        self.assertEqual(len(num_ids), len(set(num_ids)))
+        doc = _part(self.out, "word/document.xml")
+        used = {e.get(qn("w:val")) for e in doc.iter(qn("w:numId"))}
+        self.assertTrue(used <= set(num_ids))
+
+    def test_untouched_base_members_copied_raw(self) -> None:
+        with zipfile.ZipFile(self.inputs[0]) as a, zipfile.ZipFile(self.out) as b:
+            for name in ("word/theme/theme1.xml", "word/settings.xml"):
+                self.assertEqual(a.getinfo(name).CRC, b.getinfo(name).CRC)
+
+    def test_base_written_once(self) -> None:
+        with mock.patch.object(Package, "save", autospec=True,
+                               side_effect=Package.save) as save:
+            merge_files(self.inputs, self.tmp / "again.docx",
+                        page_break_before=False, merge_styles=True)
+        self.assertEqual(save.call_count, 1)
+
+    def test_cli_summary(self) -> None:
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            rc = main([str(self.tmp / "cli.docx"), *map(str, self.inputs[:2])])
+        self.assertEqual(rc, 0, err.getvalue())
+        self.assertIn("merged 2 inputs", out.getvalue())
+        self.assertIn("+1 media", out.getvalue())
+
+
+class TestMergeIntoBase(unittest.TestCase):
+    def test_unpacked_trees_merge_in_place(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td)
+            a, b = build_chapters(tmp / "in", 2, paragraphs=2)
+            unpack(a, tmp / "base")
+            unpack(b, tmp / "extra")
+            stats = merge_into_base(tmp / "base", tmp / "extra", 1,
+                                    page_break_before=False, merge_styles=True)
+            self.assertEqual(stats["media"], 1)
+            self.assertTrue((tmp / "base/word/media/extra1_image1.png").is_file())
+            text = (tmp / "base/word/document.xml").read_text(encoding="utf-8")
+            self.assertIn("Chapter 1", text)
+
+
+class TestParallelPrepare(unittest.TestCase):
+    def test_jobs_output_and_warnings_match_serial(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td)
+            inputs = build_chapters(tmp / "in", 5, paragraphs=2)
+            d = docx.Document(str(inputs[2]))
+            d.sections[0].header.paragraphs[0].text = "Running head"
+            d.save(str(inputs[2]))
+            runs = {}
+            for jobs in (1, 2):
+                err = io.StringIO()
+                totals = merge_files(inputs, tmp / f"j{jobs}.docx", jobs=jobs,
+                                     page_break_before=True, merge_styles=True,
+                                     stderr=err)
+                runs[jobs] = ((tmp / f"j{jobs}.docx").read_bytes(),
+                              err.getvalue(), totals)
+            self.assertIn("ch0002.docx contains unsupported parts", runs[1][1])
+            self.assertEqual(runs[1], runs[2])
+
+    def test_jobs_rejects_non_positive(self) -> None:
+        err = io.StringIO()
+        with redirect_stderr(err), self.assertRaises(SystemExit) as cm:
+            main(["out.docx", "a.docx", "b.docx", "--jobs", "0"])
+        self.assertEqual(cm.exception.code, 2)
+
+
+class TestMergeScaling(unittest.TestCase):
+    def test_per_document_cost_is_flat(self) -> None:
+        """4× the chapters must cost well under 4× the per-chapter time
+        a quadratic merge would show."""
+        with tempfile.TemporaryDirectory() as td:
+            chapters = build_chapters(Path(td) / "in", 48, paragraphs=5)
+            time_merge(chapters[:4], Path(td) / "warm.docx")
+            small = time_merge(chapters[:12], Path(td) / "s.docx") / 12
+            large = time_merge(chapters, Path(td) / "l.docx") / 48
+        self.assertLess(large / small, 2.0,
+                        f"ms/doc grew from {small * 1e3:.1f} to {large * 1e3:.1f}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,10 +18,13 @@ Downstream sub-task mapping per class:
   TestPostValidate             → task-006-07a
   TestLibraryMode              → task-006-07b
   TestHonestScopeLocks         → task-006-08
+  TestBatch                    → --batch (one parse, many actions)
 """
 
 import copy
 import io
+import json
+import os
 import shutil
 import subprocess
 import sys
@@ -36,9 +39,11 @@ try:
         _deep_clone,
         _do_delete_paragraph,
         _do_insert_after,
+        _do_batch,
         _do_replace,
         _extract_insert_paragraphs,
         _iter_searchable_parts,
+        _load_batch,
         _materialise_md_source,
         _parse_scope,
         _post_validate_enabled,
@@ -49,6 +54,7 @@ try:
         _tempdir,
         build_parser,
         main,
+        _AppError,
         AnchorNotFound,
         LastParagraphCannotBeDeleted,
         EmptyInsertSource,
@@ -1321,11 +1327,20 @@ class TestCli(unittest.TestCase):
 # ── TestPostValidate ──────────────────────────────────────────────────────────
 
 class TestPostValidate(unittest.TestCase):
-    """Post-operation validation gate (office.validate subprocess).
+    """Post-operation validation gate (office.validate in a worker process).
 
     Flipped GREEN in task-006-07a.
     """
 
+    def setUp(self):
+        # The worker is forked on first use and inherits whatever
+        # `validate_file` is patched in at that moment: start each test
+        # with no worker, and leave none behind.
+        if _DOCX_REPLACE_AVAILABLE:
+            import docx_replace
+            docx_replace._stop_validate_worker()
+            self.addCleanup(docx_replace._stop_validate_worker)
+
     @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
     def test_env_truthy_enables_validator(self):
         """DOCX_REPLACE_POST_VALIDATE env truthy → _post_validate_enabled() returns True."""
@@ -1346,32 +1361,47 @@ class TestPostValidate(unittest.TestCase):
 
     @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
     def test_validator_failure_unlinks_output_exit7(self):
-        """Validator exit non-zero → output file unlinked + PostValidateFailed raised."""
+        """Validator reports errors → output file unlinked + PostValidateFailed raised."""
         import tempfile
         from pathlib import Path
+        from office.validators.base import ValidationReport
         with tempfile.TemporaryDirectory() as tmp:
             out = Path(tmp) / "result.docx"
             out.write_bytes(b"fake docx content")
-            scripts_dir = Path(tmp)
-            fake_result = subprocess.CompletedProcess(
-                args=[], returncode=1, stdout="", stderr="INVALID",
-            )
-            with mock.patch("subprocess.run", return_value=fake_result):
+            report = ValidationReport(errors=["INVALID"])
+            with mock.patch("docx_replace.validate_file", return_value=report):
                 with self.assertRaises(PostValidateFailed) as ctx:
-                    _run_post_validate(out, scripts_dir)
+                    _run_post_validate(out)
             self.assertFalse(out.exists(), "Output must be unlinked on validate failure")
             exc = ctx.exception
             self.assertEqual(exc.code, 7)
-            self.assertIn("INVALID", exc.details.get("stderr", ""))
+            self.assertEqual(exc.details.get("returncode"), 1)
+            self.assertIn("ERROR: INVALID", exc.details.get("stderr", ""))
 
     @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
-    def test_env_unset_no_subprocess(self):
-        """DOCX_REPLACE_POST_VALIDATE unset → no office.validate subprocess spawned.
+    def test_validator_passes_real_output(self):
+        """A clean package passes the gate and is left in place; no
+        `python -m office.validate` subprocess is spawned."""
+        skill_dir = Path(__file__).resolve().parent.parent.parent
+        fixture = skill_dir / "examples" / "docx_replace_body.docx"
+        if not fixture.is_file():
+            self.skipTest(f"Fixture not found: {fixture}")
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "result.docx"
+            with mock.patch.dict("os.environ", {"DOCX_REPLACE_POST_VALIDATE": "1"}), \
+                    mock.patch("subprocess.run") as mock_run:
+                rc = main([str(fixture), str(out),
+                           "--anchor", "May 2024", "--replace", "June 2025"])
+            self.assertEqual(rc, 0)
+            self.assertTrue(out.is_file())
+            mock_run.assert_not_called()
+
+    @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
+    def test_env_unset_no_validation(self):
+        """DOCX_REPLACE_POST_VALIDATE unset → office.validate is never called.
 
         NOTE: The unit tests test_validator_failure_unlinks_output_exit7 and
-        the timeout variant provide the primary R9 coverage. An E2E sabotage
-        test would require patching office.validate in-process, which is not
-        straightforward from shell. The unit tests are considered sufficient.
+        the crash variant provide the primary R9 coverage.
         """
         import tempfile
         from pathlib import Path
@@ -1387,21 +1417,14 @@ class TestPostValidate(unittest.TestCase):
         with mock.patch.dict("os.environ", env_without_var, clear=True):
             with tempfile.TemporaryDirectory() as tmp:
                 out = Path(tmp) / "result.docx"
-                with mock.patch("subprocess.run", wraps=subprocess.run) as mock_run:
+                with mock.patch("docx_replace.validate_file") as mock_validate:
                     rc = main([
                         str(fixture), str(out),
                         "--anchor", "May 2024",
                         "--replace", "June 2025",
                     ])
                 self.assertEqual(rc, 0)
-                # Verify no call to office.validate was made.
-                for call in mock_run.call_args_list:
-                    args = call[0][0] if call[0] else call[1].get("args", [])
-                    cmd_str = " ".join(str(a) for a in args)
-                    self.assertNotIn(
-                        "office.validate", cmd_str,
-                        "office.validate must NOT be called when env var is unset",
-                    )
+                mock_validate.assert_not_called()
 
     @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
     def test_pack_validate_replace_pattern(self):
@@ -1445,24 +1468,64 @@ class TestPostValidate(unittest.TestCase):
             )
 
     @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
-    def test_run_post_validate_timeout_unlinks_output(self):
-        """TimeoutExpired → PostValidateFailed with details['reason']=='timeout' + output unlinked."""
+    def test_run_post_validate_crash_unlinks_output(self):
+        """Validator raises → PostValidateFailed with details['reason']=='validator-error' + output unlinked."""
         import tempfile
         from pathlib import Path
         with tempfile.TemporaryDirectory() as tmp:
             out = Path(tmp) / "result.docx"
             out.write_bytes(b"fake docx content")
-            scripts_dir = Path(tmp)
-            with mock.patch(
-                "subprocess.run",
-                side_effect=subprocess.TimeoutExpired(cmd=[], timeout=60),
-            ):
+            with mock.patch("docx_replace.validate_file",
+                            side_effect=RuntimeError("boom")):
                 with self.assertRaises(PostValidateFailed) as ctx:
-                    _run_post_validate(out, scripts_dir)
+                    _run_post_validate(out)
+            self.assertFalse(out.exists(), "Output must be unlinked on validator error")
+            exc = ctx.exception
+            self.assertEqual(exc.code, 7)
+            self.assertEqual(exc.details.get("reason"), "validator-error")
+            self.assertIn("boom", exc.details.get("stderr", ""))
+
+    @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
+    def test_run_post_validate_timeout_unlinks_output(self):
+        """Validator overruns the deadline → worker killed, PostValidateFailed
+        with details['reason']=='timeout' + output unlinked."""
+        import time
+        import docx_replace
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "result.docx"
+            out.write_bytes(b"fake docx content")
+            with mock.patch("docx_replace.validate_file",
+                            side_effect=lambda _p: time.sleep(60)), \
+                    mock.patch("docx_replace._POST_VALIDATE_TIMEOUT", 0.5):
+                start = time.monotonic()
+                with self.assertRaises(PostValidateFailed) as ctx:
+                    _run_post_validate(out)
+                self.assertLess(time.monotonic() - start, 10)
             self.assertFalse(out.exists(), "Output must be unlinked on timeout")
             exc = ctx.exception
             self.assertEqual(exc.code, 7)
             self.assertEqual(exc.details.get("reason"), "timeout")
+            self.assertIsNone(docx_replace._VALIDATE_WORKER)
+
+    @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
+    def test_run_post_validate_worker_death_is_contained(self):
+        """A validator that takes its process down fails the gate; the
+        editing process survives and the next call gets a fresh worker."""
+        from office.validators.base import ValidationReport
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "result.docx"
+            out.write_bytes(b"fake docx content")
+            with mock.patch("docx_replace.validate_file",
+                            side_effect=lambda _p: os._exit(3)):
+                with self.assertRaises(PostValidateFailed) as ctx:
+                    _run_post_validate(out)
+            self.assertEqual(ctx.exception.details.get("reason"), "validator-error")
+            self.assertIn("code 3", ctx.exception.details.get("stderr", ""))
+            out.write_bytes(b"fake docx content")
+            with mock.patch("docx_replace.validate_file",
+                            return_value=ValidationReport()):
+                _run_post_validate(out)
+            self.assertTrue(out.exists())
 
     @unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
     def test_cross_filesystem_replace_falls_back_to_shutil_move(self):
@@ -1488,9 +1551,17 @@ class TestPostValidate(unittest.TestCase):
 
         with tempfile.TemporaryDirectory() as tmp:
             out_path = Path(tmp) / "result.docx"
-            # Patch os.replace to raise EXDEV (cross-device link error).
-            exdev_exc = OSError(_errno.EXDEV, "Invalid cross-device link")
-            with mock.patch("docx_replace.os.replace", side_effect=exdev_exc), \
+            # Patch os.replace to raise EXDEV (cross-device link error)
+            # for the move onto OUTPUT. `os` is shared, so the same-directory
+            # rename inside Package.save must still go through.
+            real_replace = os.replace
+
+            def fake_replace(src, dst):
+                if Path(dst) == out_path:
+                    raise OSError(_errno.EXDEV, "Invalid cross-device link")
+                real_replace(src, dst)
+
+            with mock.patch("docx_replace.os.replace", side_effect=fake_replace), \
                  mock.patch("docx_replace.shutil.move", side_effect=fake_move):
                 rc = main([
                     str(fixture), str(out_path),
@@ -1561,11 +1632,17 @@ class TestLibraryMode(unittest.TestCase):
                 all=False,
                 json_errors=False,
             )
-            # Patch office.pack to confirm it is NOT called.
-            with mock.patch("docx_replace.pack") as mock_pack:
+            # Wrap Package.save to confirm no archive is written: library
+            # mode only saves the tree in place (no destination).
+            from office.package import Package
+            with mock.patch.object(
+                Package, "save", autospec=True, side_effect=Package.save,
+            ) as mock_save:
                 rc = _run(args)
             self.assertEqual(rc, 0, "Library mode should return 0 on success")
-            mock_pack.assert_not_called()
+            self.assertTrue(mock_save.called)
+            for call in mock_save.call_args_list:
+                self.assertIsNone(call.args[1] if len(call.args) > 1 else None)
             # Verify the paragraph was deleted from the tree on disk.
             doc_after = _etree.parse(str(doc_xml)).getroot()
             paras_after = [
@@ -2293,5 +2370,131 @@ class TestPathTraversal(unittest.TestCase):
             shutil.rmtree(insert, ignore_errors=True)
 
 
+
+# ── TestBatch ────────────────────────────────────────────────────────────────
+
+def _paragraph_texts(tree_root: Path) -> list[str]:
+    from lxml import etree as _etree
+    W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    doc = _etree.parse(str(tree_root / "word" / "document.xml")).getroot()
+    return [
+        "".join(t.text or "" for t in p.iter(f"{{{W}}}t"))
+        for p in doc.iter(f"{{{W}}}p")
+    ]
+
+
+@unittest.skipUnless(_DOCX_REPLACE_AVAILABLE, "docx_replace not yet importable")
+class TestBatch(unittest.TestCase):
+    """``--batch``: many replace / delete-paragraph actions over one parse."""
+
+    _PARAS = [
+        [({}, "alpha one")],
+        [({}, "beta "), ({}, "two")],  # merged before matching
+        [({"b": ""}, "gamma"), ({}, " three")],
+        [({}, "delta four")],
+        [({}, "alpha five")],
+    ]
+    _ACTIONS = [
+        {"anchor": "alpha", "replace": "ALPHA", "all": True},
+        {"anchor": "beta two", "replace": "epsilon"},
+        {"anchor": "epsilon", "replace": "zeta"},  # sees action 1's text
+        {"anchor": "delta", "delete_paragraph": True, "all": False},
+        {"anchor": "ALPHA five", "replace": "omega"},
+    ]
+
+    def test_batch_matches_sequential_actions(self):
+        with _build_minimal_tree(self._PARAS) as seq, \
+                _build_minimal_tree(self._PARAS) as batch:
+            expected = []
+            for a in self._ACTIONS:
+                if "replace" in a:
+                    n = _do_replace(Path(seq), a["anchor"], a["replace"],
+                                    anchor_all=a.get("all", False))
+                else:
+                    n = _do_delete_paragraph(Path(seq), a["anchor"],
+                                             anchor_all=a.get("all", False))
+                expected.append(n)
+            actions = [dict(a, all=a.get("all", False)) for a in self._ACTIONS]
+            counts = _do_batch(Path(batch), actions)
+            self.assertEqual(counts, expected)
+            self.assertEqual(counts, [2, 1, 1, 1, 1])
+            self.assertEqual(_paragraph_texts(Path(batch)),
+                             _paragraph_texts(Path(seq)))
+            self.assertEqual(_paragraph_texts(Path(batch)),
+                             ["ALPHA one", "zeta", "gamma three", "omega"])
+
+    def test_only_candidate_paragraphs_are_visited(self):
+        """N actions over P paragraphs must not cost N × P run scans."""
+        import _actions
+        paras = [[({}, f"item {i:03d}.")] for i in range(200)]
+        actions = [{"anchor": f"item {i:03d}.", "replace": f"done {i}.",
+                    "all": False} for i in range(0, 200, 2)]
+        with _build_minimal_tree(paras) as tmp, mock.patch.object(
+            _actions, "_replace_in_run", wraps=_actions._replace_in_run,
+        ) as spy:
+            counts = _do_batch(Path(tmp), actions)
+            texts = _paragraph_texts(Path(tmp))
+        self.assertEqual(counts, [1] * 100)
+        self.assertEqual(spy.call_count, 100)
+        self.assertEqual(texts[:3], ["done 0.", "item 001.", "done 2."])
+
+    def test_missing_anchor_aborts_without_writing(self):
+        with _build_minimal_tree(self._PARAS) as tmp:
+            before = (Path(tmp) / "word" / "document.xml").read_bytes()
+            with self.assertRaises(AnchorNotFound) as cm:
+                _do_batch(Path(tmp), [
+                    {"anchor": "alpha", "replace": "A", "all": True},
+                    {"anchor": "nowhere", "replace": "x", "all": False},
+                ])
+            self.assertEqual(cm.exception.details["actions"], [1])
+            after = (Path(tmp) / "word" / "document.xml").read_bytes()
+        self.assertEqual(before, after)
+
+    def test_load_batch_validation(self):
+        bad = [
+            {},
+            [],
+            [{"anchor": "", "replace": "x"}],
+            [{"anchor": "a"}],
+            [{"anchor": "a", "replace": "x", "delete_paragraph": True}],
+            [{"anchor": "a", "insert_after": "x.md"}],
+            [{"anchor": "a", "replace": 3}],
+            [{"anchor": "a", "replace": "x", "all": "yes"}],
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "batch.json"
+            for payload in bad:
+                path.write_text(json.dumps(payload))
+                with self.assertRaises(_AppError, msg=payload) as cm:
+                    _load_batch(path)
+                self.assertEqual(cm.exception.code, 2)
+            path.write_text('[{"anchor": "a", "delete_paragraph": true}]')
+            self.assertEqual(
+                _load_batch(path, default_all=True),
+                [{"anchor": "a", "all": True, "delete_paragraph": True}],
+            )
+
+    def test_cli_zip_mode(self):
+        skill_dir = Path(__file__).resolve().parent.parent.parent
+        fixture = skill_dir / "examples" / "docx_replace_body.docx"
+        if not fixture.is_file():
+            self.skipTest(f"Fixture not found: {fixture}")
+        with tempfile.TemporaryDirectory() as tmp:
+            batch = Path(tmp) / "batch.json"
+            batch.write_text(json.dumps([
+                {"anchor": "May 2024", "replace": "June 2025", "all": True},
+                {"anchor": "June 2025", "replace": "July 2026"},
+            ]))
+            out = Path(tmp) / "out.docx"
+            err = io.StringIO()
+            with mock.patch("sys.stderr", err):
+                rc = main([str(fixture), str(out), "--batch", str(batch)])
+            self.assertEqual(rc, 0, err.getvalue())
+            self.assertIn("applied 2 batch action(s)", err.getvalue())
+            rc = main([str(fixture), str(Path(tmp) / "x.docx"),
+                       "--batch", str(batch), "--anchor", "May 2024"])
+            self.assertEqual(rc, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1216,6 +1216,43 @@ with zipfile.ZipFile('$TMP/single.docx') as z:
     && ok "VDD-A: default mode still produces exactly 1 comment (got $n)" \
     || nok "VDD-A default-mode regression" "got $n, expected 1"
 
+# --batch: many comments over one parse. Entries run in order, so the
+# reply can thread onto the comment the first entry creates.
+cat > "$TMP/comments.json" <<'JSON'
+[
+  {"anchor_text": "cat", "comment": "which cat?"},
+  {"anchor_text": "the", "comment": "article", "all": true, "author": "Jane Roe"},
+  {"parent": 0, "comment": "the grey one"}
+]
+JSON
+"$PY" docx_add_comment.py "$TMP/intra.docx" "$TMP/batch_c.docx" \
+    --batch "$TMP/comments.json" --author "Q" >/dev/null 2>&1
+"$PY" -c "
+import zipfile, re
+with zipfile.ZipFile('$TMP/batch_c.docx') as z:
+    cx = z.read('word/comments.xml').decode()
+    doc = z.read('word/document.xml').decode()
+    ext = z.read('word/commentsExtended.xml').decode()
+authors = re.findall(r'<w:comment [^>]*w:author=\"([^\"]*)\"', cx)
+assert authors == ['Q', 'Jane Roe', 'Jane Roe', 'Jane Roe', 'Q'], authors
+assert len(re.findall(r'<w:commentRangeStart', doc)) == 5
+assert 'paraIdParent' in ext, 'reply not threaded'
+print('batch comments verified')
+" 2>&1 | grep -q "batch comments verified" \
+    && ok "--batch adds anchored comments + reply in one run" \
+    || nok "add_comment --batch" "see python output"
+
+set +e
+err=$("$PY" docx_add_comment.py "$TMP/intra.docx" "$TMP/_xb.docx" \
+    --batch <(echo '[{"anchor_text": "cat", "comment": "a"}, {"anchor_text": "ZZZ", "comment": "b"}]') \
+    --json-errors 2>&1 >/dev/null)
+rc=$?
+set -e
+[ "$rc" -eq 2 ] && [ ! -e "$TMP/_xb.docx" ] \
+    && echo "$err" | "$PY" -c "import sys, json; j=json.loads(sys.stdin.read()); assert j['type']=='AnchorNotFound' and j['details']['entries']==[1], j" 2>/dev/null \
+    && ok "--batch with an unmatched entry → exit 2, nothing written" \
+    || nok "add_comment --batch not found" "rc=$rc msg=$err"
+
 # VDD-B: same-path I/O must refuse with exit 6 + SelfOverwriteRefused envelope
 cp "$TMP/out.docx" "$TMP/vdb.docx"
 sz_b=$(wc -c < "$TMP/vdb.docx" | tr -d ' ')
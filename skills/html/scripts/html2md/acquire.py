@@ -15,6 +15,7 @@ import atexit
 import contextlib
 import functools
 import html as _html
+import importlib.util
 import ipaddress
 import json
 import os
@@ -23,7 +24,9 @@ import shutil
 import socket
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
 from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlparse
@@ -46,6 +49,7 @@ _LITE_SUBSTANTIAL_CHARS = 200  # auto-fallback: < this much extracted text ⇒ J
 _RETRY_BACKOFF_BASE = 1.0      # seconds; transient-retry delay = base * 2**attempt
 _RETRY_AFTER_CAP = 30.0        # never honour a Retry-After longer than this
 _MAX_429_RETRIES = 2           # separate cap so rate-limited hosts don't burn the budget
+_SEARCH_JOBS = 4               # --search results fetched concurrently (--jobs overrides)
 
 _sleep = time.sleep            # indirection so tests patch out real backoff waits
 _monotonic = time.monotonic    # ditto — lets the rate limiter run on a fake clock in tests
@@ -55,25 +59,39 @@ class _RateLimiter:
     """Minimal min-interval limiter (the *idea* of last30days' RateLimiter, reimplemented).
 
     Opt-in via ``--rate-limit`` (requests/sec); default disabled. Single-process,
-    single-invocation — bounds the one real burst on a page: its image downloads.
+    single-invocation — bounds the real bursts: a page's image downloads and a search's
+    result fan-out. The interval is kept PER HOST (the polite-crawl unit), and slots are
+    handed out under a lock so the concurrent search workers share one schedule.
     """
 
     def __init__(self, per_sec: float):
         self._interval = (1.0 / per_sec) if per_sec and per_sec > 0 else 0.0
-        self._next = 0.0
+        self._next: dict[str, float] = {}
+        self._lock = threading.Lock()
 
-    def wait(self) -> None:
+    def wait(self, host: str = "") -> None:
         if self._interval <= 0:
             return
-        now = _monotonic()
-        if now < self._next:
-            _sleep(self._next - now)
-        self._next = max(now, self._next) + self._interval
+        key = host.lower()
+        with self._lock:  # reserve the slot; sleep outside the lock
+            now = _monotonic()
+            slot = max(now, self._next.get(key, 0.0))
+            self._next[key] = slot + self._interval
+        if slot > now:
+            _sleep(slot - now)
 
 
 _RATE_LIMITER: "_RateLimiter | None" = None  # set per-invocation from opts.rate_limit
 
 
+def _configure_rate_limiter(opts) -> None:
+    """Configure (or clear) the throttle for the WHOLE run from ``opts.rate_limit`` — reset
+    every invocation so a prior in-process call cannot leak a stale limiter."""
+    global _RATE_LIMITER
+    rate = getattr(opts, "rate_limit", None)
+    _RATE_LIMITER = _RateLimiter(rate) if rate else None
+
+
 def _retry_after_seconds(resp) -> float | None:
     """Parse a numeric ``Retry-After`` header (seconds), capped. HTTP-date form ignored."""
     val = resp.headers.get("retry-after") if getattr(resp, "headers", None) else None
@@ -125,6 +143,16 @@ def _cleanup_work_dirs() -> None:
         shutil.rmtree(d, ignore_errors=True)
 
 
+def _release_work_dir(path: str) -> None:
+    """Remove one archive's work dir once its document is emitted — a ``--batch`` of
+    thousands of archives must not hold every extraction until exit."""
+    try:
+        _TEMP_DIRS.remove(path)
+    except ValueError:
+        return  # not a work dir (file / url input)
+    shutil.rmtree(path, ignore_errors=True)
+
+
 # --------------------------------------------------------------------------- #
 # Format dispatch
 # --------------------------------------------------------------------------- #
@@ -514,6 +542,33 @@ def _resolve_validated_addrs(host: str):
     return addrs or None
 
 
+_PIN_LOCAL = threading.local()  # .hosts: {lowercased host: addrs} pinned by THIS thread
+_PIN_LOCK = threading.Lock()
+_PIN_DEPTH = 0                  # open pin blocks, all threads; the override lives while > 0
+# The resolver the override falls through to: socket.getaddrinfo as it was when the first
+# block opened. Never cleared — a thread that picked up the override just before the last
+# block closed is still inside it and must reach a real resolver, not None.
+_PIN_REAL = socket.getaddrinfo
+
+
+def _pinned_getaddrinfo(h, port, *args, **kwargs):
+    name = h.decode() if isinstance(h, (bytes, bytearray)) else h
+    addrs = getattr(_PIN_LOCAL, "hosts", {}).get(name.lower()) if name else None
+    if addrs:
+        family = args[0] if args else kwargs.get("family", 0)
+        socktype = args[1] if len(args) > 1 else kwargs.get("type", 0)
+        proto = args[2] if len(args) > 2 else kwargs.get("proto", 0)
+        out = []
+        for ip, fam in addrs:
+            if family and family != fam:
+                continue
+            sockaddr = (ip, port) if fam == socket.AF_INET else (ip, port, 0, 0)
+            out.append((fam, socktype or socket.SOCK_STREAM, proto, "", sockaddr))
+        if out:
+            return out
+    return _PIN_REAL(h, port, *args, **kwargs)
+
+
 @contextlib.contextmanager
 def _pin_host_addrs(host: str, addrs):
     """Force ``socket.getaddrinfo`` to return ONLY ``addrs`` for ``host`` (rewritten to the
@@ -521,35 +576,35 @@ def _pin_host_addrs(host: str, addrs):
     IP(s) validated by :func:`_resolve_validated_addrs` — not a re-resolved (possibly
     rebinding) answer. TLS SNI, the ``Host`` header, and cert verification still use ``host``.
 
-    Honest scope: the patch is **process-global** — correct because the lite fetch path is
-    single-threaded per request (CLI). A concurrent fetch of a different host in the same
-    process during the (sub-millisecond) connect window would see the override; do not share
-    the process across threads doing simultaneous fetches.
+    Thread-safe: the pin is **per thread** (httpx's sync transport resolves in the calling
+    thread). The ``socket.getaddrinfo`` override itself is process-global but only consults
+    the calling thread's pins; it is installed by the first open block and the original is
+    restored when the last one closes, so concurrent search workers each connect to the
+    address THEY validated and never see (or tear down) another worker's pin.
     """
-    real = socket.getaddrinfo
+    global _PIN_DEPTH, _PIN_REAL
     hl = host.lower()
-
-    def patched(h, port, *args, **kwargs):
-        name = h.decode() if isinstance(h, (bytes, bytearray)) else h
-        if name and name.lower() == hl:
-            family = args[0] if args else kwargs.get("family", 0)
-            socktype = args[1] if len(args) > 1 else kwargs.get("type", 0)
-            proto = args[2] if len(args) > 2 else kwargs.get("proto", 0)
-            out = []
-            for ip, fam in addrs:
-                if family and family != fam:
-                    continue
-                sockaddr = (ip, port) if fam == socket.AF_INET else (ip, port, 0, 0)
-                out.append((fam, socktype or socket.SOCK_STREAM, proto, "", sockaddr))
-            if out:
-                return out
-        return real(h, port, *args, **kwargs)
-
-    socket.getaddrinfo = patched
+    pins = getattr(_PIN_LOCAL, "hosts", None)
+    if pins is None:
+        pins = _PIN_LOCAL.hosts = {}
+    saved = pins.get(hl)
+    pins[hl] = addrs
+    with _PIN_LOCK:
+        if _PIN_DEPTH == 0:
+            _PIN_REAL = socket.getaddrinfo
+            socket.getaddrinfo = _pinned_getaddrinfo
+        _PIN_DEPTH += 1
     try:
         yield
     finally:
-        socket.getaddrinfo = real
+        with _PIN_LOCK:
+            _PIN_DEPTH -= 1
+            if _PIN_DEPTH == 0:
+                socket.getaddrinfo = _PIN_REAL
+        if saved is None:
+            del pins[hl]
+        else:
+            pins[hl] = saved
 
 
 def _assert_public_http(url: str) -> None:
@@ -567,6 +622,113 @@ def _assert_public_http(url: str) -> None:
         )
 
 
+# Keep-alive client pool. A fresh ``httpx.Client`` per attempt paid DNS + TCP + TLS on
+# every page and every image of the same host; clients now live for the process, one per
+# (proxy, host, validated address set). Keying on the addresses is what keeps the pin
+# honest: a pooled connection was opened, under ``_pin_host_addrs``, to an address that
+# was validated then — and is only reused when this hop's fresh validation returned the
+# SAME set. A host that re-resolves elsewhere (rebinding, a changed carve-out) gets a new
+# client and a new, freshly-pinned connect.
+_HTTP_POOL_SIZE = 16  # clients kept; the least recently used one is retired beyond this
+_REDIRECT_DRAIN_MAX = 64 * 1024  # redirect bodies up to this are read to keep the connection
+_HTTP_CLIENTS: "dict[tuple, object]" = {}  # insertion order = LRU order
+# Checkouts per client. An evicted client may still be mid-stream on another thread
+# (concurrent --search / --batch workers easily pass 16 keys): it is only RETIRED then,
+# and closed by whichever caller releases it last.
+_HTTP_IN_USE: "dict[object, int]" = {}
+_HTTP_RETIRED: "set[object]" = set()
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``pip install 'httpx[http2]'``);
+    without it the pool speaks HTTP/1.1 keep-alive."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _http_client(host: str, pinned, proxy: "str | None"):
+    """Check out the pooled client for this hop (created on first use). Pair every call
+    with :func:`_release_http_client` — or use :func:`_checkout_http_client`."""
+    import httpx
+
+    # The address SET, not the resolver's order: a round-robin host answers in a new order
+    # on every lookup, and an order-sensitive key would open a fresh connection per hop.
+    key = (proxy, host.lower(), frozenset(pinned) if pinned else None)
+    evicted = []
+    with _HTTP_CLIENTS_LOCK:
+        client = _HTTP_CLIENTS.pop(key, None)
+        if client is None:
+            # trust_env=False is LOAD-BEARING, not tidiness: it is what makes the
+            # `_pin_host_addrs` override authoritative. With httpx's default the ambient
+            # (or macOS System Configuration) proxy resolves the target itself and the pin
+            # is inert — proven by experiment, see `_proxy_setting`. Proxying stays
+            # available, but only as an explicit, announced opt-in via $HTML_PROXY.
+            # Headers and timeout are per request, so one client serves every caller.
+            client = httpx.Client(follow_redirects=False, trust_env=False, proxy=proxy,
+                                  http2=_http2_available())
+        _HTTP_CLIENTS[key] = client
+        _HTTP_IN_USE[client] = _HTTP_IN_USE.get(client, 0) + 1
+        while len(_HTTP_CLIENTS) > _HTTP_POOL_SIZE:
+            old = _HTTP_CLIENTS.pop(next(iter(_HTTP_CLIENTS)))
+            if old in _HTTP_IN_USE:
+                _HTTP_RETIRED.add(old)  # closed on its last release
+            else:
+                evicted.append(old)
+    for old in evicted:
+        old.close()
+    return client
+
+
+def _release_http_client(client) -> None:
+    """End one checkout; close the client if it was evicted and this was its last user."""
+    with _HTTP_CLIENTS_LOCK:
+        left = _HTTP_IN_USE.get(client, 0) - 1
+        if left > 0:
+            _HTTP_IN_USE[client] = left
+            return
+        _HTTP_IN_USE.pop(client, None)
+        if client not in _HTTP_RETIRED:
+            return
+        _HTTP_RETIRED.discard(client)
+    client.close()
+
+
+@contextlib.contextmanager
+def _checkout_http_client(host: str, pinned, proxy: "str | None"):
+    client = _http_client(host, pinned, proxy)
+    try:
+        yield client
+    finally:
+        _release_http_client(client)
+
+
+def _close_http_clients() -> None:
+    with _HTTP_CLIENTS_LOCK:
+        clients = [*_HTTP_CLIENTS.values(), *_HTTP_RETIRED]
+        _HTTP_CLIENTS.clear()
+        _HTTP_RETIRED.clear()
+        _HTTP_IN_USE.clear()
+    for client in clients:
+        with contextlib.suppress(Exception):
+            client.close()
+
+
+def _forget_http_clients_in_child() -> None:
+    """A forked child must not talk over the parent's sockets (or close them with a TLS
+    close_notify): start with an empty pool."""
+    global _HTTP_CLIENTS_LOCK
+    _HTTP_CLIENTS.clear()
+    _HTTP_IN_USE.clear()
+    _HTTP_RETIRED.clear()
+    _HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+atexit.register(_close_http_clients)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_http_clients_in_child)
+
+
 def _http_get_bytes(url: str, *, max_bytes: int | None, timeout: float = 20.0,
                     max_redirects: int = 5, retries: int = 2, ua: str = _UA,
                     extra_headers: dict | None = None,
@@ -596,7 +758,7 @@ def _http_get_bytes(url: str, *, max_bytes: int | None, timeout: float = 20.0,
     import httpx
 
     if _RATE_LIMITER is not None:
-        _RATE_LIMITER.wait()
+        _RATE_LIMITER.wait(urlparse(url).hostname or "")
 
     # ``timeout`` is PER OPERATION (httpx applies it per connect/read/write), so on its own it
     # bounds nothing in total: a redirect chain multiplies it by ``max_redirects + 1`` inside
@@ -623,44 +785,45 @@ def _http_get_bytes(url: str, *, max_bytes: int | None, timeout: float = 20.0,
         if extra_headers:
             headers.update(extra_headers)
         current = url
-        # trust_env=False is LOAD-BEARING, not tidiness: it is what makes the
-        # `_pin_host_addrs` override below authoritative. With httpx's default the ambient
-        # (or macOS System Configuration) proxy resolves the target itself and the pin is
-        # inert — proven by experiment, see `_proxy_setting`. Proxying stays available, but
-        # only as an explicit, announced opt-in via $HTML_PROXY.
-        with httpx.Client(follow_redirects=False, timeout=timeout, headers=headers,
-                          trust_env=False, proxy=_proxy_setting()) as client:
-            for _ in range(max_redirects + 1):
-                _check_deadline("redirect")  # bounds the (max_redirects + 1) multiplier
-                _assert_public_http(current)  # scheme + fast pre-check (anti-SSRF)
-                # Authoritative SSRF check + pin: resolve once, validate, and connect to the
-                # EXACT validated IP so httpx cannot reach a re-resolved (DNS-rebinding) private
-                # address. Raises FetchFailed if the host resolves to anything non-public (fail
-                # closed). None only when the host doesn't resolve here (offline/mocked tests) →
-                # plain connect, which is safe because an unresolvable host can't be connected to.
-                host = urlparse(current).hostname or ""
-                pinned = _resolve_validated_addrs(host)
-                pin_cm = _pin_host_addrs(host, pinned) if pinned else contextlib.nullcontext()
-                with pin_cm, client.stream("GET", current) as resp:
-                    if resp.is_redirect and "location" in resp.headers:
-                        current = urljoin(current, resp.headers["location"])
-                        continue
-                    resp.raise_for_status()
-                    chunks: list[bytes] = []
-                    total = 0
-                    for chunk in resp.iter_bytes():
-                        _check_deadline("body")  # bounds the slow-drip: max_bytes caps SIZE,
-                        total += len(chunk)      # never TIME, and each read resets the timeout
-                        if max_bytes is not None and total > max_bytes:
-                            raise FetchFailed(
-                                f"response exceeds --max-bytes ({max_bytes}) for "
-                                f"{_redact(current)}",
-                                details={"url": _redact(current), "max_bytes": max_bytes},
-                            )
-                        chunks.append(chunk)
-                    if final_url_out is not None:
-                        final_url_out[:] = [current]  # post-redirect base for absolutization
-                    return b"".join(chunks)
+        proxy = _proxy_setting()
+        for _ in range(max_redirects + 1):
+            _check_deadline("redirect")  # bounds the (max_redirects + 1) multiplier
+            _assert_public_http(current)  # scheme + fast pre-check (anti-SSRF)
+            # Authoritative SSRF check + pin: resolve once, validate, and connect to the
+            # EXACT validated IP so httpx cannot reach a re-resolved (DNS-rebinding) private
+            # address. Raises FetchFailed if the host resolves to anything non-public (fail
+            # closed). None only when the host doesn't resolve here (offline/mocked tests) →
+            # plain connect, which is safe because an unresolvable host can't be connected to.
+            # The pooled client is keyed on the same validated set (see `_http_client`).
+            host = urlparse(current).hostname or ""
+            pinned = _resolve_validated_addrs(host)
+            pin_cm = _pin_host_addrs(host, pinned) if pinned else contextlib.nullcontext()
+            with _checkout_http_client(host, pinned, proxy) as client, pin_cm, \
+                    client.stream("GET", current, headers=headers, timeout=timeout) as resp:
+                if resp.is_redirect and "location" in resp.headers:
+                    # An unread response is closed rather than pooled: drain a short
+                    # redirect body so the next hop can reuse the connection.
+                    length = resp.headers.get("content-length", "")
+                    if length.isdigit() and int(length) <= _REDIRECT_DRAIN_MAX:
+                        resp.read()
+                    current = urljoin(current, resp.headers["location"])
+                    continue
+                resp.raise_for_status()
+                chunks: list[bytes] = []
+                total = 0
+                for chunk in resp.iter_bytes():
+                    _check_deadline("body")  # bounds the slow-drip: max_bytes caps SIZE,
+                    total += len(chunk)      # never TIME, and each read resets the timeout
+                    if max_bytes is not None and total > max_bytes:
+                        raise FetchFailed(
+                            f"response exceeds --max-bytes ({max_bytes}) for "
+                            f"{_redact(current)}",
+                            details={"url": _redact(current), "max_bytes": max_bytes},
+                        )
+                    chunks.append(chunk)
+                if final_url_out is not None:
+                    final_url_out[:] = [current]  # post-redirect base for absolutization
+                return b"".join(chunks)
         raise FetchFailed(
             f"too many redirects (> {max_redirects}) for {_redact(url)}",
             details={"url": _redact(url)},
@@ -1262,12 +1425,11 @@ def run_search(query: str, opts) -> "list[AcquireResult]":
 
     Vendor-agnostic: tries each search provider in order, falling through on provider-down;
     extracts result URLs and fetches EACH through the full FETCH ladder (:func:`_acquire_url`)
-    so every result inherits per-result Jina/local fallback. A result whose own ladder fails
-    is skipped (not fatal). A healthy search with zero results returns ``[]`` (caller emits a
+    so every result inherits per-result Jina/local fallback — up to ``--jobs`` at a time,
+    returned in the provider's rank order. A result whose own ladder fails is skipped (not
+    fatal). A healthy search with zero results returns ``[]`` (caller emits a
     note, exit 0); only an all-providers-down state raises one typed FetchFailed."""
-    global _RATE_LIMITER
-    rate = getattr(opts, "rate_limit", None)
-    _RATE_LIMITER = _RateLimiter(rate) if rate else None  # throttle covers the whole search run
+    _configure_rate_limiter(opts)  # throttle covers the whole search run
     _assert_safe_query(query)
     max_results = getattr(opts, "max_results", 5) or 5
     max_bytes = getattr(opts, "max_bytes", None)
@@ -1304,13 +1466,25 @@ def run_search(query: str, opts) -> "list[AcquireResult]":
     # the un-network-hardened chrome tier in non-explicit-chrome modes — chrome follows
     # redirects to internal hosts. chrome is allowed only if the user explicitly chose it.
     allow_chrome = (getattr(opts, "engine", "auto") or "auto").lower() == "chrome"
-    results: list[AcquireResult] = []
-    for u in urls[:max_results]:
+
+    def _fetch(u: str) -> "AcquireResult | None":
         try:
-            results.append(_acquire_url(u, opts, allow_chrome=allow_chrome))
+            return _acquire_url(u, opts, allow_chrome=allow_chrome)
         except (FetchFailed, EngineNotInstalled):
-            continue  # a result whose own ladder fails is skipped, not fatal
-    return results
+            return None  # a result whose own ladder fails is skipped, not fatal
+
+    # Results are fetched concurrently (each its own full ladder), so a search costs about
+    # its slowest page rather than the sum. ``pool.map`` keeps the provider's rank order.
+    # The explicit chrome engine stays one-at-a-time: each result would launch a browser.
+    targets = urls[:max_results]
+    jobs = 1 if allow_chrome else max(1, getattr(opts, "jobs", None) or _SEARCH_JOBS)
+    if jobs == 1 or len(targets) < 2:
+        fetched = [_fetch(u) for u in targets]
+    else:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(targets)),
+                                thread_name_prefix="html-search") as pool:
+            fetched = list(pool.map(_fetch, targets))
+    return [r for r in fetched if r is not None]
 
 
 # NOTE: the former ``_fetch_jina_html`` is gone — the ``jina`` engine now flows through the
@@ -1694,12 +1868,15 @@ def _acquire_url(input_ref: str, opts, *, allow_chrome: bool = True) -> AcquireR
 
 def acquire(input_ref: str, opts) -> AcquireResult:
     """Acquire raw HTML + source metadata from a URL / archive / file (FC-1)."""
-    global _RATE_LIMITER
-    rate = getattr(opts, "rate_limit", None)
-    # Configure (or clear) the throttle for the WHOLE run — covers the page fetch AND the
-    # image-download burst, in url-mode and offline-with-remote-images alike; reset every
-    # invocation so a prior in-process call cannot leak a stale limiter.
-    _RATE_LIMITER = _RateLimiter(rate) if rate else None
+    # The throttle covers the page fetch AND the image-download burst, in url-mode and
+    # offline-with-remote-images alike.
+    _configure_rate_limiter(opts)
+    return _acquire_input(input_ref, opts)
+
+
+def _acquire_input(input_ref: str, opts) -> AcquireResult:
+    """:func:`acquire` minus the throttle reset — ``--batch`` configures the limiter once
+    for the whole run, so its per-host schedule spans every item."""
     scheme = urlparse(input_ref).scheme.lower()
     if scheme in ("http", "https"):
         return _acquire_url(input_ref, opts)
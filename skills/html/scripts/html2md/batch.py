@@ -0,0 +1,342 @@
+"""FC-6 — batch ingestion (``--batch FILE``): many INPUTs through one staged work queue.
+
+Every item takes the single-input path — acquire → clean → core → emit — but each stage
+runs on its own executor, sized for what bounds it:
+
+- **acquire + emit** — network / disk (emit downloads images): a thread pool of ``--jobs``;
+- **clean** — ``web_clean`` is pure-Python CPU work: a process pool of ``--clean-jobs``
+  (a single thread when 1);
+- **convert** — the Node turndown workers (``core_bridge``): ``--convert-jobs`` threads.
+
+The main thread only hands finished futures to their next stage, so a slow fetch never
+idles the CPU stages, and the number of items in flight is capped so a large list never
+sits in memory at once. Each finished item appends one NDJSON record to the **batch
+manifest** (``OUTPUT_DIR/.html-batch.jsonl`` by default, flushed per item); a re-run
+skips inputs already recorded ``ok``, so an interrupted batch resumes where it stopped. A
+failed item is recorded and reported, never fatal — the run exits 1 (:class:`BatchFailed`)
+if any item failed.
+
+Batch file: one INPUT (URL or local path) per line; blank lines and ``#`` comments are
+skipped; a line starting with ``{`` is an NDJSON object ``{"input": "..."}``. Relative
+paths resolve against the batch file's directory (the CWD for ``-`` = stdin).
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterator
+from urllib.parse import urlparse
+
+from . import acquire as acquire_mod
+from . import clean as clean_mod
+from . import core_bridge
+from . import emit as emit_mod
+from .cli import _markdown_from_clean, _want_reader
+from .exceptions import BadInput, BatchFailed, SelfOverwriteRefused, _AppError
+from .md_clean import tidy_markdown
+from .model import AcquireResult, CleanResult
+
+_MANIFEST_NAME = ".html-batch.jsonl"
+_NET_JOBS = 4            # --jobs default: items fetched + emitted concurrently
+_CLEAN_JOBS_MAX = 4      # --clean-jobs default: min(this, CPUs)
+_CONVERT_JOBS = 2        # --convert-jobs default (matches core_bridge's idle pool)
+_WINDOW_PER_JOB = 2      # items in flight per worker across all stages
+_STAGES = ("acquire", "clean", "convert", "emit")
+
+
+@dataclass
+class _Item:
+    """One batch line on its way through the stages. ``input`` is the URL or resolved
+    path once the line is valid — the manifest's resume key."""
+
+    line: int
+    input: str | None
+    acq: AcquireResult | None = None
+    cleaned: CleanResult | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+def _timed(fn, *args, **kwargs):
+    """``(fn(*args, **kwargs), seconds)`` — module-level so the clean stage can ship it to
+    a worker process; the time is the stage's own work, not its queueing."""
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+# --------------------------------------------------------------------------- #
+# Batch file + manifest
+# --------------------------------------------------------------------------- #
+def _read_lines(stream: IO[str]) -> Iterator[tuple[int, str | None, str | None]]:
+    """Yield ``(line_no, input, error)`` per non-blank, non-comment line, lazily."""
+    for line_no, raw in enumerate(stream, 1):
+        text = raw.strip()
+        if not text or text.startswith("#"):
+            continue
+        if not text.startswith("{"):
+            yield line_no, text, None
+            continue
+        try:
+            obj = json.loads(text)
+        except ValueError:
+            yield line_no, None, "malformed JSON line"
+            continue
+        value = obj.get("input") if isinstance(obj, dict) else None
+        if not isinstance(value, str) or not value.strip():
+            yield line_no, None, 'expected {"input": "<URL or path>"}'
+            continue
+        yield line_no, value.strip(), None
+
+
+def _resolve_input(value: str, base: Path, output_dir: Path) -> str:
+    """URL as-is; a local path resolved (strict) against the batch file's directory."""
+    if urlparse(value).scheme.lower() in ("http", "https"):
+        return value
+    try:
+        path = (base / Path(value).expanduser()).resolve(strict=True)
+    except (FileNotFoundError, NotADirectoryError) as exc:
+        raise BadInput(f"Input not found: {Path(value).name}",
+                       details={"path": Path(value).name}) from exc
+    if path == output_dir:
+        raise SelfOverwriteRefused(f"OUTPUT_DIR resolves to INPUT: {path.name}",
+                                   details={"path": path.name})
+    return str(path)
+
+
+def _completed(manifest: Path) -> set[str]:
+    """Inputs recorded ``ok`` by a previous run. Unparsable lines (e.g. a record cut short
+    by a kill) are ignored — that item simply runs again."""
+    done: set[str] = set()
+    try:
+        with open(manifest, encoding="utf-8") as fh:
+            for raw in fh:
+                try:
+                    rec = json.loads(raw)
+                except ValueError:
+                    continue
+                if isinstance(rec, dict) and rec.get("status") == "ok" and rec.get("input"):
+                    done.add(rec["input"])
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _open_manifest(manifest: Path) -> IO[str]:
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    torn = False
+    if manifest.is_file() and manifest.stat().st_size:
+        with open(manifest, "rb") as fh:
+            fh.seek(-1, os.SEEK_END)
+            torn = fh.read(1) != b"\n"
+    log = open(manifest, "a", encoding="utf-8")
+    if torn:
+        log.write("\n")  # never glue a record onto a line cut short by a kill
+    return log
+
+
+# --------------------------------------------------------------------------- #
+# Reporting
+# --------------------------------------------------------------------------- #
+def _p95(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]
+
+
+def _summary(counts: dict[str, int], stage_times: dict[str, list[float]],
+             jobs: dict[str, int], wall: float) -> str:
+    done = counts["ok"] + counts["failed"]
+    rate = done / wall if wall > 0 else 0.0
+    lines = [f"html --batch: {counts['ok']} ok, {counts['failed']} failed, "
+             f"{counts['skipped']} skipped (already done) in {wall:.2f} s "
+             f"({rate:.1f} items/s)"]
+    if any(stage_times.values()):
+        lines.append(f"  {'stage':<8} {'jobs':>4} {'items':>6} {'total s':>9} "
+                     f"{'mean ms':>9} {'p95 ms':>9}")
+    for stage in _STAGES:
+        samples = stage_times[stage]
+        if not samples:
+            continue
+        total = sum(samples)
+        lines.append(f"  {stage:<8} {jobs[stage]:>4} {len(samples):>6} {total:>9.2f} "
+                     f"{total / len(samples) * 1000:>9.1f} {_p95(samples) * 1000:>9.1f}")
+    return "\n".join(lines) + "\n"
+
+
+def _error_record(exc: BaseException) -> dict:
+    if isinstance(exc, _AppError):
+        return {"type": exc.error_type, "message": str(exc)}
+    return {"type": "InternalError", "message": f"Internal error: {type(exc).__name__}"}
+
+
+def _display(value: str) -> str:
+    if urlparse(value).scheme.lower() in ("http", "https"):
+        return acquire_mod._redact(value)
+    return Path(value).name
+
+
+# --------------------------------------------------------------------------- #
+# Orchestration
+# --------------------------------------------------------------------------- #
+def _clean_executor(jobs: int):
+    """A process pool for ``jobs`` > 1, else one thread. The pool is warmed here — before
+    any thread, Node worker or HTTP connection exists — so the workers fork from a
+    single-threaded parent holding nothing they must not inherit."""
+    if jobs == 1:
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="html-batch-clean")
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    pool.submit(int).result()
+    return pool
+
+
+def run_batch(args: argparse.Namespace, output_dir: Path) -> int:
+    """Convert every INPUT listed in ``args.batch`` into ``output_dir``.
+
+    Returns 0 when every item converted (or was already done).
+
+    Raises:
+        BadInput: the batch file does not exist.
+        BatchFailed: one or more items failed (each recorded in the manifest).
+    """
+    if args.batch == "-":
+        stream, base = contextlib.nullcontext(sys.stdin), Path.cwd()
+    else:
+        try:
+            stream = open(args.batch, encoding="utf-8")
+        except FileNotFoundError as exc:
+            raise BadInput(f"batch file not found: {Path(args.batch).name}",
+                           details={"path": Path(args.batch).name}) from exc
+        base = Path(args.batch).resolve().parent
+
+    manifest = (Path(args.batch_manifest).expanduser().resolve() if args.batch_manifest
+                else output_dir / _MANIFEST_NAME)
+    done = _completed(manifest)
+    engine = (getattr(args, "engine", "auto") or "auto").lower()
+    jobs = {
+        # Explicit chrome launches a browser per fetch — keep those one at a time.
+        "acquire": 1 if engine == "chrome" else (args.jobs or _NET_JOBS),
+        "clean": args.clean_jobs or min(_CLEAN_JOBS_MAX, os.cpu_count() or 1),
+        "convert": args.convert_jobs or _CONVERT_JOBS,
+    }
+    jobs["emit"] = jobs["acquire"]
+    window = _WINDOW_PER_JOB * (jobs["acquire"] + jobs["clean"] + jobs["convert"])
+    want_reader = _want_reader(args, None)
+    counts = {"ok": 0, "failed": 0, "skipped": 0}
+    stage_times: dict[str, list[float]] = {s: [] for s in _STAGES}
+    acquire_mod._configure_rate_limiter(args)  # one per-host schedule for the whole run
+    start = time.perf_counter()
+
+    with stream as source, _open_manifest(manifest) as log, _clean_executor(jobs["clean"]) as cpu, \
+            ThreadPoolExecutor(jobs["acquire"], thread_name_prefix="html-batch") as net, \
+            ThreadPoolExecutor(jobs["convert"],
+                               thread_name_prefix="html-batch-convert") as node:
+        core_bridge.ensure_workers(jobs["convert"])
+        pending: dict[Future, tuple[_Item, str]] = {}
+
+        def _record(item: _Item, *, output: Path | None = None,
+                    error: BaseException | None = None) -> None:
+            rec = {"line": item.line, "input": item.input,
+                   "status": "error" if error is not None else "ok",
+                   "output": str(output) if output is not None else None,
+                   "engine": getattr(item.acq, "engine", None),
+                   "timings": {k: round(v, 4) for k, v in item.timings.items()}}
+            if error is not None:
+                rec["error"] = _error_record(error)
+                counts["failed"] += 1
+                where = f" ({_display(item.input)})" if item.input else ""
+                sys.stderr.write(f"html --batch: line {item.line}{where}: "
+                                 f"{rec['error']['type']}: {rec['error']['message']}\n")
+            else:
+                counts["ok"] += 1
+            log.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            log.flush()
+            if item.acq is not None and item.acq.mode == "archive":
+                acquire_mod._release_work_dir(item.acq.base_url)
+            item.acq = item.cleaned = None
+
+        def _emit(item: _Item, md_whole: str, md_reader: str | None) -> None:
+            fut = net.submit(_timed, emit_mod.emit, item.acq, item.cleaned, md_whole,
+                             md_reader, args, output_dir=output_dir, stdout_mode=False,
+                             input_ref=item.input)
+            pending[fut] = (item, "emit")
+
+        def _advance(item: _Item, stage: str, result) -> None:
+            if stage == "acquire":
+                item.acq = result
+                if getattr(result, "content_kind", "html") == "markdown":
+                    _emit(item, tidy_markdown(result.markdown or ""), None)  # trust-mode (R4)
+                    return
+                fut = cpu.submit(_timed, clean_mod.clean, result, reader=want_reader)
+                pending[fut] = (item, "clean")
+            elif stage == "clean":
+                item.cleaned = result
+                fut = node.submit(_timed, _markdown_from_clean, item.acq, result,
+                                  want_reader, item.input)
+                pending[fut] = (item, "convert")
+            elif stage == "convert":
+                _emit(item, *result)
+            else:
+                _record(item, output=result)
+
+        lines = _read_lines(source)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    entry = next(lines, None)
+                    if entry is None:
+                        exhausted = True
+                        break
+                    line_no, value, problem = entry
+                    item = _Item(line_no, value)
+                    try:
+                        if problem is not None:
+                            raise BadInput(problem, details={"line": line_no})
+                        item.input = _resolve_input(value, base, output_dir)
+                    except _AppError as exc:
+                        _record(item, error=exc)
+                        continue
+                    if item.input in done:
+                        counts["skipped"] += 1
+                        continue
+                    done.add(item.input)  # a duplicate line is converted once
+                    fut = net.submit(_timed, acquire_mod._acquire_input, item.input, args)
+                    pending[fut] = (item, "acquire")
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    item, stage = pending.pop(fut)
+                    try:
+                        result, seconds = fut.result()
+                    except Exception as exc:  # noqa: BLE001 — per-item, recorded
+                        _record(item, error=exc)
+                        continue
+                    item.timings[stage] = seconds
+                    stage_times[stage].append(seconds)
+                    try:
+                        _advance(item, stage, result)
+                    except Exception as exc:  # noqa: BLE001 — e.g. a broken process pool
+                        _record(item, error=exc)
+        finally:
+            for fut in pending:  # Ctrl-C / fatal: drop queued work, keep what finished
+                fut.cancel()
+
+    sys.stderr.write(_summary(counts, stage_times, jobs, time.perf_counter() - start))
+    if counts["failed"]:
+        raise BatchFailed(
+            f"{counts['failed']} of {counts['ok'] + counts['failed']} batch item(s) failed "
+            f"(see {manifest.name}); re-run to retry only those.",
+            details={"ok": counts["ok"], "failed": counts["failed"],
+                     "skipped": counts["skipped"], "manifest": str(manifest)},
+        )
+    return 0
@@ -137,6 +137,33 @@ def build_parser() -> argparse.ArgumentParser:
         "--max-results", dest="max_results", metavar="N", type=int, default=5,
         help="For --search: max number of top results to fetch + convert (default: 5).",
     )
+    p.add_argument(
+        "--jobs", metavar="N", type=int, default=None,
+        help="For --search: fetch up to N results concurrently, each through its own "
+             "fallback ladder (default: 4; 1 = one after another). Notes keep rank order. "
+             "For --batch: items fetched + emitted concurrently (default: 4).",
+    )
+    p.add_argument(
+        "--batch", metavar="FILE", default=None,
+        help="Batch mode: convert every INPUT listed in FILE ('-' = stdin) — one URL or "
+             "path per line, or NDJSON {\"input\": ...} lines; '#' comments skipped. The "
+             "first positional is then the OUTPUT_DIR. Stages run concurrently; finished "
+             "items are recorded in a manifest so a re-run resumes.",
+    )
+    p.add_argument(
+        "--clean-jobs", dest="clean_jobs", metavar="N", type=int, default=None,
+        help="For --batch: processes for the CPU-bound HTML cleaning stage "
+             "(default: min(4, CPUs)).",
+    )
+    p.add_argument(
+        "--convert-jobs", dest="convert_jobs", metavar="N", type=int, default=None,
+        help="For --batch: concurrent Node turndown conversions (default: 2).",
+    )
+    p.add_argument(
+        "--batch-manifest", dest="batch_manifest", metavar="PATH", default=None,
+        help="For --batch: NDJSON record of finished items, appended per item; inputs "
+             "already recorded ok are skipped (default: OUTPUT_DIR/.html-batch.jsonl).",
+    )
     # Authenticated Chrome (TASK 024). The three auth sources are mutually exclusive; any of
     # them forces the chrome engine (the credential is never silently dropped to lite). Auth is
     # strictly opt-in — with none set, behaviour is byte-for-byte the prior render (R10).
@@ -217,7 +244,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p.add_argument(
         "--rate-limit", metavar="REQS_PER_SEC", type=float, default=None,
-        help="Throttle outbound fetches (page + images) to N requests/sec "
+        help="Throttle outbound fetches (page + images) to N requests/sec per host "
              "(default: unbounded). Polite-crawl bound for image-heavy pages.",
     )
     p.add_argument(
@@ -298,12 +325,23 @@ def _validate_usage(args: argparse.Namespace) -> None:
     - ``--search`` takes a QUERY, not a URL: a URL positional is a usage error (the first
       positional is the OUTPUT_DIR in search mode).
     - ``--engine remote`` needs a configured reader (never a silent fall-back to jina.ai).
-    - ``--max-results`` must be ≥ 1.
+    - ``--batch`` reads its INPUTs from the file: a URL positional, ``--search`` and
+      ``--stdout`` are usage errors (the first positional is the OUTPUT_DIR).
+    - ``--max-results`` / ``--jobs`` / ``--clean-jobs`` / ``--convert-jobs`` must be ≥ 1.
     """
     if args.search is not None:
         for pos in (args.INPUT, args.OUTPUT_DIR):
             if pos is not None and urlparse(pos).scheme in ("http", "https"):
                 raise Usage("--search takes a QUERY, not a URL; pass an OUTPUT_DIR positional.")
+    if getattr(args, "batch", None) is not None:
+        if args.search is not None:
+            raise Usage("--batch cannot be combined with --search.")
+        if args.stdout:
+            raise Usage("--batch writes files; it cannot be combined with --stdout.")
+        for pos in (args.INPUT, args.OUTPUT_DIR):
+            if pos is not None and urlparse(pos).scheme in ("http", "https"):
+                raise Usage("--batch reads its INPUTs from the batch file; pass an "
+                            "OUTPUT_DIR positional.")
     if args.engine == "remote" and not (
             _env("READER_URL") or _env("READER_PROVIDERS")):
         raise Usage(
@@ -311,6 +349,9 @@ def _validate_usage(args: argparse.Namespace) -> None:
             "(use --engine jina for the built-in reader).")
     if args.max_results is not None and args.max_results < 1:
         raise Usage("--max-results must be >= 1.")
+    for flag in ("jobs", "clean_jobs", "convert_jobs"):
+        if getattr(args, flag, None) is not None and getattr(args, flag) < 1:
+            raise Usage(f"--{flag.replace('_', '-')} must be >= 1.")
 
     # Chrome auth (TASK 024 R2/R10): env fallbacks; sources mutually exclusive; any source forces
     # the chrome engine (never silently drop the credential to lite); a missing/unreadable
@@ -353,6 +394,10 @@ def _validate_usage(args: argparse.Namespace) -> None:
                         "--chrome-cookies-file / --chrome-user-data-dir.")
         if args.search is not None:
             raise Usage("--chrome-auth-map cannot be combined with --search.")
+        if getattr(args, "batch", None) is not None:
+            # The map forces chrome per target host, decided once per run from INPUT;
+            # a batch would need that per item. Use a fixed --chrome-* source instead.
+            raise Usage("--chrome-auth-map cannot be combined with --batch.")
         if args.INPUT and urlparse(args.INPUT).scheme in ("http", "https"):
             from . import _chrome_auth
             amap = _chrome_auth.load_auth_map(Path(args.chrome_auth_map))  # hardened: 0600/JSON/shape
@@ -389,6 +434,22 @@ def _resolve_search_paths(args: argparse.Namespace) -> tuple[Path | None, bool]:
     return out.resolve(), False
 
 
+def _resolve_batch_paths(args: argparse.Namespace) -> Path:
+    """Resolve OUTPUT_DIR for ``--batch`` (the INPUTs come from the batch file — the
+    positional is the OUTPUT_DIR). Default ``./tmp/html_out/``; >1 positional → Usage."""
+    positionals = [p for p in (args.INPUT, args.OUTPUT_DIR) if p is not None]
+    if len(positionals) > 1:
+        raise Usage("--batch accepts at most one OUTPUT_DIR positional.")
+    out = Path(positionals[0]) if positionals else (Path.cwd() / "tmp" / "html_out")
+    return out.resolve()
+
+
+def _convert_batch(args: argparse.Namespace) -> int:
+    """``--batch`` branch: every INPUT in the batch file through the staged queue (FC-6)."""
+    from . import batch as batch_mod
+    return batch_mod.run_batch(args, _resolve_batch_paths(args))
+
+
 def _convert_one(
     acq, args: argparse.Namespace, output_dir: Path | None, *,
     stdout_mode: bool, input_ref: str, query: str | None = None,
@@ -411,13 +472,30 @@ def _convert_one(
         return _EXIT_OK
 
     from . import clean as clean_mod
-    from . import core_bridge
 
-    # Search results are emitted as ONE note each (R9: N results → N notes); a direct
-    # conversion keeps the dual-output default. `query is not None` ⇒ search mode.
-    # --reader-only also needs the reader variant computed (emit collapses to it).
-    want_reader = (bool(args.reader) or bool(getattr(args, "reader_only", False))) and query is None
+    want_reader = _want_reader(args, query)
     cleaned = clean_mod.clean(acq, reader=want_reader)
+    md_whole, md_reader = _markdown_from_clean(acq, cleaned, want_reader, input_ref)
+    emit_mod.emit(
+        acq, cleaned, md_whole, md_reader, args,
+        output_dir=output_dir, stdout_mode=stdout_mode, input_ref=input_ref, query=query,
+    )
+    return _EXIT_OK
+
+
+def _want_reader(args: argparse.Namespace, query: str | None) -> bool:
+    """Search results are emitted as ONE note each (R9: N results → N notes); a direct
+    conversion keeps the dual-output default. `query is not None` ⇒ search mode.
+    --reader-only also needs the reader variant computed (emit collapses to it)."""
+    return (bool(args.reader) or bool(getattr(args, "reader_only", False))) and query is None
+
+
+def _markdown_from_clean(acq, cleaned, want_reader: bool, input_ref: str) -> tuple[str, str | None]:
+    """Cleaned HTML → ``(md_whole, md_reader)`` via the turndown core, with the
+    empty-extraction guard (R-7a). Shared by :func:`_convert_one` and ``--batch``."""
+    from . import core_bridge
+    from .md_clean import tidy_markdown
+
     md_whole = tidy_markdown(core_bridge.html_to_markdown(cleaned.whole_html))
     md_reader = (
         tidy_markdown(core_bridge.html_to_markdown(cleaned.reader_html))
@@ -432,11 +510,7 @@ def _convert_one(
             details={"source_chars": len(acq.html), "body_chars": len(md_whole.strip()),
                      "engine": acq.engine},
         )
-    emit_mod.emit(
-        acq, cleaned, md_whole, md_reader, args,
-        output_dir=output_dir, stdout_mode=stdout_mode, input_ref=input_ref, query=query,
-    )
-    return _EXIT_OK
+    return md_whole, md_reader
 
 
 def _convert_search(args: argparse.Namespace) -> int:
@@ -464,6 +538,8 @@ def convert(args: argparse.Namespace) -> int:
     _validate_usage(args)
     if args.search is not None:
         return _convert_search(args)
+    if args.batch is not None:
+        return _convert_batch(args)
 
     from . import acquire as acquire_mod
     input_ref, mode, output_dir, stdout_mode = _resolve_paths(args)
@@ -569,6 +645,8 @@ def _fetch_main(argv: list[str]) -> int:
     try:
         if args.search is not None:
             raise Usage("`html fetch` does not take --search; use `html search`.")
+        if args.batch is not None:
+            raise Usage("`html fetch` does not take --batch; use `html --batch` or `html2md --batch`.")
         _validate_usage(args)
         if getattr(args, "remote_format", "html") == "markdown":
             raise Usage("--remote-format markdown is a convert-stage option; use `html md`.")
@@ -617,6 +695,8 @@ def _md_main(argv: list[str]) -> int:
     try:
         if args.search is not None:
             raise Usage("`html md` does not take --search; use `html search`.")
+        if args.batch is not None:
+            raise Usage("`html md` does not take --batch; use `html --batch` or `html2md --batch`.")
         _validate_usage(args)
         input_ref, mode, output_dir, stdout_mode = _resolve_paths(args)
         from . import acquire as acquire_mod
@@ -872,6 +952,8 @@ def combined_main(argv: list[str] | None = None) -> int:
         _validate_usage(args)  # before the --search dispatch (parity with convert())
         if args.search is not None:
             return _convert_search(args)  # search is inherently fetch+convert per result
+        if args.batch is not None:
+            return _convert_batch(args)  # per item in-process, like search (no artifact)
         input_ref, _mode, output_dir, stdout_mode = _resolve_paths(args)
         from . import acquire as acquire_mod
         from . import serialize as serialize_mod
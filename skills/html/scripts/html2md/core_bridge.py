@@ -1,14 +1,32 @@
 """FC-3 bridge — Python → Node turndown core (ARCH §2.1, §5.2).
 
-Spawns ``node html2md_core.js`` as a pure ``stdin → stdout`` filter: cleaned HTML
-in, GFM Markdown out. No shell, bounded timeout. ``html2md_core.js`` is the
-docx-mastered, ``diff -q``-gated converter (lifted verbatim from ``docx2md.js``).
+Cleaned HTML in, GFM Markdown out, via ``html_convert.js`` (which require()s
+``html2md_core.js``, the docx-mastered, ``diff -q``-gated converter lifted verbatim
+from ``docx2md.js``). No shell, bounded timeout.
+
+Node startup + the turndown module load cost a few hundred ms — more than the
+conversion itself on a typical page — so documents go to a small pool of long-lived
+``node html_convert.js --serve`` workers (length-prefixed JSON frames over
+stdin/stdout; the protocol is documented in ``html_convert.js``). A worker is pinged
+when spawned and again after sitting idle, killed on the per-request timeout, and
+replaced on the next call; one that died since its last use is replaced and the
+request retried once. When no worker can be started (node missing, broken
+``node_modules``, or ``HTML_NODE_WORKERS=0``) the one-shot ``node html_convert.js``
+stdin → stdout filter runs instead — which also reports the precise failure.
 """
 from __future__ import annotations
 
+import atexit
+import json
 import os
+import select
+import struct
 import subprocess
+import tempfile
+import threading
+import time
 
+from ._env import env
 from .exceptions import ConvertFailed
 
 # scripts/html_convert.js — the html-owned turndown wrapper (ARIA tables +
@@ -17,14 +35,241 @@ _CORE_JS = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "html_convert.js"
 )
 _TIMEOUT_S = 120
+# Idle workers kept alive (`HTML_NODE_WORKERS`; 0 = always use the one-shot filter).
+# Callers beyond this many at once get a worker that is closed after its request.
+_POOL_SIZE = 2
+_HANDSHAKE_TIMEOUT_S = 10  # spawn + require(turndown) + first ping
+_IDLE_PING_S = 30  # re-ping a worker that sat idle longer than this before reuse
 
 
-def html_to_markdown(html: str) -> str:
-    """Convert cleaned HTML → GFM Markdown via the Node turndown core.
+class _WorkerTimeout(Exception):
+    """The worker did not answer within the request timeout."""
 
-    Raises:
-        ConvertFailed: node missing, the core errored, or it timed out.
-    """
+
+class _WorkerDead(Exception):
+    """The worker exited or broke the frame protocol; discard it."""
+
+
+class _NodeWorker:
+    """One ``node html_convert.js --serve`` process. Used by one thread at a time
+    (the pool hands it out exclusively)."""
+
+    def __init__(self, script: str) -> None:
+        self.script = script
+        # A file, not a pipe: nobody drains a long-lived worker's stderr, and a full
+        # pipe would block node. Read back only to enrich an error message.
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            self.proc = subprocess.Popen(
+                ["node", script, "--serve"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=self._stderr,
+            )
+        except BaseException:
+            self._stderr.close()
+            raise
+        self._next_id = 0
+        self.last_used = time.monotonic()
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def call(self, payload: dict, timeout: float) -> dict:
+        """Send one request frame, return the reply object."""
+        self._next_id += 1
+        request_id = self._next_id
+        body = json.dumps({"id": request_id, **payload}).encode("ascii")
+        deadline = time.monotonic() + timeout
+        try:
+            self.proc.stdin.write(struct.pack(">I", len(body)) + body)
+            self.proc.stdin.flush()
+        except OSError as exc:  # BrokenPipeError: the worker is gone
+            raise _WorkerDead(self.stderr_tail()) from exc
+        (size,) = struct.unpack(">I", self._read(4, deadline))
+        try:
+            reply = json.loads(self._read(size, deadline))
+        except ValueError as exc:
+            raise _WorkerDead("malformed reply frame") from exc
+        if not isinstance(reply, dict) or reply.get("id") != request_id:
+            raise _WorkerDead("out-of-sync reply frame")
+        self.last_used = time.monotonic()
+        return reply
+
+    def _read(self, size: int, deadline: float) -> bytes:
+        fd = self.proc.stdout.fileno()
+        buf = bytearray()
+        while len(buf) < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise _WorkerTimeout()
+            chunk = os.read(fd, size - len(buf))
+            if not chunk:
+                raise _WorkerDead(self.stderr_tail())
+            buf += chunk
+        return bytes(buf)
+
+    def ping(self, timeout: float) -> bool:
+        try:
+            return bool(self.call({"ping": True}, timeout).get("ok"))
+        except (_WorkerDead, _WorkerTimeout):
+            return False
+
+    def stderr_tail(self) -> str:
+        try:
+            self._stderr.seek(0)
+            return self._stderr.read().decode("utf-8", "replace").strip()[-300:]
+        except (OSError, ValueError):
+            return ""
+
+    def close(self) -> None:
+        """Graceful stop: stdin EOF ends the worker's read loop."""
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
+            self.proc.wait()
+        self._release()
+
+    def kill(self) -> None:
+        self.proc.kill()
+        self.proc.wait()
+        try:
+            self.proc.stdin.close()
+        except OSError:  # unflushed bytes to a dead process
+            pass
+        self._release()
+
+    def _release(self) -> None:
+        self.proc.stdout.close()
+        self._stderr.close()
+
+
+class _WorkerPool:
+    """Keeps up to ``size`` idle workers. Thread-safe: a worker is checked out for
+    exactly one request at a time."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._idle: list[_NodeWorker] = []
+        self._lock = threading.Lock()
+        # Scripts whose worker failed its handshake: stay on the one-shot filter
+        # instead of paying a failed spawn per document.
+        self._broken: set[str] = set()
+
+    def convert(self, html: str) -> str | None:
+        """Markdown for ``html``, or ``None`` when no worker is usable (the caller
+        falls back to the one-shot filter)."""
+        for _attempt in range(2):
+            worker = self._checkout()
+            if worker is None:
+                return None
+            try:
+                reply = worker.call({"html": html}, _TIMEOUT_S)
+            except _WorkerTimeout as exc:
+                worker.kill()
+                raise ConvertFailed(
+                    f"html2md_core timed out after {_TIMEOUT_S}s.",
+                    details={"timeout_s": _TIMEOUT_S},
+                ) from exc
+            except _WorkerDead:
+                worker.kill()
+                continue
+            self._checkin(worker)
+            if not reply.get("ok"):
+                raise ConvertFailed(
+                    f"html2md_core failed: {str(reply.get('error', '')).strip()[:300]}",
+                    details={"reason": "core-error"},
+                )
+            return reply.get("markdown", "")
+        return None
+
+    def _checkout(self) -> _NodeWorker | None:
+        worker = None
+        with self._lock:
+            while self._idle and worker is None:
+                candidate = self._idle.pop()
+                if candidate.script == _CORE_JS and candidate.alive():
+                    worker = candidate
+                else:
+                    candidate.kill()
+            if _CORE_JS in self._broken:
+                return worker
+        if worker is not None and time.monotonic() - worker.last_used > _IDLE_PING_S:
+            if not worker.ping(_HANDSHAKE_TIMEOUT_S):
+                worker.kill()
+                worker = None
+        return worker if worker is not None else self._spawn()
+
+    def _spawn(self) -> _NodeWorker | None:
+        script = _CORE_JS
+        try:
+            worker = _NodeWorker(script)
+        except OSError:  # node missing — the one-shot path reports it
+            return None
+        if worker.ping(_HANDSHAKE_TIMEOUT_S):
+            return worker
+        worker.kill()
+        with self._lock:
+            self._broken.add(script)
+        return None
+
+    def _checkin(self, worker: _NodeWorker) -> None:
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(worker)
+                return
+        worker.close()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+_POOL: _WorkerPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _forget_pool_in_child() -> None:
+    """A forked child must not share the parent's worker pipes: start empty (the
+    parent still owns and shuts down its workers)."""
+    global _POOL, _POOL_LOCK
+    _POOL = None
+    _POOL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_pool_in_child)
+
+
+def _pool() -> _WorkerPool | None:
+    """The process-wide pool, created on first use; ``None`` when disabled."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            raw = env("NODE_WORKERS", default=str(_POOL_SIZE))
+            try:
+                size = max(0, int(raw))
+            except ValueError:
+                size = _POOL_SIZE
+            _POOL = _WorkerPool(size)
+            atexit.register(_POOL.shutdown)
+        return _POOL if _POOL.size > 0 else None
+
+
+def ensure_workers(n: int) -> None:
+    """Keep at least ``n`` idle workers, so ``n`` concurrent callers (``--batch
+    --convert-jobs``) all reuse warm workers instead of spawning throwaway ones. No-op when
+    the pool is disabled."""
+    pool = _pool()
+    if pool is not None:
+        with pool._lock:
+            pool.size = max(pool.size, n)
+
+
+def _convert_once(html: str) -> str:
+    """One-shot fallback: ``node html_convert.js`` as a stdin → stdout filter."""
     try:
         proc = subprocess.run(
             ["node", _CORE_JS],
@@ -49,3 +294,18 @@ def html_to_markdown(html: str) -> str:
             details={"returncode": proc.returncode},
         )
     return proc.stdout
+
+
+def html_to_markdown(html: str) -> str:
+    """Convert cleaned HTML → GFM Markdown via the Node turndown core — on a pooled
+    worker when one is available, else the one-shot filter.
+
+    Raises:
+        ConvertFailed: node missing, the core errored, or it timed out.
+    """
+    pool = _pool()
+    if pool is not None:
+        markdown = pool.convert(html)
+        if markdown is not None:
+            return markdown
+    return _convert_once(html)
@@ -16,6 +16,7 @@ import binascii
 import hashlib
 import re
 import sys
+import threading
 import urllib.parse
 from pathlib import Path
 
@@ -206,6 +207,12 @@ def _download_and_rewrite(
 # --------------------------------------------------------------------------- #
 # Output
 # --------------------------------------------------------------------------- #
+# Picking a collision-free base name and writing it must be one step when several
+# documents are emitted at once (``--batch``): two inputs with the same slug would
+# otherwise both claim ``<slug>.md``.
+_OUTPUT_LOCK = threading.Lock()
+
+
 def emit(
     acq: AcquireResult,
     clean_res: CleanResult,
@@ -217,9 +224,10 @@ def emit(
     stdout_mode: bool,
     input_ref: str,
     query: str | None = None,
-) -> None:
+) -> Path | None:
     """Write frontmatter + Markdown (+ optional attachments / reader variant), or
-    stream the whole-page Markdown to stdout."""
+    stream the whole-page Markdown to stdout. Returns the written ``<base>.md`` (``None``
+    in stdout mode)."""
     front = _frontmatter(acq.source_meta, query, getattr(acq, "engine", None))
 
     # --reader-only: collapse to a SINGLE output = the reader extraction, falling back to
@@ -237,7 +245,7 @@ def emit(
     # would dump KBs of base64 into the stream (agent-step bloat).
     if stdout_mode:
         sys.stdout.write(front + (_strip_data_images(md_whole) or "").strip() + "\n")
-        return
+        return None
 
     assert output_dir is not None
     output_dir.mkdir(parents=True, exist_ok=True)  # lazy: only once a write is certain
@@ -266,26 +274,28 @@ def emit(
     provenance = (acq.source_meta.url if acq.source_meta and acq.source_meta.url
                   else input_ref)
     marker = _src_marker(provenance)
-    base = _resolve_base(output_dir, slug, marker)
-    out_md = output_dir / f"{base}.md"
-    out_reader = output_dir / f"{base}.reader.md"
-
-    # File-level self-overwrite guard (the dir-vs-file check in _resolve_paths can't see
-    # this): never let an emitted file clobber the INPUT being converted (e.g. a fetch→md
-    # round-trip in the same folder, or a local input whose name collides with an output).
-    try:
-        in_resolved = Path(input_ref).resolve()
-        if out_md.resolve() == in_resolved or out_reader.resolve() == in_resolved:
-            raise SelfOverwriteRefused(
-                f"output would overwrite the input: {Path(input_ref).name}",
-                details={"path": Path(input_ref).name})
-    except OSError:
-        pass  # input_ref is a URL or unresolvable → no local collision possible
-
-    _atomic_write(out_md, front + md_whole.strip() + "\n\n" + marker + "\n")
-    if md_reader is not None:
-        _atomic_write(out_reader, front + md_reader.strip() + "\n\n" + marker + "\n")
-    elif out_reader.exists():
-        # A prior run wrote <base>.reader.md; this --no-reader / search re-run must not
-        # leave a stale phantom dual-output for downstream (Obsidian/docx/pdf) to pick up.
-        out_reader.unlink(missing_ok=True)
+    with _OUTPUT_LOCK:
+        base = _resolve_base(output_dir, slug, marker)
+        out_md = output_dir / f"{base}.md"
+        out_reader = output_dir / f"{base}.reader.md"
+
+        # File-level self-overwrite guard (the dir-vs-file check in _resolve_paths can't see
+        # this): never let an emitted file clobber the INPUT being converted (e.g. a fetch→md
+        # round-trip in the same folder, or a local input whose name collides with an output).
+        try:
+            in_resolved = Path(input_ref).resolve()
+            if out_md.resolve() == in_resolved or out_reader.resolve() == in_resolved:
+                raise SelfOverwriteRefused(
+                    f"output would overwrite the input: {Path(input_ref).name}",
+                    details={"path": Path(input_ref).name})
+        except OSError:
+            pass  # input_ref is a URL or unresolvable → no local collision possible
+
+        _atomic_write(out_md, front + md_whole.strip() + "\n\n" + marker + "\n")
+        if md_reader is not None:
+            _atomic_write(out_reader, front + md_reader.strip() + "\n\n" + marker + "\n")
+        elif out_reader.exists():
+            # A prior run wrote <base>.reader.md; this --no-reader / search re-run must not
+            # leave a stale phantom dual-output for downstream (Obsidian/docx/pdf) to pick up.
+            out_reader.unlink(missing_ok=True)
+    return out_md
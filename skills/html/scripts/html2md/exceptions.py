@@ -5,7 +5,7 @@ Each subclass carries a class-level ``CODE`` (the process exit status) and an
 (ARCH §5.1) is the single source of truth:
 
     0  ok
-    1  BadInput / ConvertFailed / InternalError (generic failure)
+    1  BadInput / ConvertFailed / InternalError (generic failure) / BatchFailed
     2  usage (argparse)
     3  EngineNotInstalled (Chrome requested, Playwright absent)
     6  SelfOverwriteRefused (OUTPUT collides with INPUT, incl. symlink)
@@ -78,3 +78,12 @@ class EmptyExtraction(_AppError):
 
     CODE = 11
     error_type = "EmptyExtraction"
+
+
+class BatchFailed(_AppError):
+    """One or more ``--batch`` items failed. Each failure is already recorded in the batch
+    manifest and reported on stderr; this is the run-level summary — the other items were
+    still converted, and a re-run resumes with only the failed ones."""
+
+    CODE = 1
+    error_type = "BatchFailed"
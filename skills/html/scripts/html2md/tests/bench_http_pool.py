@@ -0,0 +1,139 @@
+"""Latency benchmark for the pooled `acquire._http_get_bytes` client.
+
+Serves a small page from a local keep-alive stub server and times N
+sequential fetches two ways: "fresh" empties the client pool before
+every fetch — the old behaviour, a new `httpx.Client` (SSL context,
+connection pool, TCP connect) per request — and "pooled" keeps it, so
+every fetch after the first reuses one connection. The full SSRF path
+runs in both: loopback is allowed through `HTML_SSRF_ALLOW_NETS` and the
+connection is pinned to the validated address as in production.
+
+`StubServer` is also the fixture server for `test_http_pool.py`.
+
+Usage (from skills/html/scripts/):
+    python3 html2md/tests/bench_http_pool.py [--requests 200] [--size 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import http.server
+import os
+import statistics
+import sys
+import threading
+import time
+
+SCRIPTS = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if SCRIPTS not in sys.path:
+    sys.path.insert(0, SCRIPTS)
+
+from html2md import acquire  # noqa: E402
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # header + body are separate writes
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:  # noqa: N802 — http.server API
+        with self.server.lock:
+            self.server.requests += 1
+        if self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", "/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = self.server.body
+        if self.path.startswith("/big"):
+            body = body * 64
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class StubServer:
+    """Threaded HTTP/1.1 server on 127.0.0.1 that counts TCP connections
+    and requests. Context manager; ``url(path)`` builds request URLs."""
+
+    def __init__(self, body_size: int = 2000) -> None:
+        self._httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.lock = threading.Lock()
+        self._httpd.connections = 0
+        self._httpd.requests = 0
+        self._httpd.body = b"<p>" + b"x" * body_size + b"</p>"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def connections(self) -> int:
+        return self._httpd.connections
+
+    @property
+    def requests(self) -> int:
+        return self._httpd.requests
+
+    @property
+    def body(self) -> bytes:
+        return self._httpd.body
+
+    def url(self, path: str = "/page") -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}{path}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+
+def _time_fetches(url: str, n: int, *, pooled: bool) -> list[float]:
+    acquire._close_http_clients()
+    samples = []
+    for _ in range(n):
+        if not pooled:
+            acquire._close_http_clients()
+        t0 = time.perf_counter()
+        acquire._http_get_bytes(url, max_bytes=None, retries=0)
+        samples.append(time.perf_counter() - t0)
+    acquire._close_http_clients()
+    return samples
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--requests", type=int, default=200)
+    ap.add_argument("--size", type=int, default=20000, help="page body bytes")
+    args = ap.parse_args(argv)
+
+    os.environ[acquire._SSRF_ALLOW_ENV] = "127.0.0.0/8"
+    os.environ.pop(acquire._PROXY_ENV, None)
+    print(f"http2={'on' if acquire._http2_available() else 'off (h2 not installed)'}")
+    print(f"{'mode':>7} {'conns':>6} {'median ms':>10} {'p90 ms':>8} {'req/s':>8}")
+    for pooled in (False, True):
+        with StubServer(args.size) as server:
+            samples = _time_fetches(server.url(), args.requests, pooled=pooled)
+            conns = server.connections
+        samples.sort()
+        median = statistics.median(samples) * 1000
+        p90 = samples[int(len(samples) * 0.9) - 1] * 1000
+        rate = len(samples) / sum(samples)
+        print(f"{'pooled' if pooled else 'fresh':>7} {conns:>6} {median:>10.2f} "
+              f"{p90:>8.2f} {rate:>8.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""FC-6 — ``--batch`` ingestion: batch-file parsing, the staged queue, manifest resume.
+
+Offline: local ``.html`` inputs only, and the Node core is replaced by a stub on the
+``core_bridge.html_to_markdown`` seam (the queue, not turndown, is under test).
+
+Run from ``skills/html/scripts``:  python3 -m pytest html2md/tests/test_batch.py
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if SCRIPTS not in sys.path:
+    sys.path.insert(0, SCRIPTS)
+
+from html2md import batch, cli, core_bridge  # noqa: E402
+from html2md.exceptions import ConvertFailed  # noqa: E402
+
+_BODY = "A paragraph of body text for the batch test. " * 20
+
+
+def _page(title: str) -> str:
+    return (f"<html><head><title>{title}</title></head><body><article>"
+            f"<h1>{title}</h1><p>{_BODY}</p></article></body></html>")
+
+
+def _fake_core(html: str) -> str:
+    if "Broken" in html:
+        raise ConvertFailed("html2md_core failed: stub")
+    return "# converted\n\n" + _BODY
+
+
+class _Base(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.out = self.tmp / "out"
+        for name in ("alpha", "beta", "gamma"):
+            (self.tmp / f"{name}.html").write_text(_page(name.title()), encoding="utf-8")
+        patcher = mock.patch.object(core_bridge, "html_to_markdown",
+                                    side_effect=_fake_core)
+        self.core = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _list(self, *lines: str) -> Path:
+        path = self.tmp / "list.txt"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+    def _run(self, *argv: str) -> tuple[int, str]:
+        err = io.StringIO()
+        with redirect_stderr(err):
+            rc = cli.main(list(argv))
+        return rc, err.getvalue()
+
+    def _manifest(self) -> list[dict]:
+        text = (self.out / batch._MANIFEST_NAME).read_text(encoding="utf-8")
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class TestReadLines(unittest.TestCase):
+    def test_text_ndjson_comments_and_malformed(self):
+        src = io.StringIO('a.html\n\n# note\n  https://x.com/p  \n{"input": "b.html"}\n'
+                          '{"url": "c"}\n{oops\n')
+        self.assertEqual(list(batch._read_lines(src)), [
+            (1, "a.html", None),
+            (4, "https://x.com/p", None),
+            (5, "b.html", None),
+            (6, None, 'expected {"input": "<URL or path>"}'),
+            (7, None, "malformed JSON line"),
+        ])
+
+
+class TestBatch(_Base):
+    def test_converts_every_item_with_stage_timings(self):
+        rc, err = self._run("--batch", str(self._list("alpha.html", "beta.html",
+                                                     "gamma.html")), str(self.out))
+        self.assertEqual(rc, 0, err)
+        for name in ("alpha", "beta", "gamma"):
+            self.assertIn(_BODY.strip(), (self.out / f"{name}.md").read_text())
+            self.assertTrue((self.out / f"{name}.reader.md").is_file())
+        records = self._manifest()
+        self.assertEqual(sorted(r["line"] for r in records), [1, 2, 3])
+        for rec in records:
+            self.assertEqual(rec["status"], "ok")
+            self.assertEqual(Path(rec["output"]).parent, self.out)
+            self.assertEqual(set(rec["timings"]), set(batch._STAGES))
+        self.assertIn("3 ok, 0 failed, 0 skipped", err)
+        for stage in batch._STAGES:
+            self.assertIn(f"  {stage} ", err)
+
+    def test_failures_are_recorded_not_fatal(self):
+        (self.tmp / "broken.html").write_text(_page("Broken"), encoding="utf-8")
+        listing = self._list("alpha.html", "missing.html", "broken.html", "{nope", "beta.html")
+        rc, err = self._run("--batch", str(listing), str(self.out))
+        self.assertEqual(rc, 1)
+        self.assertTrue((self.out / "alpha.md").is_file())
+        self.assertTrue((self.out / "beta.md").is_file())
+        self.assertFalse((self.out / "broken.md").exists())
+        errors = {r["line"]: r["error"]["type"] for r in self._manifest()
+                  if r["status"] == "error"}
+        self.assertEqual(errors, {2: "BadInput", 3: "ConvertFailed", 4: "BadInput"})
+        self.assertIn("line 3 (broken.html): ConvertFailed", err)
+        self.assertIn("line 4: BadInput: malformed JSON line", err)
+        self.assertIn("3 of 5 batch item(s) failed", err)
+
+    def test_rerun_resumes_from_manifest(self):
+        listing = self._list("alpha.html", "beta.html")
+        self.assertEqual(self._run("--batch", str(listing), str(self.out))[0], 0)
+        converted = self.core.call_count
+        listing = self._list("alpha.html", "beta.html", "gamma.html", "alpha.html")
+        rc, err = self._run("--batch", str(listing), str(self.out))
+        self.assertEqual(rc, 0, err)
+        self.assertIn("1 ok, 0 failed, 3 skipped", err)
+        self.assertEqual(self.core.call_count - converted, converted // 2)  # gamma only
+        self.assertFalse((self.out / "alpha-2.md").exists())
+
+    def test_torn_manifest_line_is_ignored(self):
+        self.out.mkdir()
+        ok = json.dumps({"input": str(self.tmp / "alpha.html"), "status": "ok"})
+        (self.out / batch._MANIFEST_NAME).write_text(
+            ok + '\n{"input": "' + str(self.tmp / "beta.html"), encoding="utf-8")
+        rc, err = self._run("--batch", str(self._list("alpha.html", "beta.html")),
+                            str(self.out))
+        self.assertEqual(rc, 0, err)
+        self.assertIn("1 ok, 0 failed, 1 skipped", err)
+        lines = (self.out / batch._MANIFEST_NAME).read_text().splitlines()
+        self.assertEqual(json.loads(lines[-1])["input"], str(self.tmp / "beta.html"))
+
+    def test_clean_process_pool_matches_single_thread(self):
+        listing = str(self._list("alpha.html", "beta.html", "gamma.html"))
+        self.assertEqual(self._run("--batch", listing, str(self.out),
+                                   "--clean-jobs", "1", "--convert-jobs", "1")[0], 0)
+        single = {p.name: p.read_text() for p in self.out.glob("*.md")}
+        shutil.rmtree(self.out)
+        self.assertEqual(self._run("--batch", listing, str(self.out),
+                                   "--clean-jobs", "2", "--jobs", "3")[0], 0)
+        self.assertEqual({p.name: p.read_text() for p in self.out.glob("*.md")}, single)
+
+    def test_stdin_and_explicit_manifest(self):
+        manifest = self.tmp / "runs" / "m.jsonl"
+        stdin = io.StringIO(json.dumps({"input": str(self.tmp / "alpha.html")}) + "\n")
+        with mock.patch.object(sys, "stdin", stdin):
+            rc, err = self._run("--batch", "-", str(self.out),
+                                "--batch-manifest", str(manifest))
+        self.assertEqual(rc, 0, err)
+        self.assertEqual(json.loads(manifest.read_text())["status"], "ok")
+        self.assertFalse((self.out / batch._MANIFEST_NAME).exists())
+
+    def test_missing_batch_file(self):
+        rc, err = self._run("--batch", str(self.tmp / "nope.txt"), str(self.out))
+        self.assertEqual(rc, 1)
+        self.assertIn("batch file not found", err)
+
+
+class TestBatchUsage(_Base):
+    def test_usage_errors(self):
+        listing = str(self._list("alpha.html"))
+        for argv in (["--batch", listing, "--search", "q"],
+                     ["--batch", listing, "--stdout"],
+                     ["--batch", listing, "https://example.com/"],
+                     ["--batch", listing, "a", "b"],
+                     ["--batch", listing, "--clean-jobs", "0"],
+                     ["--batch", listing, "--convert-jobs", "0"]):
+            with self.subTest(argv=argv):
+                self.assertEqual(self._run(*argv)[0], 2)
+        self.assertEqual(self._run("fetch", "--batch", listing)[0], 2)
+        self.assertEqual(self._run("md", "--batch", listing)[0], 2)
+        self.assertFalse(self.out.exists())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
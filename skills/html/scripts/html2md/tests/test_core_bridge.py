@@ -5,7 +5,10 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import unittest
+from unittest import mock
 
 SCRIPTS = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if SCRIPTS not in sys.path:
@@ -99,19 +102,125 @@ class TestBridgeErrors(unittest.TestCase):
             core_bridge._CORE_JS = saved
 
     def test_node_missing_raises_convertfailed(self):
-        """TC-03-04c: node executable absent (FileNotFoundError) → ConvertFailed."""
-        saved = core_bridge.subprocess.run
-
+        """TC-03-04c: node executable absent (FileNotFoundError) → ConvertFailed —
+        on the worker spawn and the one-shot fallback alike."""
         def _boom(*a, **k):
             raise FileNotFoundError("node")
 
-        core_bridge.subprocess.run = _boom
-        try:
+        with mock.patch.object(core_bridge, "_POOL", core_bridge._WorkerPool(2)), \
+                mock.patch.object(core_bridge.subprocess, "Popen", _boom), \
+                mock.patch.object(core_bridge.subprocess, "run", _boom):
             with self.assertRaises(ConvertFailed) as ctx:
                 core_bridge.html_to_markdown("<p>x</p>")
-            self.assertEqual(ctx.exception.details.get("reason"), "node-missing")
-        finally:
-            core_bridge.subprocess.run = saved
+        self.assertEqual(ctx.exception.details.get("reason"), "node-missing")
+
+
+# Stand-in for the docx-mastered core so the worker protocol is exercised without
+# turndown installed: html_convert.js runs unchanged on top of it.
+_FAKE_CORE_JS = r"""
+exports.buildTurndown = () => ({
+    addRule() {},
+    remove() {},
+    turndown(html) {
+        if (html === "THROW") throw new Error("bad input");
+        if (html === "EXIT") process.exit(3);
+        if (html === "HANG") { for (;;) {} }
+        if (html === "PID") return String(process.pid);
+        return "MD:" + html;
+    },
+});
+exports.expandTableToGrid = () => "";
+"""
+
+
+@unittest.skipUnless(shutil.which("node"), "node not installed")
+class TestWorkerPool(unittest.TestCase):
+    """Persistent `html_convert.js --serve` workers: reuse, error frames, crash
+    respawn, timeout, fallback to the one-shot filter."""
+
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        shutil.copy(os.path.join(SCRIPTS, "html_convert.js"), self._td.name)
+        with open(os.path.join(self._td.name, "html2md_core.js"), "w") as fh:
+            fh.write(_FAKE_CORE_JS)
+        self.pool = core_bridge._WorkerPool(2)
+        for patcher in (
+            mock.patch.object(core_bridge, "_CORE_JS",
+                              os.path.join(self._td.name, "html_convert.js")),
+            mock.patch.object(core_bridge, "_POOL", self.pool),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self._td.cleanup()
+
+    def test_worker_reused_and_matches_one_shot(self):
+        pid = core_bridge.html_to_markdown("PID")
+        self.assertEqual(core_bridge.html_to_markdown("PID"), pid)
+        for html in ("<p>hi</p>", "Привет — ☕", "x" * 1_000_000):
+            self.assertEqual(core_bridge.html_to_markdown(html),
+                             core_bridge._convert_once(html))
+
+    def test_core_error_keeps_worker(self):
+        pid = core_bridge.html_to_markdown("PID")
+        with self.assertRaises(ConvertFailed) as ctx:
+            core_bridge.html_to_markdown("THROW")
+        self.assertIn("bad input", str(ctx.exception))
+        self.assertEqual(core_bridge.html_to_markdown("PID"), pid)
+
+    def test_dead_idle_worker_respawned(self):
+        pid = core_bridge.html_to_markdown("PID")
+        self.pool._idle[0].proc.kill()
+        self.pool._idle[0].proc.wait()
+        new_pid = core_bridge.html_to_markdown("PID")
+        self.assertNotEqual(new_pid, pid)
+        self.assertEqual(core_bridge.html_to_markdown("<b>"), "MD:<b>")
+
+    def test_crash_falls_back_to_one_shot(self):
+        with self.assertRaises(ConvertFailed) as ctx:
+            core_bridge.html_to_markdown("EXIT")
+        self.assertEqual(ctx.exception.details.get("returncode"), 3)
+        self.assertEqual(core_bridge.html_to_markdown("ok"), "MD:ok")
+
+    def test_timeout_kills_worker(self):
+        with mock.patch.object(core_bridge, "_TIMEOUT_S", 1):
+            with self.assertRaises(ConvertFailed) as ctx:
+                core_bridge.html_to_markdown("HANG")
+        self.assertEqual(ctx.exception.details.get("timeout_s"), 1)
+        self.assertEqual(self.pool._idle, [])
+        self.assertEqual(core_bridge.html_to_markdown("ok"), "MD:ok")
+
+    def test_failed_handshake_uses_one_shot(self):
+        os.remove(os.path.join(self._td.name, "html2md_core.js"))
+        with self.assertRaises(ConvertFailed):
+            core_bridge.html_to_markdown("<p>x</p>")
+        self.assertIn(core_bridge._CORE_JS, self.pool._broken)
+        with mock.patch.object(core_bridge, "_NodeWorker") as spawn, \
+                self.assertRaises(ConvertFailed):
+            core_bridge.html_to_markdown("<p>x</p>")
+        spawn.assert_not_called()
+
+    def test_concurrent_callers(self):
+        results = {}
+
+        def run(i):
+            results[i] = core_bridge.html_to_markdown(f"<p>{i}</p>")
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, {i: f"MD:<p>{i}</p>" for i in range(6)})
+        self.assertLessEqual(len(self.pool._idle), 2)
+
+    def test_env_zero_disables_pool(self):
+        with mock.patch.object(core_bridge, "_POOL", None), \
+                mock.patch.dict(os.environ, {"HTML_NODE_WORKERS": "0"}):
+            self.assertIsNone(core_bridge._pool())
+            self.assertEqual(core_bridge.html_to_markdown("x"), "MD:x")
 
 
 if __name__ == "__main__":
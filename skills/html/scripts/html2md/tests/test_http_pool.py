@@ -0,0 +1,188 @@
+"""Keep-alive client pool behind `acquire._http_get_bytes`.
+
+Real `httpx` against the local `StubServer` (see `bench_http_pool.py`), with loopback
+allowed through `HTML_SSRF_ALLOW_NETS` so the whole SSRF path — public pre-check,
+validated resolve, `_pin_host_addrs` — runs exactly as in production. The server counts
+TCP connections, which is the property under test: one per (host, validated addresses),
+not one per request.
+
+Run from ``skills/html/scripts``:  python3 -m pytest html2md/tests/test_http_pool.py
+"""
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import threading
+import unittest
+
+SCRIPTS = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if SCRIPTS not in sys.path:
+    sys.path.insert(0, SCRIPTS)
+
+from html2md import acquire  # noqa: E402
+from html2md.exceptions import FetchFailed  # noqa: E402
+from html2md.tests.bench_http_pool import StubServer  # noqa: E402
+
+_LOOPBACK = [("127.0.0.1", socket.AF_INET)]
+
+
+class TestHttpPool(unittest.TestCase):
+    def setUp(self):
+        self._saved_env = {k: os.environ.get(k)
+                           for k in (acquire._SSRF_ALLOW_ENV, acquire._PROXY_ENV)}
+        os.environ[acquire._SSRF_ALLOW_ENV] = "127.0.0.0/8"
+        os.environ.pop(acquire._PROXY_ENV, None)
+        acquire._close_http_clients()
+        self.server = StubServer()
+        self.server.__enter__()
+
+    def tearDown(self):
+        acquire._close_http_clients()
+        self.server.__exit__(None, None, None)
+        for k, v in self._saved_env.items():
+            os.environ.pop(k, None)
+            if v is not None:
+                os.environ[k] = v
+
+    def _get(self, path="/page", **kw):
+        kw.setdefault("max_bytes", None)
+        kw.setdefault("retries", 0)
+        return acquire._http_get_bytes(self.server.url(path), **kw)
+
+    def test_requests_share_one_connection(self):
+        for _ in range(5):
+            self.assertEqual(self._get(), self.server.body)
+        self.assertEqual(self.server.requests, 5)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(len(acquire._HTTP_CLIENTS), 1)
+
+    def test_redirect_hops_reuse_the_connection(self):
+        final = []
+        self.assertEqual(self._get("/redirect", final_url_out=final), self.server.body)
+        self.assertEqual(final, [self.server.url("/page")])
+        self.assertEqual((self.server.requests, self.server.connections), (2, 1))
+
+    def test_headers_are_per_request(self):
+        """One pooled client serves callers with different headers — nothing leaks from
+        one request into the next."""
+        seen = []
+        real = acquire._http_client
+
+        def spy(host, pinned, proxy):
+            client = real(host, pinned, proxy)
+            orig = client.stream
+
+            def stream(method, url, **kw):
+                seen.append(dict(kw.get("headers") or {}))
+                return orig(method, url, **kw)
+            client.stream = stream
+            return client
+
+        acquire._http_client = spy
+        try:
+            self._get(extra_headers={"X-Token": "a"})
+            self._get(ua="other-ua")
+        finally:
+            acquire._http_client = real
+        self.assertEqual(seen[0], {"User-Agent": acquire._UA, "X-Token": "a"})
+        self.assertEqual(seen[1], {"User-Agent": "other-ua"})
+        self.assertEqual(self.server.connections, 1)
+
+    def test_aborted_body_does_not_poison_the_pool(self):
+        with self.assertRaises(FetchFailed):
+            self._get("/big", max_bytes=1000)
+        self.assertEqual(self._get(), self.server.body)
+
+    def test_eviction_waits_for_the_stream_in_flight(self):
+        """A client evicted while another thread is mid-body is retired, not closed under
+        it: the reader finishes, and the client closes on that last release."""
+        started, evicted = threading.Event(), threading.Event()
+        got: dict = {}
+
+        def reader():
+            try:
+                with acquire._checkout_http_client("127.0.0.1", None, None) as client:
+                    got["client"] = client
+                    with client.stream("GET", self.server.url("/big")) as resp:
+                        chunks = resp.iter_bytes(1024)
+                        body = next(chunks)
+                        started.set()
+                        evicted.wait(timeout=5)
+                        got["body"] = body + b"".join(chunks)
+            except Exception as exc:  # noqa: BLE001 — surfaced by the assertion below
+                got["error"] = exc
+
+        t = threading.Thread(target=reader)
+        t.start()
+        self.assertTrue(started.wait(timeout=5))
+        for i in range(acquire._HTTP_POOL_SIZE):
+            acquire._release_http_client(acquire._http_client(f"h{i}.example", None, None))
+        client = got["client"]
+        self.assertNotIn(client, acquire._HTTP_CLIENTS.values())
+        self.assertFalse(client.is_closed)
+        evicted.set()
+        t.join(timeout=10)
+        self.assertNotIn("error", got)
+        self.assertEqual(len(got["body"]), len(self.server.body) * 64)
+        self.assertTrue(client.is_closed)
+
+    def test_refused_target_still_refused(self):
+        """The pool sits behind the SSRF gate: a pooled client for the host changes
+        nothing once loopback is no longer allowed."""
+        self._get()
+        os.environ[acquire._SSRF_ALLOW_ENV] = ""
+        with self.assertRaises(FetchFailed) as cm:
+            self._get()
+        self.assertEqual(cm.exception.details["kind"], "refused")
+        self.assertEqual(self.server.requests, 1)
+
+
+class TestClientKey(unittest.TestCase):
+    def setUp(self):
+        acquire._close_http_clients()
+
+    def tearDown(self):
+        acquire._close_http_clients()
+
+    def test_keyed_by_host_addresses_and_proxy(self):
+        a = acquire._http_client("Example.com", _LOOPBACK, None)
+        self.assertIs(acquire._http_client("example.com", _LOOPBACK, None), a)
+        self.assertIsNot(acquire._http_client("example.com",
+                                              [("127.0.0.2", socket.AF_INET)], None), a)
+        self.assertIsNot(acquire._http_client("example.com", None, None), a)
+        self.assertIsNot(acquire._http_client("example.com", _LOOPBACK,
+                                              "http://127.0.0.1:9"), a)
+        self.assertIsNot(acquire._http_client("example.org", _LOOPBACK, None), a)
+
+    def test_round_robin_order_shares_one_client(self):
+        """A round-robin host returns the same validated set in a new order per lookup:
+        still one client, so the connection is reused across hops."""
+        addrs = [("93.184.216.34", socket.AF_INET), ("93.184.216.35", socket.AF_INET)]
+        a = self._get("cdn.example", addrs)
+        self.assertIs(self._get("cdn.example", addrs[::-1]), a)
+        self.assertIsNot(self._get("cdn.example", addrs[:1]), a)
+
+    def _get(self, host, pinned=None):
+        client = acquire._http_client(host, pinned, None)
+        acquire._release_http_client(client)
+        return client
+
+    def test_least_recently_used_client_is_closed(self):
+        clients = [self._get(f"h{i}.example") for i in range(acquire._HTTP_POOL_SIZE)]
+        self._get("h0.example")  # h0 is now the most recent
+        self._get("new.example")
+        self.assertEqual(len(acquire._HTTP_CLIENTS), acquire._HTTP_POOL_SIZE)
+        self.assertTrue(clients[1].is_closed)
+        self.assertNotIn((None, "h1.example", None), acquire._HTTP_CLIENTS)
+        self.assertFalse(clients[0].is_closed)
+        self.assertIs(self._get("h0.example"), clients[0])
+
+    def test_forked_child_starts_empty(self):
+        acquire._http_client("example.com", None, None)
+        acquire._forget_http_clients_in_child()
+        self.assertEqual(acquire._HTTP_CLIENTS, {})
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -63,7 +63,10 @@ class _Client:
     def __exit__(self, *a):
         return False
 
-    def stream(self, method, url):
+    def close(self):
+        pass
+
+    def stream(self, method, url, **kw):
         return _Resp()
 
 
@@ -95,6 +98,7 @@ class _ProxyBase(unittest.TestCase):
         acquire._resolve_validated_addrs = lambda host: None
         self.spy = _KwargSpy()
         sys.modules["httpx"] = self.spy
+        acquire._close_http_clients()  # every test builds (and inspects) a fresh client
 
     def tearDown(self):
         os.environ.pop(acquire._PROXY_ENV, None)
@@ -107,6 +111,7 @@ class _ProxyBase(unittest.TestCase):
             sys.modules.pop("httpx", None)
         acquire._host_is_public = self._saved_pub
         acquire._resolve_validated_addrs = self._saved_pin
+        acquire._close_http_clients()
 
     def _fetch(self):
         with contextlib.redirect_stderr(io.StringIO()) as buf:
@@ -10,6 +10,8 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 
@@ -139,6 +141,30 @@ class TestSearch(_Base):
         acquire.run_search("q", _opts(rate_limit=2.0))
         self.assertIsNotNone(acquire._RATE_LIMITER)
 
+    def test_search_results_fetched_concurrently_in_rank_order(self):
+        """Results run on a bounded pool (first result slowest) and come back ranked;
+        --jobs 1 is strictly one after another."""
+        urls = [f"https://r{i}.com/p" for i in range(5)]
+        lock = threading.Lock()
+        state = {"now": 0, "peak": 0}
+
+        def router(url, **kw):
+            if "s.jina.ai" in url:
+                return _json_urls(*urls)
+            with lock:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+            time.sleep(0.15 if "r0.com" in url else 0.02)
+            with lock:
+                state["now"] -= 1
+            return GOOD
+        self._route(router)
+        for jobs, peak in ((3, 3), (1, 1)):
+            state["peak"] = 0
+            results = acquire.run_search("q", _opts(jobs=jobs))
+            self.assertEqual([r.source_meta.url for r in results], urls)
+            self.assertEqual(state["peak"], peak, f"jobs={jobs}")
+
     def test_search_results_skip_chrome_in_auto(self):
         """S-1: in auto, an (attacker-influenceable) search-result URL never escalates to the
         un-network-hardened chrome tier; a thin result falls to remote instead."""
@@ -210,6 +210,9 @@ class TestTask023Surface(unittest.TestCase):
         self.assertEqual(cli.main(["x.html", "--max-results", "0"]), 2)
         self.assertEqual(cli.main(["x.html", "--max-results", "-1"]), 2)
 
+    def test_jobs_must_be_positive(self):
+        self.assertEqual(cli.main(["--search", "q", "--jobs", "0"]), 2)
+
     def test_frontmatter_engine_field(self):
         """TC-01-10 (AC-R6): frontmatter records the real engine + query; offline → no engine."""
         from html2md import emit
@@ -64,7 +64,12 @@ class _FakeClient:
     def __exit__(self, *a):
         return False
 
-    def stream(self, method, url):  # noqa: D401 — mimic httpx.Client.stream
+    def close(self):
+        pass
+
+    def stream(self, method, url, headers=None, **kw):  # noqa: D401 — mimic httpx.Client.stream
+        self._fake.seen_headers.append(dict(headers or {}))
+        self._fake.seen_uas.append((headers or {}).get("User-Agent"))
         self._fake.seen_urls.append(url)
         step = self._fake.next_step()
         if isinstance(step, BaseException):
@@ -100,9 +105,6 @@ class _FakeHttpx:
         return step
 
     def Client(self, **kw):  # noqa: N802 — mimic httpx.Client
-        hdrs = kw.get("headers") or {}
-        self.seen_headers.append(dict(hdrs))
-        self.seen_uas.append(hdrs.get("User-Agent"))
         return _FakeClient(self)
 
 
@@ -129,6 +131,7 @@ class _patch_httpx:
     def __enter__(self):
         self._saved_httpx = sys.modules.get("httpx")
         sys.modules["httpx"] = self._fake
+        acquire._close_http_clients()  # no pooled client from another fake / the real httpx
         self._saved_pub = acquire._host_is_public
         # Skip the connection-pin's real getaddrinfo for the (non-resolving) fake test hosts
         # — keeps the suite offline + fast. The pin itself is covered by the dedicated
@@ -146,6 +149,7 @@ class _patch_httpx:
             sys.modules.pop("httpx", None)
         acquire._host_is_public = self._saved_pub
         acquire._resolve_validated_addrs = self._saved_pin
+        acquire._close_http_clients()
         return False
 
 
@@ -378,6 +382,78 @@ class TestSsrfAndErrors(unittest.TestCase):
             # restored after the context
             self.assertIs(acquire.socket.getaddrinfo, rebind)
 
+    def test_pin_host_addrs_is_per_thread(self):
+        """Concurrent search workers: each thread sees only its own pin, and the resolver
+        is restored only when the LAST pin block closes, whichever thread opens first."""
+        import socket as _s
+        import threading
+        from unittest import mock
+
+        rebind = mock.Mock(return_value=[(_s.AF_INET, _s.SOCK_STREAM, 6, "", ("10.0.0.5", 0))])
+        inside, release = threading.Barrier(2), threading.Event()
+        seen: dict = {}
+
+        def worker(ip):
+            with acquire._pin_host_addrs("evil.test", [(ip, _s.AF_INET)]):
+                inside.wait(timeout=5)
+                seen[ip] = acquire.socket.getaddrinfo("evil.test", 80)[0][4][0]
+                if ip == "93.184.216.35":
+                    release.wait(timeout=5)  # hold the pin open past the other thread
+            if ip == "93.184.216.34":
+                seen["unpinned"] = acquire.socket.getaddrinfo("evil.test", 80)[0][4][0]
+                release.set()
+
+        with mock.patch.object(acquire.socket, "getaddrinfo", rebind):
+            threads = [threading.Thread(target=worker, args=(ip,))
+                       for ip in ("93.184.216.34", "93.184.216.35")]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=10)
+            self.assertIs(acquire.socket.getaddrinfo, rebind)
+        self.assertEqual(seen, {"93.184.216.34": "93.184.216.34",
+                                "93.184.216.35": "93.184.216.35",
+                                "unpinned": "10.0.0.5"})
+
+    def test_unpinned_lookup_survives_last_pin_closing(self):
+        """A thread that fetched the override just before the last pin block closed (e.g.
+        `_resolve_validated_addrs` on another worker) still reaches the real resolver —
+        never a torn-down one. Stress: pins open/close in one thread while others resolve."""
+        import socket as _s
+        import threading
+        from unittest import mock
+
+        real = mock.Mock(return_value=[(_s.AF_INET, _s.SOCK_STREAM, 6, "", ("10.0.0.5", 0))])
+        pin = [("93.184.216.34", _s.AF_INET)]
+        errors: list = []
+        stop = threading.Event()
+
+        def lookups():
+            while not stop.is_set():
+                try:
+                    acquire.socket.getaddrinfo("other.test", 80)
+                except Exception as exc:  # noqa: BLE001 — collected for the assertion
+                    errors.append(exc)
+
+        with mock.patch.object(acquire.socket, "getaddrinfo", real):
+            with acquire._pin_host_addrs("evil.test", pin):
+                stale = acquire.socket.getaddrinfo  # the override, mid-call
+            self.assertEqual(stale("other.test", 80)[0][4][0], "10.0.0.5")
+
+            threads = [threading.Thread(target=lookups) for _ in range(3)]
+            for t in threads:
+                t.start()
+            try:
+                for _ in range(2000):
+                    with acquire._pin_host_addrs("evil.test", pin):
+                        pass
+            finally:
+                stop.set()
+                for t in threads:
+                    t.join(timeout=10)
+            self.assertIs(acquire.socket.getaddrinfo, real)
+        self.assertEqual(errors, [])
+
     def test_maxbytes_exceeded_streaming(self):
         """TC-06-04: streamed body over --max-bytes → FetchFailed (aborts mid-stream)."""
         with _patch_httpx(content=b"x" * 50000):
@@ -586,6 +662,22 @@ class TestRetryUAandEngines(unittest.TestCase):
             acquire._monotonic, acquire._sleep = saved_m, saved_s
         self.assertAlmostEqual(sum(slept), 0.5, places=3)
 
+    def test_rate_limiter_interval_is_per_host(self):
+        clock = [100.0]
+        saved_m, saved_s = acquire._monotonic, acquire._sleep
+        slept: list = []
+        acquire._monotonic = lambda: clock[0]
+        acquire._sleep = slept.append
+        try:
+            rl = acquire._RateLimiter(2.0)
+            rl.wait("a.com")
+            rl.wait("b.com")   # another host: its own schedule, no wait
+            rl.wait("A.com")   # same host (case-insensitive): next slot is 0.5s away
+            rl.wait("a.com")   # a concurrent caller queues behind it: 1.0s
+        finally:
+            acquire._monotonic, acquire._sleep = saved_m, saved_s
+        self.assertEqual(slept, [0.5, 1.0])
+
 
 class TestProactiveVariants(unittest.TestCase):
     """R-7 (Wikipedia REST) / R-9 (arXiv /html) proactive URL rewrites + link absolutize."""
@@ -17,7 +17,8 @@
 //     the line-number gutter span (mirrors docx `_html2docx_walker.emitLatexmlListing`).
 //
 // Pure stdin → stdout filter, same contract as html2md_core.js. The Python bridge
-// (core_bridge.py) spawns THIS file.
+// (core_bridge.py) spawns THIS file — as a long-lived `--serve` worker (see `serve()`
+// below), with the one-shot filter as its fallback.
 
 const { buildTurndown, expandTableToGrid } = require("./html2md_core");
 
@@ -477,8 +478,63 @@ function htmlToMarkdown(html) {
 
 module.exports = { htmlToMarkdown, buildConverter };
 
-// Pure stdin → stdout filter when executed directly.
-if (require.main === module) {
+// `--serve`: long-lived worker for core_bridge's pool. Frames in both directions are a
+// 4-byte big-endian byte length + a UTF-8 JSON object:
+//   request  {"id": N, "html": "…"}   → {"id": N, "ok": true, "markdown": "…"}
+//                                       | {"id": N, "ok": false, "error": "…"}
+//   request  {"id": N, "ping": true}  → {"id": N, "ok": true}   (health check)
+// Requests are answered in order, one converter per request (identical output to the
+// one-shot filter). stdin EOF ends the worker; a malformed frame exits 2.
+function serve() {
+    let chunks = [];
+    let buffered = 0;
+    const send = (obj) => {
+        const body = Buffer.from(JSON.stringify(obj), "utf8");
+        const head = Buffer.alloc(4);
+        head.writeUInt32BE(body.length, 0);
+        process.stdout.write(Buffer.concat([head, body]));
+    };
+    const handle = (req) => {
+        if (req.ping) {
+            send({ id: req.id, ok: true });
+            return;
+        }
+        try {
+            send({ id: req.id, ok: true, markdown: htmlToMarkdown(String(req.html)) });
+        } catch (e) {
+            send({ id: req.id, ok: false, error: String((e && e.message) || e) });
+        }
+    };
+    process.stdin.on("data", (chunk) => {
+        chunks.push(chunk);
+        buffered += chunk.length;
+        // Concatenate only once a whole frame is buffered — a multi-MB page arrives in
+        // many 64 KB chunks and must not be re-copied per chunk.
+        while (buffered >= 4) {
+            if (chunks[0].length < 4) chunks = [Buffer.concat(chunks)];
+            const len = chunks[0].readUInt32BE(0);
+            if (buffered < 4 + len) break;
+            const buf = chunks.length > 1 ? Buffer.concat(chunks) : chunks[0];
+            let req;
+            try {
+                req = JSON.parse(buf.subarray(4, 4 + len).toString("utf8"));
+            } catch (e) {
+                process.stderr.write("html_convert --serve: malformed frame\n");
+                process.exit(2);
+            }
+            const rest = buf.subarray(4 + len);
+            chunks = rest.length ? [rest] : [];
+            buffered = rest.length;
+            handle(req);
+        }
+    });
+    process.stdin.on("end", () => process.exit(0));
+}
+
+// Pure stdin → stdout filter when executed directly (`--serve` → worker mode).
+if (require.main === module && process.argv.includes("--serve")) {
+    serve();
+} else if (require.main === module) {
     let input = "";
     process.stdin.setEncoding("utf8");
     process.stdin.on("data", (chunk) => { input += chunk; });
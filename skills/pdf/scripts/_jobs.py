@@ -0,0 +1,52 @@
+"""Shared `--jobs N` plumbing for the pdf skill's CLIs.
+
+`jobs_type` validates the flag; `bounded_map` feeds a process pool with
+at most a fixed number of tasks in flight and yields their results in
+submission order, so a parallel run produces exactly the serial output
+while holding only a bounded number of results in memory.
+`pdf_extract.py` uses it for page runs; `pdf_watermark.py` for files.
+"""
+from __future__ import annotations
+
+import argparse
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def jobs_type(value: str) -> int:
+    """Argparse `type=` callable for `--jobs`: a positive integer."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(
+            f"--jobs must be a positive integer; got {value!r}"
+        )
+    return n
+
+
+def bounded_map(pool: Executor, fn: Callable[[T], R], items: Iterable[T], *,
+                in_flight: int) -> Iterator[R]:
+    """Yield `fn(item)` for every item, in order, computed on `pool`.
+
+    At most `in_flight` tasks are submitted ahead of the consumer. A
+    task's exception propagates from the matching `next()`; when the
+    consumer stops early (an exception or `close()`), the tasks not yet
+    started are cancelled."""
+    pending: deque[Future] = deque()
+    try:
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
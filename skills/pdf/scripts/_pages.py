@@ -0,0 +1,56 @@
+"""Shared `--pages` spec parser for the pdf skill's CLIs.
+
+A spec is `"all"` or a comma-separated list of 1-indexed pages and
+inclusive ranges (`"1-5,8,12-end"`). `pdf_watermark.py` uses it to pick
+the pages to stamp; `pdf_extract.py` to pick the pages to dump.
+"""
+from __future__ import annotations
+
+
+class PageSpecError(ValueError):
+    """Raised by parse_pages for a syntactically invalid --pages spec.
+
+    Kept separate from plain ValueError so a caller's except clause does
+    not swallow pypdf's own ValueErrors (e.g. corrupt page tree) and
+    misreport them as UsageError / exit 2."""
+
+
+def parse_pages(spec: str, total: int) -> set[int]:
+    """Resolve a 1-indexed page spec to a 0-indexed set of indices.
+
+    Accepts `"all"`, single pages (`"7"`), and ranges (`"1-5"`,
+    `"3-end"`). Multiple parts are comma-separated. Empty parts and
+    out-of-bounds endpoints raise PageSpecError so the CLI can emit a
+    UsageError envelope with a precise message.
+    """
+    if spec.strip().lower() == "all":
+        return set(range(total))
+    out: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            raise PageSpecError(f"empty page spec component in {spec!r}")
+        if "-" in part:
+            lo_s, hi_s = part.split("-", 1)
+            try:
+                lo = int(lo_s)
+                hi = total if hi_s.strip().lower() == "end" else int(hi_s)
+            except ValueError:
+                raise PageSpecError(
+                    f"invalid page spec component {part!r} "
+                    f"(expected N, N-M, or N-end)"
+                )
+        else:
+            try:
+                lo = hi = int(part)
+            except ValueError:
+                raise PageSpecError(
+                    f"invalid page spec component {part!r} "
+                    f"(expected a page number or 'all')"
+                )
+        if lo < 1 or hi < 1 or lo > total or hi > total or lo > hi:
+            raise PageSpecError(
+                f"page range {part!r} is out of bounds (1..{total})"
+            )
+        out.update(range(lo - 1, hi))
+    return out
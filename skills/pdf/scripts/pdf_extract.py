@@ -51,15 +51,32 @@ behaviour on PDFs that use real space glyphs (a space character always splits a
 word regardless of tolerance), so it does not regress normal documents. Pass
 ``--x-tolerance-ratio 0`` to disable it and fall back to the absolute tolerance.
 
+Page selection and parallelism: ``--pages "1-5,8,12-end"`` dumps only that
+slice (1-indexed, inclusive; same grammar as ``pdf_watermark.py``). Each
+PageRecord keeps its original page number in ``n``; ``page_count`` and the
+scan verdict describe the pages actually dumped. ``--jobs N`` splits the
+selected pages into contiguous runs and extracts them in N worker processes,
+each with its own pdfplumber handle; the runs are merged back in page order,
+so the dump is identical to a serial run.
+
+Streaming output: ``--format ndjson`` writes one PageRecord per line as soon
+as each page is extracted (flushed per line, so a downstream chunker can start
+on page 1 while page 2 000 is still parsing), then one trailer line carrying
+``page_count`` / ``doc_scanned`` / ``scanned_pages`` / ``x_tolerance_ratio``
+(the JSON dump minus ``pages``; the only line without ``n``). Pages are not
+kept in memory, so RSS stays flat on huge PDFs. A stream that ends without a
+trailer line was cut short by a mid-document failure (exit 1).
+
 Usage:
     python3 pdf_extract.py INPUT.pdf [-o OUT.json] [--layout]
                            [--password PW] [--x-tolerance-ratio R]
-                           [--json-errors]
+                           [--pages SPEC] [--jobs N]
+                           [--format json|ndjson] [--json-errors]
 
 Exit codes:
     0  — success: structured dump emitted (digital, mixed, or all-blank PDF)
     1  — failure: input missing / not a PDF / corrupt / encrypted-without-password
-    2  — usage error (argparse)
+    2  — usage error (argparse, or an invalid / out-of-range --pages spec)
     6  — SelfOverwriteRefused: the -o output path resolves to the input PDF
     10 — DocumentScanned: whole document is image-only; run OCR or the Read tool
 """
@@ -68,13 +85,19 @@ from __future__ import annotations
 
 import argparse
 import json
+import itertools
 import logging
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TextIO
 
 import pdfplumber  # type: ignore
 
 from _errors import add_json_errors_argument, report_error
+from _jobs import bounded_map, jobs_type
+from _pages import PageSpecError, parse_pages
 
 # A CLI owns its stderr: with --json-errors a wrapper parses stderr as JSON.
 # pdfminer / pypdf log free-text warnings ("invalid pdf header", "EOF marker
@@ -96,6 +119,13 @@ _EXIT_FAIL = 1
 _EXIT_USAGE = 2
 _EXIT_SELF_OVERWRITE = 6  # cross-7 parity: -o path == input path
 _EXIT_SCANNED = 10
+# `--jobs` splits the selection into about this many contiguous runs per
+# worker: enough that one slow (table-heavy) run does not leave the other
+# workers idle, few enough that per-task pickling stays negligible. A run
+# never exceeds `_MAX_RUN_PAGES`, and at most 2 × jobs runs are in flight, so
+# the records held in memory are bounded however long the document is.
+_RUNS_PER_JOB = 4
+_MAX_RUN_PAGES = 32
 
 
 class _ExtractError(Exception):
@@ -121,7 +151,8 @@ def _build_parser() -> argparse.ArgumentParser:
         ),
         epilog=(
             "Exit codes: 0 success; 1 failure (missing/not-a-PDF/corrupt/"
-            "encrypted-without-password); 2 usage error; 6 SelfOverwriteRefused "
+            "encrypted-without-password); 2 usage error (incl. a bad --pages "
+            "spec); 6 SelfOverwriteRefused "
             "(-o path is the input PDF); 10 DocumentScanned (whole document is "
             "image-only — run OCR or the Read tool)."
         ),
@@ -152,6 +183,24 @@ def _build_parser() -> argparse.ArgumentParser:
              "PDFs. Pass 0 (or a negative value) to disable and fall back to "
              "pdfplumber's absolute x_tolerance.",
     )
+    parser.add_argument(
+        "--pages", default="all", metavar="SPEC",
+        help='Pages to dump: "all" or "1-5,8,12-end" (1-indexed, inclusive). '
+             "Records keep their original page number in `n`. Default: all.",
+    )
+    parser.add_argument(
+        "--jobs", type=jobs_type, default=1, metavar="N",
+        help="Extract the selected pages in N worker processes, each with its "
+             "own pdfplumber handle (default: 1 = serial). Records are merged "
+             "in page order; the dump is identical to a serial run.",
+    )
+    parser.add_argument(
+        "--format", choices=("json", "ndjson"), default="json",
+        help="json (default): one indented DumpDocument. ndjson: one "
+             "PageRecord per line, written as each page finishes, then a "
+             "trailer line with page_count / doc_scanned / scanned_pages / "
+             "x_tolerance_ratio — pages are never held in memory.",
+    )
     add_json_errors_argument(parser)
     return parser
 
@@ -255,38 +304,116 @@ def _extract_page(
     }
 
 
-def extract_pdf(
+# Per-worker state for `--jobs`: each pool process opens the PDF once in
+# `_init_worker` and extracts every run it is handed from that handle.
+_WORKER_PDF = None
+_WORKER_OPTS: dict = {}
+
+
+def _init_worker(pdf_path: Path, password: str | None, layout: bool,
+                 x_tolerance_ratio: float | None) -> None:
+    """Pool initializer: open this worker's own pdfplumber handle. A handle is
+    never shared across processes; it is released when the worker exits."""
+    global _WORKER_PDF, _WORKER_OPTS
+    _WORKER_PDF = _open_pdf(pdf_path, password)
+    _WORKER_OPTS = {"layout": layout, "x_tolerance_ratio": x_tolerance_ratio}
+
+
+def _extract_run(indices: list[int]) -> list[dict]:
+    """Worker task: PageRecords for one contiguous run of 0-based indices.
+    Each page's parsed objects are dropped once its record is built, so a
+    worker's memory does not grow with the pages it has already done."""
+    assert _WORKER_PDF is not None
+    pages = _WORKER_PDF.pages
+    records = []
+    for index in indices:
+        page = pages[index]
+        record = _extract_page(page, **_WORKER_OPTS)
+        record["n"] = index + 1
+        records.append(record)
+        page.close()
+    return records
+
+
+def _runs(indices: list[int], jobs: int) -> list[list[int]]:
+    """Split sorted `indices` into about `jobs * _RUNS_PER_JOB` contiguous
+    runs (each at most `_MAX_RUN_PAGES` long), in order."""
+    size = min(_MAX_RUN_PAGES,
+               max(1, -(-len(indices) // (jobs * _RUNS_PER_JOB))))
+    return [indices[i:i + size] for i in range(0, len(indices), size)]
+
+
+def _effective_ratio(x_tolerance_ratio: float | None) -> float | None:
+    """`x_tolerance_ratio` ≤ 0 (or `None`) → `None` (legacy absolute-tolerance
+    word splitting); anything else passes through."""
+    return x_tolerance_ratio if (
+        x_tolerance_ratio and x_tolerance_ratio > 0) else None
+
+
+def iter_page_records(
     pdf_path: Path, *, password: str | None, layout: bool,
     x_tolerance_ratio: float | None = _DEFAULT_X_TOLERANCE_RATIO,
-) -> dict:
-    """Open the PDF, extract every page, classify, return the dump dict
-    (ARCH §4.1 `DumpDocument`).
+    pages: str = "all", jobs: int = 1,
+) -> Iterator[dict]:
+    """Yield the PageRecord of every selected page, in page order, as soon as
+    it is extracted.
 
     Owns the pdfplumber handle: once `_open_pdf` returns a handle, the `with`
     block releases the file descriptor on every path, including a page raising
     mid-extraction. (A failure *inside* `_open_pdf`, before a handle exists,
-    raises `_ExtractError` directly — no handle to leak here.)
-
-    `x_tolerance_ratio` ≤ 0 (or `None`) is normalised to `None` (legacy
-    absolute-tolerance word splitting); the *effective* value is echoed back in
-    the dump's top-level `x_tolerance_ratio` so the dump is self-describing
-    about how words were split."""
-    ratio = x_tolerance_ratio if (
-        x_tolerance_ratio and x_tolerance_ratio > 0) else None
+    raises `_ExtractError` directly — no handle to leak here.) Both the open
+    and the `pages` spec check (`PageSpecError` when invalid or out of range)
+    run on the first `next()`, before any record is produced.
+
+    Each page's parsed objects are dropped once its record is built, so memory
+    stays flat as long as the caller does not keep the records. With `jobs` >
+    1 the selection is extracted by a process pool (`_init_worker` /
+    `_extract_run`) with at most 2 × `jobs` runs in flight; runs are yielded
+    in submission order, so the sequence equals the serial one."""
+    ratio = _effective_ratio(x_tolerance_ratio)
     with _open_pdf(pdf_path, password) as pdf:
-        pages: list[dict] = []
-        for index, page in enumerate(pdf.pages, start=1):
-            record = _extract_page(
-                page, layout=layout, x_tolerance_ratio=ratio)
-            record["n"] = index
-            pages.append(record)
-    doc_scanned, scanned_pages = _classify_document(pages)
+        selected = sorted(parse_pages(pages, len(pdf.pages)))
+        if jobs <= 1 or len(selected) <= 1:
+            for index in selected:
+                page = pdf.pages[index]
+                record = _extract_page(
+                    page, layout=layout, x_tolerance_ratio=ratio)
+                record["n"] = index + 1
+                page.close()
+                yield record
+            return
+        runs = _runs(selected, jobs)
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(runs)), initializer=_init_worker,
+            initargs=(pdf_path, password, layout, ratio),
+        ) as pool:
+            for records in bounded_map(pool, _extract_run, runs,
+                                       in_flight=2 * jobs):
+                yield from records
+
+
+def extract_pdf(
+    pdf_path: Path, *, password: str | None, layout: bool,
+    x_tolerance_ratio: float | None = _DEFAULT_X_TOLERANCE_RATIO,
+    pages: str = "all", jobs: int = 1,
+) -> dict:
+    """Extract the selected pages, classify, return the dump dict (ARCH §4.1
+    `DumpDocument`). See `iter_page_records` for handle ownership, `pages`
+    and `jobs`; records keep their original 1-based `n`.
+
+    The *effective* `x_tolerance_ratio` (≤ 0 normalised to `None`) is echoed
+    back in the dump's top-level `x_tolerance_ratio` so the dump is
+    self-describing about how words were split."""
+    records = list(iter_page_records(
+        pdf_path, password=password, layout=layout,
+        x_tolerance_ratio=x_tolerance_ratio, pages=pages, jobs=jobs))
+    doc_scanned, scanned_pages = _classify_document(records)
     return {
-        "page_count": len(pages),
+        "page_count": len(records),
         "doc_scanned": doc_scanned,
         "scanned_pages": scanned_pages,
-        "x_tolerance_ratio": ratio,
-        "pages": pages,
+        "x_tolerance_ratio": _effective_ratio(x_tolerance_ratio),
+        "pages": records,
     }
 
 
@@ -315,14 +442,56 @@ def _emit(dump: dict, out_path: Path | None) -> None:
             fh.write("\n")
 
 
+def _write_ndjson(records: Iterable[dict], fh: TextIO,
+                  x_tolerance_ratio: float | None) -> dict:
+    """Write each record as one compact JSON line, flushed so a reader of the
+    stream sees it at once, then the trailer line; return the trailer. Only
+    the fields `_classify_document` reads are kept per page, never the text
+    or tables."""
+    seen: list[dict] = []
+    for record in records:
+        fh.write(json.dumps(record, ensure_ascii=False))
+        fh.write("\n")
+        fh.flush()
+        seen.append({k: record[k] for k in ("n", "char_count", "scanned")})
+    doc_scanned, scanned_pages = _classify_document(seen)
+    trailer = {
+        "page_count": len(seen),
+        "doc_scanned": doc_scanned,
+        "scanned_pages": scanned_pages,
+        "x_tolerance_ratio": x_tolerance_ratio,
+    }
+    fh.write(json.dumps(trailer, ensure_ascii=False))
+    fh.write("\n")
+    fh.flush()
+    return trailer
+
+
+def _emit_ndjson(records: Iterable[dict], out_path: Path | None, *,
+                 x_tolerance_ratio: float | None) -> dict:
+    """`--format ndjson` counterpart of `_emit`: stream `records` to stdout
+    (`out_path is None`) or overwrite `out_path`, and return the trailer (the
+    dump minus `pages`) so `main` can pick the exit code."""
+    if out_path is None:
+        return _write_ndjson(records, sys.stdout, x_tolerance_ratio)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as fh:
+        return _write_ndjson(records, fh, x_tolerance_ratio)
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entry point: parse → extract → emit → return the exit code.
 
     Exit codes: 0 success; 1 failure (`InputNotFound` / `EncryptedPDF` /
     `CorruptPdf` / `OutputWriteFailed` / `InternalError`); 2 argparse usage
-    error; 6 `SelfOverwriteRefused` (`-o` resolves to the input PDF); 10
+    error or an invalid `--pages` spec (`UsageError`); 6 `SelfOverwriteRefused` (`-o` resolves to the input PDF); 10
     `DocumentScanned` (whole-document scan). On a whole-doc scan the dump is
-    still emitted (to stdout or `-o`) — exit 10 + stderr is the loud signal."""
+    still emitted (to stdout or `-o`) — exit 10 + stderr is the loud signal.
+
+    `--format ndjson` pulls the first record before opening the sink, so an
+    open / `--pages` failure still exits cleanly with nothing written; a page
+    failing after output began exits 1 and leaves the stream without its
+    trailer line."""
     parser = _build_parser()
     args = parser.parse_args(argv)
     je = args.json_errors
@@ -346,9 +515,24 @@ def main(argv: list[str] | None = None) -> int:
         )
 
     try:
-        dump = extract_pdf(
-            input_path, password=args.password, layout=args.layout,
-            x_tolerance_ratio=args.x_tolerance_ratio)
+        if args.format == "ndjson":
+            dump = None
+            records = iter_page_records(
+                input_path, password=args.password, layout=args.layout,
+                x_tolerance_ratio=args.x_tolerance_ratio,
+                pages=args.pages, jobs=args.jobs)
+            head = list(itertools.islice(records, 1))
+        else:
+            dump = extract_pdf(
+                input_path, password=args.password, layout=args.layout,
+                x_tolerance_ratio=args.x_tolerance_ratio,
+                pages=args.pages, jobs=args.jobs)
+    except PageSpecError as exc:
+        return report_error(
+            f"Invalid --pages spec: {exc}",
+            code=_EXIT_USAGE, error_type="UsageError",
+            details={"flag": "pages", "spec": args.pages}, json_mode=je,
+        )
     except _ExtractError as exc:
         return report_error(
             exc.message, code=_EXIT_FAIL, error_type=exc.error_type,
@@ -364,25 +548,36 @@ def main(argv: list[str] | None = None) -> int:
     # whole-document scan (it has diagnostic value). A failure writing the
     # `-o` file surfaces as a clean envelope, never a raw traceback.
     try:
-        _emit(dump, args.output)
+        if dump is None:
+            summary = _emit_ndjson(
+                itertools.chain(head, records), args.output,
+                x_tolerance_ratio=_effective_ratio(args.x_tolerance_ratio))
+        else:
+            _emit(dump, args.output)
+            summary = dump
     except OSError as exc:
         return report_error(
             f"Could not write output {args.output}: {exc}",
             code=_EXIT_FAIL, error_type="OutputWriteFailed",
             details={"path": str(args.output)}, json_mode=je,
         )
+    except Exception as exc:  # ndjson: a page failed after output began
+        return report_error(
+            f"Internal error: {type(exc).__name__}: {exc}",
+            code=_EXIT_FAIL, error_type="InternalError", json_mode=je,
+        )
 
-    if dump["doc_scanned"]:
+    if summary["doc_scanned"]:
         return report_error(
-            f"Document appears scanned / image-only — {dump['page_count']} "
+            f"Document appears scanned / image-only — {summary['page_count']} "
             f"page(s), no extractable text. Run OCR (e.g. ocrmypdf) or render "
             f"the pages as images with the Read tool; see "
             f"references/pdf-to-markdown.md.",
             code=_EXIT_SCANNED, error_type="DocumentScanned",
-            details={"page_count": dump["page_count"]}, json_mode=je,
+            details={"page_count": summary["page_count"]}, json_mode=je,
         )
-    if dump["scanned_pages"]:
-        pages = ", ".join(str(n) for n in dump["scanned_pages"])
+    if summary["scanned_pages"]:
+        pages = ", ".join(str(n) for n in summary["scanned_pages"])
         sys.stderr.write(
             f"warning: page(s) {pages} appear scanned / image-only "
             f"(no extractable text); the rest of the document extracted "
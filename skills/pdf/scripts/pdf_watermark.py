@@ -6,6 +6,19 @@ Two modes (mutually exclusive, exactly one required):
   pdf_watermark.py IN.pdf OUT.pdf --text "DRAFT" [...]
   pdf_watermark.py IN.pdf OUT.pdf --image stamp.png [...]
 
+Batch mode (nightly stamping of many files with one stamp):
+
+  pdf_watermark.py --manifest files.json --text "DRAFT" [--jobs N] [...]
+
+  files.json is a JSON list of {"input": ..., "output": ..., "pages"?: ...}
+  objects (relative paths resolve against the manifest's directory; a
+  missing "pages" falls back to --pages). One overlay cache serves the
+  whole batch, so each unique page size is rendered once per run (once
+  per worker with --jobs), not once per file. --jobs N stamps N files
+  concurrently in worker processes. A throughput summary (files, pages,
+  pages/s) goes to stdout; a file that fails is reported on stderr and
+  the rest of the batch still runs (exit 1 at the end).
+
 Common flags:
 
   --opacity 0.0..1.0          Watermark alpha (default 0.3).
@@ -26,17 +39,25 @@ Pipeline:
     overlay PDF (one page) at exactly that size; then merge each
     in-scope page of the input with the matching overlay via
     pypdf.merge_page. Heterogeneous decks (mixed Letter+A4) keep
-    correct watermark proportions.
+    correct watermark proportions. The overlay cache (`OverlayCache`)
+    can be shared across `watermark()` calls; `watermark_batch()` does
+    that for a manifest.
 
 Same-path I/O (input == output, including via symlink) is refused
 with exit 6 / SelfOverwriteRefused — merging on top of the source
-mid-write would corrupt it.
+mid-write would corrupt it. A manifest is checked as a whole before
+anything is stamped: two entries sharing an output, or an output that
+is another entry's input, is refused the same way.
 """
 from __future__ import annotations
 
 import argparse
+import json
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 
@@ -46,61 +67,14 @@ from reportlab.lib.colors import HexColor  # type: ignore
 from reportlab.pdfgen import canvas  # type: ignore
 
 from _errors import add_json_errors_argument, report_error
+from _jobs import bounded_map, jobs_type
+from _pages import PageSpecError, parse_pages as _parse_pages
 
 
 POSITIONS = ("center", "top-left", "top-right",
              "bottom-left", "bottom-right", "diagonal")
 
 
-class PageSpecError(ValueError):
-    """Raised by _parse_pages for a syntactically invalid --pages spec.
-
-    Kept separate from plain ValueError so main()'s except clause does
-    not swallow pypdf's own ValueErrors (e.g. corrupt page tree) and
-    misreport them as UsageError / exit 2."""
-
-
-def _parse_pages(spec: str, total: int) -> set[int]:
-    """Resolve a 1-indexed page spec to a 0-indexed set of indices.
-
-    Accepts `"all"`, single pages (`"7"`), and ranges (`"1-5"`,
-    `"3-end"`). Multiple parts are comma-separated. Empty parts and
-    out-of-bounds endpoints raise ValueError so the CLI can emit a
-    UsageError envelope with a precise message.
-    """
-    if spec.strip().lower() == "all":
-        return set(range(total))
-    out: set[int] = set()
-    for part in spec.split(","):
-        part = part.strip()
-        if not part:
-            raise PageSpecError(f"empty page spec component in {spec!r}")
-        if "-" in part:
-            lo_s, hi_s = part.split("-", 1)
-            try:
-                lo = int(lo_s)
-                hi = total if hi_s.strip().lower() == "end" else int(hi_s)
-            except ValueError:
-                raise PageSpecError(
-                    f"invalid page spec component {part!r} "
-                    f"(expected N, N-M, or N-end)"
-                )
-        else:
-            try:
-                lo = hi = int(part)
-            except ValueError:
-                raise PageSpecError(
-                    f"invalid page spec component {part!r} "
-                    f"(expected a page number or 'all')"
-                )
-        if lo < 1 or hi < 1 or lo > total or hi > total or lo > hi:
-            raise PageSpecError(
-                f"page range {part!r} is out of bounds (1..{total})"
-            )
-        out.update(range(lo - 1, hi))
-    return out
-
-
 def _anchor(position: str, w: float, h: float, margin: float = 36.0) -> tuple[float, float]:
     """Return the (x, y) PDF point at which to place the watermark
     centre. PDF origin is bottom-left; `margin` is a 0.5-inch safe
@@ -190,57 +164,99 @@ def _build_image_overlay(
     return buf.getvalue()
 
 
-def watermark(
-    input_pdf: Path,
-    output_pdf: Path,
-    *,
-    text: str | None,
-    image: Path | None,
-    opacity: float,
-    position: str,
-    rotation: float | None,
-    font_size: int,
-    color: str,
-    scale: float,
-    pages_spec: str,
-) -> dict:
-    reader = PdfReader(str(input_pdf))
-    total = len(reader.pages)
-    in_scope = _parse_pages(pages_spec, total)
-
-    # Auto-rotation: "diagonal" → 45° unless caller overrode.
-    effective_rotation = rotation if rotation is not None else (
-        45.0 if position == "diagonal" else 0.0
-    )
+class OverlayCache:
+    """One overlay PdfReader per unique mediabox for one set of stamp
+    settings, so heterogeneous decks (mixed Letter+A4) get correctly
+    proportioned watermarks. The same cache can be passed to many
+    `watermark()` calls: a batch of same-size documents renders its
+    overlay once, not once per file."""
+
+    def __init__(
+        self,
+        *,
+        text: str | None,
+        image: Path | None,
+        opacity: float,
+        position: str,
+        rotation: float | None,
+        font_size: int,
+        color: str,
+        scale: float,
+    ) -> None:
+        if text is None and image is None:
+            raise ValueError("image path must be provided when text is None")
+        self.text = text
+        self.image = image
+        self.opacity = opacity
+        self.position = position
+        # Auto-rotation: "diagonal" → 45° unless caller overrode.
+        self.rotation = rotation if rotation is not None else (
+            45.0 if position == "diagonal" else 0.0
+        )
+        self.font_size = font_size
+        self.color = color
+        self.scale = scale
+        self.built = 0
+        self._readers: dict[tuple[float, float], PdfReader] = {}
 
-    # Cache one overlay PdfReader per unique mediabox so heterogeneous
-    # decks (mixed Letter+A4) get correctly proportioned watermarks.
-    overlay_cache: dict[tuple[float, float], PdfReader] = {}
+    @property
+    def mode(self) -> str:
+        return "text" if self.text is not None else "image"
 
-    def get_overlay(w: float, h: float) -> PdfReader:
+    def get(self, w: float, h: float) -> PdfReader:
         key = (round(w, 3), round(h, 3))
-        cached = overlay_cache.get(key)
+        cached = self._readers.get(key)
         if cached is not None:
             return cached
-        if text is not None:
+        if self.text is not None:
             blob = _build_text_overlay(
                 (w, h),
-                text=text, opacity=opacity, position=position,
-                rotation=effective_rotation,
-                font_size=font_size, color=color,
+                text=self.text, opacity=self.opacity, position=self.position,
+                rotation=self.rotation,
+                font_size=self.font_size, color=self.color,
             )
         else:
-            if image is None:
-                raise ValueError("image path must be provided when text is None")
             blob = _build_image_overlay(
                 (w, h),
-                image_path=image, opacity=opacity, position=position,
-                rotation=effective_rotation, scale=scale,
+                image_path=self.image, opacity=self.opacity,
+                position=self.position, rotation=self.rotation,
+                scale=self.scale,
             )
         rdr = PdfReader(BytesIO(blob))
-        overlay_cache[key] = rdr
+        self._readers[key] = rdr
+        self.built += 1
         return rdr
 
+
+def watermark(
+    input_pdf: Path,
+    output_pdf: Path,
+    *,
+    text: str | None = None,
+    image: Path | None = None,
+    opacity: float = 0.3,
+    position: str = "diagonal",
+    rotation: float | None = None,
+    font_size: int = 60,
+    color: str = "#888888",
+    scale: float = 0.5,
+    pages_spec: str = "all",
+    overlays: OverlayCache | None = None,
+) -> dict:
+    """Stamp the `pages_spec` pages of `input_pdf` into `output_pdf`.
+
+    `overlays` supplies the stamp settings and an overlay cache shared with
+    other calls; when given, the individual stamp keywords are ignored.
+    """
+    if overlays is None:
+        overlays = OverlayCache(
+            text=text, image=image, opacity=opacity, position=position,
+            rotation=rotation, font_size=font_size, color=color, scale=scale,
+        )
+    reader = PdfReader(str(input_pdf))
+    total = len(reader.pages)
+    in_scope = _parse_pages(pages_spec, total)
+
     writer = PdfWriter(clone_from=reader)
     stamped = 0
     for i, page in enumerate(writer.pages):
@@ -249,7 +265,7 @@ def watermark(
         mb = page.mediabox
         w = float(mb.width)
         h = float(mb.height)
-        overlay = get_overlay(w, h).pages[0]
+        overlay = overlays.get(w, h).pages[0]
         page.merge_page(overlay)
         stamped += 1
 
@@ -262,7 +278,123 @@ def watermark(
         "output": str(output_pdf),
         "pages_total": total,
         "pages_stamped": stamped,
-        "mode": "text" if text is not None else "image",
+        "mode": overlays.mode,
+    }
+
+
+class ManifestError(ValueError):
+    """Raised by _load_manifest for a malformed --manifest file (→ exit 2)."""
+
+
+def _load_manifest(path: Path) -> list[dict]:
+    """Read and validate a --manifest JSON file.
+
+    The file holds a non-empty list of objects, each with `input` and
+    `output` paths and an optional `pages` spec (default: the CLI
+    `--pages`). Relative paths resolve against the manifest's directory.
+    Returns `{"input": Path, "output": Path, "pages": str | None}` dicts.
+    """
+    try:
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise ManifestError(f"{path} is not valid JSON: {exc}")
+    if not isinstance(raw, list) or not raw:
+        raise ManifestError("manifest must hold a non-empty JSON list of files")
+    base = Path(path).parent
+    entries: list[dict] = []
+    for i, entry in enumerate(raw):
+        if not isinstance(entry, dict):
+            raise ManifestError(f"entry {i}: must be an object")
+        unknown = set(entry) - {"input", "output", "pages"}
+        if unknown:
+            raise ManifestError(f"entry {i}: unsupported key(s): {sorted(unknown)}")
+        for key in ("input", "output"):
+            if not isinstance(entry.get(key), str) or not entry[key]:
+                raise ManifestError(f"entry {i}: {key!r} must be a non-empty string")
+        pages = entry.get("pages")
+        if pages is not None and not isinstance(pages, str):
+            raise ManifestError(f"entry {i}: 'pages' must be a string")
+        entries.append({
+            "input": base / entry["input"],
+            "output": base / entry["output"],
+            "pages": pages,
+        })
+    return entries
+
+
+def _stamp_entry(entry: dict, overlays: OverlayCache, pages_spec: str) -> dict:
+    """`watermark()` one manifest entry; a failure becomes the report's
+    `error` instead of aborting the rest of the batch."""
+    try:
+        return watermark(
+            entry["input"], entry["output"],
+            pages_spec=entry["pages"] or pages_spec, overlays=overlays,
+        )
+    except Exception as exc:
+        return {
+            "input": str(entry["input"]),
+            "output": str(entry["output"]),
+            "error": f"{type(exc).__name__}: {exc}",
+        }
+
+
+# Per-worker state for `--jobs`: each pool process builds its own overlays.
+_WORKER_OVERLAYS: OverlayCache | None = None
+
+
+def _init_worker(stamp: dict) -> None:
+    """Pool initializer: one overlay cache per worker process, reused for
+    every file that worker stamps."""
+    global _WORKER_OVERLAYS
+    _WORKER_OVERLAYS = OverlayCache(**stamp)
+
+
+def _stamp_in_worker(entry: dict, pages_spec: str) -> dict:
+    assert _WORKER_OVERLAYS is not None
+    return _stamp_entry(entry, _WORKER_OVERLAYS, pages_spec)
+
+
+def watermark_batch(
+    entries: list[dict],
+    *,
+    stamp: dict,
+    pages_spec: str = "all",
+    jobs: int = 1,
+) -> dict:
+    """Stamp every manifest entry with one set of `stamp` settings
+    (`OverlayCache` keywords) and return a throughput summary.
+
+    Serially, one `OverlayCache` serves the whole batch; with `jobs` > 1
+    the files are stamped concurrently in a process pool, each worker
+    keeping its own cache, with at most 2 × `jobs` files in flight.
+    `reports` is in manifest order either way; a failed file carries an
+    `error` key and does not stop the batch.
+    """
+    started = time.perf_counter()
+    reports: list[dict] = []
+    if jobs <= 1:
+        overlays = OverlayCache(**stamp)
+        for entry in entries:
+            reports.append(_stamp_entry(entry, overlays, pages_spec))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(entries)),
+            initializer=_init_worker, initargs=(stamp,),
+        ) as pool:
+            reports.extend(bounded_map(
+                pool, partial(_stamp_in_worker, pages_spec=pages_spec),
+                entries, in_flight=2 * jobs))
+    seconds = time.perf_counter() - started
+    done = [r for r in reports if "error" not in r]
+    stamped = sum(r["pages_stamped"] for r in done)
+    return {
+        "files": len(done),
+        "failed": len(reports) - len(done),
+        "pages_total": sum(r["pages_total"] for r in done),
+        "pages_stamped": stamped,
+        "seconds": seconds,
+        "pages_per_sec": stamped / seconds if seconds > 0 else 0.0,
+        "reports": reports,
     }
 
 
@@ -275,10 +407,111 @@ def _hex_colour(s: str) -> str:
     return s
 
 
+def _same_path(a: Path, b: Path) -> bool:
+    """cross-7 H1 same-path check (catches symlinks via .resolve())."""
+    try:
+        return a.resolve() == b.resolve()
+    except OSError:
+        return False
+
+
+def _manifest_collision(entries: list[dict]) -> tuple[str, dict] | None:
+    """cross-7 H1 across a whole manifest: an entry writing its own input,
+    two entries writing one output, or an entry writing another entry's
+    input. With `--jobs` those files would be written concurrently, or read
+    while being written. Returns `(message, details)` for the first
+    collision, or None."""
+    def resolved(p: Path) -> Path:
+        try:
+            return p.resolve()
+        except OSError:
+            return p.absolute()
+
+    inputs: dict[Path, int] = {}
+    for i, entry in enumerate(entries):
+        inputs.setdefault(resolved(entry["input"]), i)
+    outputs: dict[Path, int] = {}
+    for i, entry in enumerate(entries):
+        out = resolved(entry["output"])
+        if out in outputs:
+            j = outputs[out]
+            return (f"Manifest entries {j} and {i} write the same output: "
+                    f"{out}.", {"entries": [j, i], "output": str(out)})
+        outputs[out] = i
+        if out in inputs:
+            j = inputs[out]
+            if j == i:
+                return (f"Manifest entry {i}: input and output resolve to the "
+                        f"same path: {out} (would corrupt the source "
+                        "mid-write).",
+                        {"entry": i, "input": str(entry["input"]),
+                         "output": str(entry["output"])})
+            return (f"Manifest entry {i} writes the input of entry {j}: "
+                    f"{out} (would be read while being written).",
+                    {"entries": [j, i], "path": str(out)})
+    return None
+
+
+def _run_batch(args: argparse.Namespace, stamp: dict) -> int:
+    """--manifest mode: validate the whole manifest before any I/O, stamp,
+    print the throughput summary."""
+    je = args.json_errors
+    try:
+        entries = _load_manifest(args.manifest)
+    except OSError as exc:
+        return report_error(
+            f"Manifest not readable: {args.manifest}: {exc}",
+            code=1, error_type="FileNotFound",
+            details={"path": str(args.manifest)}, json_mode=je,
+        )
+    except ManifestError as exc:
+        return report_error(
+            f"Invalid --manifest: {exc}",
+            code=2, error_type="UsageError",
+            details={"flag": "manifest", "path": str(args.manifest)},
+            json_mode=je,
+        )
+    collision = _manifest_collision(entries)
+    if collision is not None:
+        message, details = collision
+        return report_error(message, code=6, error_type="SelfOverwriteRefused",
+                            details=details, json_mode=je)
+
+    summary = watermark_batch(entries, stamp=stamp, pages_spec=args.pages,
+                              jobs=args.jobs)
+    for report in summary["reports"]:
+        if "error" in report:
+            sys.stderr.write(
+                f"error: {report['input']}: {report['error']}\n")
+    print(f"Stamped {summary['pages_stamped']}/{summary['pages_total']} "
+          f"page(s) in {summary['files']} file(s) in "
+          f"{summary['seconds']:.2f}s ({summary['pages_per_sec']:.1f} "
+          f"pages/s, jobs={args.jobs}); {summary['failed']} failed.")
+    if summary["failed"]:
+        return report_error(
+            f"{summary['failed']} of {len(entries)} file(s) failed",
+            code=1, error_type="BatchFailed",
+            details={"failed": [r["input"] for r in summary["reports"]
+                                if "error" in r]},
+            json_mode=je,
+        )
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
-    parser.add_argument("input", type=Path, help="Source .pdf")
-    parser.add_argument("output", type=Path, help="Destination .pdf")
+    parser.add_argument("input", type=Path, nargs="?", help="Source .pdf")
+    parser.add_argument("output", type=Path, nargs="?", help="Destination .pdf")
+    parser.add_argument("--manifest", type=Path, default=None,
+                        metavar="FILE.json",
+                        help='Batch mode instead of INPUT OUTPUT: a JSON list '
+                             'of {"input": ..., "output": ..., "pages"?: ...} '
+                             "objects (paths relative to the manifest). One "
+                             "overlay cache serves every file; prints a "
+                             "pages/s summary.")
+    parser.add_argument("--jobs", type=jobs_type, default=1, metavar="N",
+                        help="--manifest only: stamp N files concurrently in "
+                             "worker processes (default: 1 = serial).")
     mode = parser.add_mutually_exclusive_group(required=True)
     mode.add_argument("--text", type=str, help="Watermark text (e.g. DRAFT, CONFIDENTIAL).")
     mode.add_argument("--image", type=Path, help="Watermark image (PNG/JPG).")
@@ -303,6 +536,12 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
     je = args.json_errors
 
+    if args.manifest is None and (args.input is None or args.output is None):
+        parser.error("INPUT and OUTPUT are required (or use --manifest)")
+    if args.manifest is not None and args.input is not None:
+        parser.error("--manifest cannot be combined with INPUT / OUTPUT")
+    if args.jobs > 1 and args.manifest is None:
+        parser.error("--jobs requires --manifest")
     if not (0.0 <= args.opacity <= 1.0):
         parser.error(f"--opacity must be in [0.0, 1.0], got {args.opacity}")
     if args.scale <= 0 or args.scale > 1.0:
@@ -310,7 +549,7 @@ def main(argv: list[str] | None = None) -> int:
     if args.font_size <= 0:
         parser.error(f"--font-size must be > 0, got {args.font_size}")
 
-    if not args.input.is_file():
+    if args.manifest is None and not args.input.is_file():
         return report_error(
             f"Input not found: {args.input}",
             code=1, error_type="FileNotFound",
@@ -322,13 +561,16 @@ def main(argv: list[str] | None = None) -> int:
             code=1, error_type="FileNotFound",
             details={"path": str(args.image)}, json_mode=je,
         )
+    stamp = {
+        "text": args.text, "image": args.image,
+        "opacity": args.opacity, "position": args.position,
+        "rotation": args.rotation, "font_size": args.font_size,
+        "color": args.color, "scale": args.scale,
+    }
+    if args.manifest is not None:
+        return _run_batch(args, stamp)
 
-    # cross-7 H1 same-path guard (catches symlinks via .resolve()).
-    try:
-        same = args.input.resolve() == args.output.resolve()
-    except OSError:
-        same = False
-    if same:
+    if _same_path(args.input, args.output):
         return report_error(
             f"INPUT and OUTPUT resolve to the same path: {args.input.resolve()} "
             "(would corrupt the source mid-write).",
@@ -340,11 +582,7 @@ def main(argv: list[str] | None = None) -> int:
     try:
         report = watermark(
             args.input, args.output,
-            text=args.text, image=args.image,
-            opacity=args.opacity, position=args.position,
-            rotation=args.rotation, font_size=args.font_size,
-            color=args.color, scale=args.scale,
-            pages_spec=args.pages,
+            pages_spec=args.pages, overlays=OverlayCache(**stamp),
         )
     except PageSpecError as exc:
         # Only PageSpecError from _parse_pages maps to UsageError / exit 2.
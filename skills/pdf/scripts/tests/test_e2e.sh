@@ -343,6 +343,17 @@ assert 'DRAFT' not in p2, 'DRAFT leaked to page 2'
     && ok "watermark: --pages '1' restricts stamp to page 1" \
     || nok "watermark --pages selectivity" "DRAFT distribution wrong"
 
+# --manifest batch: two files, one with its own "pages", stamped by 2 workers.
+cat > "$TMP/wm_manifest.json" <<'JSON'
+[{"input": "out.pdf", "output": "wm_batch/a.pdf"},
+ {"input": "merged.pdf", "output": "wm_batch/b.pdf", "pages": "2"}]
+JSON
+out=$("$PY" pdf_watermark.py --manifest "$TMP/wm_manifest.json" --text DRAFT --jobs 2 2>/dev/null)
+echo "$out" | grep -q "in 2 file(s)" \
+    && [ -s "$TMP/wm_batch/a.pdf" ] && [ -s "$TMP/wm_batch/b.pdf" ] \
+    && ok "watermark: --manifest --jobs 2 stamps both files + pages/s summary" \
+    || nok "watermark --manifest" "$out"
+
 # --color non-hex value → argparse type= validation → exit 2 (UsageError)
 set +e
 "$PY" pdf_watermark.py "$TMP/out.pdf" "$TMP/_x.pdf" --text DRAFT --color red >/dev/null 2>&1
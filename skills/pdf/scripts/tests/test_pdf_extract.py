@@ -77,7 +77,8 @@ class TestStubSmoke(unittest.TestCase):
         self.assertEqual(r.returncode, 0, r.stderr)
         out = r.stdout
         for flag in ("INPUT", "-o", "--output", "--layout", "--password",
-                     "--x-tolerance-ratio", "--json-errors"):
+                     "--x-tolerance-ratio", "--pages", "--jobs",
+                     "--format", "--json-errors"):
             self.assertIn(flag, out)
         # Collapse argparse line-wrapping before phrase checks.
         norm = " ".join(out.split())
@@ -622,5 +623,174 @@ class TestWordGapSplitting(unittest.TestCase):
         self.assertIn(self.concat, dump["pages"][0]["text"])
 
 
+def _build_deck(path: Path) -> Path:
+    """Mixed 7-page deck: digital, scanned and glued pages interleaved."""
+    from pypdf import PdfWriter  # type: ignore
+
+    writer = PdfWriter()
+    for name in ("digital", "scanlike", "glued", "digital", "scanlike"):
+        writer.append(str(FIXTURES_DIR / f"{name}.pdf"))
+    with open(path, "wb") as fh:
+        writer.write(fh)
+    return path
+
+
+class TestPagesAndJobs(unittest.TestCase):
+    """`--pages` slicing and `--jobs` parallel extraction. The fixture is a
+    mixed deck (digital, scanned and glued pages) so every PageRecord field
+    varies across the page range the workers split."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _ensure_fixtures()
+        cls._td = tempfile.TemporaryDirectory()
+        cls.deck = _build_deck(Path(cls._td.name) / "deck.pdf")
+        cls.serial = pdf_extract.extract_pdf(
+            cls.deck, password=None, layout=False)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._td.cleanup()
+
+    def test_jobs_match_serial(self):
+        self.assertGreater(self.serial["page_count"], 6)
+        self.assertTrue(self.serial["scanned_pages"])
+        for jobs in (2, 3):
+            self.assertEqual(
+                pdf_extract.extract_pdf(
+                    self.deck, password=None, layout=False, jobs=jobs),
+                self.serial, f"jobs={jobs}")
+
+    def test_pages_slice_keeps_numbering(self):
+        total = self.serial["page_count"]
+        for jobs in (1, 2):
+            dump = pdf_extract.extract_pdf(
+                self.deck, password=None, layout=False,
+                pages=f"2-3,{total}", jobs=jobs)
+            self.assertEqual([p["n"] for p in dump["pages"]], [2, 3, total])
+            self.assertEqual(dump["page_count"], 3)
+            self.assertEqual(
+                dump["pages"],
+                [self.serial["pages"][i] for i in (1, 2, total - 1)])
+
+    def test_runs_are_contiguous_and_ordered(self):
+        indices = list(range(3, 20))
+        runs = pdf_extract._runs(indices, 2)
+        self.assertEqual([i for run in runs for i in run], indices)
+        self.assertLessEqual(len(runs), 2 * pdf_extract._RUNS_PER_JOB)
+
+    def test_bad_pages_spec_is_usage_error(self):
+        with self.assertRaises(pdf_extract.PageSpecError):
+            pdf_extract.extract_pdf(
+                self.deck, password=None, layout=False, pages="0-2")
+        r = _run_cli([str(self.deck), "--pages", "99", "--json-errors"])
+        self.assertEqual(r.returncode, 2)
+        env = json.loads(r.stderr.strip())
+        self.assertEqual(env["type"], "UsageError")
+        self.assertEqual(env["details"]["flag"], "pages")
+
+    def test_cli_jobs(self):
+        r = _run_cli([str(self.deck), "--jobs", "2", "--pages", "1-2"])
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertEqual(json.loads(r.stdout)["pages"],
+                         self.serial["pages"][:2])
+        r = _run_cli([str(self.deck), "--jobs", "0", "--json-errors"])
+        self.assertEqual(r.returncode, 2)
+
+
+class TestNdjsonStream(unittest.TestCase):
+    """`--format ndjson`: one PageRecord per line as pages finish, then a
+    trailer equal to the JSON dump minus `pages`."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        _ensure_fixtures()
+        cls._td = tempfile.TemporaryDirectory()
+        cls.tmp = Path(cls._td.name)
+        cls.deck = _build_deck(cls.tmp / "deck.pdf")
+        cls.dump = pdf_extract.extract_pdf(
+            cls.deck, password=None, layout=False)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._td.cleanup()
+
+    def _main(self, *args: str) -> int:
+        with _silence_fd_stderr():
+            return pdf_extract.main([str(self.deck), *args])
+
+    def _lines(self, path: Path) -> list[dict]:
+        return [json.loads(ln) for ln in
+                path.read_text(encoding="utf-8").splitlines()]
+
+    def test_lines_match_json_dump(self):
+        out = self.tmp / "deck.ndjson"
+        self.assertEqual(self._main("--format", "ndjson", "-o", str(out)), 0)
+        *records, trailer = self._lines(out)
+        expected = dict(self.dump)
+        self.assertEqual(records, expected.pop("pages"))
+        self.assertEqual(trailer, expected)
+        self.assertNotIn("n", trailer)
+
+    def test_jobs_stream_is_byte_identical(self):
+        outs = []
+        for jobs in ("1", "2"):
+            out = self.tmp / f"j{jobs}.ndjson"
+            self._main("--format", "ndjson", "--jobs", jobs, "-o", str(out))
+            outs.append(out.read_bytes())
+        self.assertEqual(outs[0], outs[1])
+
+    def test_records_are_yielded_as_pages_finish(self):
+        calls = []
+        real = pdf_extract._extract_page
+
+        def counting(page, **kw):
+            calls.append(page.page_number)
+            return real(page, **kw)
+
+        with mock.patch.object(pdf_extract, "_extract_page", counting):
+            stream = pdf_extract.iter_page_records(
+                self.deck, password=None, layout=False)
+            self.assertEqual(next(stream)["n"], 1)
+            self.assertEqual(calls, [1])
+            stream.close()
+
+    def test_scanned_document_exits_10_after_trailer(self):
+        out = self.tmp / "scan.ndjson"
+        with _silence_fd_stderr():
+            rc = pdf_extract.main([str(FIXTURES_DIR / "scanlike.pdf"),
+                                   "--format", "ndjson", "-o", str(out)])
+        self.assertEqual(rc, 10)
+        self.assertIs(self._lines(out)[-1]["doc_scanned"], True)
+
+    def test_open_failure_writes_nothing(self):
+        out = self.tmp / "bad.ndjson"
+        self.assertEqual(
+            self._main("--format", "ndjson", "--pages", "99", "-o", str(out)),
+            2)
+        self.assertFalse(out.exists())
+
+    def test_mid_stream_failure_leaves_no_trailer(self):
+        real = pdf_extract._extract_page
+
+        def fail_on_page_3(page, **kw):
+            if page.page_number == 3:
+                raise RuntimeError("boom on page 3")
+            return real(page, **kw)
+
+        out = self.tmp / "cut.ndjson"
+        with mock.patch.object(pdf_extract, "_extract_page", fail_on_page_3):
+            rc = self._main("--format", "ndjson", "-o", str(out))
+        self.assertEqual(rc, 1)
+        self.assertEqual([r.get("n") for r in self._lines(out)], [1, 2])
+
+    def test_cli_stdout(self):
+        r = _run_cli([str(self.deck), "--format", "ndjson", "--pages", "4"])
+        self.assertEqual(r.returncode, 0, r.stderr)
+        lines = [json.loads(ln) for ln in r.stdout.splitlines()]
+        self.assertEqual(lines[0], self.dump["pages"][3])
+        self.assertEqual(lines[1]["page_count"], 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,200 @@
+"""Tests for `pdf_watermark.py` — shared overlay cache, `--manifest` batch
+mode and its `--jobs` process pool. Single-file CLI behaviour is covered by
+`test_e2e.sh`.
+
+Run:
+    cd skills/pdf/scripts
+    ./.venv/bin/python -m unittest tests.test_pdf_watermark -v
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from pypdf import PdfReader, PdfWriter  # type: ignore
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import pdf_watermark  # noqa: E402
+
+LETTER = (612.0, 792.0)
+A4 = (595.28, 841.89)
+STAMP = {"text": "DRAFT", "image": None, "opacity": 0.3,
+         "position": "diagonal", "rotation": None, "font_size": 60,
+         "color": "#888888", "scale": 0.5}
+
+
+def _blank_pdf(path: Path, sizes: list[tuple[float, float]]) -> Path:
+    writer = PdfWriter()
+    for w, h in sizes:
+        writer.add_blank_page(width=w, height=h)
+    with open(path, "wb") as fh:
+        writer.write(fh)
+    return path
+
+
+@contextlib.contextmanager
+def _silence_fd_stderr():
+    """`_errors.report_error` binds `sys.stderr` at import time, so only an
+    fd-level redirect keeps in-process `main()` calls quiet."""
+    saved = os.dup(2)
+    with tempfile.TemporaryFile(mode="w+") as sink:
+        os.dup2(sink.fileno(), 2)
+        try:
+            yield sink
+        finally:
+            os.dup2(saved, 2)
+            os.close(saved)
+
+
+def _stamped_pages(path: Path) -> list[bool]:
+    return ["DRAFT" in (p.extract_text() or "") for p in PdfReader(str(path)).pages]
+
+
+class TestOverlayCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_shared_across_files(self):
+        overlays = pdf_watermark.OverlayCache(**STAMP)
+        for i in range(3):
+            src = _blank_pdf(self.tmp / f"in{i}.pdf", [LETTER, LETTER, A4])
+            report = pdf_watermark.watermark(
+                src, self.tmp / f"out{i}.pdf", overlays=overlays)
+            self.assertEqual(report["pages_stamped"], 3)
+        self.assertEqual(overlays.built, 2)  # one per mediabox, not per file
+        self.assertEqual(_stamped_pages(self.tmp / "out2.pdf"), [True] * 3)
+
+    def test_keywords_without_cache(self):
+        src = _blank_pdf(self.tmp / "in.pdf", [LETTER] * 3)
+        report = pdf_watermark.watermark(
+            src, self.tmp / "out.pdf", text="DRAFT", pages_spec="2-end")
+        self.assertEqual(report["mode"], "text")
+        self.assertEqual(_stamped_pages(self.tmp / "out.pdf"),
+                         [False, True, True])
+
+    def test_needs_text_or_image(self):
+        with self.assertRaises(ValueError):
+            pdf_watermark.OverlayCache(**{**STAMP, "text": None})
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        for i in range(4):
+            _blank_pdf(self.tmp / f"in{i}.pdf", [LETTER] * (i + 1))
+        self.manifest = self.tmp / "files.json"
+        self.manifest.write_text(json.dumps(
+            [{"input": f"in{i}.pdf", "output": f"out/{i}.pdf"} for i in range(3)]
+            + [{"input": "in3.pdf", "output": "out/3.pdf", "pages": "1"}]
+        ), encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_serial_and_parallel_agree(self):
+        entries = pdf_watermark._load_manifest(self.manifest)
+        runs = {}
+        for jobs in (1, 2):
+            summary = pdf_watermark.watermark_batch(
+                entries, stamp=STAMP, jobs=jobs)
+            runs[jobs] = summary
+            self.assertEqual(_stamped_pages(self.tmp / "out/3.pdf"),
+                             [True, False, False, False])
+        for jobs in (1, 2):
+            self.assertEqual(runs[jobs]["files"], 4)
+            self.assertEqual(runs[jobs]["failed"], 0)
+            self.assertEqual(runs[jobs]["pages_total"], 10)
+            self.assertEqual(runs[jobs]["pages_stamped"], 7)
+            self.assertGreater(runs[jobs]["pages_per_sec"], 0)
+        self.assertEqual(runs[1]["reports"], runs[2]["reports"])
+
+    def test_failed_file_does_not_stop_batch(self):
+        entries = pdf_watermark._load_manifest(self.manifest)
+        (self.tmp / "in1.pdf").write_bytes(b"not a pdf")
+        with contextlib.redirect_stderr(io.StringIO()):  # pypdf warnings
+            summary = pdf_watermark.watermark_batch(entries, stamp=STAMP)
+        self.assertEqual((summary["files"], summary["failed"]), (3, 1))
+        self.assertIn("error", summary["reports"][1])
+        self.assertTrue((self.tmp / "out/3.pdf").is_file())
+
+    def test_manifest_validation(self):
+        for body in ("{}", "[]", '[{"input": "a.pdf"}]',
+                     '[{"input": "a.pdf", "output": "b.pdf", "x": 1}]',
+                     '[{"input": "a.pdf", "output": "b.pdf", "pages": 3}]'):
+            self.manifest.write_text(body, encoding="utf-8")
+            with self.assertRaises(pdf_watermark.ManifestError, msg=body):
+                pdf_watermark._load_manifest(self.manifest)
+
+    def _main(self, *argv: str) -> tuple[int, str]:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), \
+                contextlib.redirect_stderr(io.StringIO()), _silence_fd_stderr():
+            try:
+                rc = pdf_watermark.main(list(argv))
+            except SystemExit as exc:
+                rc = exc.code
+        return rc, out.getvalue()
+
+    def test_cli_manifest(self):
+        rc, out = self._main("--manifest", str(self.manifest), "--text",
+                             "DRAFT", "--jobs", "2")
+        self.assertEqual(rc, 0)
+        self.assertIn("Stamped 7/10 page(s) in 4 file(s)", out)
+        self.assertIn("pages/s, jobs=2", out)
+
+    def test_cli_usage_errors(self):
+        rc, _ = self._main(str(self.tmp / "in0.pdf"), str(self.tmp / "o.pdf"),
+                           "--text", "X", "--jobs", "2")
+        self.assertEqual(rc, 2)
+        rc, _ = self._main("--manifest", str(self.manifest),
+                           str(self.tmp / "in0.pdf"), "--text", "X")
+        self.assertEqual(rc, 2)
+        self.manifest.write_text("[1]", encoding="utf-8")
+        rc, _ = self._main("--manifest", str(self.manifest), "--text", "X")
+        self.assertEqual(rc, 2)
+
+    def test_cli_same_path_entry_refused(self):
+        self.manifest.write_text(json.dumps(
+            [{"input": "in0.pdf", "output": "./in0.pdf"}]), encoding="utf-8")
+        rc, _ = self._main("--manifest", str(self.manifest), "--text", "X")
+        self.assertEqual(rc, 6)
+        self.assertFalse((self.tmp / "out").exists())
+
+    def test_cli_duplicate_output_refused(self):
+        self.manifest.write_text(json.dumps(
+            [{"input": "in0.pdf", "output": "out/a.pdf"},
+             {"input": "in1.pdf", "output": "out/../out/a.pdf"}]), encoding="utf-8")
+        rc, _ = self._main("--manifest", str(self.manifest), "--text", "X",
+                           "--jobs", "2")
+        self.assertEqual(rc, 6)
+        self.assertFalse((self.tmp / "out").exists())
+
+    def test_cli_output_is_another_entrys_input_refused(self):
+        before = (self.tmp / "in2.pdf").read_bytes()
+        self.manifest.write_text(json.dumps(
+            [{"input": "in0.pdf", "output": "out/0.pdf"},
+             {"input": "in1.pdf", "output": "in2.pdf"},
+             {"input": "in2.pdf", "output": "out/2.pdf"}]), encoding="utf-8")
+        rc, _ = self._main("--manifest", str(self.manifest), "--text", "X",
+                           "--jobs", "2")
+        self.assertEqual(rc, 6)
+        self.assertFalse((self.tmp / "out").exists())
+        self.assertEqual((self.tmp / "in2.pdf").read_bytes(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Unit tests for `office.pack` — raw passthrough from `--source` and
+stored media.
+
+Run:
+    cd skills/docx/scripts
+    ./.venv/bin/python -m unittest office.tests.test_pack
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stderr
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+SCRIPTS = HERE.parent.parent  # skills/<skill>/scripts
+sys.path.insert(0, str(SCRIPTS))
+
+from office import pack as pack_mod  # noqa: E402
+from office._zip import _read_compressed  # noqa: E402
+from office.unpack import unpack  # noqa: E402
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+CT = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    b'<Default Extension="xml" ContentType="application/xml"/></Types>'
+)
+DOC = (
+    f'<w:document xmlns:w="{W}"><w:body><w:p><w:r><w:t>Hi</w:t></w:r></w:p>'
+    f'</w:body></w:document>'
+).encode()
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64
+VBA = b"\xd0\xcf\x11\xe0" + b"macro" * 500
+
+
+class TestPackSource(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._td.name)
+        self.src = self.tmp / "in.docx"
+        with zipfile.ZipFile(self.src, "w", zipfile.ZIP_DEFLATED) as z:
+            z.writestr("[Content_Types].xml", CT)
+            z.writestr("word/document.xml", DOC)
+            z.writestr("word/media/image1.png", PNG)
+            z.writestr("word/vbaProject.bin", VBA)
+        self.tree = self.tmp / "tree"
+        unpack(self.src, self.tree)
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_unchanged_members_copied_raw_from_source(self) -> None:
+        out = self.tmp / "out.docx"
+        stats = pack_mod.pack(self.tree, out, source=self.src)
+        self.assertEqual(stats.copied, 2)  # image + vbaProject.bin
+        self.assertEqual(stats.bytes_copied, len(PNG) + len(VBA))
+        self.assertEqual(stats.recompressed, 2)  # pretty-printed XML differs
+        with zipfile.ZipFile(self.src) as a, zipfile.ZipFile(out) as b:
+            for name in ("word/media/image1.png", "word/vbaProject.bin"):
+                self.assertEqual(_read_compressed(b, b.getinfo(name)),
+                                 _read_compressed(a, a.getinfo(name)))
+            self.assertIsNone(b.testzip())
+
+    def test_edited_member_is_rewritten(self) -> None:
+        (self.tree / "word" / "vbaProject.bin").write_bytes(VBA + b"!")
+        stats = pack_mod.pack(self.tree, self.tmp / "out.docx", source=self.src)
+        self.assertEqual(stats.copied, 1)
+        with zipfile.ZipFile(self.tmp / "out.docx") as b:
+            self.assertEqual(b.read("word/vbaProject.bin"), VBA + b"!")
+
+    def test_repack_of_packed_output_copies_everything(self) -> None:
+        first = self.tmp / "first.docx"
+        pack_mod.pack(self.tree, first)
+        tree2 = self.tmp / "tree2"
+        unpack(first, tree2)
+        stats = pack_mod.pack(tree2, self.tmp / "second.docx", source=first)
+        self.assertEqual((stats.recompressed, stats.stored), (0, 0))
+        self.assertEqual(stats.copied, 4)
+
+    def test_precompressed_media_is_stored(self) -> None:
+        out = self.tmp / "out.docx"
+        stats = pack_mod.pack(self.tree, out)
+        self.assertEqual((stats.copied, stats.stored), (0, 1))
+        with zipfile.ZipFile(out) as z:
+            self.assertEqual(z.getinfo("word/media/image1.png").compress_type,
+                             zipfile.ZIP_STORED)
+            self.assertEqual(z.getinfo("word/vbaProject.bin").compress_type,
+                             zipfile.ZIP_DEFLATED)
+
+    def test_output_is_reproducible(self) -> None:
+        a, b = self.tmp / "a.docx", self.tmp / "b.docx"
+        pack_mod.pack(self.tree, a)
+        with zipfile.ZipFile(a) as z:
+            self.assertEqual({i.date_time for i in z.infolist()},
+                             {(1980, 1, 1, 0, 0, 0)})
+        pack_mod.pack(self.tree, b)
+        self.assertEqual(a.read_bytes(), b.read_bytes())
+
+    def test_cli_stats_line(self) -> None:
+        buf = io.StringIO()
+        with redirect_stderr(buf):
+            rc = pack_mod.main([str(self.tree), str(self.tmp / "o.docx"),
+                                "--source", str(self.src), "--stats"])
+        self.assertEqual(rc, 0)
+        self.assertIn("2 member(s) copied raw", buf.getvalue())
+
+    def test_rejects_non_zip_source(self) -> None:
+        junk = self.tmp / "junk.docx"
+        junk.write_bytes(b"nope")
+        with self.assertRaises(ValueError):
+            pack_mod.pack(self.tree, self.tmp / "o.docx", source=junk)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,8 +4,17 @@
 Picks the right validator by extension, runs it, and prints either a
 human report or a JSON object (`--json`).
 
+In-process API: `validate_file(path, strict=..., schemas_dir=...)`
+returns the same `ValidationReport` the CLI prints, without paying
+interpreter start-up per call. Validators are kept per (format,
+schemas dir, strict) for the life of the process, so compiled XSDs are
+reused and — validators run `incremental=True` — a re-validation after
+an edit only re-checks the parts whose bytes changed. `format_report`
+/ `exit_code` render and grade a report exactly as `main` does.
+
 Usage (module):
     python -m office.validate file.docx [--strict] [--json] [--schemas-dir <path>]
+    python -m office.validate edited.docx --compare-to original.docx [--stats]
 Usage (script):
     python office/validate.py file.docx
 
@@ -34,14 +43,14 @@ from pathlib import Path
 if __package__ in (None, ""):
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     from office._encryption import EncryptedFileError, assert_not_encrypted
-    from office.validators.base import ValidationReport
+    from office.validators.base import BaseSchemaValidator, ValidationReport
     from office.validators.docx import DocxValidator
     from office.validators.pptx import PptxValidator
     from office.validators.redlining import RedliningValidator
     from office.validators.xlsx import XlsxValidator
 else:
     from ._encryption import EncryptedFileError, assert_not_encrypted
-    from .validators.base import ValidationReport
+    from .validators.base import BaseSchemaValidator, ValidationReport
     from .validators.docx import DocxValidator
     from .validators.pptx import PptxValidator
     from .validators.redlining import RedliningValidator
@@ -95,6 +104,72 @@ def _resolve_schemas_dir(cli_value: Path | None) -> Path | None:
     return guess if guess.is_dir() else None
 
 
+_VALIDATORS: dict[tuple[str, Path | None, bool], BaseSchemaValidator] = {}
+
+
+def validate_file(
+    path: Path,
+    *,
+    strict: bool = False,
+    schemas_dir: Path | None = None,
+    compare_to: Path | None = None,
+) -> ValidationReport:
+    """Validate `path` in-process; the report `main` would print.
+
+    `schemas_dir=None` means the bundled `office/schemas`. Raises
+    `EncryptedFileError` for a CFB container and `ValueError` for an
+    unknown extension or a non-.docx `compare_to`.
+    """
+    path = Path(path)
+    assert_not_encrypted(path)
+    ext = path.suffix.lower()
+    cls = _VALIDATOR_BY_EXT.get(ext)
+    if cls is None:
+        raise ValueError(f"Unknown extension: {ext}")
+    if compare_to is not None and ext != ".docx":
+        raise ValueError(f"--compare-to only supports .docx (got {ext})")
+
+    schemas = _resolve_schemas_dir(schemas_dir)
+    key = (ext, schemas, strict)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        validator = _VALIDATORS[key] = cls(
+            schemas_dir=schemas, strict=strict, incremental=True,
+        )
+    report = validator.validate(path)
+
+    # 2026-05-12 scratch-leak follow-up: structural package check.
+    # Adds one warning per ZIP entry not under the canonical OOXML
+    # hierarchy. With --strict, warnings become errors (exit 1).
+    for leak in _check_package_structure(path, _ALLOWED_PREFIXES_BY_EXT[ext]):
+        report.warnings.append(
+            f"non-OOXML package member: {leak!r} "
+            "(not under any allowed prefix; likely scratch-file leak)"
+        )
+
+    if compare_to is not None:
+        redliner = RedliningValidator(schemas_dir=schemas, strict=strict)
+        report.merge(redliner.compare(Path(compare_to), path))
+    return report
+
+
+def format_report(report: ValidationReport) -> str:
+    """The plain-text report (`ERROR:` / `WARN:` lines, or `OK`)."""
+    lines = [f"ERROR: {err}" for err in report.errors]
+    lines += [f"WARN:  {warn}" for warn in report.warnings]
+    if report.ok and not report.warnings:
+        lines.append("OK")
+    return "\n".join(lines)
+
+
+def exit_code(report: ValidationReport, *, strict: bool = False) -> int:
+    if report.errors:
+        return 1
+    if strict and report.warnings:
+        return 1
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
     parser.add_argument("input", type=Path, help="OOXML file to validate")
@@ -115,6 +190,9 @@ def main(argv: list[str] | None = None) -> int:
              "report any text change that is not wrapped in <w:ins>/<w:del>. "
              "Catches 'editor forgot to enable Track Changes' scenarios. .docx only.",
     )
+    parser.add_argument("--stats", action="store_true",
+                        help="Print validator statistics (e.g. --compare-to "
+                             "throughput in paragraphs/s) to stderr")
     args = parser.parse_args(argv)
 
     if not args.input.is_file():
@@ -127,56 +205,27 @@ def main(argv: list[str] | None = None) -> int:
     # which gives the user a different (and misleading) remediation hint
     # than every other reader in the office skills.
     try:
-        assert_not_encrypted(args.input)
+        report = validate_file(
+            args.input, strict=args.strict, schemas_dir=args.schemas_dir,
+            compare_to=args.compare_to,
+        )
     except EncryptedFileError as exc:
         print(str(exc), file=sys.stderr)
         return 3
-
-    ext = args.input.suffix.lower()
-    cls = _VALIDATOR_BY_EXT.get(ext)
-    if cls is None:
-        print(f"Unknown extension: {ext}", file=sys.stderr)
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
         return 2
 
-    schemas_dir = _resolve_schemas_dir(args.schemas_dir)
-    validator = cls(schemas_dir=schemas_dir, strict=args.strict)
-    report: ValidationReport = validator.validate(args.input)
-
-    # 2026-05-12 scratch-leak follow-up: structural package check.
-    # Adds one warning per ZIP entry not under the canonical OOXML
-    # hierarchy. With --strict, warnings become errors (exit 1).
-    pkg_leaks = _check_package_structure(
-        args.input, _ALLOWED_PREFIXES_BY_EXT[ext],
-    )
-    for leak in pkg_leaks:
-        report.warnings.append(
-            f"non-OOXML package member: {leak!r} "
-            "(not under any allowed prefix; likely scratch-file leak)"
-        )
-
-    if args.compare_to is not None:
-        if ext != ".docx":
-            print(f"--compare-to only supports .docx (got {ext})", file=sys.stderr)
-            return 2
-        redliner = RedliningValidator(schemas_dir=schemas_dir, strict=args.strict)
-        redline_report = redliner.compare(args.compare_to, args.input)
-        report.merge(redline_report)
-
+    if args.stats:
+        for line in report.stats:
+            print(line, file=sys.stderr)
     if args.json:
         print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
     else:
-        for err in report.errors:
-            print(f"ERROR: {err}")
-        for warn in report.warnings:
-            print(f"WARN:  {warn}")
-        if report.ok and not report.warnings:
-            print("OK")
-
-    if report.errors:
-        return 1
-    if args.strict and report.warnings:
-        return 1
-    return 0
+        text = format_report(report)
+        if text:
+            print(text)
+    return exit_code(report, strict=args.strict)
 
 
 if __name__ == "__main__":
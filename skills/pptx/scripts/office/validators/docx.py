@@ -6,7 +6,7 @@ import zipfile
 
 from lxml import etree  # type: ignore
 
-from .base import BaseSchemaValidator, ValidationReport, _safe_parser
+from .base import BaseSchemaValidator, ValidationReport
 
 
 W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
@@ -25,7 +25,7 @@ class DocxValidator(BaseSchemaValidator):
         super()._validate_container(archive, report)
         if "word/document.xml" in archive.namelist():
             try:
-                doc = etree.fromstring(archive.read("word/document.xml"), _safe_parser())
+                doc = self._part_tree(archive, "word/document.xml")
             except etree.XMLSyntaxError as exc:
                 report.errors.append(f"word/document.xml: parse error {exc}")
                 return
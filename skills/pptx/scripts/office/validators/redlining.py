@@ -36,6 +36,20 @@ The validator does NOT attempt to diff formatting (bold/italic/colour
 changes); ECMA-376's `<w:rPrChange>` / `<w:pPrChange>` are acknowledged
 but not compared — a later enhancement if needed.
 
+Streaming
+---------
+`compare` never materialises either document. Both packages are
+iterparsed side by side (`_iter_docx_paragraphs`), one paragraph at a
+time, and each paragraph is reduced to a 64-bit digest of its
+normalised original-view text; finished subtrees are cleared as the
+parse moves on. The digest sequences are aligned with a patience diff
+(`_paradiff`). Only when something differs is a second pass made, and
+it keeps the text of just the paragraphs inside the differing regions
+(plus any `<w:del>` paragraph that needs a substring probe against the
+original). Memory is one paragraph of XML + 8 bytes per paragraph.
+Throughput is recorded in `ValidationReport.stats` / `last_stats`
+(`office.validate --compare-to ... --stats` prints it).
+
 Public API:
     RedliningValidator(schemas_dir=None, strict=False)
         .compare(original_path, edited_path) -> ValidationReport
@@ -43,14 +57,20 @@ Public API:
 
 from __future__ import annotations
 
-import difflib
+import hashlib
 import re
+import time
 import zipfile
-from dataclasses import dataclass
+from array import array
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from itertools import zip_longest
 from pathlib import Path
+from typing import IO
 
 from lxml import etree  # type: ignore
 
+from ._paradiff import Opcode, diff_opcodes
 from .base import BaseSchemaValidator, ValidationReport, _safe_parser
 
 
@@ -223,10 +243,181 @@ def _extract_from_docx(path: Path) -> list[ExtractedParagraph]:
     return paragraphs
 
 
+def _comparable_parts(z: zipfile.ZipFile, path: Path) -> list[str]:
+    """`_extract_from_docx`'s part order: document.xml, then the rest sorted."""
+    names = sorted(n for n in z.namelist() if _COMPARABLE_PARTS_RE.match(n))
+    if "word/document.xml" not in names:
+        raise ValueError(f"{path} is not a .docx (no word/document.xml)")
+    return ["word/document.xml"] + [n for n in names if n != "word/document.xml"]
+
+
+@dataclass
+class _TrackedTally:
+    """Author coverage over every `<w:ins>` / `<w:del>` of a package."""
+    missing_author: int = 0
+    authors: set[str] = field(default_factory=set)
+    broken_parts: list[str] = field(default_factory=list)
+
+    def see(self, el: etree._Element) -> None:
+        author = el.get(f"{_W}author")
+        if not author or not author.strip():
+            self.missing_author += 1
+        else:
+            self.authors.add(author)
+
+
+_P, _INS, _DEL, _T, _DEL_TEXT = (
+    f"{_W}p", f"{_W}ins", f"{_W}del", f"{_W}t", f"{_W}delText",
+)
+# Only these reach Python; `w:tbl` is listed so a finished table is cleared.
+_STREAM_TAGS = (_P, _INS, _DEL, _T, _DEL_TEXT, "{*}drawing", f"{_W}tbl")
+
+
+def _iter_part_paragraphs(
+    stream: IO[bytes], tally: _TrackedTally | None = None,
+) -> Iterator[ExtractedParagraph]:
+    """Streaming `_extract_from_xml`: the same paragraphs, in the same
+    (pre-)order, with ins/del/drawing nesting tracked as depth counters
+    instead of per-text ancestor walks. Paragraphs nested in a
+    non-drawing paragraph are buffered until the outer one closes;
+    everything else is cleared as soon as it ends."""
+    ins = dels = drawing = 0
+    open_paras: list[ExtractedParagraph] = []
+    group: list[ExtractedParagraph] = []
+    for event, el in etree.iterparse(
+        stream, events=("start", "end"), tag=_STREAM_TAGS,
+        resolve_entities=False, no_network=True, load_dtd=False,
+    ):
+        tag = el.tag
+        if event == "start":
+            if tag == _P:
+                if not drawing:
+                    para = ExtractedParagraph("", "", False, False, set())
+                    open_paras.append(para)
+                    group.append(para)
+            elif tag == _INS or tag == _DEL:
+                if tag == _INS:
+                    ins += 1
+                else:
+                    dels += 1
+                author = el.get(f"{_W}author")
+                for para in open_paras:
+                    if tag == _INS:
+                        para.has_insertions = True
+                    else:
+                        para.has_deletions = True
+                    if author:
+                        para.authors.add(author)
+                if tally is not None:
+                    tally.see(el)
+            elif isinstance(tag, str) and tag.endswith("}drawing"):
+                drawing += 1
+            continue
+
+        if tag == _T:
+            if not (ins and dels):  # inserted-then-deleted: in neither view
+                text = el.text or ""
+                for para in open_paras:
+                    if not ins:
+                        para.original += text
+                    if not dels:
+                        para.edited += text
+        elif tag == _DEL_TEXT:
+            text = el.text or ""
+            for para in open_paras:
+                para.original += text
+        elif tag == _P:
+            if not drawing:
+                open_paras.pop()
+                if not open_paras:
+                    yield from group
+                    group = []
+        elif tag == _INS:
+            ins -= 1
+        elif tag == _DEL:
+            dels -= 1
+        elif isinstance(tag, str) and tag.endswith("}drawing"):
+            drawing -= 1
+        if not open_paras:
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+
+
+def _iter_docx_paragraphs(
+    path: Path, tally: _TrackedTally | None = None,
+) -> Iterator[ExtractedParagraph]:
+    """Streaming `_extract_from_docx`. A part that stops being
+    well-formed contributes the paragraphs before the error and is
+    listed in `tally.broken_parts`."""
+    with zipfile.ZipFile(str(path)) as z:
+        for name in _comparable_parts(z, path):
+            with z.open(name) as stream:
+                try:
+                    yield from _iter_part_paragraphs(stream, tally)
+                except etree.XMLSyntaxError:
+                    if tally is not None:
+                        tally.broken_parts.append(name)
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=8).digest(),
+        "little",
+    )
+
+
+_EMPTY = _digest("")
+
+
+@dataclass
+class RedlineStats:
+    """Size and speed of one `compare`."""
+    original_paragraphs: int
+    edited_paragraphs: int
+    seconds: float
+
+    @property
+    def paragraphs_per_second(self) -> float:
+        total = self.original_paragraphs + self.edited_paragraphs
+        return total / self.seconds if self.seconds > 0 else float("inf")
+
+    def summary(self) -> str:
+        return (
+            f"redlining: {self.original_paragraphs} original + "
+            f"{self.edited_paragraphs} edited paragraph(s) in "
+            f"{self.seconds:.3f} s ({self.paragraphs_per_second:,.0f} paragraphs/s)"
+        )
+
+
+def _second_pass(
+    path: Path, wanted: set[int], probes: dict[int, str] | None = None,
+) -> tuple[dict[int, str], set[int]]:
+    """Stream `path` again; return the normalised original view of the
+    paragraphs in `wanted` (0-based), and the keys of `probes` whose
+    text is a substring of — or contains — some paragraph."""
+    texts: dict[int, str] = {}
+    matched: set[int] = set()
+    pending = dict(probes or {})
+    last = max(wanted, default=-1)
+    for idx, para in enumerate(_iter_docx_paragraphs(path)):
+        if idx > last and not pending:
+            break
+        text = para.as_original()
+        if idx in wanted:
+            texts[idx] = text
+        for key, probe in list(pending.items()):
+            if probe in text or text in probe:
+                matched.add(key)
+                del pending[key]
+    return texts, matched
+
+
 class RedliningValidator(BaseSchemaValidator):
     """Validates tracked-change coverage between two .docx files."""
 
     expected_parts = ("word/document.xml",)
+    last_stats: RedlineStats | None = None
 
     def compare(self, original_path: Path, edited_path: Path) -> ValidationReport:
         report = ValidationReport()
@@ -238,80 +429,113 @@ class RedliningValidator(BaseSchemaValidator):
             report.errors.append(f"Edited not found: {edited_path}")
             return report
 
+        started = time.perf_counter()
+        orig_hashes, edit_hashes = array("Q"), array("Q")
+        # Edited paragraphs with a <w:del> whose original view differs
+        # from the edited one: 1-based index → normalised original view.
+        del_probes: dict[int, str] = {}
+        tracked = False
+        tally = _TrackedTally()
         try:
-            orig_paragraphs = _extract_from_docx(original_path)
-            edit_paragraphs = _extract_from_docx(edited_path)
+            for po, pe in zip_longest(
+                _iter_docx_paragraphs(original_path),
+                _iter_docx_paragraphs(edited_path, tally),
+            ):
+                if po is not None:
+                    orig_hashes.append(_digest(po.as_original()))
+                if pe is not None:
+                    edit_hashes.append(_digest(pe.as_original()))
+                    tracked = tracked or pe.has_insertions or pe.has_deletions
+                    if pe.has_deletions and pe.original != pe.edited:
+                        deleted_only = _normalise(pe.original)
+                        if deleted_only:
+                            del_probes[len(edit_hashes)] = deleted_only
         except Exception as exc:
             report.errors.append(f"Parse failure: {exc}")
             return report
-
-        orig_text = "\n".join(p.as_original() for p in orig_paragraphs)
-        reconstructed = "\n".join(p.as_original() for p in edit_paragraphs)
-
-        if orig_text != reconstructed:
-            self._report_unmarked_differences(orig_text, reconstructed, report)
-
-        # False-positive deletion detection.
-        orig_bag = {p.as_original() for p in orig_paragraphs}
-        for i, p in enumerate(edit_paragraphs, start=1):
-            if not p.has_deletions:
-                continue
-            deleted_only = _normalise(
-                "".join(ch for ch in p.original if ch) if p.original != p.edited else ""
+        n_orig, n_edit = len(orig_hashes), len(edit_hashes)
+        orig_set = set(orig_hashes)
+
+        # "\n".join of zero paragraphs equals that of one empty paragraph.
+        if not orig_hashes:
+            orig_hashes.append(_EMPTY)
+        if not edit_hashes:
+            edit_hashes.append(_EMPTY)
+
+        opcodes: list[Opcode] = []
+        orig_wanted: set[int] = set()
+        edit_wanted: set[int] = set()
+        if orig_hashes != edit_hashes:
+            opcodes = diff_opcodes(orig_hashes, edit_hashes)
+            for tag, i1, i2, j1, j2 in opcodes:
+                if tag != "equal":
+                    orig_wanted.update(range(i1, i2))
+                    edit_wanted.update(range(j1, j2))
+
+        # False-positive deletion detection: a <w:del> paragraph whose
+        # original view is neither contained in nor contains any original
+        # paragraph. Exact matches (and the empty paragraph, which every
+        # string contains) are settled from the digests alone.
+        probes = {} if _EMPTY in orig_set else {
+            i: text for i, text in del_probes.items()
+            if _digest(text) not in orig_set
+        }
+
+        orig_texts: dict[int, str] = {}
+        edit_texts: dict[int, str] = {}
+        matched: set[int] = set()
+        if orig_wanted or probes:
+            orig_texts, matched = _second_pass(original_path, orig_wanted, probes)
+        if edit_wanted:
+            edit_texts, _ = _second_pass(edited_path, edit_wanted)
+        if opcodes:
+            self._report_unmarked_differences(
+                opcodes,
+                lambda i: orig_texts.get(i, ""),
+                lambda j: edit_texts.get(j, ""),
+                report,
             )
-            if not deleted_only:
-                continue
-            if not any(deleted_only in par or par in deleted_only for par in orig_bag):
+        for i, deleted_only in probes.items():
+            if i not in matched:
                 report.warnings.append(
                     f"Edited paragraph {i}: <w:del> content not present in original "
                     f"(possible false-positive mark): {deleted_only[:80]!r}"
                 )
 
         # Author coverage across the whole edited document — body, headers, footers.
-        missing_author = 0
-        all_authors: set[str] = set()
-        with zipfile.ZipFile(str(edited_path)) as z:
-            for name in z.namelist():
-                if not _COMPARABLE_PARTS_RE.match(name):
-                    continue
-                try:
-                    doc = etree.fromstring(z.read(name), _safe_parser())
-                except etree.XMLSyntaxError:
-                    continue
-                for el in doc.iter():
-                    if el.tag in (f"{_W}ins", f"{_W}del"):
-                        author = el.get(f"{_W}author")
-                        if not author or not author.strip():
-                            missing_author += 1
-                        else:
-                            all_authors.add(author)
-        if missing_author:
+        if tally.missing_author:
             report.warnings.append(
-                f"{missing_author} tracked-change element(s) have no w:author attribute"
+                f"{tally.missing_author} tracked-change element(s) have no w:author attribute"
             )
-        if not all_authors and any(p.has_insertions or p.has_deletions for p in edit_paragraphs):
+        if not tally.authors and tracked:
             report.warnings.append(
                 "Tracked changes are present but no distinct authors recorded"
             )
+        for name in tally.broken_parts:
+            report.warnings.append(
+                f"{edited_path.name}: {name} is not well-formed; "
+                "compared up to the parse error"
+            )
 
+        self.last_stats = RedlineStats(
+            n_orig, n_edit, time.perf_counter() - started,
+        )
+        report.stats.append(self.last_stats.summary())
         return report
 
     def _report_unmarked_differences(
         self,
-        orig_text: str,
-        reconstructed: str,
+        opcodes: list[Opcode],
+        orig_line: Callable[[int], str],
+        recon_line: Callable[[int], str],
         report: ValidationReport,
     ) -> None:
-        """Diff reconstructed-original against actual original. Every
-        non-equal chunk is an edit that happened without a
-        Track-Changes marker. Delete+insert pairs with identical
-        content are collapsed into a single 'unmarked move' finding.
+        """Report the paragraph diff of reconstructed-original against
+        actual original. Every non-equal chunk is an edit that happened
+        without a Track-Changes marker. Delete+insert pairs with
+        identical content are collapsed into a single 'unmarked move'
+        finding.
         """
-        orig_lines = orig_text.split("\n")
-        recon_lines = reconstructed.split("\n")
-
-        matcher = difflib.SequenceMatcher(a=orig_lines, b=recon_lines, autojunk=False)
-        opcodes = list(matcher.get_opcodes())
 
         # Collect deletions and insertions separately so we can pair
         # identical-content chunks as "move" before emitting errors.
@@ -322,8 +546,8 @@ class RedliningValidator(BaseSchemaValidator):
         for tag, i1, i2, j1, j2 in opcodes:
             if tag == "equal":
                 continue
-            orig_chunk = " | ".join(orig_lines[i1:i2])
-            edit_chunk = " | ".join(recon_lines[j1:j2])
+            orig_chunk = " | ".join(orig_line(i) for i in range(i1, i2))
+            edit_chunk = " | ".join(recon_line(j) for j in range(j1, j2))
             if tag == "delete":
                 deletions.append((i1, orig_chunk))
             elif tag == "insert":
@@ -6,8 +6,16 @@ print-ready decks and as the pre-step for `pptx_thumbnails.py`.
 
 Usage:
     python3 pptx_to_pdf.py INPUT.pptx [OUTPUT.pdf] [--timeout 180]
+    python3 pptx_to_pdf.py A.pptx B.pptx ... --outdir DIR [--jobs N]
 
 If OUTPUT.pdf is omitted, writes `<stem>.pdf` next to the input.
+
+With `--outdir`, every positional is an input and each deck is written
+to `DIR/<stem>.pdf`. The decks are converted on a `SofficePool` of
+`--jobs` warm LibreOffice instances (default 1), so the 2-5 s start-up
+is paid once per instance rather than once per deck. Two inputs with
+the same stem would write the same PDF and are refused up front (exit
+6). The produced paths are printed one per line, in input order.
 """
 
 from __future__ import annotations
@@ -18,45 +26,99 @@ import sys
 from pathlib import Path
 
 from _errors import add_json_errors_argument, report_error
-from _soffice import SofficeError, convert_to
+from _soffice import SofficeError, SofficePool, convert_to
 from office._encryption import EncryptedFileError, assert_not_encrypted
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
-    parser.add_argument("input", type=Path, help="Source .pptx file")
-    parser.add_argument("output", nargs="?", type=Path, default=None, help="Destination .pdf (optional)")
-    parser.add_argument("--timeout", type=int, default=180, help="soffice timeout in seconds (default 180)")
-    add_json_errors_argument(parser)
-    args = parser.parse_args(argv)
-    je = args.json_errors
-
-    if not args.input.is_file():
+def _check_input(path: Path, je: bool) -> int:
+    """0 when `path` is a readable, unencrypted file; else the reported
+    error's exit code."""
+    if not path.is_file():
         return report_error(
-            f"Input not found: {args.input}",
+            f"Input not found: {path}",
             code=1, error_type="FileNotFound",
-            details={"path": str(args.input)}, json_mode=je,
+            details={"path": str(path)}, json_mode=je,
         )
     try:
-        assert_not_encrypted(args.input)
+        assert_not_encrypted(path)
     except EncryptedFileError as exc:
         return report_error(
             str(exc), code=3, error_type="EncryptedFileError",
-            details={"path": str(args.input)}, json_mode=je,
+            details={"path": str(path)}, json_mode=je,
+        )
+    return 0
+
+
+def _convert_batch(inputs: list[Path], out_dir: Path, *, jobs: int,
+                   timeout: int, je: bool) -> int:
+    seen: dict[str, Path] = {}
+    for src in inputs:
+        other = seen.setdefault(src.stem, src)
+        if other is not src:
+            return report_error(
+                f"{other} and {src} would both write {out_dir / (src.stem + '.pdf')}",
+                code=6, error_type="SelfOverwriteRefused",
+                details={"inputs": [str(other), str(src)]}, json_mode=je,
+            )
+    out_dir = out_dir.resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with SofficePool(size=min(jobs, len(inputs))) as pool:
+            produced = pool.convert_many(inputs, out_dir, "pdf", timeout=timeout)
+    except SofficeError as exc:
+        return report_error(
+            str(exc), code=1, error_type="SofficeError", json_mode=je,
         )
+    for path in produced:
+        print(str(path))
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", type=Path, metavar="INPUT.pptx",
+                        help="Source .pptx file, optionally followed by the "
+                             "destination .pdf; with --outdir, one or more sources")
+    parser.add_argument("--outdir", type=Path, default=None,
+                        help="Convert every input to DIR/<stem>.pdf on a pool "
+                             "of warm LibreOffice instances")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="LibreOffice instances for --outdir (default 1)")
+    parser.add_argument("--timeout", type=int, default=180, help="soffice timeout in seconds (default 180)")
+    add_json_errors_argument(parser)
+    args = parser.parse_args(argv)
+    je = args.json_errors
+
+    if args.jobs < 1:
+        parser.error(f"--jobs must be a positive integer; got {args.jobs}")
+    if args.outdir is None and len(args.paths) > 2:
+        parser.error("several inputs need --outdir DIR")
+    if args.outdir is None and args.jobs != 1:
+        parser.error("--jobs needs --outdir DIR")
+
+    inputs = args.paths if args.outdir else args.paths[:1]
+    for src in inputs:
+        rc = _check_input(src, je)
+        if rc:
+            return rc
+    if args.outdir is not None:
+        return _convert_batch(inputs, args.outdir, jobs=args.jobs,
+                              timeout=args.timeout, je=je)
 
-    out_dir = (args.output.parent if args.output else args.input.parent).resolve()
+    src = inputs[0]
+    output = args.paths[1] if len(args.paths) == 2 else None
+    out_dir = (output.parent if output else src.parent).resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
     try:
-        produced = convert_to(args.input, out_dir, "pdf", timeout=args.timeout)
+        produced = convert_to(src, out_dir, "pdf", timeout=args.timeout)
     except SofficeError as exc:
         return report_error(
             str(exc), code=1, error_type="SofficeError", json_mode=je,
         )
 
-    if args.output and produced != args.output.resolve():
-        shutil.move(str(produced), str(args.output))
-        produced = args.output.resolve()
+    if output and produced != output.resolve():
+        shutil.move(str(produced), str(output))
+        produced = output.resolve()
 
     print(str(produced))
     return 0
@@ -84,9 +84,26 @@ if command -v soffice >/dev/null 2>&1; then
     head -c 5 "$TMP/out.pdf" | grep -q "%PDF" \
         && ok "PDF magic-bytes present" \
         || nok "PDF magic" "missing %PDF header"
+    cp "$TMP/out.pptx" "$TMP/second.pptx"
+    out=$("$PY" pptx_to_pdf.py "$TMP/out.pptx" "$TMP/second.pptx" \
+        --outdir "$TMP/batch" --jobs 2 2>/dev/null)
+    [ "$out" = "$(printf '%s\n%s' "$TMP/batch/out.pdf" "$TMP/batch/second.pdf")" ] \
+        && head -c 5 "$TMP/batch/out.pdf" | grep -q "%PDF" \
+        && head -c 5 "$TMP/batch/second.pdf" | grep -q "%PDF" \
+        && ok "--outdir --jobs 2 converts both decks on the pool" \
+        || nok "pptx_to_pdf --outdir" "got: $out"
 else
     echo "pptx_to_pdf: skipped (soffice not on PATH)"
 fi
+mkdir -p "$TMP/dup"; cp "$TMP/out.pptx" "$TMP/dup/out.pptx"
+set +e
+"$PY" pptx_to_pdf.py "$TMP/out.pptx" "$TMP/dup/out.pptx" --outdir "$TMP/dupout" \
+    >/dev/null 2>&1
+rc=$?
+set -e
+[ "$rc" = "6" ] && [ ! -e "$TMP/dupout" ] \
+    && ok "pptx_to_pdf --outdir refuses two decks with one stem (exit 6)" \
+    || nok "pptx_to_pdf duplicate stem" "exit=$rc"
 
 # --- pptx_clean -----------------------------------------------------------
 echo "pptx_clean:"
@@ -1,7 +1,9 @@
 """Thin wrapper around the LibreOffice `soffice` command.
 
 Used by `docx_accept_changes.py`, `xlsx_recalc.py`, `pptx_to_pdf.py`,
-`pptx_thumbnails.py`. Not a CLI — import as a module.
+`pptx_thumbnails.py`. Not a CLI — import as a module. Batch callers
+use `SofficePool` to keep N instances warm between jobs (`pptx_to_pdf.py
+--outdir`).
 
 Design goals:
 - Locate `soffice` via $PATH or common macOS/Linux install paths.
@@ -17,6 +19,8 @@ Design goals:
   can still start. Shim is no-op on AF_UNIX-capable machines (desktop
   macOS / Linux / most CI runners).
 - Raise a clear exception on timeout or non-zero exit.
+- `SofficePool`: pay the start-up cost once per long-lived instance
+  (pre-seeded profile, job queue, recycling) instead of once per call.
 """
 
 from __future__ import annotations
@@ -24,12 +28,15 @@ from __future__ import annotations
 import fcntl
 import os
 import platform
+import queue
 import shutil
 import socket
 import subprocess
 import sys
 import tempfile
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -184,6 +191,87 @@ def _apply_shim_env(env: dict[str, str]) -> bool:
     return False
 
 
+def _seed_profile(profile: str | Path, profile_seed: dict[str, str] | None) -> None:
+    """Write `profile_seed` files into the profile directory."""
+    if not profile_seed:
+        return
+    profile_root = Path(profile).resolve()
+    for rel_path, content in profile_seed.items():
+        target = (profile_root / rel_path).resolve()
+        if profile_root not in target.parents:
+            raise ValueError(
+                f"profile_seed path escapes the profile: {rel_path!r}"
+            )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+
+
+def _shim_forced() -> bool:
+    return os.environ.get("LO_SHIM_FORCE", "").strip() not in ("", "0", "false", "no")
+
+
+def _soffice_env(soffice: str) -> dict[str, str]:
+    """Environment for a soffice process (headless VCL + shim if needed)."""
+    env = os.environ.copy()
+    env.setdefault("SAL_USE_VCLPLUGIN", "svp")
+
+    # Force the shim when requested explicitly; otherwise only
+    # activate it when we detect AF_UNIX is blocked.
+    if _shim_forced() or not _af_unix_available():
+        applied = _apply_shim_env(env)
+        # Apple strips DYLD_INSERT_LIBRARIES at exec for hardened-
+        # runtime binaries. LibreOffice.app from The Document
+        # Foundation is signed with hardened runtime, so the shim
+        # silently no-ops. Warn when shim was requested but target
+        # is hardened — saves the user from a confusing session of
+        # wondering why their shim didn't apply.
+        if applied and _soffice_hardened_on_macos(soffice):
+            warnings.warn(
+                f"DYLD_INSERT_LIBRARIES will be stripped by macOS: {soffice} "
+                "has hardened runtime. The shim cannot attach. If you need "
+                "the shim here, use an unhardened LibreOffice build or re-sign "
+                "the binary with `codesign --remove-signature`.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+    return env
+
+
+def _soffice_cmd(soffice: str, profile: str | Path, args: list[str]) -> list[str]:
+    return [
+        soffice,
+        "--headless",
+        "--norestore",
+        "--nologo",
+        "--nodefault",
+        f"-env:UserInstallation={Path(profile).as_uri()}",
+        *args,
+    ]
+
+
+def _run_cmd(
+    cmd: list[str], *, env: dict[str, str], cwd: str | None, timeout: int,
+) -> subprocess.CompletedProcess:
+    try:
+        return subprocess.run(
+            cmd,
+            env=env,
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=True,
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise SofficeError(f"soffice timed out after {timeout}s: {' '.join(cmd)}") from exc
+    except subprocess.CalledProcessError as exc:
+        raise SofficeError(
+            f"soffice failed (exit {exc.returncode}):\n"
+            f"cmd: {' '.join(cmd)}\n"
+            f"stderr: {exc.stderr.strip()}"
+        ) from exc
+
+
 def run(
     args: list[str],
     *,
@@ -211,68 +299,21 @@ def run(
     """
     soffice = find_soffice()
     with tempfile.TemporaryDirectory(prefix="soffice-profile-") as profile:
-        if profile_seed:
-            profile_root = Path(profile).resolve()
-            for rel_path, content in profile_seed.items():
-                target = (profile_root / rel_path).resolve()
-                if profile_root not in target.parents:
-                    raise ValueError(
-                        f"profile_seed path escapes the profile: {rel_path!r}"
-                    )
-                target.parent.mkdir(parents=True, exist_ok=True)
-                target.write_text(content, encoding="utf-8")
-        env = os.environ.copy()
-        env.setdefault("SAL_USE_VCLPLUGIN", "svp")
-
-        # Force the shim when requested explicitly; otherwise only
-        # activate it when we detect AF_UNIX is blocked.
-        shim_forced = env.get("LO_SHIM_FORCE", "").strip() not in ("", "0", "false", "no")
-        if shim_forced or not _af_unix_available():
-            applied = _apply_shim_env(env)
-            # Apple strips DYLD_INSERT_LIBRARIES at exec for hardened-
-            # runtime binaries. LibreOffice.app from The Document
-            # Foundation is signed with hardened runtime, so the shim
-            # silently no-ops. Warn when shim was requested but target
-            # is hardened — saves the user from a confusing session of
-            # wondering why their shim didn't apply.
-            if applied and _soffice_hardened_on_macos(soffice):
-                warnings.warn(
-                    f"DYLD_INSERT_LIBRARIES will be stripped by macOS: {soffice} "
-                    "has hardened runtime. The shim cannot attach. If you need "
-                    "the shim here, use an unhardened LibreOffice build or re-sign "
-                    "the binary with `codesign --remove-signature`.",
-                    RuntimeWarning,
-                    stacklevel=2,
-                )
-
-        profile_url = Path(profile).as_uri()
-        cmd = [
-            soffice,
-            "--headless",
-            "--norestore",
-            "--nologo",
-            "--nodefault",
-            f"-env:UserInstallation={profile_url}",
-            *args,
-        ]
-        try:
-            return subprocess.run(
-                cmd,
-                env=env,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=True,
-            )
-        except subprocess.TimeoutExpired as exc:
-            raise SofficeError(f"soffice timed out after {timeout}s: {' '.join(cmd)}") from exc
-        except subprocess.CalledProcessError as exc:
-            raise SofficeError(
-                f"soffice failed (exit {exc.returncode}):\n"
-                f"cmd: {' '.join(cmd)}\n"
-                f"stderr: {exc.stderr.strip()}"
-            ) from exc
+        _seed_profile(profile, profile_seed)
+        env = _soffice_env(soffice)
+        cmd = _soffice_cmd(soffice, profile, args)
+        return _run_cmd(cmd, env=env, cwd=cwd, timeout=timeout)
+
+
+def _convert_args(src: Path, out_dir: Path, target_format: str) -> list[str]:
+    return ["--convert-to", target_format, "--outdir", str(out_dir), str(src)]
+
+
+def _produced(src: Path, out_dir: Path, target_format: str) -> Path:
+    produced = out_dir / f"{src.stem}.{target_format.split(':', 1)[0]}"
+    if not produced.is_file():
+        raise SofficeError(f"Expected output not found: {produced}")
+    return produced
 
 
 def convert_to(
@@ -293,20 +334,223 @@ def convert_to(
     out_dir = Path(out_dir).resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
     run(
-        [
-            "--convert-to",
-            target_format,
-            "--outdir",
-            str(out_dir),
-            str(src),
-        ],
+        _convert_args(src, out_dir, target_format),
         timeout=timeout,
         profile_seed=profile_seed,
     )
-    produced = out_dir / f"{src.stem}.{target_format.split(':', 1)[0]}"
-    if not produced.is_file():
-        raise SofficeError(f"Expected output not found: {produced}")
-    return produced
+    return _produced(src, out_dir, target_format)
+
+
+# --- Persistent instance pool ---
+
+def _wait_ready(proc: subprocess.Popen, profile: str, timeout: float) -> bool:
+    """Poll until soffice owns `profile` (start-up finished), it exits,
+    or `timeout` passes.
+
+    LibreOffice creates the profile's single-instance pipe in
+    `Desktop::Init` and only then, in `Desktop::Main`, writes
+    `<UserInstallation>/.lock`; once the lock file exists, a second
+    soffice on the profile is handed over instead of starting its own
+    instance. Nothing is opened for the probe: no TCP port, no UNO
+    bridge another local user could drive."""
+    lock = Path(profile) / ".lock"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            return False
+        if lock.is_file():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+class _Instance:
+    """One long-lived headless soffice with its own seeded profile.
+
+    Jobs are plain `soffice -env:UserInstallation=<same profile> <args>`
+    invocations: a second soffice on a profile that is already in use
+    hands its command line to the running instance over the profile's
+    single-instance IPC pipe, waits until it has been processed and
+    exits. The running instance does the work on its warm profile.
+    The instance listens on nothing else (no `--accept`).
+    """
+
+    def __init__(self, soffice: str, env: dict[str, str],
+                 profile_seed: dict[str, str] | None) -> None:
+        self.soffice = soffice
+        self.env = env
+        self.profile = tempfile.mkdtemp(prefix="soffice-pool-")
+        self.jobs = 0
+        try:
+            _seed_profile(self.profile, profile_seed)
+            self.proc = subprocess.Popen(
+                _soffice_cmd(soffice, self.profile, []),
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except BaseException:
+            # No process owns the profile yet, so stop() will never run.
+            shutil.rmtree(self.profile, ignore_errors=True)
+            raise
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def run(self, args: list[str], *, timeout: int,
+            cwd: str | None) -> subprocess.CompletedProcess:
+        self.jobs += 1
+        return _run_cmd(_soffice_cmd(self.soffice, self.profile, args),
+                        env=self.env, cwd=cwd, timeout=timeout)
+
+    def stop(self) -> None:
+        if self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        shutil.rmtree(self.profile, ignore_errors=True)
+
+
+class SofficePool:
+    """N long-lived headless soffice instances behind `run` / `convert_to`.
+
+    Start-up (2–5 s per `run()` call) is paid once per instance instead
+    of once per job. Each instance gets its own profile, seeded once
+    with `profile_seed` before it starts. Jobs queue for a free
+    instance, so the pool is safe to share between threads; see
+    `convert_many`. An instance is replaced after `max_jobs` jobs,
+    after a job that fails or times out, and when it has exited.
+
+    The hand-over to a running instance uses LibreOffice's
+    single-instance pipe (a real AF_UNIX socket). Where that is
+    unavailable — AF_UNIX blocked, or `LO_SHIM_FORCE` set — the pool
+    falls back to one `run()` per job with the same `profile_seed`.
+
+    Use as a context manager, or call `close()`::
+
+        with SofficePool(size=4) as pool:
+            pdfs = pool.convert_many(docs, out_dir, "pdf")
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        profile_seed: dict[str, str] | None = None,
+        max_jobs: int = 200,
+        start_timeout: int = 60,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self.size = size
+        self.profile_seed = dict(profile_seed) if profile_seed else None
+        self.max_jobs = max_jobs
+        self.start_timeout = start_timeout
+        self.pooled = not _shim_forced() and _af_unix_available()
+        self._idle: queue.Queue[_Instance | None] = queue.Queue()
+        self._closed = False
+        if not self.pooled:
+            return
+        self._soffice = find_soffice()
+        self._env = _soffice_env(self._soffice)
+        # Launch all instances first so they warm up concurrently.
+        started = [self._spawn() for _ in range(size)]
+        for inst in started:
+            self._idle.put(self._ready(inst))
+
+    def _spawn(self) -> _Instance:
+        return _Instance(self._soffice, self._env, self.profile_seed)
+
+    def _ready(self, inst: _Instance) -> _Instance | None:
+        if _wait_ready(inst.proc, inst.profile, self.start_timeout):
+            return inst
+        inst.stop()
+        return None  # restarted on next acquire
+
+    def _acquire(self) -> _Instance:
+        inst = self._idle.get()
+        if inst is not None and inst.alive():
+            return inst
+        if inst is not None:
+            inst.stop()
+        try:
+            inst = self._ready(self._spawn())
+        except BaseException:
+            self._idle.put(None)
+            raise
+        if inst is None:
+            self._idle.put(None)
+            raise SofficeError(
+                f"soffice pool instance did not start within {self.start_timeout}s"
+            )
+        return inst
+
+    def run(self, args: list[str], *, timeout: int = 120,
+            cwd: str | None = None) -> subprocess.CompletedProcess:
+        """`run()` on a pooled instance (same flags, same errors)."""
+        if self._closed:
+            raise SofficeError("soffice pool is closed")
+        if not self.pooled:
+            return run(args, timeout=timeout, cwd=cwd, profile_seed=self.profile_seed)
+        inst = self._acquire()
+        ok = False
+        try:
+            result = inst.run(args, timeout=timeout, cwd=cwd)
+            ok = True
+            return result
+        finally:
+            # A failed / timed-out job may have left the instance
+            # wedged or with a document open: recycle it.
+            if (not ok or self._closed or inst.jobs >= self.max_jobs
+                    or not inst.alive()):
+                inst.stop()
+                self._idle.put(None)
+            else:
+                self._idle.put(inst)
+
+    def convert_to(self, src: str | Path, out_dir: str | Path,
+                   target_format: str, *, timeout: int = 180) -> Path:
+        """`convert_to()` on a pooled instance."""
+        src = Path(src).resolve()
+        out_dir = Path(out_dir).resolve()
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self.run(_convert_args(src, out_dir, target_format), timeout=timeout)
+        return _produced(src, out_dir, target_format)
+
+    def convert_many(self, srcs: list[str | Path], out_dir: str | Path,
+                     target_format: str, *, timeout: int = 180) -> list[Path]:
+        """Convert every file in `srcs`, `size` at a time; results in
+        input order. Raises the first failure after the rest finished."""
+        with ThreadPoolExecutor(max_workers=self.size) as ex:
+            futures = [
+                ex.submit(self.convert_to, src, out_dir, target_format, timeout=timeout)
+                for src in srcs
+            ]
+        return [f.result() for f in futures]
+
+    def close(self) -> None:
+        """Stop every instance and remove its profile."""
+        if self._closed:
+            return
+        self._closed = True
+        while True:
+            try:
+                inst = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if inst is not None:
+                inst.stop()
+
+    def __enter__(self) -> SofficePool:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
 
 if __name__ == "__main__":
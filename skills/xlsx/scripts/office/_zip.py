@@ -0,0 +1,175 @@
+"""Raw ZIP member copy — move a member between archives without
+inflating and re-deflating it.
+
+`zipfile` only exposes decompressed reads (`ZipFile.read`) and
+compressing writes (`ZipFile.writestr`). For an OOXML package where
+most parts are untouched by an edit (media, styles, theme, fonts…)
+that round-trip is pure overhead: `copy_raw` seeks to the member's
+local header in the source, takes the stored compressed bytes as-is
+and writes them under a fresh local header in the destination. CRC,
+sizes and compression method carry over, so the copied member is
+bit-identical to the source member.
+
+Falls back to a plain `read` + `writestr` when the member cannot be
+copied verbatim (encrypted, unusual compression method) or when the
+running `zipfile` lacks the private attributes the fast path relies
+on.
+
+`write_member` is the matching write side for new / edited bytes:
+members whose payload is already compressed (PNG, JPEG, GIF, EMZ…)
+go in as `ZIP_STORED` — deflating them again burns CPU for a ~0%
+gain — everything else is deflated. `PackStats` counts both sides so
+`pack` and `Package.save` can report bytes copied vs recompressed.
+
+Replication: this file lives under `office/` and is therefore covered
+by the existing docx → xlsx + pptx replication protocol (CLAUDE.md §2).
+docx is the master copy.
+"""
+from __future__ import annotations
+
+import struct
+import zipfile
+import zlib
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+
+__all__ = [
+    "FIXED_DATE_TIME", "STORED_SUFFIXES", "PackStats", "copy_raw", "is_unchanged",
+    "transfer", "write_member",
+]
+
+# Payloads that are compressed already. EMF / WMF / BMP / TIFF are raw
+# and still deflate well, so they are not listed; their compressed
+# wrappers (.emz / .wmz) are.
+STORED_SUFFIXES = frozenset({
+    ".png", ".jpg", ".jpeg", ".jpe", ".gif", ".wdp", ".emz", ".wmz",
+    ".mp3", ".m4a", ".mp4", ".m4v", ".zip",
+})
+
+# ZIP's epoch; Word writes every member with this timestamp.
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_MAGIC = b"PK\x03\x04"
+_RAW_METHODS = frozenset({zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED})
+
+
+def _read_compressed(zin: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    fp = zin.fp
+    fp.seek(info.header_offset)
+    header = fp.read(_LOCAL_HEADER.size)
+    fields = _LOCAL_HEADER.unpack(header)
+    if fields[0] != _LOCAL_MAGIC:
+        raise zipfile.BadZipFile(f"bad local header for {info.filename!r}")
+    name_len, extra_len = fields[-2], fields[-1]
+    fp.seek(info.header_offset + _LOCAL_HEADER.size + name_len + extra_len)
+    data = fp.read(info.compress_size)
+    if len(data) != info.compress_size:
+        raise zipfile.BadZipFile(f"truncated member {info.filename!r}")
+    return data
+
+
+def copy_raw(
+    zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo,
+) -> bool:
+    """Copy member `info` of `zin` into `zout` without recompression.
+
+    Returns True when the compressed bytes were copied verbatim, False
+    when the member had to be decompressed and re-deflated instead.
+    Both archives must be idle (no open member handles).
+    """
+    if info.flag_bits & 0x1 or info.compress_type not in _RAW_METHODS:
+        zout.writestr(info, zin.read(info))
+        return False
+    try:
+        with zin._lock:  # shared fp; private API — see module doc
+            data = _read_compressed(zin, info)
+        out = zipfile.ZipInfo(info.filename, info.date_time)
+        out.compress_type = info.compress_type
+        out.CRC = info.CRC
+        out.compress_size = info.compress_size
+        out.file_size = info.file_size
+        out.external_attr = info.external_attr
+        out.internal_attr = info.internal_attr
+        out.create_system = info.create_system
+        # Keep the UTF-8 name flag; drop the data-descriptor bit — sizes
+        # and CRC go straight into the local header here.
+        out.flag_bits = info.flag_bits & 0x800
+        with zout._lock:
+            zout._writecheck(out)
+            zout._didModify = True
+            zout.fp.seek(zout.start_dir)
+            out.header_offset = zout.fp.tell()
+            zout.fp.write(out.FileHeader())
+            zout.fp.write(data)
+            zout.start_dir = zout.fp.tell()
+            zout.filelist.append(out)
+            zout.NameToInfo[out.filename] = out
+    except AttributeError:
+        zout.writestr(info, zin.read(info))
+        return False
+    return True
+
+
+def is_unchanged(zin: zipfile.ZipFile, info: zipfile.ZipInfo, data: bytes) -> bool:
+    """Whether `data` is byte-identical to member `info` of `zin`.
+
+    Size + CRC-32 reject almost every edited member without inflating
+    anything; a match is confirmed against the real bytes.
+    """
+    if info.file_size != len(data) or info.CRC != zlib.crc32(data):
+        return False
+    return zin.read(info) == data
+
+
+@dataclass
+class PackStats:
+    """Members / uncompressed bytes per write path of one archive."""
+
+    copied: int = 0
+    bytes_copied: int = 0
+    recompressed: int = 0
+    bytes_recompressed: int = 0
+    stored: int = 0
+    bytes_stored: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.copied} member(s) copied raw ({self.bytes_copied} bytes), "
+            f"{self.recompressed} recompressed ({self.bytes_recompressed} bytes), "
+            f"{self.stored} stored ({self.bytes_stored} bytes)"
+        )
+
+
+def write_member(
+    zout: zipfile.ZipFile, name: str, data: bytes, stats: PackStats,
+) -> None:
+    """Write new bytes: `ZIP_STORED` for pre-compressed media, else the
+    archive's default (deflate).
+
+    Members are stamped `FIXED_DATE_TIME` (as Word does) rather than
+    the wall clock, so the same parts always pack to the same bytes."""
+    info = zipfile.ZipInfo(name, FIXED_DATE_TIME)
+    info.external_attr = 0o600 << 16  # what writestr(str, ...) sets
+    if PurePosixPath(name).suffix.lower() in STORED_SUFFIXES:
+        zout.writestr(info, data, compress_type=zipfile.ZIP_STORED)
+        stats.stored += 1
+        stats.bytes_stored += len(data)
+    else:
+        zout.writestr(info, data, compress_type=zout.compression,
+                      compresslevel=zout.compresslevel)
+        stats.recompressed += 1
+        stats.bytes_recompressed += len(data)
+
+
+def transfer(
+    zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo,
+    stats: PackStats,
+) -> None:
+    """`copy_raw` with bookkeeping."""
+    if copy_raw(zin, zout, info):
+        stats.copied += 1
+        stats.bytes_copied += info.file_size
+    else:
+        stats.recompressed += 1
+        stats.bytes_recompressed += info.file_size
@@ -0,0 +1,362 @@
+"""In-memory OOXML package: open, edit parts, save — no unpacked tree.
+
+`unpack.py` → edit → `pack.py` extracts every member to disk, pretty-
+prints every XML part, then re-reads, condenses and re-deflates all of
+them, even when an edit touches one paragraph of `document.xml`.
+`Package` keeps the source ZIP open instead:
+
+* parts are parsed lazily, on first `xml(name)`, with the hardened
+  parser (no entities, no network, no DTD);
+* only parts the caller marks dirty (or adds / replaces) are
+  re-serialised on `save()`;
+* every other member is copied straight from the source archive as
+  compressed bytes (`_zip.copy_raw`) — no inflate, no re-deflate, and
+  the output member is bit-identical to the input one.
+
+`Package.open()` also accepts an unpacked directory tree. `save()`
+with no destination then writes the dirty parts back in place, which
+lets tree-based callers (`--unpacked-dir` library modes) share the
+same editing code as the zip path.
+
+For code that still needs a real tree (the docx asset relocator, the
+xlsx comment editor's part scanners), `extract(dir)` materialises the
+current parts as-is (no pretty-print) and `sync_from(dir)` folds the
+edited tree back in — only members whose bytes changed are marked
+dirty, so the raw passthrough still covers everything else.
+
+With `apply_docx_helpers=True` and a `.docx` source, the main document
+part gets the same `merge_runs` + `simplify_redlines` canonicalisation
+`unpack.py` applies, on first access.
+
+Usage:
+    from office.package import Package
+
+    with Package.open("in.docx", apply_docx_helpers=True) as pkg:
+        root = pkg.xml("word/document.xml")
+        ...  # mutate root
+        pkg.mark_dirty("word/document.xml")
+        pkg.save("out.docx")
+
+Replication: this file lives under `office/` and is therefore covered
+by the existing docx → xlsx + pptx replication protocol (CLAUDE.md §2).
+docx is the master copy.
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import uuid
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+from lxml import etree  # type: ignore
+
+from ._zip import PackStats, transfer, write_member
+from .helpers.merge_runs import merge_runs_in_tree
+from .helpers.simplify_redlines import simplify_redlines_in_tree
+
+__all__ = ["Package", "edit_in_place"]
+
+CONTENT_TYPES = "[Content_Types].xml"
+
+# Hardened XML parser — mirrors office/validators/base.py; defangs XXE /
+# external-entity expansion + DTD-based attacks (CWE-611).
+_SAFE_PARSER = etree.XMLParser(
+    resolve_entities=False, no_network=True, load_dtd=False,
+)
+
+
+def _norm(name: str) -> str:
+    """Part name → member name: `/word/document.xml` → `word/document.xml`."""
+    return name.lstrip("/")
+
+
+def _serialise(root: etree._Element) -> bytes:
+    return etree.tostring(
+        root.getroottree(), xml_declaration=True,
+        encoding="UTF-8", standalone=True,
+    )
+
+
+class Package:
+    """One OOXML package (ZIP file or unpacked directory), edited in memory."""
+
+    def __init__(self, source: Path, *, apply_docx_helpers: bool = False) -> None:
+        self.source = Path(source)
+        self.is_dir = self.source.is_dir()
+        self._zip: zipfile.ZipFile | None = None
+        self._members: dict[str, zipfile.ZipInfo] = {}
+        if self.is_dir:
+            self._order = self._walk_tree(self.source)
+        else:
+            if not zipfile.is_zipfile(str(self.source)):
+                raise ValueError(f"Not a ZIP-based OOXML container: {self.source}")
+            self._zip = zipfile.ZipFile(str(self.source))
+            for info in self._zip.infolist():
+                if not info.is_dir():
+                    self._members.setdefault(info.filename, info)
+            self._order = list(self._members)
+        self._docx_helpers = (
+            apply_docx_helpers and self.source.suffix.lower() == ".docx"
+        )
+        self._trees: dict[str, etree._Element] = {}
+        self._data: dict[str, bytes] = {}  # replaced / added raw parts
+        self._dirty: set[str] = set()
+        self._added: list[str] = []
+        self._deleted: set[str] = set()
+
+    @classmethod
+    def open(cls, path: "Path | str", *, apply_docx_helpers: bool = False) -> "Package":
+        """Open a .docx/.xlsx/.pptx (or macro variant) or an unpacked tree."""
+        return cls(Path(path), apply_docx_helpers=apply_docx_helpers)
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __enter__(self) -> "Package":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- reading -----------------------------------------------------------
+
+    @staticmethod
+    def _walk_tree(root: Path) -> list[str]:
+        names = sorted(
+            p.relative_to(root).as_posix()
+            for p in root.rglob("*") if p.is_file()
+        )
+        if CONTENT_TYPES in names:
+            names.remove(CONTENT_TYPES)
+            names.insert(0, CONTENT_TYPES)
+        return names
+
+    def names(self) -> list[str]:
+        """Current member names: source order, then added parts."""
+        return [n for n in self._order + self._added if n not in self._deleted]
+
+    def __contains__(self, name: str) -> bool:
+        name = _norm(name)
+        if name in self._deleted:
+            return False
+        return name in self._data or name in self._trees or self._exists(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names())
+
+    def _exists(self, name: str) -> bool:
+        if self.is_dir:
+            return (self.source / name).is_file()
+        return name in self._members
+
+    def _source_bytes(self, name: str) -> bytes:
+        if self.is_dir:
+            return (self.source / name).read_bytes()
+        if self._zip is None:
+            raise ValueError(f"Package is closed: {self.source}")
+        return self._zip.read(self._members[name])
+
+    def read(self, name: str) -> bytes:
+        """Current bytes of a part (re-serialised if it was edited)."""
+        name = _norm(name)
+        if name in self._deleted:
+            raise KeyError(name)
+        if name not in self._trees and self._needs_helpers(name):
+            try:
+                self.xml(name)
+            except etree.XMLSyntaxError:
+                pass  # served raw, as `unpack.py` leaves it
+        if name in self._trees and name in self._dirty:
+            return _serialise(self._trees[name])
+        return self._raw(name)
+
+    def _raw(self, name: str) -> bytes:
+        if name in self._data:
+            return self._data[name]
+        try:
+            return self._source_bytes(name)
+        except (KeyError, FileNotFoundError):
+            raise KeyError(name) from None
+
+    def xml(self, name: str) -> etree._Element:
+        """Root element of an XML part, parsed on first access and cached.
+
+        Mutations are NOT tracked — call `mark_dirty(name)` afterwards.
+        """
+        name = _norm(name)
+        root = self._trees.get(name)
+        if root is not None:
+            return root
+        if name in self._deleted:
+            raise KeyError(name)
+        root = etree.fromstring(self._raw(name), _SAFE_PARSER)
+        self._trees[name] = root
+        self._data.pop(name, None)
+        if (self._needs_helpers(name) and root.tag.endswith("}document")
+                and merge_runs_in_tree(root) + simplify_redlines_in_tree(root)):
+            self._dirty.add(name)
+        return root
+
+    def _needs_helpers(self, name: str) -> bool:
+        return self._docx_helpers and name.rsplit("/", 1)[-1] == "document.xml"
+
+    # -- editing -----------------------------------------------------------
+
+    def mark_dirty(self, name: str) -> None:
+        """Re-serialise the parsed part `name` on save."""
+        name = _norm(name)
+        if name not in self._trees:
+            raise KeyError(f"{name} has not been parsed via xml()")
+        self._dirty.add(name)
+
+    def set_xml(self, name: str, root: etree._Element) -> None:
+        """Add or replace an XML part with `root`."""
+        name = _norm(name)
+        self._note_new(name)
+        self._data.pop(name, None)
+        self._trees[name] = root
+        self._dirty.add(name)
+
+    def write(self, name: str, data: bytes) -> None:
+        """Add or replace a part with raw bytes."""
+        name = _norm(name)
+        self._note_new(name)
+        self._trees.pop(name, None)
+        self._data[name] = bytes(data)
+        self._dirty.add(name)
+
+    def delete(self, name: str) -> None:
+        name = _norm(name)
+        self._trees.pop(name, None)
+        self._data.pop(name, None)
+        self._dirty.discard(name)
+        if name in self._added:
+            self._added.remove(name)
+        else:
+            self._deleted.add(name)
+
+    def _note_new(self, name: str) -> None:
+        self._deleted.discard(name)
+        if name not in self._order and name not in self._added:
+            self._added.append(name)
+
+    def is_modified(self, name: str | None = None) -> bool:
+        """Whether `name` (or, with no argument, anything) will be rewritten."""
+        if name is None:
+            return bool(self._dirty or self._deleted)
+        name = _norm(name)
+        return name in self._dirty or name in self._deleted
+
+    # -- tree bridge -------------------------------------------------------
+
+    def extract(self, dest: Path) -> Path:
+        """Write every current part under `dest` as-is; return `dest`."""
+        dest = Path(dest)
+        for name in self.names():
+            target = dest / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(self.read(name))
+        return dest
+
+    def sync_from(self, tree: Path) -> None:
+        """Fold an edited `extract()` tree back in: changed and new
+        files replace parts, missing files delete them."""
+        tree = Path(tree)
+        on_disk = self._walk_tree(tree)
+        present = set(on_disk)
+        for name in self.names():
+            if name not in present:
+                self.delete(name)
+        for name in on_disk:
+            data = (tree / name).read_bytes()
+            if name in self and self.read(name) == data:
+                continue
+            self.write(name, data)
+
+    # -- saving ------------------------------------------------------------
+
+    def save(self, dest: "Path | str | None" = None) -> PackStats:
+        """Write the package.
+
+        `dest=None` is only valid for a directory-backed package: dirty
+        parts are written back in place and deleted parts removed.
+        Otherwise `dest` is a new ZIP — `[Content_Types].xml` first,
+        then the source member order, then added parts; unchanged
+        members are copied raw from the source archive, new bytes go
+        through `_zip.write_member` (stored for pre-compressed media).
+        The ZIP is written to a sibling `.partial` and renamed over
+        `dest` once complete, so a failed save leaves `dest` untouched
+        and `dest` may be the package's own source: its members are
+        still read from the original file while the new one is built.
+
+        Returns the `PackStats` of the write (all zero in place).
+        """
+        if dest is None:
+            if not self.is_dir:
+                raise ValueError("save() needs a destination for a ZIP-backed package")
+            return self._save_tree()
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        names = self.names()
+        if CONTENT_TYPES in names:
+            names.remove(CONTENT_TYPES)
+            names.insert(0, CONTENT_TYPES)
+        stats = PackStats()
+        # Unique per save: record renderers write many outputs into one
+        # directory concurrently.
+        tmp = dest.with_name(f"{dest.name}.{uuid.uuid4().hex[:8]}.partial")
+        try:
+            with zipfile.ZipFile(
+                str(tmp), "w", zipfile.ZIP_DEFLATED, compresslevel=6,
+            ) as out:
+                for name in names:
+                    info = self._members.get(name)
+                    if info is not None and name not in self._dirty:
+                        if self._zip is None:
+                            raise ValueError(f"Package is closed: {self.source}")
+                        transfer(self._zip, out, info, stats)
+                        continue
+                    write_member(out, name, self.read(name), stats)
+            os.replace(tmp, dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return stats
+
+    def _save_tree(self) -> PackStats:
+        for name in self.names():
+            if name in self._dirty:
+                target = self.source / name
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(self.read(name))
+        for name in self._deleted:
+            (self.source / name).unlink(missing_ok=True)
+        self._order = self._walk_tree(self.source)
+        self._added.clear()
+        self._deleted.clear()
+        self._data.clear()
+        self._dirty.clear()
+        return PackStats()  # nothing compressed in place
+
+
+@contextlib.contextmanager
+def edit_in_place(target: "Path | Package") -> Iterator[Package]:
+    """Accept an unpacked tree or an open Package.
+
+    A tree Path is wrapped in a directory-backed Package whose edited
+    parts are written back in place when the block completes without
+    an exception; a Package passes through untouched — its owner
+    decides when (and where) to `save()`.
+    """
+    if isinstance(target, Package):
+        yield target
+        return
+    pkg = Package.open(target)
+    yield pkg
+    pkg.save()
@@ -25,7 +25,10 @@ HERE = Path(__file__).resolve().parent
 SCRIPTS = HERE.parent.parent  # skills/docx/scripts
 sys.path.insert(0, str(SCRIPTS))
 
-from office.validators.redlining import RedliningValidator  # noqa: E402
+from office.validators._paradiff import diff_opcodes  # noqa: E402
+from office.validators.redlining import (  # noqa: E402
+    RedliningValidator, _extract_from_docx, _iter_docx_paragraphs,
+)
 
 
 CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
@@ -248,5 +251,75 @@ class TestRedlining(unittest.TestCase):
         )
 
 
+class TestStreamingCompare(unittest.TestCase):
+    """The streaming comparator (`_iter_docx_paragraphs` + patience diff)."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        import tempfile
+        cls.tmp = Path(tempfile.mkdtemp(prefix="redline-stream-"))
+
+    def test_streaming_extraction_matches_tree_extraction(self) -> None:
+        body = (
+            _p(_r("Plain "), _ins("added"), _del("removed"))
+            + "<w:tbl><w:tr><w:tc>" + _p(_r("cell")) + _p() + "</w:tc></w:tr></w:tbl>"
+            + _p(
+                "<w:ins w:id=\"5\"><w:del w:id=\"6\" w:author=\"B\">"
+                "<w:r><w:t>both</w:t></w:r></w:del></w:ins>",
+                "<w:r><w:drawing><wp:inline xmlns:wp=\"http://schemas.openxmlformats."
+                "org/drawingml/2006/wordprocessingDrawing\"><wp:txbxContent>"
+                + _p(_r("box")) + "</wp:txbxContent></wp:inline></w:drawing></w:r>",
+                "<w:r><w:pict><w:txbxContent>" + _p(_r("vml")) + "</w:txbxContent></w:pict></w:r>",
+            )
+        )
+        path = _build_docx(self.tmp / "x.docx", body)
+        as_tuples = lambda ps: [  # noqa: E731
+            (p.original, p.edited, p.has_insertions, p.has_deletions, p.authors)
+            for p in ps
+        ]
+        self.assertEqual(as_tuples(_iter_docx_paragraphs(path)),
+                         as_tuples(_extract_from_docx(path)))
+
+    def test_patience_opcodes_rebuild_target(self) -> None:
+        a = [1, 2, 3, 0, 0, 4, 5, 0, 6]
+        b = [1, 3, 0, 7, 0, 5, 4, 0, 6, 8]
+        rebuilt: list[int] = []
+        for tag, i1, i2, j1, j2 in diff_opcodes(a, b):
+            if tag == "equal":
+                self.assertEqual(a[i1:i2], b[j1:j2])
+            rebuilt.extend(b[j1:j2])
+        self.assertEqual(rebuilt, b)
+
+    def test_stats_and_unmarked_edit_far_into_document(self) -> None:
+        paras = [_p(_r(f"Clause {i}.")) for i in range(400)]
+        orig = _build_docx(self.tmp / "s-orig.docx", "".join(paras))
+        paras[300] = _p(_r("Clause 300 (quietly changed)."))
+        edit = _build_docx(self.tmp / "s-edit.docx", "".join(paras))
+        validator = RedliningValidator()
+        rep = validator.compare(orig, edit)
+        self.assertEqual(rep.errors, [
+            "Unmarked rewrite around paragraph 301: original='Clause 300.' "
+            "vs edited='Clause 300 (quietly changed).'"
+        ])
+        stats = validator.last_stats
+        self.assertEqual((stats.original_paragraphs, stats.edited_paragraphs),
+                         (400, 400))
+        self.assertGreater(stats.paragraphs_per_second, 0)
+        self.assertEqual(rep.stats, [stats.summary()])
+        self.assertIn("paragraphs/s", rep.stats[0])
+
+    def test_broken_part_reported(self) -> None:
+        orig = _build_docx(self.tmp / "b-orig.docx", _p(_r("Hello.")))
+        edit = self.tmp / "b-edit.docx"
+        with zipfile.ZipFile(orig) as src, zipfile.ZipFile(edit, "w") as dst:
+            for name in src.namelist():
+                dst.writestr(name, src.read(name))
+            dst.writestr("word/header1.xml", "<w:hdr xmlns:w='x'><w:p>")
+        rep = RedliningValidator().compare(orig, edit)
+        self.assertTrue(rep.ok, rep.errors)
+        self.assertTrue(any("word/header1.xml is not well-formed" in w
+                            for w in rep.warnings), rep.warnings)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,275 @@
+"""Tests for `_soffice.SofficePool`.
+
+The pool keeps N headless soffice instances running, each on its own
+seeded profile, and runs every job as a second soffice invocation on
+the same profile (LibreOffice hands it to the running instance over
+the single-instance pipe). `TestSofficePool` replaces
+`subprocess.Popen` with a fake instance and `subprocess.run` with a
+recorder, and checks the bookkeeping: profile seeding, job routing,
+recycling, fallback. `TestSofficePoolLive` drives a real LibreOffice
+and is skipped when `soffice` is not installed.
+
+Run:
+    cd skills/docx/scripts
+    ./.venv/bin/python -m unittest office.tests.test_soffice_pool
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+HERE = Path(__file__).resolve().parent
+SCRIPTS = HERE.parent.parent  # skills/<skill>/scripts
+sys.path.insert(0, str(SCRIPTS))
+
+import _soffice  # noqa: E402
+
+
+def _profile_of(cmd: list[str]) -> Path:
+    arg = next(a for a in cmd if a.startswith("-env:UserInstallation="))
+    return Path(url2pathname(urlparse(arg.split("=", 1)[1]).path))
+
+
+class _FakeInstance:
+    """Stands in for a long-lived headless soffice process."""
+
+    def __init__(self, cmd: list[str], **_kw) -> None:
+        self.cmd = cmd
+        self.profile = _profile_of(cmd)
+        self.seeded = {
+            str(p.relative_to(self.profile)): p.read_text(encoding="utf-8")
+            for p in self.profile.rglob("*") if p.is_file()
+        }
+        self.returncode: int | None = None
+        self.terminated = False
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.terminated = True
+        self.returncode = -15
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+    def wait(self, timeout: float | None = None) -> int:
+        return self.returncode if self.returncode is not None else 0
+
+
+class TestSofficePool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.spawned: list[_FakeInstance] = []
+        self.jobs: list[list[str]] = []
+        self.fail_next = False
+        self.lock = threading.Lock()
+
+        def fake_popen(cmd, **kw):
+            inst = _FakeInstance(cmd, **kw)
+            self.spawned.append(inst)
+            return inst
+
+        def fake_run(cmd, **_kw):
+            if not any(a.startswith("-env:UserInstallation=") for a in cmd):
+                return subprocess.CompletedProcess(cmd, 0, "", "")
+            with self.lock:
+                self.jobs.append(cmd)
+                fail, self.fail_next = self.fail_next, False
+            if fail:
+                raise subprocess.CalledProcessError(1, cmd, "", "boom")
+            if "--convert-to" in cmd:
+                out_dir = Path(cmd[cmd.index("--outdir") + 1])
+                src = Path(cmd[-1])
+                (out_dir / f"{src.stem}.pdf").write_text("%PDF")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        patches = [
+            mock.patch.object(_soffice, "find_soffice", return_value="/fake/soffice"),
+            mock.patch.object(_soffice, "_af_unix_available", return_value=True),
+            mock.patch.object(_soffice, "_wait_ready", return_value=True),
+            mock.patch.object(_soffice.subprocess, "Popen", side_effect=fake_popen),
+            mock.patch.object(_soffice.subprocess, "run", side_effect=fake_run),
+            mock.patch.dict(_soffice.os.environ, {"LO_SHIM_FORCE": ""}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_instances_start_once_with_seeded_profiles(self) -> None:
+        seed = {"user/registrymodifications.xcu": "<seed/>"}
+        with _soffice.SofficePool(size=2, profile_seed=seed) as pool:
+            for _ in range(6):
+                pool.run(["--version"])
+        self.assertEqual(len(self.spawned), 2)
+        for inst in self.spawned:
+            self.assertEqual(inst.seeded, seed)
+            # No UNO acceptor: the pipe hand-over is the only channel.
+            self.assertFalse(any(a.startswith("--accept") for a in inst.cmd))
+            self.assertTrue(inst.terminated)
+            self.assertFalse(inst.profile.exists())
+        # Every job runs against one of the live instances' profiles.
+        profiles = {inst.profile for inst in self.spawned}
+        self.assertEqual(len(self.jobs), 6)
+        for cmd in self.jobs:
+            self.assertIn(_profile_of(cmd), profiles)
+            self.assertEqual(
+                sum(a.startswith("-env:UserInstallation=") for a in cmd), 1,
+            )
+
+    def test_recycles_after_max_jobs(self) -> None:
+        with _soffice.SofficePool(size=1, max_jobs=2) as pool:
+            for _ in range(5):
+                pool.run(["--version"])
+        self.assertEqual(len(self.spawned), 3)
+        self.assertEqual([_profile_of(c) for c in self.jobs[:2]],
+                         [self.spawned[0].profile] * 2)
+
+    def test_replaces_dead_and_failed_instances(self) -> None:
+        with _soffice.SofficePool(size=1) as pool:
+            pool.run(["--version"])
+            self.spawned[0].returncode = 1  # crashed between jobs
+            pool.run(["--version"])
+            self.assertEqual(len(self.spawned), 2)
+            self.fail_next = True
+            with self.assertRaises(_soffice.SofficeError):
+                pool.run(["--version"])
+            self.assertTrue(self.spawned[1].terminated)
+            pool.run(["--version"])
+            self.assertEqual(len(self.spawned), 3)
+
+    def test_convert_many_keeps_input_order(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            srcs = [Path(td) / f"doc{i}.docx" for i in range(7)]
+            for src in srcs:
+                src.write_text("x")
+            with _soffice.SofficePool(size=3) as pool:
+                produced = pool.convert_many(srcs, Path(td) / "out", "pdf")
+            self.assertEqual([p.name for p in produced],
+                             [f"doc{i}.pdf" for i in range(7)])
+        self.assertLessEqual(len(self.spawned), 3)
+
+    def test_falls_back_to_one_shot_without_af_unix(self) -> None:
+        seed = {"user/basic/Standard/Module1.xba": "<module/>"}
+        with mock.patch.object(_soffice, "_af_unix_available", return_value=False), \
+             mock.patch.object(_soffice, "_apply_shim_env", return_value=False), \
+             _soffice.SofficePool(size=2, profile_seed=seed) as pool:
+            self.assertFalse(pool.pooled)
+            with mock.patch.object(_soffice, "run") as one_shot:
+                pool.run(["--version"], timeout=5)
+        self.assertEqual(self.spawned, [])
+        one_shot.assert_called_once_with(
+            ["--version"], timeout=5, cwd=None, profile_seed=seed,
+        )
+
+    def test_failed_start_removes_profile(self) -> None:
+        made: list[str] = []
+        real_mkdtemp = tempfile.mkdtemp
+
+        def mkdtemp(**kw):
+            made.append(real_mkdtemp(**kw))
+            return made[-1]
+
+        with mock.patch.object(_soffice.tempfile, "mkdtemp", side_effect=mkdtemp):
+            with mock.patch.object(_soffice.subprocess, "Popen",
+                                   side_effect=OSError("exec failed")):
+                with self.assertRaises(OSError):
+                    _soffice.SofficePool(size=1)
+            with self.assertRaises(ValueError):
+                _soffice.SofficePool(size=1, profile_seed={"../escape": "x"})
+        self.assertEqual(len(made), 2)
+        for profile in made:
+            self.assertFalse(Path(profile).exists())
+
+    def test_rejects_bad_size_and_closed_pool(self) -> None:
+        with self.assertRaises(ValueError):
+            _soffice.SofficePool(size=0)
+        pool = _soffice.SofficePool(size=1)
+        pool.close()
+        with self.assertRaises(_soffice.SofficeError):
+            pool.run(["--version"])
+
+
+class TestWaitReady(unittest.TestCase):
+    def test_ready_when_profile_is_locked(self) -> None:
+        """Readiness is the instance's `<profile>/.lock`, not a socket."""
+        with tempfile.TemporaryDirectory() as profile:
+            proc = _FakeInstance([f"-env:UserInstallation={Path(profile).as_uri()}"])
+            self.assertFalse(_soffice._wait_ready(proc, profile, 0.3))
+            threading.Timer(0.2, (Path(profile) / ".lock").touch).start()
+            self.assertTrue(_soffice._wait_ready(proc, profile, 10))
+            proc.returncode = 1
+            self.assertFalse(_soffice._wait_ready(proc, profile, 10))
+
+
+def _have_soffice() -> bool:
+    try:
+        _soffice.find_soffice()
+    except _soffice.SofficeError:
+        return False
+    return True
+
+
+@unittest.skipUnless(_have_soffice(), "LibreOffice (soffice) not installed")
+class TestSofficePoolLive(unittest.TestCase):
+    """Real instances: jobs must be handed to the warm instance over the
+    single-instance pipe, and each job must return only once its
+    conversion has finished."""
+
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(_soffice.shutil.rmtree, self.tmp, True)
+        self.srcs = []
+        for i in range(3):
+            src = self.tmp / f"note{i}.txt"
+            src.write_text(f"pooled conversion {i}\n", encoding="utf-8")
+            self.srcs.append(src)
+
+    def test_jobs_hand_off_to_one_warm_instance(self) -> None:
+        spawned: list[_soffice._Instance] = []
+        real_spawn = _soffice.SofficePool._spawn
+
+        def spawn(pool):
+            spawned.append(real_spawn(pool))
+            return spawned[-1]
+
+        with mock.patch.object(_soffice.SofficePool, "_spawn", spawn):
+            pool = _soffice.SofficePool(size=1)
+        if not pool.pooled:
+            pool.close()
+            self.skipTest("single-instance pipe unavailable (AF_UNIX blocked)")
+        with pool:
+            out = self.tmp / "out"
+            for src in self.srcs:
+                # `_produced` raises unless the PDF exists the moment the
+                # handing-off process returns: no polling, no sleep.
+                pdf = pool.convert_to(src, out, "pdf", timeout=120)
+                self.assertEqual(pdf.read_bytes()[:5], b"%PDF-")
+            self.assertEqual(len(spawned), 1)
+            inst = spawned[0]
+            self.assertTrue(inst.alive())
+            self.assertTrue((Path(inst.profile) / ".lock").is_file())
+            self.assertEqual(inst.jobs, 3)
+            profile = Path(inst.profile)
+        self.assertFalse(inst.alive())
+        self.assertFalse(profile.exists())
+
+    def test_convert_many_across_instances(self) -> None:
+        with _soffice.SofficePool(size=2) as pool:
+            pdfs = pool.convert_many(self.srcs, self.tmp / "many", "pdf",
+                                     timeout=120)
+        self.assertEqual([p.name for p in pdfs],
+                         [f"note{i}.pdf" for i in range(3)])
+        for pdf in pdfs:
+            self.assertEqual(pdf.read_bytes()[:5], b"%PDF-")
+
+
+if __name__ == "__main__":
+    unittest.main()
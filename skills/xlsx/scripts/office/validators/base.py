@@ -17,14 +17,32 @@ apply regardless of format:
 XSD validation is best-effort. ECMA-376 is a large standard and real
 files frequently use elements from schemas we don't ship. The validator
 reports those as warnings, not errors, unless `strict=True`.
+
+Per-part work is lazy and cached:
+
+- Compiled `etree.XMLSchema` objects are cached per process, keyed on
+  the XSD path + mtime + size (`_compiled_schema`). Compiling the
+  ECMA-376 set takes far longer than validating one part against it,
+  and a compiled schema cannot be pickled, so the cache is in-memory
+  only — long-lived callers get the benefit via `office.validate.
+  validate_file`.
+- Each XML part is parsed at most once per `validate` call and only
+  when a check needs it (a part without the WordprocessingML namespace
+  cannot carry a duplicate `w:id`).
+- With `incremental=True` the instance remembers each part's findings
+  keyed on a digest of its bytes; the next `validate` re-checks only
+  parts whose bytes changed. Package-level checks (content types,
+  relationships, subclass cross-part checks) always run.
 """
 
 from __future__ import annotations
 
+import hashlib
 import urllib.parse
 import zipfile
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from lxml import etree  # type: ignore
@@ -94,10 +112,37 @@ def _resolve_zip_path(base_dir: str, target: str) -> str:
     return "/".join(parts)
 
 
+_W_NS_BYTES = b"http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+@lru_cache(maxsize=32)
+def _compiled_schema(xsd_path: str, mtime_ns: int, size: int) -> "etree.XMLSchema":
+    """Compile `xsd_path` once per process. `mtime_ns` / `size` are part
+    of the key only, so a re-fetched schema set is picked up."""
+    return etree.XMLSchema(etree.parse(xsd_path, _safe_parser()))
+
+
+def _load_schema(xsd_path: Path) -> "etree.XMLSchema":
+    st = xsd_path.stat()
+    return _compiled_schema(str(xsd_path), st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class _PartResult:
+    """Per-part findings: parse / XSD messages and duplicate-id warnings
+    (reported in two passes to keep the historical message order)."""
+
+    report: "ValidationReport"
+    id_warnings: list[str]
+
+
 @dataclass
 class ValidationReport:
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    # Informational lines (e.g. redlining throughput); never affect `ok`
+    # and are not part of `to_dict`.
+    stats: list[str] = field(default_factory=list)
 
     @property
     def ok(self) -> bool:
@@ -106,6 +151,7 @@ class ValidationReport:
     def merge(self, other: "ValidationReport") -> None:
         self.errors.extend(other.errors)
         self.warnings.extend(other.warnings)
+        self.stats.extend(other.stats)
 
     def to_dict(self) -> dict[str, list[str]]:
         return {"errors": self.errors, "warnings": self.warnings, "ok": self.ok}
@@ -119,24 +165,51 @@ class BaseSchemaValidator:
     # per-slide entries on the fly) don't leak state across instances.
     xsd_map: dict[str, str] = {}
 
-    def __init__(self, schemas_dir: Path | None = None, *, strict: bool = False) -> None:
+    def __init__(
+        self, schemas_dir: Path | None = None, *, strict: bool = False,
+        incremental: bool = False,
+    ) -> None:
         self.schemas_dir = schemas_dir
         self.strict = strict
+        self.incremental = incremental
         # Per-instance dict — required because subclasses populate
         # `self.xsd_map` dynamically during validation. Without this
         # copy, every dynamic add would mutate the class attribute and
         # leak into the next instance.
         self.xsd_map = dict(self.__class__.xsd_map)
+        # part name → (digest of its bytes, findings); incremental only.
+        self._part_results: dict[str, tuple[bytes, _PartResult]] = {}
+        # Parsed parts of the archive being validated (one `validate`).
+        self._trees: dict[str, "etree._Element | etree.XMLSyntaxError"] = {}
+        self.parts_checked = 0
+        self.parts_reused = 0
 
     def validate(self, input_path: Path) -> ValidationReport:
         report = ValidationReport()
+        self.parts_checked = self.parts_reused = 0
         if not zipfile.is_zipfile(str(input_path)):
             report.errors.append(f"Not a ZIP-based OOXML container: {input_path}")
             return report
-        with zipfile.ZipFile(str(input_path)) as archive:
-            self._validate_container(archive, report)
+        try:
+            with zipfile.ZipFile(str(input_path)) as archive:
+                self._validate_container(archive, report)
+        finally:
+            self._trees.clear()
         return report
 
+    def _part_tree(self, archive: zipfile.ZipFile, name: str) -> etree._Element:
+        """Parse `name` once per `validate`; re-raises a cached syntax error."""
+        tree = self._trees.get(name)
+        if tree is None:
+            try:
+                tree = etree.fromstring(archive.read(name), _safe_parser())
+            except etree.XMLSyntaxError as exc:
+                tree = exc
+            self._trees[name] = tree
+        if isinstance(tree, etree.XMLSyntaxError):
+            raise tree
+        return tree
+
     def _validate_container(self, archive: zipfile.ZipFile, report: ValidationReport) -> None:
         namelist = set(archive.namelist())
 
@@ -157,20 +230,47 @@ class BaseSchemaValidator:
             if part not in namelist:
                 report.errors.append(f"Missing expected part: {part}")
 
+        results: list[_PartResult] = []
         for name in namelist:
             if not name.endswith(".xml"):
                 continue
-            if self.strict:
-                # Every XML part must at least parse.
-                try:
-                    etree.fromstring(archive.read(name), _safe_parser())
-                except etree.XMLSyntaxError as exc:
-                    report.errors.append(f"{name}: parse error {exc}")
-            if self.schemas_dir is None:
+            data = archive.read(name)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            cached = self._part_results.get(name)
+            if cached is not None and cached[0] == digest:
+                self.parts_reused += 1
+                results.append(cached[1])
                 continue
-            self._validate_against_xsd(archive, name, report)
-
-        self._check_unique_ids(archive, namelist, report)
+            result = self._check_part(archive, name, data)
+            self.parts_checked += 1
+            if self.incremental:
+                self._part_results[name] = (digest, result)
+            results.append(result)
+        if self.incremental:
+            for name in set(self._part_results) - namelist:
+                del self._part_results[name]
+
+        for result in results:
+            report.merge(result.report)
+        for result in results:
+            report.warnings.extend(result.id_warnings)
+
+    def _check_part(
+        self, archive: zipfile.ZipFile, name: str, data: bytes,
+    ) -> _PartResult:
+        part_report = ValidationReport()
+        if self.strict:
+            # Every XML part must at least parse.
+            try:
+                self._part_tree(archive, name)
+            except etree.XMLSyntaxError as exc:
+                part_report.errors.append(f"{name}: parse error {exc}")
+        if self.schemas_dir is not None:
+            self._validate_against_xsd(archive, name, part_report)
+        id_report = ValidationReport()
+        if _W_NS_BYTES in data:
+            self._check_unique_ids(archive, {name}, id_report)
+        return _PartResult(part_report, id_report.warnings)
 
     def _check_relationships(
         self,
@@ -212,7 +312,7 @@ class BaseSchemaValidator:
             if not name.endswith(".xml"):
                 continue
             try:
-                root = etree.fromstring(archive.read(name), _safe_parser())
+                root = self._part_tree(archive, name)
             except etree.XMLSyntaxError:
                 continue
             seen: dict[str, list[str]] = defaultdict(list)
@@ -246,8 +346,8 @@ class BaseSchemaValidator:
                 report.warnings.append(f"XSD not bundled: {xsd_name}")
             return
         try:
-            schema = etree.XMLSchema(etree.parse(str(xsd_path), _safe_parser()))
-            doc = etree.fromstring(archive.read(name), _safe_parser())
+            schema = _load_schema(xsd_path)
+            doc = self._part_tree(archive, name)
             if not schema.validate(doc):
                 for err in schema.error_log:  # type: ignore[attr-defined]
                     level = "errors" if self.strict else "warnings"
@@ -83,9 +83,7 @@ class PptxValidator(BaseSchemaValidator):
         if "ppt/presentation.xml" not in namelist:
             return  # base() already errored
         try:
-            pres = etree.fromstring(
-                archive.read("ppt/presentation.xml"), _safe_parser()
-            )
+            pres = self._part_tree(archive, "ppt/presentation.xml")
         except etree.XMLSyntaxError as exc:
             report.errors.append(f"ppt/presentation.xml: parse error {exc}")
             return
@@ -285,9 +283,7 @@ class PptxValidator(BaseSchemaValidator):
             rels_path = f"{slide_dir}/_rels/{PurePosixPath(slide_part).name}.rels"
             rels = self._read_rels(archive, rels_path, report) if rels_path in namelist else {}
             try:
-                slide_doc = etree.fromstring(
-                    archive.read(slide_part), _safe_parser()
-                )
+                slide_doc = self._part_tree(archive, slide_part)
             except etree.XMLSyntaxError as exc:
                 report.errors.append(f"{slide_part}: parse error {exc}")
                 continue
@@ -33,6 +33,7 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Any
 
 
 def _smoke_import(module_name: str) -> None:
@@ -798,6 +799,73 @@ class TestScopeResolver(unittest.TestCase):
         self.assertEqual(result.sheet_name, "Bob's Sheet")
         self.assertEqual(result.cells[0].value, 42)
 
+    # === ColumnCache (run-scoped column memo) ===
+
+    def test_column_cache_shares_classification(self) -> None:
+        """Same column + options → one pass; merged-cell info replayed."""
+        from openpyxl import Workbook
+        from xlsx_check_rules.ast_nodes import ColRef, MultiColRef
+        from xlsx_check_rules.scope_resolver import ColumnCache, resolve_scope
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Amount", "Note"])
+        for i in range(10):
+            ws.append([i, f" n{i} "])
+        ws.merge_cells("A4:A5")
+        cache = ColumnCache()
+        opts = {"column_cache": cache}
+        first = resolve_scope(ColRef(None, "Amount", False), wb, opts=opts)
+        again = resolve_scope(ColRef(None, "A", True), wb, opts=opts)
+        self.assertEqual(cache.hits, 1)
+        self.assertIs(again.cells, first.cells)
+        self.assertEqual(again.info_findings, first.info_findings)
+        self.assertEqual(len(first.info_findings), 1)
+        both = resolve_scope(MultiColRef(None, (ColRef(None, "A", True),
+                                               ColRef(None, "B", True))),
+                             wb, opts=opts)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(len(both.cells), 20)
+        # Classify-relevant options are part of the key.
+        raw = resolve_scope(ColRef(None, "B", True), wb,
+                            opts={**opts, "strip_whitespace": False})
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(raw.cells[0].value, " n0 ")
+        self.assertEqual(both.cells[10].value, "n0")
+        self.assertEqual(first.cells, resolve_scope(
+            ColRef(None, "A", True), wb).cells)
+
+    def test_column_cache_hits_in_summary(self) -> None:
+        """Rules + aggregates over one column share one pass."""
+        import io, json as _json
+        from contextlib import redirect_stdout, redirect_stderr
+        from openpyxl import Workbook
+        from xlsx_check_rules.cli import main
+        with tempfile.TemporaryDirectory() as td:
+            wb = Workbook()
+            ws = wb.active
+            ws.append(["Amount"])
+            for i in range(20):
+                ws.append([i])
+            ws["B1"] = 190
+            wb.save(Path(td) / "in.xlsx")
+            rules = {"version": 1, "rules": [
+                {"id": "pos", "scope": "col:Amount", "check": "value >= 0"},
+                {"id": "cap", "scope": "col:Amount", "check": "value <= 100"},
+                {"id": "total", "scope": "cell:B1",
+                 "check": "value == sum(col:Amount)"},
+            ]}
+            (Path(td) / "r.json").write_text(_json.dumps(rules))
+            for engine, hits in (("cell", 2), ("columnar", 1)):
+                out = io.StringIO()
+                with self.subTest(engine=engine), redirect_stdout(out), \
+                        redirect_stderr(io.StringIO()):
+                    rc = main([str(Path(td) / "in.xlsx"), "--rules",
+                               str(Path(td) / "r.json"), "--json",
+                               "--engine", engine])
+                    self.assertEqual(rc, 0)
+                    summary = _json.loads(out.getvalue())["summary"]
+                    self.assertEqual(summary["column_cache_hits"], hits)
+
 
 class TestHonestScopeMultiRowHeaders(unittest.TestCase):
     """R13.g lock: multi-row / merged headers are explicitly out of scope."""
@@ -1381,6 +1449,17 @@ class TestEvaluator(unittest.TestCase):
         self.assertIn("regex evaluation timed out", result.message)
         self.assertEqual(ctx.regex_timeouts, 1)
 
+    def test_eval_regex_prefilter_skips_missing_literal(self) -> None:
+        """Values without the pattern's literal prefix never reach `fullmatch`."""
+        from xlsx_check_rules.ast_nodes import RegexPredicate
+        from xlsx_check_rules.evaluator import eval_check
+        ctx = _ctx()
+        node = RegexPredicate(r"^INV-\d{4}$")
+        results = [eval_check(node, _classified(v), ctx)
+                   for v in ("INV-0001", "PO-0001", "INV-12", "inv-0001")]
+        self.assertEqual(results, [True, False, False, False])
+        self.assertEqual(ctx.regex_prefilter_skips, 2)
+
     # === Cell-error auto-emit (D4) ===
 
     def test_eval_cell_error_auto_emit_d4_seven_codes(self) -> None:
@@ -3276,5 +3355,602 @@ class TestComprehensiveRulesCoverage(unittest.TestCase):
         )
 
 
+
+# ---------------------------------------------------------------------------
+# F7-columnar — `--engine columnar` parity ---------------------------------
+# ---------------------------------------------------------------------------
+class TestColumnarEngine(unittest.TestCase):
+    """`--engine columnar` MUST reproduce the cell engine's envelope
+    byte-for-byte (findings, order, summary minus `elapsed_seconds` /
+    `column_cache_hits`) and its stderr."""
+
+    def test_smoke(self) -> None:
+        _smoke_import("xlsx_check_rules.columnar")
+
+    @staticmethod
+    def _write_fixture(tmp: Path) -> tuple[Path, Path]:
+        import datetime as _dt
+        import json as _json
+        from decimal import Decimal
+        from openpyxl import Workbook
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Data"
+        ws.append(["Hours", "Status", "Code", "When", "Serial", "Flag",
+                   "Notes", "Week", "Ref"])
+        statuses = ("Approved", " Pending ", "Draft", None, "#N/A")
+        for i in range(2, 80):
+            ws.append([
+                (i % 30) - 3 if i % 11 else "n/a",
+                statuses[i % len(statuses)],
+                f"PRJ-{i:04d}" if i % 4 else f"prj-{i}",
+                _dt.datetime(2026, 1 + i % 12, 1 + i % 27) if i % 6 else None,
+                45000 + i if i % 5 else Decimal("12.5"),
+                bool(i % 3) if i % 7 else "yes",
+                "x" * (i % 15),
+                i % 5,
+                10,
+            ])
+        ws["A20"] = "=1/0"            # data_only load → no cached value
+        ws["B9"].value = "#DIV/0!"
+        ws["B9"].data_type = "e"
+        ws.merge_cells("C30:C33")
+        ws.merge_cells("G40:H41")
+        ws["I1"] = "Ref"
+        wb_path = tmp / "columnar.xlsx"
+        wb.save(wb_path)
+        rules = {"version": 1, "defaults": {"sheet": "Data", "header_row": 1}, "rules": [
+            {"id": "hours-range", "scope": "col:Hours", "check": "value <= 24"},
+            {"id": "hours-eq", "scope": "col:Hours", "check": "value == 7"},
+            {"id": "hours-neq", "scope": "col:Hours", "check": "value != 5",
+             "tolerance": 0.5},
+            {"id": "status-in", "scope": "col:Status",
+             "check": "value in [Approved, Pending]"},
+            {"id": "status-required", "scope": "col:Status", "check": "required"},
+            {"id": "code-regex", "scope": "col:Code", "check": "regex:^PRJ-\\d{4}$"},
+            {"id": "code-start", "scope": "col:Code", "check": "starts_with:PRJ"},
+            {"id": "when-date", "scope": "col:When",
+             "check": "date_in_range:2026-02-01,2026-09-30", "when": "is_date"},
+            {"id": "serial-date", "scope": "col:Serial", "check": "is_date"},
+            {"id": "flag-bool", "scope": "col:Flag", "check": "is_bool",
+             "skip_empty": False},
+            {"id": "notes-len", "scope": "col:Notes", "check": "len <= 10"},
+            {"id": "notes-not-empty", "scope": "cols:Notes,Code",
+             "check": "not_empty"},
+            {"id": "composite", "scope": "col:Hours",
+             "check": {"and": ["is_number", {"or": ["value > 20", "value < 2"]}]}},
+            {"id": "negated", "scope": "col:Week",
+             "check": {"not": "between:1,3"}},
+            {"id": "cell-ref", "scope": "col:Week", "check": "value < cell:I2"},
+            {"id": "weekday", "scope": "col:When",
+             "check": "date_weekday:Mon,Tue,Wed,Thu,Fri"},
+            {"id": "agg", "scope": "col:Week", "check": "value <= avg(col:Week)"},
+            {"id": "group", "scope": "col:Hours", "check": "sum_by:Week <= 100"},
+            {"id": "range", "scope": "A2:B12", "check": "is_number"},
+        ]}
+        rules_path = tmp / "columnar.rules.json"
+        rules_path.write_text(_json.dumps(rules))
+        return wb_path, rules_path
+
+    def _envelope(self, *argv: str) -> tuple[int, dict, str]:
+        import io, json as _json
+        from contextlib import redirect_stdout, redirect_stderr
+        from xlsx_check_rules.cli import main
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            rc = main([*argv, "--json", "--max-findings", "0",
+                       "--summarize-after", "0"])
+        env = _json.loads(out.getvalue())
+        env["summary"].pop("elapsed_seconds")
+        # Engine-specific observability counter (the engines cache
+        # different column shapes); like timing, not part of parity.
+        env["summary"].pop("column_cache_hits")
+        return rc, env, err.getvalue()
+
+    def _assert_parity(self, *argv: str) -> dict:
+        cell = self._envelope(*argv)
+        columnar = self._envelope(*argv, "--engine", "columnar")
+        self.assertEqual(columnar, cell)
+        return cell[1]
+
+    def test_parity_synthetic_workbook(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = self._write_fixture(Path(td))
+            for extra in ((), ("--no-strip-whitespace",),
+                          ("--treat-numeric-as-date", "E"),
+                          ("--visible-only", "--ignore-stale-cache")):
+                with self.subTest(extra=extra):
+                    env = self._assert_parity(str(wb_path), "--rules",
+                                              str(rules_path), *extra)
+                    self.assertGreater(len(env["findings"]), 100)
+
+    def test_parity_comprehensive_fixture(self) -> None:
+        inputs = Path(__file__).parent / "golden" / "inputs"
+        workbook = inputs / "comprehensive-rules.xlsx"
+        if not workbook.exists():
+            self.skipTest(f"comprehensive fixture absent: {workbook.name}")
+        self._assert_parity(str(workbook), "--rules",
+                            str(inputs / "comprehensive-rules.rules.json"))
+
+    def test_batch_matches_cell_classification(self) -> None:
+        """Typed arrays materialise to exactly F6's `ClassifiedCell`s."""
+        from openpyxl import load_workbook
+        from xlsx_check_rules.ast_nodes import ColRef, MultiColRef
+        from xlsx_check_rules.columnar import resolve_batch
+        from xlsx_check_rules.scope_resolver import resolve_scope
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, _ = self._write_fixture(Path(td))
+            wb = load_workbook(wb_path, data_only=True)
+        opts = {"treat_numeric_as_date": {"E"}, "strip_whitespace": True}
+        for scope in (ColRef("Data", "Status", False), ColRef("Data", "E", True),
+                      MultiColRef("Data", (ColRef("Data", "C", True),
+                                           ColRef("Data", "Notes", False)))):
+            with self.subTest(scope=scope):
+                expected = resolve_scope(scope, wb, {"header_row": 1}, opts)
+                got = resolve_batch(scope, wb, {"header_row": 1}, opts)
+                self.assertEqual(got.to_scope_result(), expected)
+
+    def test_aggregate_rules_fall_back_to_cell_engine(self) -> None:
+        from xlsx_check_rules.columnar import _needs_cell_engine
+        from xlsx_check_rules.dsl_parser import build_rule_spec
+        def spec(check):
+            return build_rule_spec({"id": "r", "scope": "col:A", "check": check})
+        self.assertTrue(_needs_cell_engine(spec("value <= sum(col:A)")))
+        self.assertTrue(_needs_cell_engine(spec("sum_by:B <= 10")))
+        self.assertTrue(_needs_cell_engine(spec({"and": ["is_number", "value > avg(col:A)"]})))
+        self.assertFalse(_needs_cell_engine(spec({"or": ["value > 1", "regex:^a$"]})))
+
+
+# ---------------------------------------------------------------------------
+# F6-streaming — `--streaming-input` parity --------------------------------
+# ---------------------------------------------------------------------------
+class TestStreamingInput(unittest.TestCase):
+    """`--streaming-input` (read-only load, one pass per sheet) MUST
+    reproduce the full-load envelope and stderr on either engine."""
+
+    def test_smoke(self) -> None:
+        _smoke_import("xlsx_check_rules.streaming")
+
+    @staticmethod
+    def _write_fixture(tmp: Path) -> tuple[Path, Path]:
+        """The columnar fixture plus Tables, a defined name, a second
+        sheet and a hyperlink / comment past the last data row (both
+        widen `max_row` in full mode)."""
+        import json as _json
+        from openpyxl import load_workbook
+        from openpyxl.comments import Comment
+        from openpyxl.workbook.defined_name import DefinedName
+        from openpyxl.worksheet.table import Table
+        wb_path, rules_path = TestColumnarEngine._write_fixture(tmp)
+        wb = load_workbook(wb_path)
+        ws = wb["Data"]
+        ws["K120"].hyperlink = "https://example.com/"
+        ws["M95"].comment = Comment("note", "qa")
+        lookup = wb.create_sheet("Lookup")
+        lookup.append(["Key", "Rate"])
+        for i in range(2, 12):
+            lookup.append([f"k{i}", i * 1.5 if i != 7 else "bad"])
+        lookup.add_table(Table(displayName="Rates", ref="A1:B11"))
+        lookup["A40"] = "stray"
+        wb.defined_names["Window"] = DefinedName("Window", attr_text="Data!$D$2:$E$6")
+        wb.save(wb_path)
+        rules = _json.loads(rules_path.read_text())
+        rules["rules"] += [
+            {"id": "table-col", "scope": "table:Rates[Rate]", "check": "is_number"},
+            {"id": "table-all", "scope": "table:Rates", "check": "not_empty"},
+            {"id": "table-header", "scope": "Lookup!col:Rate", "check": "value < 14"},
+            {"id": "row", "scope": "row:5", "check": "not_empty"},
+            {"id": "sheet", "scope": "sheet:Lookup", "check": "required"},
+            {"id": "named", "scope": "named:Window", "check": "is_date"},
+            {"id": "cross-ref", "scope": "col:Week", "check": "value < Lookup!cell:B3"},
+            {"id": "merged", "scope": "col:G", "check": "len < 12"},
+            {"id": "empty-tail", "scope": "col:K", "check": "required",
+             "severity": "info"},
+        ]
+        rules_path.write_text(_json.dumps(rules))
+        return wb_path, rules_path
+
+    def _envelope(self, *argv: str) -> tuple[int, dict, str]:
+        import io, json as _json
+        from contextlib import redirect_stdout, redirect_stderr
+        from xlsx_check_rules.cli import main
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            rc = main([*argv, "--json", "--max-findings", "0",
+                       "--summarize-after", "0"])
+        env = _json.loads(out.getvalue())
+        env["summary"].pop("elapsed_seconds")
+        return rc, env, err.getvalue()
+
+    def test_parity_with_full_load(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = self._write_fixture(Path(td))
+            for extra in ((), ("--engine", "columnar"),
+                          ("--no-table-autodetect", "--no-strip-whitespace"),
+                          ("--visible-only", "--ignore-stale-cache")):
+                with self.subTest(extra=extra):
+                    argv = (str(wb_path), "--rules", str(rules_path), *extra)
+                    full = self._envelope(*argv)
+                    streamed = self._envelope(*argv, "--streaming-input")
+                    self.assertEqual(streamed, full)
+                    self.assertGreater(len(full[1]["findings"]), 100)
+
+    def test_parity_comprehensive_fixture(self) -> None:
+        inputs = Path(__file__).parent / "golden" / "inputs"
+        workbook = inputs / "comprehensive-rules.xlsx"
+        if not workbook.exists():
+            self.skipTest(f"comprehensive fixture absent: {workbook.name}")
+        argv = (str(workbook), "--rules",
+                str(inputs / "comprehensive-rules.rules.json"))
+        self.assertEqual(self._envelope(*argv, "--streaming-input"),
+                         self._envelope(*argv))
+
+    def test_missing_header_error_matches_full_load(self) -> None:
+        import json as _json
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = self._write_fixture(Path(td))
+            rules = _json.loads(rules_path.read_text())
+            rules["rules"].append({"id": "nope", "scope": "col:Nope",
+                                   "check": "required"})
+            rules_path.write_text(_json.dumps(rules))
+            argv = (str(wb_path), "--rules", str(rules_path))
+            full = self._envelope_raw(*argv)
+            self.assertNotEqual(full[0], 0)
+            self.assertEqual(self._envelope_raw(*argv, "--streaming-input"), full)
+
+    def _envelope_raw(self, *argv: str) -> tuple[int, str, str]:
+        # Subprocess: `_errors.report_error` binds `sys.stderr` at import,
+        # so an in-process redirect would only catch the first fatal.
+        proc = subprocess.run(
+            [sys.executable, "xlsx_check_rules.py", *argv, "--json"],
+            capture_output=True, text=True, cwd=Path(__file__).parent.parent,
+            timeout=60,
+        )
+        return proc.returncode, proc.stdout, proc.stderr
+
+    def _planned(self, wb_path: Path, rules_path: Path):
+        from xlsx_check_rules.dsl_parser import build_rule_spec
+        from xlsx_check_rules.rules_loader import load_rules_file
+        from xlsx_check_rules.streaming import load_streaming_workbook, plan_rules
+        data = load_rules_file(str(rules_path))
+        specs = [build_rule_spec(r) for r in data["rules"]]
+        wb = load_streaming_workbook(str(wb_path))
+        plan_rules(specs, wb, data["defaults"], {})
+        return wb, specs, data["defaults"]
+
+    def test_pass_keeps_only_planned_cells(self) -> None:
+        """Column I is read only through `cell:I2`; nothing else of it
+        is retained, and evaluating every rule needs no second pass."""
+        from xlsx_check_rules.aggregates import AggregateCache
+        from xlsx_check_rules.evaluator import EvalContext, eval_rule
+        from xlsx_check_rules.scope_resolver import resolve_scope
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestColumnarEngine._write_fixture(Path(td))
+            wb, specs, defaults = self._planned(wb_path, rules_path)
+            try:
+                ws = wb["Data"]
+                self.assertEqual(sorted(ws.plan.cols), list(range(1, 9)))
+                cache = AggregateCache()
+                for rule in specs:
+                    sr = resolve_scope(rule.scope, wb, defaults, {})
+                    list(eval_rule(rule, sr, EvalContext(
+                        workbook=wb, rule=rule, aggregate_cache=cache,
+                        defaults=defaults, eval_opts={},
+                    )))
+                self.assertEqual(ws.repasses, 0)
+                kept_i = sorted(r for (r, c) in ws._cells if c == 9)
+                self.assertEqual(kept_i, [1, 2])
+            finally:
+                wb.close()
+
+    def test_unplanned_read_repasses(self) -> None:
+        from openpyxl import load_workbook
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestColumnarEngine._write_fixture(Path(td))
+            wb, _, _ = self._planned(wb_path, rules_path)
+            full = load_workbook(wb_path, data_only=True)
+            try:
+                ws = wb["Data"]
+                self.assertEqual(ws["I50"].value, full["Data"]["I50"].value)
+                self.assertEqual(ws.repasses, 1)
+                self.assertEqual(ws.cell(60, 9).value, 10)
+                self.assertEqual(ws.repasses, 1)
+            finally:
+                wb.close()
+
+    def test_bounds_match_full_load(self) -> None:
+        from openpyxl import load_workbook
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = self._write_fixture(Path(td))
+            wb, _, _ = self._planned(wb_path, rules_path)
+            full = load_workbook(wb_path, data_only=True)
+            try:
+                for name in full.sheetnames:
+                    with self.subTest(sheet=name):
+                        self.assertEqual(
+                            (wb[name].max_row, wb[name].max_column),
+                            (full[name].max_row, full[name].max_column),
+                        )
+                        self.assertEqual(
+                            sorted(str(r) for r in wb[name].merged_cells.ranges),
+                            sorted(str(r) for r in full[name].merged_cells.ranges),
+                        )
+                        self.assertEqual(list(wb[name].tables),
+                                         list(full[name].tables))
+                # Reading past the bounds grows them, as `Worksheet.cell` does.
+                wb["Lookup"].cell(300, 2)
+                full["Lookup"].cell(300, 2)
+                self.assertEqual(wb["Lookup"].max_row, full["Lookup"].max_row)
+            finally:
+                wb.close()
+
+
+class TestRegexPrefilter(unittest.TestCase):
+    """`literal_prefilter` is a *necessary* condition for `fullmatch`:
+    it may pass a value the pattern rejects, never the reverse."""
+
+    def test_smoke(self) -> None:
+        _smoke_import("xlsx_check_rules.regex_prefilter")
+
+    def test_extracts_required_runs(self) -> None:
+        from xlsx_check_rules.regex_prefilter import literal_prefilter
+        cases = {
+            r"^INV-\d{4}$": ("INV-", "", ()),
+            r"\d+kg": ("", "kg", ()),
+            r"^\w+@\w+\.com$": ("", ".com", ("@",)),
+            r"ab*c": ("a", "c", ()),
+            r"(ab)?cd": ("", "cd", ()),
+        }
+        for pattern, (prefix, suffix, infixes) in cases.items():
+            with self.subTest(pattern=pattern):
+                pf = literal_prefilter(pattern)
+                self.assertEqual((pf.prefix, pf.suffix, pf.infixes),
+                                 (prefix, suffix, infixes))
+
+    def test_gives_up_on_unmodelled_syntax(self) -> None:
+        from xlsx_check_rules.regex_prefilter import literal_prefilter
+        for pattern in (r"abc|xyz", r"(?i)abc", r"a\x41b", r"(?P<n>a)b",
+                        r"\p{L}+x", r"a{b", r"^[A-Z]+$"):
+            with self.subTest(pattern=pattern):
+                self.assertIsNone(literal_prefilter(pattern))
+
+    def test_never_rejects_a_full_match(self) -> None:
+        import itertools
+        import random
+        from regex import fullmatch
+        from xlsx_check_rules.regex_prefilter import literal_prefilter
+        atoms = ["a", "b", "-", r"\.", r"\d", ".", "[ab]", "[^a]", "(ab)",
+                 "(?:a|b)", r"\b", "^", "$", "[[:alpha:]]", "(?=a)", "[]a]", "1"]
+        quants = ["", "", "*", "+", "?", "{2}", "{,2}", "*?", "{0}"]
+        values = ["".join(t) for n in range(4)
+                  for t in itertools.product("ab-.1", repeat=n)]
+        rng = random.Random(7)
+        checked = 0
+        for _ in range(400):
+            pattern = "".join(rng.choice(atoms) + rng.choice(quants)
+                              for _ in range(rng.randint(1, 4)))
+            pf = literal_prefilter(pattern)
+            if pf is None:
+                continue
+            for v in values:
+                try:
+                    matched = fullmatch(pattern, v)
+                except Exception:  # noqa: BLE001 — invalid random pattern
+                    break
+                if matched:
+                    checked += 1
+                    self.assertTrue(pf.may_match(v), (pattern, v))
+        self.assertGreater(checked, 100)
+
+
+class TestWorkers(unittest.TestCase):
+    """`--workers N` MUST reproduce the serial envelope and stderr,
+    minus the per-process cache-hit counters."""
+
+    def test_smoke(self) -> None:
+        _smoke_import("xlsx_check_rules.parallel")
+
+    def _envelope(self, *argv: str) -> tuple[int, dict, str]:
+        rc, env, err = TestStreamingInput._envelope(self, *argv)
+        env["summary"].pop("aggregate_cache_hits")
+        env["summary"].pop("column_cache_hits")
+        return rc, env, err
+
+    def test_parity_with_serial(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestStreamingInput._write_fixture(Path(td))
+            for extra in ((), ("--engine", "columnar"), ("--streaming-input",),
+                          ("--visible-only", "--no-strip-whitespace")):
+                with self.subTest(extra=extra):
+                    argv = (str(wb_path), "--rules", str(rules_path), *extra)
+                    serial = self._envelope(*argv)
+                    pooled = self._envelope(*argv, "--workers", "3")
+                    self.assertEqual(pooled, serial)
+                    self.assertGreater(len(serial[1]["findings"]), 100)
+
+    def test_missing_header_error_matches_serial(self) -> None:
+        import json as _json
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestStreamingInput._write_fixture(Path(td))
+            rules = _json.loads(rules_path.read_text())
+            rules["rules"][3:3] = [{"id": "nope", "scope": "col:Nope",
+                                    "check": "required"}]
+            rules_path.write_text(_json.dumps(rules))
+            argv = (str(wb_path), "--rules", str(rules_path))
+            serial = TestStreamingInput._envelope_raw(self, *argv)
+            self.assertNotEqual(serial[0], 0)
+            self.assertEqual(
+                TestStreamingInput._envelope_raw(self, *argv, "--workers", "2"),
+                serial,
+            )
+
+    def test_units_group_rules_by_sheet_and_scope(self) -> None:
+        from xlsx_check_rules.dsl_parser import build_rule_spec
+        from xlsx_check_rules.parallel import plan_units
+        scopes = ["col:A", "col:B", "col:A", "Other!col:A", "sheet:Other",
+                  "col:B"]
+        specs = [build_rule_spec({"id": f"r{i}", "scope": s, "check": "required"})
+                 for i, s in enumerate(scopes)]
+        self.assertEqual(plan_units(specs), [[0, 2], [1, 5], [3], [4]])
+
+    def test_merge_drops_error_after_timeout_gap(self) -> None:
+        """After a timeout, units that never ran leave gaps; a fatal
+        past the first gap is one the serial run might not reach.
+        Gaps stay as None so positions line up with the rules."""
+        from xlsx_check_rules.cli import _RuleOutcome
+        from xlsx_check_rules.exceptions import HeaderNotFound
+        from xlsx_check_rules.parallel import _UnitResult, _merge_results
+        ok = _RuleOutcome(findings=["f0"])
+        late = _RuleOutcome(error=HeaderNotFound("x"))
+        merged = _merge_results(
+            [_UnitResult(outcomes=[(0, ok)]), _UnitResult(outcomes=[(2, late)])],
+            n_rules=3,
+        )
+        self.assertEqual(merged.outcomes, [ok, None, None])
+        early = _RuleOutcome(error=HeaderNotFound("y"))
+        merged = _merge_results(
+            [_UnitResult(outcomes=[(0, early)]), _UnitResult(outcomes=[(1, ok)])],
+            n_rules=2,
+        )
+        self.assertEqual(merged.outcomes, [early])
+
+    def test_merge_replays_first_stderr_once(self) -> None:
+        """Each process warns once; only the earliest rule's copy prints."""
+        import io
+        from contextlib import redirect_stderr
+        from xlsx_check_rules.cli import _RuleOutcome
+        from xlsx_check_rules.parallel import _UnitResult, _merge_results
+        quiet = _RuleOutcome()
+        first = _RuleOutcome(stderr="WARNING: a\n")
+        second = _RuleOutcome(stderr="WARNING: b\n")
+        err = io.StringIO()
+        with redirect_stderr(err):
+            merged = _merge_results(
+                [_UnitResult(outcomes=[(0, quiet), (2, second)]),
+                 _UnitResult(outcomes=[(1, first)])],
+                n_rules=3,
+            )
+        self.assertEqual(err.getvalue(), "WARNING: a\n")
+        self.assertEqual(merged.outcomes, [quiet, first, second])
+
+    def test_rejects_non_positive(self) -> None:
+        import io
+        from contextlib import redirect_stderr
+        from xlsx_check_rules.cli import build_parser
+        for bad in ("0", "-1", "two"):
+            with self.subTest(value=bad), redirect_stderr(io.StringIO()), \
+                    self.assertRaises(SystemExit):
+                build_parser().parse_args(["in.xlsx", "--rules", "r.json",
+                                           "--workers", bad])
+
+
+class TestBaseline(unittest.TestCase):
+    """`--baseline FILE` MUST reproduce the full-run envelope after any
+    edit, re-evaluating only rules whose footprint changed."""
+
+    def test_smoke(self) -> None:
+        _smoke_import("xlsx_check_rules.baseline")
+
+    def _envelope(self, *argv: str) -> tuple[tuple[int, dict, str], int]:
+        rc, env, err = TestStreamingInput._envelope(self, *argv)
+        env["summary"].pop("aggregate_cache_hits")
+        env["summary"].pop("column_cache_hits")
+        carried = env["summary"].pop("rules_carried", None)
+        # Only a --baseline run reports it; a plain run keeps the
+        # pre-baseline summary shape.
+        self.assertEqual(carried is not None, "--baseline" in argv)
+        return (rc, env, err), carried
+
+    @staticmethod
+    def _edit(wb_path: Path, sheet: str, ref: str, value: Any) -> None:
+        from openpyxl import load_workbook
+        wb = load_workbook(wb_path)
+        wb[sheet][ref] = value
+        wb.save(wb_path)
+
+    def test_parity_after_edits(self) -> None:
+        import json as _json
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestStreamingInput._write_fixture(Path(td))
+            n_rules = len(_json.loads(rules_path.read_text())["rules"])
+            for k, extra in enumerate(((), ("--engine", "columnar"),
+                                       ("--streaming-input",), ("--workers", "3"))):
+                with self.subTest(extra=extra):
+                    baseline = Path(td) / f"baseline-{k}.json"
+                    argv = (str(wb_path), "--rules", str(rules_path), *extra)
+                    first, carried = self._envelope(*argv, "--baseline", str(baseline))
+                    self.assertEqual(carried, 0)
+                    again, carried = self._envelope(*argv, "--baseline", str(baseline))
+                    self.assertEqual(carried, n_rules)
+                    self.assertEqual(again, first)
+                    for sheet, ref, value in (("Data", "C10", f"bad code {k}"),
+                                              ("Lookup", "B3", 1.0 + k),
+                                              ("Data", "A50", 99 + k)):
+                        self._edit(wb_path, sheet, ref, value)
+                        full, _ = self._envelope(*argv)
+                        inc, carried = self._envelope(*argv, "--baseline", str(baseline))
+                        self.assertEqual(inc, full)
+                        self.assertGreater(carried, 0)
+                        self.assertLess(carried, n_rules)
+
+    def test_edit_reruns_only_rules_reading_it(self) -> None:
+        import json as _json
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestColumnarEngine._write_fixture(Path(td))
+            rules = _json.loads(rules_path.read_text())["rules"]
+            baseline = str(Path(td) / "baseline.json")
+            argv = (str(wb_path), "--rules", str(rules_path), "--baseline", baseline)
+            self._envelope(*argv)
+            self._edit(wb_path, "Data", "C10", "bad code")
+            _, carried = self._envelope(*argv)
+            on_code = sum(1 for r in rules if r["scope"] in ("col:Code", "col:C"))
+            self.assertGreater(on_code, 0)
+            self.assertLessEqual(carried, len(rules) - on_code)
+            self.assertGreater(carried, 0)
+
+    def test_option_change_reruns_everything(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestColumnarEngine._write_fixture(Path(td))
+            baseline = str(Path(td) / "baseline.json")
+            argv = (str(wb_path), "--rules", str(rules_path), "--baseline", baseline)
+            self._envelope(*argv)
+            full, _ = self._envelope(str(wb_path), "--rules", str(rules_path),
+                                     "--visible-only")
+            inc, carried = self._envelope(*argv, "--visible-only")
+            self.assertEqual(carried, 0)
+            self.assertEqual(inc, full)
+
+    def test_unreadable_baseline_falls_back_to_full_run(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestColumnarEngine._write_fixture(Path(td))
+            baseline = Path(td) / "baseline.json"
+            baseline.write_text("{not json")
+            argv = (str(wb_path), "--rules", str(rules_path))
+            (rc, env, err), carried = self._envelope(*argv, "--baseline", str(baseline))
+            self.assertEqual(carried, 0)
+            self.assertIn("--baseline baseline.json ignored", err)
+            full, _ = self._envelope(*argv)
+            self.assertEqual((rc, env), full[:2])
+            _, carried = self._envelope(*argv, "--baseline", str(baseline))
+            self.assertGreater(carried, 0)
+
+    def test_timeout_leaves_baseline_untouched(self) -> None:
+        from unittest import mock
+        from xlsx_check_rules.baseline import Baseline
+        with tempfile.TemporaryDirectory() as td:
+            wb_path, rules_path = TestColumnarEngine._write_fixture(Path(td))
+            baseline = Path(td) / "baseline.json"
+            argv = (str(wb_path), "--rules", str(rules_path), "--baseline", str(baseline))
+            self._envelope(*argv)
+            before = baseline.read_bytes()
+            with mock.patch("xlsx_check_rules.cli._install_watchdog",
+                            lambda _secs, flag: flag.trip()), \
+                    mock.patch.object(Baseline, "write") as write:
+                (rc, _, _), _ = self._envelope(*argv)
+            self.assertEqual(rc, 7)
+            write.assert_not_called()
+            self.assertEqual(baseline.read_bytes(), before)
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
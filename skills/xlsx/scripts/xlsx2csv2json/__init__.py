@@ -125,6 +125,8 @@ _KWARG_TO_FLAG = {
     "encoding": "--encoding",
     # xlsx-8a-11 (R13): openpyxl streaming-mode opt-in.
     "memory_mode": "--memory-mode",
+    # F7: per-sheet process pool (CSV --output-dir only).
+    "jobs": "--jobs",
 }
 _BOOL_KWARG_TO_FLAG = {
     "include_hidden": "--include-hidden",
@@ -173,6 +173,19 @@ def _delimiter_type(value: str) -> str:
     )
 
 
+def _jobs_type(value: str) -> int:
+    """Argparse `type=` callable for `--jobs`: a positive integer."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(
+            f"--jobs must be a positive integer; got {value!r}"
+        )
+    return n
+
+
 def build_parser(*, format_lock: str | None) -> argparse.ArgumentParser:
     """Construct the argparse surface.
 
@@ -426,6 +439,20 @@ def build_parser(*, format_lock: str | None) -> argparse.ArgumentParser:
         ),
     )
 
+    # F7 — per-sheet process pool (multi-file CSV only).
+    parser.add_argument(
+        "--jobs",
+        metavar="N",
+        type=_jobs_type,
+        default=1,
+        help=(
+            "Convert sheets in N worker processes (default: 1 = "
+            "serial). Only effective for CSV with --output-dir and "
+            "more than one selected sheet; output files and stderr "
+            "warnings are byte-identical to the serial run."
+        ),
+    )
+
     # Cross-5 envelope flag (4-skill replicated helper).
     _errors.add_json_errors_argument(parser)
 
@@ -537,6 +564,17 @@ def _validate_flag_combo(args: argparse.Namespace, *, format_lock: str | None) -
             file=sys.stderr,
         )
 
+    # F7: `--jobs` fans sheets out to per-sheet output subdirectories;
+    # single-stream outputs (JSON, one CSV file/stdout) stay serial.
+    if args.jobs > 1 and (
+        effective_format != "csv" or args.output_dir is None
+    ):
+        print(
+            "warning: --jobs has no effect without CSV --output-dir "
+            "(single-stream output is written serially).",
+            file=sys.stderr,
+        )
+
 
 # ===========================================================================
 # Path resolution (010-02)
@@ -846,18 +884,51 @@ def _dispatch_to_emit(
         args.hyperlink_scheme_allowlist
     )
 
+    # F7 (`--jobs N`): the parent only enumerates sheets — the stream
+    # engine reads `workbook.xml` and nothing else — while each pool
+    # worker opens its own reader. Same `open_workbook` call site either
+    # way, so open-time warnings are reported identically.
+    jobs = args.jobs if (
+        effective_format == "csv" and output_dir is not None
+        and args.sheet == "all"
+    ) else 1
+    # The serial path stays on openpyxl: `read_only_mode` (from
+    # `--memory-mode`) is what bounds reader memory there. With
+    # `full` / `auto` below the size threshold the whole workbook is
+    # loaded, whatever the emitters below do.
+    if jobs > 1:
+        from . import parallel
+        open_kwargs: dict[str, Any] = {"engine": "stream"}
+    else:
+        open_kwargs = {"read_only_mode": read_only_mode}
+
     with warnings.catch_warnings(record=True) as captured:
         warnings.simplefilter("always")
         with open_workbook(
             input_path,
             keep_formulas=args.include_formulas,
-            read_only_mode=read_only_mode,
+            **open_kwargs,
         ) as reader:
+            # `stream=True`: tables are pulled through
+            # `WorkbookReader.iter_table`, so both emitters hold one
+            # row at a time (O(row width) on multi-million-row sheets).
+            # Peak RSS only follows when the reader streams too.
+            # The generator is lazy — unused on the `--jobs` path.
             payloads = dispatch.iter_table_payloads(
                 args, reader, format=effective_format,
                 hyperlink_scheme_allowlist=scheme_allowlist,
+                stream=True,
             )
-            if effective_format == "json":
+            if jobs > 1:
+                rc = parallel.emit_csv_parallel(
+                    args, reader,
+                    jobs=jobs,
+                    open_kwargs=parallel.worker_open_kwargs(
+                        input_path, read_only_mode,
+                    ),
+                    scheme_allowlist=scheme_allowlist,
+                )
+            elif effective_format == "json":
                 rc = emit_json.emit_json(
                     payloads,
                     output=output_path,
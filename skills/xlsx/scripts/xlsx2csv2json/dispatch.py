@@ -6,6 +6,8 @@ Drives the xlsx-10.A :mod:`xlsx_read` foundation library. Responsibilities:
   enumerate sheets per ``--sheet`` selector, detect regions per
   ``--tables`` mode (with the 4→3 enum mapping for ``gap``), iterate
   per region, yield ``(sheet_name, region, table_data, hyperlinks_map)``.
+  With ``stream=True`` the ``table_data`` is a :class:`_StreamedTable`
+  backed by ``WorkbookReader.iter_table`` (rows produced lazily).
 * :func:`_resolve_tables_mode` — maps the shim's 4-valued ``--tables``
   enum to the library's 3-valued :data:`xlsx_read.TableDetectMode`
   plus a region-source post-filter (D-A2).
@@ -176,43 +178,100 @@ def _extract_hyperlinks_for_region(
     return result
 
 
-def iter_table_payloads(
+class _StreamedTable:
+    """Lazy ``TableData`` stand-in over ``WorkbookReader.iter_table``.
+
+    Exposes the attributes the emitters read (``region``, ``headers``,
+    ``rows``, ``warnings``) plus ``header_band`` — the number of region
+    rows consumed by the header, which the emitters otherwise derive
+    from ``len(rows)``. Nothing is read from the workbook until the
+    first attribute access, so ``list(payloads)`` stays cheap; ``rows``
+    is a one-shot iterator and must be consumed exactly once.
+
+    Library warnings are re-emitted via ``warnings.warn`` (H2): the
+    header-phase ones when the header is first resolved, the cell-level
+    ones once ``rows`` is exhausted.
+    """
+
+    def __init__(self, table_iter: Iterator[Any], *, leaf_mode: bool) -> None:
+        self._iter = table_iter
+        self._leaf_mode = leaf_mode
+        self._head: Any = None
+        self._headers: list[str] = []
+        self._n_warned = 0
+
+    def _start(self) -> Any:
+        if self._head is None:
+            self._head = next(self._iter)
+            self._headers = list(self._head.headers)
+            if self._leaf_mode and self._headers:
+                self._headers = [_keys_leaf_only(h) for h in self._headers]
+            self._flush_warnings()
+        return self._head
+
+    def _flush_warnings(self) -> None:
+        pending = self._head.warnings[self._n_warned:]
+        self._n_warned += len(pending)
+        for msg in pending:
+            warnings.warn(msg, UserWarning, stacklevel=3)
+
+    @property
+    def region(self) -> Any:
+        return self._start().region
+
+    @property
+    def headers(self) -> list[str]:
+        self._start()
+        return self._headers
+
+    @property
+    def header_band(self) -> int:
+        return len(self._start().rows)
+
+    @property
+    def warnings(self) -> list[str]:
+        return self._start().warnings
+
+    @property
+    def rows(self) -> Iterator[list[Any]]:
+        self._start()
+        return self._drain()
+
+    def _drain(self) -> Iterator[list[Any]]:
+        yield from self._iter
+        self._flush_warnings()
+
+
+def _select_sheets(
     args: Any,
     reader: Any,
     *,
-    format: str | None = None,
-    hyperlink_scheme_allowlist: frozenset[str] | None = None,
-) -> Iterator[tuple[str, Any, Any, dict[tuple[int, int], str] | None]]:
-    """Yield ``(sheet_name, region, table_data, hyperlinks_map)`` per region.
+    is_csv: bool,
+    csv_multi_file: bool,
+    only_sheet: str | None = None,
+) -> list[Any]:
+    """Resolve ``--sheet`` / ``--include-hidden`` to ``SheetInfo`` objects.
 
-    The 4-tuple shape preserves doc-order. ``hyperlinks_map`` is
-    ``None`` unless ``args.include_hyperlinks`` is set; when set, the
-    map is keyed by ``(row_offset_within_region, col_offset_within_region)``
-    so the emitter can reconstruct the dict-shape / markdown-link
-    cells without re-reading openpyxl.
+    Shared by :func:`iter_table_payloads` and the ``--jobs`` pool in
+    :mod:`parallel` (which fans the selected sheets out to workers).
 
-    Pre-flight invariants raised here (post sheet enumeration):
-
-    * :class:`MultiSheetRequiresOutputDir` — ``--sheet all`` ∧ CSV ∧
-      no ``--output-dir`` ∧ > 1 visible sheet.
-    * :class:`MultiTableRequiresOutputDir` — CSV ∧
-      ``--tables != whole`` ∧ no ``--output-dir`` ∧ ≥ 1 sheet produces
-      > 1 region.
+    ``only_sheet`` is the exact sheet name a ``--jobs`` worker was
+    handed. It bypasses ``args.sheet`` entirely — a sheet literally
+    named ``all`` must not be read as the all-sheets sentinel.
 
-    Pre-flight path-component validation (D-A8 first-line defence):
-    when the eventual layout will be a CSV subdirectory, every
-    sheet / table name is passed through
-    :func:`_validate_sheet_path_components` BEFORE yielding.
+    Raises:
+        SheetNotFound: explicit ``--sheet NAME`` does not exist.
+        MultiSheetRequiresOutputDir: CSV ∧ ``--sheet all`` ∧ no
+            ``--output-dir`` ∧ > 1 visible sheet.
     """
     from xlsx_read import SheetNotFound
 
-    library_mode, post_filter = _resolve_tables_mode(args.tables)
-    is_csv = (format == "csv")
-    csv_multi_file = is_csv and (args.output_dir is not None)
-
-    # Sheet selection.
     sheet_infos = reader.sheets()
-    if args.sheet == "all":
+    if only_sheet is not None:
+        selected = [s for s in sheet_infos if s.name == only_sheet]
+        if not selected:
+            raise SheetNotFound(only_sheet)
+    elif args.sheet == "all":
         selected = [
             s for s in sheet_infos
             if args.include_hidden or s.state == "visible"
@@ -236,6 +295,57 @@ def iter_table_payloads(
             # honour the explicit name (the hidden filter is for "all").
             pass
         selected = matching
+    return selected
+
+
+def iter_table_payloads(
+    args: Any,
+    reader: Any,
+    *,
+    format: str | None = None,
+    hyperlink_scheme_allowlist: frozenset[str] | None = None,
+    stream: bool = False,
+    only_sheet: str | None = None,
+) -> Iterator[tuple[str, Any, Any, dict[tuple[int, int], str] | None]]:
+    """Yield ``(sheet_name, region, table_data, hyperlinks_map)`` per region.
+
+    The 4-tuple shape preserves doc-order. ``hyperlinks_map`` is
+    ``None`` unless ``args.include_hyperlinks`` is set; when set, the
+    map is keyed by ``(row_offset_within_region, col_offset_within_region)``
+    so the emitter can reconstruct the dict-shape / markdown-link
+    cells without re-reading openpyxl.
+
+    Pre-flight invariants raised here (post sheet enumeration):
+
+    * :class:`MultiSheetRequiresOutputDir` — ``--sheet all`` ∧ CSV ∧
+      no ``--output-dir`` ∧ > 1 visible sheet.
+    * :class:`MultiTableRequiresOutputDir` — CSV ∧
+      ``--tables != whole`` ∧ no ``--output-dir`` ∧ ≥ 1 sheet produces
+      > 1 region.
+
+    Pre-flight path-component validation (D-A8 first-line defence):
+    when the eventual layout will be a CSV subdirectory, every
+    sheet / table name is passed through
+    :func:`_validate_sheet_path_components` BEFORE yielding.
+
+    ``stream=True`` swaps ``reader.read_table`` for
+    ``reader.iter_table``: each ``table_data`` is a
+    :class:`_StreamedTable` whose ``rows`` is a one-shot iterator, so
+    the emitters hold one row at a time instead of the whole region.
+    The hyperlink map (if requested) is still built eagerly — it is
+    O(hyperlinked cells), not O(region).
+
+    ``only_sheet`` restricts the run to that one sheet name regardless
+    of ``args.sheet`` (see :func:`_select_sheets`).
+    """
+    library_mode, post_filter = _resolve_tables_mode(args.tables)
+    is_csv = (format == "csv")
+    csv_multi_file = is_csv and (args.output_dir is not None)
+
+    selected = _select_sheets(
+        args, reader, is_csv=is_csv, csv_multi_file=csv_multi_file,
+        only_sheet=only_sheet,
+    )
 
     # Resolve header_rows for `read_table`. `1` (default), `"auto"`,
     # `"leaf"`, and `"smart"` are all legal CLI values; `int` other
@@ -288,14 +398,27 @@ def iter_table_payloads(
             # with URL; we always read text via `include_hyperlinks
             # =False` and do a parallel hyperlink pass when the user
             # asked for them.
-            table_data = reader.read_table(
-                region,
-                header_rows=header_rows_arg,
-                merge_policy=args.merge_policy,
-                include_hyperlinks=False,
-                include_formulas=args.include_formulas,
-                datetime_format=args.datetime_format,
-            )
+            if stream:
+                table_data: Any = _StreamedTable(
+                    reader.iter_table(
+                        region,
+                        header_rows=header_rows_arg,
+                        merge_policy=args.merge_policy,
+                        include_hyperlinks=False,
+                        include_formulas=args.include_formulas,
+                        datetime_format=args.datetime_format,
+                    ),
+                    leaf_mode=leaf_mode,
+                )
+            else:
+                table_data = reader.read_table(
+                    region,
+                    header_rows=header_rows_arg,
+                    merge_policy=args.merge_policy,
+                    include_hyperlinks=False,
+                    include_formulas=args.include_formulas,
+                    datetime_format=args.datetime_format,
+                )
 
             hyperlinks_map: dict[tuple[int, int], str] | None = None
             if args.include_hyperlinks:
@@ -304,6 +427,12 @@ def iter_table_payloads(
                     scheme_allowlist=hyperlink_scheme_allowlist,
                 )
 
+            if stream:
+                # Warnings and `leaf` header trimming are handled by
+                # `_StreamedTable` as the emitter pulls the table.
+                yield (sheet_name, region, table_data, hyperlinks_map)
+                continue
+
             # H2 (vdd-multi): the library appends soft warnings to
             # `TableData.warnings` (list[str]) without calling
             # `warnings.warn`. Re-emit them here so the shim's outer
@@ -326,6 +455,23 @@ def iter_table_payloads(
             yield (sheet_name, region, table_data, hyperlinks_map)
 
 
+def _header_band(table_data: Any) -> int:
+    """Number of region rows consumed by the header of ``table_data``.
+
+    Hyperlink maps are keyed by region-relative row, so the emitters
+    translate data-row index ``r`` to ``header_band + r``. A
+    :class:`_StreamedTable` knows the band up front; for a
+    materialised ``TableData`` it is inferred as
+    ``total region rows - len(rows)`` (the library does not expose it).
+    """
+    band = getattr(table_data, "header_band", None)
+    if band is not None:
+        return band
+    region = table_data.region
+    total_rows = region.bottom_row - region.top_row + 1
+    return total_rows - len(table_data.rows)
+
+
 def _keys_leaf_only(header: str, separator: str = " › ") -> str:
     """Return only the deepest (last) segment of a `separator`-joined
     multi-level header key. Used by `--header-rows leaf` to discard
@@ -25,6 +25,7 @@ import sys
 from pathlib import Path
 from typing import Any, Iterator
 
+from .dispatch import _header_band
 from .exceptions import (
     CollisionSuffixExhausted,
     MultiTableRequiresOutputDir,
@@ -258,6 +259,9 @@ def _write_region_csv(
 ) -> None:
     """Common writer body — emit header row + data rows.
 
+    Memory is O(row width): ``table_data.rows`` is iterated once, so a
+    streamed table is written without ever materialising the region.
+
     xlsx-8a-04 (R4): ``escape_formulas`` applies the OWASP
     CSV-injection defang to both header and data cells (a header
     cell ``="Total"`` is identical in attack surface to a data
@@ -270,17 +274,18 @@ def _write_region_csv(
         fp, quoting=csv.QUOTE_MINIMAL, lineterminator="\n", delimiter=delimiter,
     )
     headers = list(table_data.headers)
+    n_cols = len(headers)
     if escape_formulas != "off":
         headers = [_apply_formula_escape(h, escape_formulas) for h in headers]
     writer.writerow(headers)
 
-    region = table_data.region
-    total_rows = region.bottom_row - region.top_row + 1
-    header_band = total_rows - len(table_data.rows)
+    # Rows are consumed exactly once and never indexed — a streamed
+    # table (`dispatch._StreamedTable`) hands out a one-shot iterator.
+    header_band = _header_band(table_data)
 
     for r_idx, row in enumerate(table_data.rows):
         out_row: list[Any] = []
-        for c_idx in range(len(table_data.headers)):
+        for c_idx in range(n_cols):
             value = row[c_idx] if c_idx < len(row) else None
             if include_hyperlinks and hl_map is not None:
                 href = hl_map.get((header_band + r_idx, c_idx))
@@ -29,7 +29,9 @@ import datetime as _dt
 import json
 import sys
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
+
+from .dispatch import _header_band
 
 _HEADER_SEPARATOR = " › "  # ' › '
 
@@ -94,6 +96,7 @@ def emit_json(
         header_flatten_style=header_flatten_style,
         include_hyperlinks=include_hyperlinks,
         drop_empty_rows=drop_empty_rows,
+        lazy_rows=True,
     )
 
     # **xlsx-8a-08 (R10, D-A18)** — R11.1 single-sheet single-region
@@ -110,34 +113,63 @@ def emit_json(
             drop_empty_rows=drop_empty_rows,
         )
 
+    # R11.2-4 shapes: the dict skeleton (sheet / region keys) is built
+    # eagerly but every row-list is a lazy iterator, written one row
+    # at a time by `_write_json_streaming` — O(row width) memory on
+    # streamed tables. Byte-identical to `json.dump(shape, indent=2)`.
     if output is None:
-        # Stdout path: build the string then write. Pipe consumers
-        # buffer the output downstream anyway, so the memory benefit
-        # of streaming-to-pipe is downstream-dependent — keep the
-        # existing newline contract here. (D-A17 asymmetric.)
-        text = json.dumps(
-            shape,
-            ensure_ascii=False, indent=2, sort_keys=False,
-            default=_json_default,
-        )
-        sys.stdout.write(text + "\n")
+        _write_json_streaming(sys.stdout, shape)
+        sys.stdout.write("\n")
     else:
-        # **xlsx-8a-07 (R9, PERF-HIGH-2 partial)**: stream-serialise
-        # directly to the file descriptor. Drops the intermediate
-        # `text = json.dumps(...)` string buffer (~300-500 MB on a
-        # 3M-cell payload). The `shape` dict itself remains in RAM
-        # for R11.2-4 shapes — full closure of PERF-HIGH-2 for
-        # R11.1 single-region is the 011-08 streaming refactor.
         with output.open("w", encoding="utf-8") as fp:
-            json.dump(
-                shape, fp,
-                ensure_ascii=False, indent=2, sort_keys=False,
-                default=_json_default,
-            )
+            _write_json_streaming(fp, shape)
             fp.write("\n")
     return 0
 
 
+def _write_json_streaming(fp: Any, value: Any, depth: int = 0) -> None:
+    """Serialise ``value`` to ``fp`` exactly as ``json.dump(indent=2)``.
+
+    Dicts recurse; iterators (the lazy row-lists produced by
+    :func:`_shape_for_payloads` with ``lazy_rows=True``) are drained
+    item by item, each item dumped on its own and re-indented to
+    ``depth + 1`` — the same technique as
+    :func:`_stream_single_region_json`. Plain values (including
+    materialised lists) go through ``json.dumps`` directly.
+    """
+    pad = "\n" + "  " * (depth + 1)
+    if isinstance(value, dict):
+        if not value:
+            fp.write("{}")
+            return
+        fp.write("{")
+        sep = pad
+        for key, item in value.items():
+            fp.write(sep)
+            fp.write(json.dumps(key, ensure_ascii=False))
+            fp.write(": ")
+            _write_json_streaming(fp, item, depth + 1)
+            sep = "," + pad
+        fp.write("\n" + "  " * depth + "}")
+        return
+    if isinstance(value, Iterator):
+        sep = "[" + pad
+        for item in value:
+            fp.write(sep)
+            fp.write(json.dumps(
+                item, ensure_ascii=False, indent=2, default=_json_default,
+            ).replace("\n", pad))
+            sep = "," + pad
+        if sep.startswith("["):
+            fp.write("[]")
+        else:
+            fp.write("\n" + "  " * depth + "]")
+        return
+    fp.write(json.dumps(
+        value, ensure_ascii=False, indent=2, default=_json_default,
+    ).replace("\n", "\n" + "  " * depth))
+
+
 def _shape_for_payloads(
     payloads_list: list[tuple[str, Any, Any, dict[tuple[int, int], str] | None]],
     *,
@@ -146,6 +178,7 @@ def _shape_for_payloads(
     header_flatten_style: str,
     include_hyperlinks: bool,
     drop_empty_rows: bool = False,
+    lazy_rows: bool = False,
 ) -> Any:
     """Pure function — build the JSON shape from payloads.
 
@@ -158,10 +191,16 @@ def _shape_for_payloads(
     full row-list. R11.2-4 branches still build the dict-shape
     eagerly (the dict-of-arrays shapes cannot be RFC-8259-streamed
     without a non-canonical chunked-encoding contract).
+
+    ``lazy_rows=True`` leaves each row-list as the iterator returned by
+    :func:`_rows_to_dicts` instead of wrapping it in ``list(...)``;
+    :func:`_write_json_streaming` then drains them in document order.
     """
     if not payloads_list:
         return []
 
+    materialise = _identity if lazy_rows else list
+
     # Group by sheet, preserving doc-order via dict insertion.
     by_sheet: dict[str, list[tuple[Any, Any, Any]]] = {}
     for sheet_name, region, table_data, hl_map in payloads_list:
@@ -182,7 +221,7 @@ def _shape_for_payloads(
             # JSON-serialisable shape (json.dump cannot serialise
             # generators).
             return {
-                _region_key(r): list(_rows_to_dicts(
+                _region_key(r): materialise(_rows_to_dicts(
                     td, hl, header_flatten_style,
                     include_hyperlinks, drop_empty_rows,
                 ))
@@ -201,7 +240,7 @@ def _shape_for_payloads(
             # Rule 3 per-sheet: {"tables": {Name: [...], ...}}.
             out[sheet_name] = {
                 "tables": {
-                    _region_key(r): list(_rows_to_dicts(
+                    _region_key(r): materialise(_rows_to_dicts(
                         td, hl, header_flatten_style,
                         include_hyperlinks, drop_empty_rows,
                     ))
@@ -211,13 +250,17 @@ def _shape_for_payloads(
         else:
             # Rule 2 per-sheet: flat [...]
             r, td, hl = regions[0]
-            out[sheet_name] = list(_rows_to_dicts(
+            out[sheet_name] = materialise(_rows_to_dicts(
                 td, hl, header_flatten_style,
                 include_hyperlinks, drop_empty_rows,
             ))
     return out
 
 
+def _identity(rows: Any) -> Any:
+    return rows
+
+
 def _region_key(region: Any) -> str:
     """Map a ``TableRegion`` to its dict-key.
 
@@ -245,27 +288,26 @@ def _rows_to_dicts(
     ``hl_map`` is keyed by ``(row_offset_within_region, col_offset_within_region)``
     where row 0 is the FIRST row of the region (which may be a header
     row). We translate to ``(data_row_index, col_offset)`` here.
+
+    A generator: ``table_data`` is not touched until the first row is
+    pulled, so a lazy shape over many streamed tables keeps at most
+    one region's reader open at a time.
     """
     headers = list(table_data.headers)
-    rows = list(table_data.rows)
-
-    # Header band length within the region is the number of rows
-    # consumed before data rows started. For ListObject regions with
-    # synthetic headers (headerRowCount=0), no rows were consumed; for
-    # regular regions, the library consumed `len(headers_band)` rows.
-    # The library does not expose this directly, but we can infer:
-    # total region rows = bottom_row - top_row + 1; data rows = len(rows).
-    # So header band = total - data_rows.
-    region = table_data.region
-    total_rows = region.bottom_row - region.top_row + 1
-    header_band = total_rows - len(rows)
+    # Header band = region rows consumed before data rows started (0
+    # for synthetic headers). Read BEFORE touching `rows`: for a
+    # materialised `TableData` it is inferred from `len(rows)`, for a
+    # streamed table `rows` is a one-shot iterator.
+    header_band = _header_band(table_data)
+    rows = table_data.rows
 
     if header_flatten_style == "array":
-        return _rows_to_array_style(
+        yield from _rows_to_array_style(
             headers, rows, hl_map, header_band, include_hyperlinks,
             drop_empty_rows=drop_empty_rows,
         )
-    return _rows_to_string_style(
+        return
+    yield from _rows_to_string_style(
         headers, rows, hl_map, header_band, include_hyperlinks,
         drop_empty_rows=drop_empty_rows,
     )
@@ -273,7 +315,7 @@ def _rows_to_dicts(
 
 def _rows_to_string_style(
     headers: list[str],
-    rows: list[list[Any]],
+    rows: Iterable[list[Any]],
     hl_map: dict[tuple[int, int], str] | None,
     header_band: int,
     include_hyperlinks: bool,
@@ -355,7 +397,7 @@ def _disambiguate_duplicate_headers(headers: list[str]) -> list[str]:
 
 def _rows_to_array_style(
     headers: list[str],
-    rows: list[list[Any]],
+    rows: Iterable[list[Any]],
     hl_map: dict[tuple[int, int], str] | None,
     header_band: int,
     include_hyperlinks: bool,
@@ -0,0 +1,187 @@
+"""F7 — ``--jobs N``: per-sheet process pool for multi-file CSV.
+
+Only the ``--output-dir`` CSV layout is parallelised: every sheet
+writes its own ``<sheet>/<table>.csv`` subtree, so workers never
+share an output handle. The parent enumerates sheets (cheap — the
+``"stream"`` engine reads ``workbook.xml`` only), then hands one
+sheet per task to a :class:`~concurrent.futures.ProcessPoolExecutor`.
+Each worker opens its **own** reader and runs the unchanged serial
+path (:func:`dispatch.iter_table_payloads` → :func:`emit_csv.emit_csv`)
+restricted to that sheet.
+
+Byte-identity with the serial run:
+
+* Output files — identical by construction (same code, same sheet).
+* Warnings — the serial run collects every payload before emitting
+  (``emit_csv`` ``list()``s its input), so its stderr is *all*
+  collect-phase warnings in sheet order, then *all* emit-phase
+  warnings in sheet order. Workers record the two phases separately;
+  the parent replays them in that order via
+  :func:`warnings.warn_explicit` (original filename / lineno kept),
+  into the CLI's ``catch_warnings`` block.
+* Errors — the serial run raises the first collect-phase error in
+  sheet order before writing anything, else the first emit-phase
+  error. The parent re-raises the same exception. **Honest scope:**
+  sibling workers have already run by then, so other sheets'
+  subdirectories may exist on disk next to the failure envelope
+  (serial would have stopped earlier).
+
+Worker reader choice: where the serial run would load openpyxl in
+full mode, workers use ``engine="stream"`` instead — the ``TableData``
+is identical and each worker then parses only its own sheet, rather
+than N workers each materialising the whole workbook. Where the
+serial run streams (``read_only_mode=True``, or auto above the size
+threshold) workers do the same, so merge-blind semantics match.
+"""
+from __future__ import annotations
+
+import argparse
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# (message, category, filename, lineno) — `WarningMessage` itself
+# carries an arbitrary `source` object, so ship the printable fields.
+_WarningRecord = tuple[str, type, str, int]
+
+
+@dataclass
+class _SheetResult:
+    """What one worker sends back for one sheet."""
+
+    rc: int = 0
+    collect_warnings: list[_WarningRecord] = field(default_factory=list)
+    emit_warnings: list[_WarningRecord] = field(default_factory=list)
+    collect_error: BaseException | None = None
+    emit_error: BaseException | None = None
+
+
+def worker_open_kwargs(input_path: Path, read_only_mode: bool | None) -> dict[str, Any]:
+    """``open_workbook`` kwargs a worker should use (see module doc)."""
+    from xlsx_read import open_workbook
+
+    if read_only_mode is None:
+        threshold = open_workbook.__kwdefaults__["size_threshold_bytes"]
+        read_only_mode = input_path.stat().st_size > threshold
+    if read_only_mode:
+        return {"read_only_mode": True}
+    return {"engine": "stream"}
+
+
+def _records(captured: list) -> list[_WarningRecord]:
+    return [
+        (str(w.message), w.category, w.filename, w.lineno) for w in captured
+    ]
+
+
+def _convert_sheet(
+    args: argparse.Namespace,
+    sheet_name: str,
+    open_kwargs: dict[str, Any],
+    scheme_allowlist: frozenset[str],
+) -> _SheetResult:
+    """Pool task: convert one sheet exactly as the serial path would."""
+    from xlsx_read import open_workbook
+    from . import dispatch, emit_csv
+
+    result = _SheetResult()
+
+    # Open-time warnings (MacroEnabledWarning) were already surfaced
+    # by the parent's own open — drop the per-worker duplicates.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        reader = open_workbook(
+            args._resolved_input,  # noqa: SLF001
+            keep_formulas=args.include_formulas,
+            **open_kwargs,
+        )
+    with reader:
+        with warnings.catch_warnings(record=True) as captured:
+            warnings.simplefilter("always")
+            try:
+                payloads = list(dispatch.iter_table_payloads(
+                    args, reader, format="csv",
+                    hyperlink_scheme_allowlist=scheme_allowlist,
+                    stream=True, only_sheet=sheet_name,
+                ))
+            except Exception as exc:  # noqa: BLE001 — re-raised by parent
+                result.collect_error = exc
+        result.collect_warnings = _records(captured)
+        if result.collect_error is not None:
+            return result
+
+        with warnings.catch_warnings(record=True) as captured:
+            warnings.simplefilter("always")
+            try:
+                result.rc = emit_csv.emit_csv(
+                    payloads,
+                    output=args._resolved_output,  # noqa: SLF001
+                    output_dir=args._resolved_output_dir,  # noqa: SLF001
+                    sheet_selector=args.sheet,
+                    tables_mode=args.tables,
+                    include_hyperlinks=args.include_hyperlinks,
+                    datetime_format=args.datetime_format,
+                    encoding=args.encoding,
+                    delimiter=args.delimiter,
+                    drop_empty_rows=args.drop_empty_rows,
+                    escape_formulas=args.escape_formulas,
+                )
+            except Exception as exc:  # noqa: BLE001 — re-raised by parent
+                result.emit_error = exc
+        result.emit_warnings = _records(captured)
+    return result
+
+
+def emit_csv_parallel(
+    args: argparse.Namespace,
+    reader: Any,
+    *,
+    jobs: int,
+    open_kwargs: dict[str, Any],
+    scheme_allowlist: frozenset[str],
+) -> int:
+    """Fan the selected sheets out to ``jobs`` processes; merge results.
+
+    ``reader`` is the parent's (metadata-only) reader, used for sheet
+    selection so the pre-flight raises match the serial path. Worker
+    warnings are replayed into the caller's ``catch_warnings`` block.
+    Returns the first non-zero worker rc, else 0.
+    """
+    from . import dispatch
+
+    selected = dispatch._select_sheets(  # noqa: SLF001
+        args, reader, is_csv=True, csv_multi_file=True,
+    )
+    names = [s.name for s in selected]
+    if not names:
+        return 0
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(names))) as pool:
+        results = list(pool.map(
+            _convert_sheet,
+            [args] * len(names),
+            names,
+            [open_kwargs] * len(names),
+            [scheme_allowlist] * len(names),
+        ))
+
+    return _merge_results(results)
+
+
+def _merge_results(results: list[_SheetResult]) -> int:
+    """Replay worker warnings / errors in the serial run's order."""
+    for res in results:
+        if res.collect_error is not None:
+            raise res.collect_error
+    for res in results:
+        for message, category, filename, lineno in res.collect_warnings:
+            warnings.warn_explicit(message, category, filename, lineno)
+    for res in results:
+        if res.emit_error is not None:
+            raise res.emit_error
+    for res in results:
+        for message, category, filename, lineno in res.emit_warnings:
+            warnings.warn_explicit(message, category, filename, lineno)
+    return next((res.rc for res in results if res.rc), 0)
@@ -410,5 +410,121 @@ class TestParseSchemeAllowlist(unittest.TestCase):
         )
 
 
+# ===========================================================================
+# stream=True — `_StreamedTable` over `WorkbookReader.iter_table`
+# ===========================================================================
+class TestStreamedPayloads(unittest.TestCase):
+    """`iter_table_payloads(stream=True)` emits byte-identical output.
+
+    The workbook is synthesised in a temp dir (fixtures are not
+    required): a merged two-level header, a hyperlink, and a second
+    gap-separated table so the multi-region emit paths are covered.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        import tempfile
+
+        import openpyxl
+
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "stream.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Data"
+        ws["A1"] = "Plan"
+        ws.merge_cells("A1:B1")
+        ws["C1"] = "Link"
+        ws.append(["id", "name", "url"])
+        for i in range(3, 30):
+            ws.append([i, f"n{i}", "go"])
+        ws["C5"].hyperlink = "https://example.com/5"
+        ws.merge_cells("B8:B9")
+        ws["A40"] = "k"
+        ws["B40"] = "v"
+        ws["A41"] = 1
+        ws["B41"] = "=1+1"
+        wb.create_sheet("Other").append(["x"])
+        wb.save(cls.path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
+
+    def _emit(self, fmt: str, stream: bool, out_dir: Path, **overrides):
+        from xlsx_read import open_workbook
+        from xlsx2csv2json import dispatch, emit_csv, emit_json
+
+        args = _args(output_dir=out_dir if fmt == "csv" else None, **overrides)
+        with warnings.catch_warnings(record=True) as captured:
+            warnings.simplefilter("always")
+            with open_workbook(self.path) as reader:
+                payloads = dispatch.iter_table_payloads(
+                    args, reader, format=fmt, stream=stream,
+                    hyperlink_scheme_allowlist=frozenset({"https"}),
+                )
+                if fmt == "json":
+                    emit_json.emit_json(
+                        payloads, output=out_dir / "out.json",
+                        sheet_selector=args.sheet, tables_mode=args.tables,
+                        header_flatten_style=args.header_flatten_style,
+                        include_hyperlinks=args.include_hyperlinks,
+                        datetime_format="ISO",
+                    )
+                else:
+                    emit_csv.emit_csv(
+                        payloads, output=None, output_dir=out_dir,
+                        sheet_selector=args.sheet, tables_mode=args.tables,
+                        include_hyperlinks=args.include_hyperlinks,
+                        datetime_format="ISO",
+                    )
+        files = sorted(
+            (str(f.relative_to(out_dir)), f.read_bytes())
+            for f in out_dir.rglob("*") if f.is_file()
+        )
+        return files, sorted(str(w.message) for w in captured)
+
+    def test_byte_identical_to_materialised(self) -> None:
+        import tempfile
+
+        cases = [
+            dict(),
+            dict(tables="gap", header_rows="auto", merge_policy="fill"),
+            dict(tables="auto", header_rows="leaf", include_hyperlinks=True),
+            dict(sheet="Data", header_flatten_style="array",
+                 include_hyperlinks=True),
+        ]
+        for fmt in ("json", "csv"):
+            for overrides in cases:
+                with self.subTest(fmt=fmt, **overrides), \
+                        tempfile.TemporaryDirectory() as a, \
+                        tempfile.TemporaryDirectory() as b:
+                    self.assertEqual(
+                        self._emit(fmt, True, Path(a), **overrides),
+                        self._emit(fmt, False, Path(b), **overrides),
+                    )
+
+    def test_streamed_table_is_lazy_and_one_shot(self) -> None:
+        from xlsx_read import open_workbook
+        from xlsx2csv2json.dispatch import (
+            _StreamedTable, _header_band, iter_table_payloads,
+        )
+
+        with open_workbook(self.path) as reader:
+            payloads = list(iter_table_payloads(
+                _args(sheet="Data", header_rows="auto"), reader,
+                format="json", stream=True,
+            ))
+            _, _, table, _ = payloads[0]
+            self.assertIsInstance(table, _StreamedTable)
+            self.assertIsNone(table._head)  # nothing read yet
+            self.assertEqual(table.headers, ["Plan › id", "Plan › name", "Link › url"])
+            self.assertEqual(_header_band(table), 2)
+            rows = table.rows
+            self.assertEqual(next(rows), [3, "n3", "go"])
+            # Whole-sheet region runs to row 41 (the gap table).
+            self.assertEqual(sum(1 for _ in rows), 38)
+
+
 if __name__ == "__main__":
     unittest.main()
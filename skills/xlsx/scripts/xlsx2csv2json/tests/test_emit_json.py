@@ -747,5 +747,57 @@ class TestR10R111Streaming(unittest.TestCase):
         self.assertTrue(hasattr(result, "__next__"))
 
 
+class TestWriteJsonStreaming(unittest.TestCase):
+    """`_write_json_streaming` — lazy row-lists, `json.dump` bytes."""
+
+    def _check(self, lazy, eager) -> None:
+        import io
+
+        from xlsx2csv2json.emit_json import _write_json_streaming
+        buf = io.StringIO()
+        _write_json_streaming(buf, lazy)
+        self.assertEqual(
+            buf.getvalue(),
+            json.dumps(eager, ensure_ascii=False, indent=2),
+        )
+
+    def test_nested_shapes(self) -> None:
+        rows_a = [{"id": 1, "name": "ä"}, {"id": 2, "name": None}]
+        rows_b = [[{"key": ["k"], "value": {"value": "x", "href": "h"}}]]
+        eager = {
+            "S1": rows_a,
+            "S2": {"tables": {"T1": rows_b, "T2": []}},
+            "S3": [],
+        }
+        lazy = {
+            "S1": iter(rows_a),
+            "S2": {"tables": {"T1": iter(rows_b), "T2": iter([])}},
+            "S3": iter([]),
+        }
+        self._check(lazy, eager)
+
+    def test_plain_values(self) -> None:
+        self._check([], [])
+        self._check({}, {})
+        self._check({"k": [1, {"a": [2]}]}, {"k": [1, {"a": [2]}]})
+
+    def test_rows_pulled_lazily(self) -> None:
+        import io
+
+        from xlsx2csv2json.emit_json import _write_json_streaming
+        pulled: list[int] = []
+
+        def rows():
+            for i in range(3):
+                pulled.append(i)
+                yield {"i": i}
+
+        buf = io.StringIO()
+        gen = rows()
+        _write_json_streaming(buf, {"S": gen})
+        self.assertEqual(pulled, [0, 1, 2])
+        self.assertIn('"S": [\n    {\n      "i": 0\n    }', buf.getvalue())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,239 @@
+"""Unit tests for :mod:`xlsx2csv2json.parallel` (F7, ``--jobs N``).
+
+The contract is **byte-identity with the serial run**: the same files
+under ``--output-dir`` and the same stderr. Workbooks are synthesised
+in a temp dir (the ``fixtures/*.xlsx`` set is gitignored).
+"""
+from __future__ import annotations
+
+import io
+import sys
+import tempfile
+import unittest
+import warnings
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[2]
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+
+def _build(path: Path) -> None:
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws["A1"] = "Plan"
+    ws.merge_cells("A1:B1")
+    ws["C1"] = "Link"
+    ws.append(["id", "name", "url"])
+    for i in range(3, 30):
+        ws.append([i, f"n{i}", "go"])
+    ws["C5"].hyperlink = "https://example.com/5"
+    ws["C6"].hyperlink = "javascript:alert(1)"
+    ws.merge_cells("B8:B9")
+    ws["A40"] = "k"
+    ws["B40"] = "v"
+    ws["A41"] = 1
+    ws["B41"] = "=1+1"
+    for n in range(3):
+        other = wb.create_sheet(f"S{n}")
+        other.append(["x", "y"])
+        for i in range(n * 5 + 2):
+            other.append([i, f"=A{i + 2}*2"])
+        other["D1"] = "ftp-link"
+        other["D1"].hyperlink = "ftp://example.com/f"
+    wb.create_sheet("Hidden").sheet_state = "hidden"
+    wb.save(path)
+
+
+def _to_stderr(message, category, filename, lineno, file=None, line=None):
+    sys.stderr.write(
+        warnings.formatwarning(message, category, filename, lineno, line)
+    )
+
+
+def _run(path: Path, out_dir: Path, *extra: str) -> tuple[int, list, str]:
+    """Run the CSV CLI; return ``(rc, files, stderr)``.
+
+    The warnings filter and display hook are pinned here so stderr does
+    not depend on the runner (pytest records warnings instead of
+    printing them, and a ``default`` filter dedups across runs).
+    """
+    from xlsx2csv2json import cli
+
+    buf = io.StringIO()
+    with warnings.catch_warnings(), redirect_stderr(buf):
+        warnings.simplefilter("always")
+        warnings.showwarning = _to_stderr
+        rc = cli.main(
+            [str(path), "--output-dir", str(out_dir), *extra],
+            format_lock="csv",
+        )
+    files = sorted(
+        (str(f.relative_to(out_dir)), f.read_bytes())
+        for f in out_dir.rglob("*") if f.is_file()
+    )
+    return rc, files, buf.getvalue()
+
+
+class TestJobsByteIdentity(unittest.TestCase):
+    """``--jobs 2`` reproduces the serial files and stderr exactly."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "multi.xlsx"
+        _build(cls.path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
+
+    def test_matches_serial(self) -> None:
+        cases = [
+            (),
+            ("--tables", "auto", "--merge-policy", "fill"),
+            ("--include-hyperlinks", "--include-hidden"),
+            ("--include-formulas", "--memory-mode", "streaming"),
+            ("--header-rows", "leaf", "--tables", "gap",
+             "--escape-formulas", "quote", "--delimiter", ";"),
+        ]
+        for extra in cases:
+            with self.subTest(extra=extra), \
+                    tempfile.TemporaryDirectory() as a, \
+                    tempfile.TemporaryDirectory() as b:
+                serial = _run(self.path, Path(a), *extra)
+                pooled = _run(self.path, Path(b), "--jobs", "2", *extra)
+                self.assertEqual(serial[0], 0)
+                self.assertEqual(pooled, serial)
+
+    def test_warning_order_is_serial_order(self) -> None:
+        """Blocked-scheme warnings replay in sheet order."""
+        with tempfile.TemporaryDirectory() as a, \
+                tempfile.TemporaryDirectory() as b:
+            _, _, serial = _run(self.path, Path(a), "--include-hyperlinks")
+            _, _, pooled = _run(
+                self.path, Path(b), "--jobs", "4", "--include-hyperlinks",
+            )
+        lines = [ln for ln in pooled.splitlines() if "disallowed" in ln]
+        self.assertEqual(len(lines), 4)
+        self.assertIn("'javascript'", lines[0])
+        self.assertEqual(pooled, serial)
+
+    def test_sheet_named_all_is_not_the_sentinel(self) -> None:
+        """A worker handed sheet ``all`` converts that sheet only."""
+        import openpyxl
+        from xlsx2csv2json import emit_csv
+        from xlsx2csv2json.cli import build_parser
+        from xlsx2csv2json.parallel import _convert_sheet
+
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "all.xlsx"
+            wb = openpyxl.Workbook()
+            wb.active.title = "all"
+            wb.active.append(["a", 1])
+            for name in ("B", "C"):
+                wb.create_sheet(name).append([name, 2])
+            wb.save(path)
+
+            args = build_parser(format_lock="csv").parse_args(
+                [str(path), "--output-dir", str(Path(td) / "out")],
+            )
+            args._resolved_input = path
+            args._resolved_output = None
+            args._resolved_output_dir = Path(td) / "out"
+            with mock.patch.object(emit_csv, "emit_csv",
+                                   return_value=0) as emit:
+                result = _convert_sheet(
+                    args, "all", {"engine": "stream"}, frozenset(),
+                )
+            self.assertIsNone(result.collect_error)
+            self.assertEqual(
+                [payload[0] for payload in emit.call_args.args[0]], ["all"],
+            )
+
+            # And end to end, the pooled run still matches serial.
+            serial = _run(path, Path(td) / "serial")
+            pooled = _run(path, Path(td) / "pooled", "--jobs", "3")
+        self.assertEqual(serial[0], 0)
+        self.assertEqual(
+            [name for name, _ in serial[1]],
+            ["B/Table-1.csv", "C/Table-1.csv", "all/Table-1.csv"],
+        )
+        self.assertEqual(pooled, serial)
+
+    def test_jobs_ignored_for_json(self) -> None:
+        from xlsx2csv2json import cli
+
+        buf = io.StringIO()
+        with tempfile.TemporaryDirectory() as td, redirect_stderr(buf):
+            rc = cli.main(
+                [str(self.path), str(Path(td) / "o.json"), "--jobs", "2"],
+                format_lock="json",
+            )
+        self.assertEqual(rc, 0)
+        self.assertIn("--jobs has no effect", buf.getvalue())
+
+
+class TestJobsFlag(unittest.TestCase):
+
+    def test_rejects_non_positive(self) -> None:
+        from xlsx2csv2json.cli import build_parser
+
+        parser = build_parser(format_lock="csv")
+        for bad in ("0", "-1", "two"):
+            with self.subTest(value=bad), redirect_stderr(io.StringIO()), \
+                    self.assertRaises(SystemExit):
+                parser.parse_args(["in.xlsx", "--jobs", bad])
+
+    def test_default_is_serial(self) -> None:
+        from xlsx2csv2json.cli import build_parser
+
+        args = build_parser(format_lock="csv").parse_args(["in.xlsx"])
+        self.assertEqual(args.jobs, 1)
+
+
+class TestMergeResults(unittest.TestCase):
+    """Parent-side replay mirrors serial error / warning precedence."""
+
+    def _result(self, **kw):
+        from xlsx2csv2json.parallel import _SheetResult
+        return _SheetResult(**kw)
+
+    def _warn(self, text: str):
+        return (text, UserWarning, "f.py", 1)
+
+    def test_collect_error_wins_over_earlier_emit_error(self) -> None:
+        from xlsx2csv2json.parallel import _merge_results
+
+        results = [
+            self._result(emit_error=OSError("emit 0")),
+            self._result(collect_error=ValueError("collect 1")),
+        ]
+        with self.assertRaisesRegex(ValueError, "collect 1"):
+            _merge_results(results)
+
+    def test_phases_replay_in_order(self) -> None:
+        from xlsx2csv2json.parallel import _merge_results
+
+        results = [
+            self._result(collect_warnings=[self._warn("c0")],
+                         emit_warnings=[self._warn("e0")]),
+            self._result(collect_warnings=[self._warn("c1")],
+                         emit_warnings=[self._warn("e1")], rc=3),
+        ]
+        with warnings.catch_warnings(record=True) as captured:
+            warnings.simplefilter("always")
+            rc = _merge_results(results)
+        self.assertEqual(rc, 3)
+        self.assertEqual(
+            [str(w.message) for w in captured], ["c0", "c1", "e0", "e1"],
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
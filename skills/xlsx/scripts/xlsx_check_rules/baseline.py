@@ -0,0 +1,296 @@
+"""F11-baseline — `--baseline FILE`: re-check only what changed.
+
+A run with `--baseline FILE` writes FILE next to its normal output:
+per-rule findings and summary counts, plus a content fingerprint of
+the workbook —
+
+* workbook digest: sheet names / order / states and defined names;
+* per sheet: a meta digest (bounds, merged ranges, Excel Tables,
+  sheet state), one digest per row and one per column, each over the
+  non-empty cells' value, data type and number format.
+
+The next run with the same FILE fingerprints the workbook again and
+diffs it. A rule is re-evaluated when its *footprint* — every cell it
+reads, from `streaming.rule_footprint`: scope, F8 aggregate scopes,
+group-by keys, `cell:` operands, the header row — touches a changed
+row / column, or a sheet whose meta changed. Everything else (the rule
+text, the rules-file `defaults` and every eval option are keyed too)
+carries its stored outcome forward unchanged. Outcomes merge in rule
+order, so the envelope matches a full run; `column_cache_hits` /
+`aggregate_cache_hits` (cache observability) and `rules_carried`
+differ.
+
+Conservative by construction: a cell edit changes both its row and
+its column digest, and a spot read is dirty only when both are. A
+workbook-level change, an unreadable FILE, or a rule whose footprint
+cannot be planned re-evaluates (everything / that rule). FILE is
+rewritten only after a complete run — never on timeout or a fatal.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .evaluator import Finding
+from .output import _json_default
+from .streaming import StreamingWorksheet, rule_footprint
+
+__all__ = ["Baseline", "fingerprint"]
+
+SCHEMA = "xlsx_check_rules.baseline/1"
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=8).hexdigest()
+
+
+def _cells(ws: Any) -> tuple[Iterator[tuple[int, int, Any]], list[int]]:
+    """Non-empty cells in (row, col) order + a [max_row, max_col] box
+    that is complete once the iterator is exhausted."""
+    bounds = [0, 0]
+    if isinstance(ws, StreamingWorksheet):
+        def gen() -> Iterator[tuple[int, int, Any]]:
+            for r, row in ws.scan():
+                if not row:
+                    continue
+                bounds[0] = r
+                bounds[1] = max(bounds[1], len(row))
+                for c, cell in enumerate(row, start=1):
+                    if cell.value is not None:
+                        yield r, c, cell
+            meta_row, meta_col = ws.meta_bounds
+            bounds[0], bounds[1] = max(bounds[0], meta_row), max(bounds[1], meta_col)
+        return gen(), bounds
+
+    bounds[:] = [ws.max_row, ws.max_column]
+    cells = ws._cells  # noqa: SLF001 — iterate without materialising gaps
+    return ((r, c, cells[(r, c)]) for r, c in sorted(cells)
+            if cells[(r, c)].value is not None), bounds
+
+
+def _sheet_fingerprint(ws: Any) -> dict[str, Any]:
+    rows: dict[str, str] = {}
+    cols: dict[int, Any] = {}
+    current_row, parts = 0, []
+    it, bounds = _cells(ws)
+    for r, c, cell in it:
+        token = f"{c}\x1f{cell.value!r}\x1f{cell.data_type}\x1f{cell.number_format}\x1e"
+        if r != current_row:
+            if parts:
+                rows[str(current_row)] = _digest("".join(parts))
+            current_row, parts = r, []
+        parts.append(token)
+        h = cols.get(c)
+        if h is None:
+            h = cols[c] = hashlib.blake2b(digest_size=8)
+        h.update(f"{r}\x1f{token}".encode("utf-8", "surrogatepass"))
+    if parts:
+        rows[str(current_row)] = _digest("".join(parts))
+    tables = sorted(
+        (t.displayName or t.name, t.ref, tuple(tc.name for tc in (t.tableColumns or ())))
+        for t in ws.tables.values()
+    )
+    meta = (tuple(bounds), sorted(str(rng) for rng in ws.merged_cells.ranges),
+            tables, ws.sheet_state)
+    return {
+        "meta": _digest(repr(meta)),
+        "rows": rows,
+        "cols": {str(c): h.hexdigest() for c, h in cols.items()},
+    }
+
+
+def fingerprint(wb: Any) -> dict[str, Any]:
+    """Workbook + per-sheet digests (see module doc)."""
+    sheets: dict[str, Any] = {}
+    states = []
+    for name in wb.sheetnames:
+        ws = wb[name]
+        states.append(getattr(ws, "sheet_state", "visible"))
+        if getattr(ws, "tables", None) is not None:  # not a chartsheet
+            sheets[name] = _sheet_fingerprint(ws)
+    names = sorted(
+        (n, getattr(d, "value", None) or getattr(d, "attr_text", "") or "")
+        for n, d in wb.defined_names.items()
+    )
+    return {
+        "workbook": _digest(repr((list(wb.sheetnames), states, names))),
+        "sheets": sheets,
+    }
+
+
+@dataclasses.dataclass
+class _SheetDiff:
+    meta: bool
+    rows: set[int]
+    cols: set[int]
+
+
+def _diff(old: dict[str, Any], new: dict[str, Any]) -> dict[str, _SheetDiff] | None:
+    """Per-sheet changes, or None when the workbook itself changed."""
+    if old.get("workbook") != new["workbook"]:
+        return None
+    out: dict[str, _SheetDiff] = {}
+    for name, cur in new["sheets"].items():
+        prev = old["sheets"].get(name)
+        if prev is None or prev["meta"] != cur["meta"]:
+            out[name] = _SheetDiff(True, set(), set())
+            continue
+        out[name] = _SheetDiff(
+            False,
+            {int(r) for r in prev["rows"].keys() ^ cur["rows"].keys()}
+            | {int(r) for r, d in cur["rows"].items() if prev["rows"].get(r, d) != d},
+            {int(c) for c in prev["cols"].keys() ^ cur["cols"].keys()}
+            | {int(c) for c, d in cur["cols"].items() if prev["cols"].get(c, d) != d},
+        )
+    return out
+
+
+def _touches(footprint: dict[str, Any], diffs: dict[str, _SheetDiff]) -> bool:
+    for title, proj in footprint.items():
+        d = diffs.get(title)
+        if d is None or d.meta:
+            return True
+        if not (d.rows or d.cols):
+            continue
+        if proj.keep_all or proj.cols & d.cols or proj.rows & d.rows:
+            return True
+        for r in proj.spots.keys() & d.rows:
+            if proj.spots[r] & d.cols:
+                return True
+    return False
+
+
+def _options_signature(args: Any, defaults: dict[str, Any]) -> str:
+    """Everything outside the workbook that can change a rule's outcome."""
+    opts = {
+        "defaults": defaults,
+        "strip_whitespace": not args.no_strip_whitespace,
+        "no_table_autodetect": args.no_table_autodetect,
+        "no_merge_info": args.no_merge_info,
+        "ignore_stale_cache": args.ignore_stale_cache,
+        "treat_numeric_as_date": sorted(args.treat_numeric_as_date or ()),
+        "treat_text_as_date": sorted(args.treat_text_as_date or ()),
+        "visible_only": args.visible_only,
+        "strict_aggregates": args.strict_aggregates,
+        # Fingerprint bounds are read differently in the two load modes.
+        "streaming_input": bool(getattr(args, "streaming_input", False)),
+    }
+    return _digest(json.dumps(opts, sort_keys=True, default=str))
+
+
+def _rule_signature(rule: Any) -> str:
+    return _digest(repr(rule))
+
+
+# Findings are stored as positional rows (field order of `Finding`).
+_FINDING_FIELDS = tuple(f.name for f in dataclasses.fields(Finding))
+
+
+class Baseline:
+    """One `--baseline FILE` round: what to carry, what to re-run."""
+
+    def __init__(self, path: Path, rule_specs: list[Any], options: str,
+                 current: dict[str, Any], carried: dict[int, Any]) -> None:
+        self.path = path
+        self.rule_specs = rule_specs
+        self.options = options
+        self.current = current
+        self.carried = carried
+
+    @classmethod
+    def prepare(cls, args: Any, wb: Any, rule_specs: list[Any],
+                defaults: dict[str, Any]) -> "Baseline":
+        """Fingerprint `wb`, read FILE, decide which rules carry over."""
+        from .cli import _RuleOutcome
+
+        path = Path(args.baseline)
+        options = _options_signature(args, defaults)
+        current = fingerprint(wb)
+        carried: dict[int, Any] = {}
+        stored = cls._read(path)
+        if stored is None or stored.get("options") != options:
+            return cls(path, rule_specs, options, current, carried)
+        diffs = _diff(stored["fingerprint"], current)
+        if diffs is None:
+            return cls(path, rule_specs, options, current, carried)
+        by_sig: dict[str, list[dict[str, Any]]] = {}
+        for entry in stored["rules"]:
+            by_sig.setdefault(entry["sig"], []).append(entry)
+        plan_opts = {"no_table_autodetect": args.no_table_autodetect}
+        for i, rule in enumerate(rule_specs):
+            entries = by_sig.get(_rule_signature(rule))
+            if not entries:
+                continue
+            entry = entries.pop(0)
+            footprint = rule_footprint(rule, wb, defaults, plan_opts)
+            if footprint is None or _touches(footprint, diffs):
+                continue
+            carried[i] = _RuleOutcome(
+                findings=[Finding(*row) for row in entry["findings"]],
+                counts=dict(entry["counts"]),
+                aggregate_cache_hits=entry["aggregate_cache_hits"],
+            )
+        return cls(path, rule_specs, options, current, carried)
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        if not path.exists():
+            return None
+        try:
+            with path.open(encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("schema") != SCHEMA:
+                raise ValueError(f"schema {data.get('schema')!r} != {SCHEMA!r}")
+            return data
+        except (OSError, ValueError, AttributeError) as e:
+            sys.stderr.write(
+                f"NOTE: --baseline {path.name} ignored ({e}); "
+                "re-validating every rule.\n"
+            )
+            return None
+
+    @property
+    def dirty_rules(self) -> list[Any]:
+        return [r for i, r in enumerate(self.rule_specs) if i not in self.carried]
+
+    def merge(self, fresh: Iterable[Any]) -> Iterator[Any]:
+        """Interleave carried outcomes with `fresh` (outcomes for
+        `dirty_rules`, in order) back into rule order."""
+        fresh_it = iter(fresh)
+        for i in range(len(self.rule_specs)):
+            outcome = self.carried.get(i)
+            if outcome is None:
+                outcome = next(fresh_it, None)
+            if outcome is not None:
+                yield outcome
+
+    def write(self, outcomes: list[Any]) -> None:
+        """Persist a complete run (`outcomes` aligned with the rules)."""
+        data = {
+            "schema": SCHEMA,
+            "options": self.options,
+            "fingerprint": self.current,
+            "rules": [
+                {
+                    "sig": _rule_signature(rule),
+                    "counts": outcome.counts,
+                    "aggregate_cache_hits": outcome.aggregate_cache_hits,
+                    "findings": [
+                        [getattr(f, name) for name in _FINDING_FIELDS]
+                        for f in outcome.findings
+                    ],
+                }
+                for rule, outcome in zip(self.rule_specs, outcomes)
+            ],
+        }
+        # `dumps` (C encoder) + one write; `dump` streams via the pure-
+        # Python iterencode. Temp file + rename: never a half-written FILE.
+        text = json.dumps(data, separators=(",", ":"), default=_json_default)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, self.path)
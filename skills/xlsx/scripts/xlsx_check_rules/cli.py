@@ -9,6 +9,7 @@ import signal
 import sys
 import threading
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -40,6 +41,19 @@ def _split_treat_as_date(raw: str) -> list[str]:
     return [t.strip() for t in raw.split(sep) if t.strip()]
 
 
+def _workers_type(value: str) -> int:
+    """Argparse `type=` callable for `--workers`: a positive integer."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(
+            f"--workers must be a positive integer; got {value!r}"
+        )
+    return n
+
+
 # === argparse builder (TASK §2.5 — 22+ flags) =============================
 
 def build_parser() -> argparse.ArgumentParser:
@@ -88,6 +102,22 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--timeout", dest="timeout_seconds", type=int,
                    default=DEFAULT_TIMEOUT_SECONDS,
                    help=f"wall-clock cap in seconds (default {DEFAULT_TIMEOUT_SECONDS}; exit 7 on overrun)")
+    p.add_argument("--engine", choices=("cell", "columnar"), default="cell",
+                   help=("(default 'cell') per-cell evaluator, or 'columnar': "
+                         "classify each column once and evaluate rules as "
+                         "batch predicates (identical findings)"))
+    p.add_argument("--streaming-input", dest="streaming_input", action="store_true",
+                   help=("openpyxl read-only load: plan every rule's scopes, then "
+                         "one iter_rows pass per sheet keeping only the cells they "
+                         "read (identical findings)"))
+    p.add_argument("--workers", metavar="N", type=_workers_type, default=1,
+                   help=("(default 1 = serial) evaluate (sheet, scope) rule "
+                         "groups in N worker processes; findings are merged "
+                         "in serial order"))
+    p.add_argument("--baseline", metavar="FILE", default=None,
+                   help=("incremental re-validation: re-evaluate only rules "
+                         "whose cells changed since the run that wrote FILE, "
+                         "carry the rest forward, then rewrite FILE"))
 
     # Sheet & header config
     p.add_argument("--sheet", dest="sheet_override", default=None,
@@ -306,11 +336,150 @@ def _new_summary() -> dict[str, Any]:
     return {
         "errors": 0, "warnings": 0, "info": 0,
         "checked_cells": 0, "rules_evaluated": 0, "cell_errors": 0,
-        "skipped_in_aggregates": 0, "regex_timeouts": 0, "eval_errors": 0,
-        "aggregate_cache_hits": 0, "elapsed_seconds": 0.0, "truncated": False,
+        "skipped_in_aggregates": 0, "regex_timeouts": 0,
+        "regex_prefilter_skips": 0, "eval_errors": 0,
+        "aggregate_cache_hits": 0, "column_cache_hits": 0,
+        "elapsed_seconds": 0.0, "truncated": False,
     }
 
 
+# Summary keys a rule adds to (the rest are run-level).
+_SUMMED_KEYS = (
+    "errors", "warnings", "info", "checked_cells", "rules_evaluated",
+    "cell_errors", "skipped_in_aggregates", "regex_timeouts",
+    "regex_prefilter_skips", "eval_errors",
+)
+
+
+def _eval_opts(args: Any) -> dict[str, Any]:
+    """Scope-resolver / evaluator options derived from the CLI flags."""
+    from .scope_resolver import ColumnCache
+
+    return {
+        "strip_whitespace": not args.no_strip_whitespace,
+        "no_table_autodetect": args.no_table_autodetect,
+        "no_merge_info": args.no_merge_info,
+        "ignore_stale_cache": args.ignore_stale_cache,
+        "treat_numeric_as_date": set(args.treat_numeric_as_date or ()),
+        "treat_text_as_date": set(args.treat_text_as_date or ()),
+        "visible_only": args.visible_only,
+        # Run-scoped: every rule / aggregate scope over the same column
+        # shares one classification pass (`summary.column_cache_hits`).
+        "column_cache": ColumnCache(),
+    }
+
+
+@dataclass
+class _RuleOutcome:
+    """One rule's share of the run: its findings and summary deltas."""
+
+    findings: list[Any] = field(default_factory=list)
+    counts: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(_SUMMED_KEYS, 0),
+    )
+    aggregate_cache_hits: int = 0
+    error: Any = None  # `_AppError` from scope resolution → fatal envelope
+    stderr: str = ""   # `--workers`: what the rule printed in its worker
+
+
+class _RuleRunner:
+    """Evaluates rules one at a time against a loaded workbook.
+
+    Holds the run-scoped state every rule shares (P3): one
+    `AggregateCache`, the regex compile and prefilter caches, the
+    `ColumnCache` and the stale-cache "warned once" bit. The serial loop owns one runner;
+    under `--workers` each pool process owns its own."""
+
+    def __init__(self, wb: Any, defaults: dict[str, Any], args: Any) -> None:
+        from .aggregates import AggregateCache
+
+        self.wb = wb
+        self.defaults = defaults
+        self.eval_opts = _eval_opts(args)
+        self.strict_aggregates = args.strict_aggregates
+        self.columnar = getattr(args, "engine", "cell") == "columnar"
+        self.cache = AggregateCache()
+        self.regex_cache: dict[str, Any] = {}
+        self.regex_prefilters: dict[str, Any] = {}
+        self.stale_warned = False
+        self.column_cache = self.eval_opts["column_cache"]
+        if self.columnar:
+            from .columnar import eval_rule_columnar, resolve_batch
+            self._resolve, self._evaluate = resolve_batch, eval_rule_columnar
+        else:
+            from .evaluator import eval_rule
+            from .scope_resolver import resolve_scope
+            self._resolve, self._evaluate = resolve_scope, eval_rule
+
+    @property
+    def column_cache_hits(self) -> int:
+        return self.column_cache.hits
+
+    def run_all(self, rules: list[Any], flag: _TimeoutFlag) -> Any:
+        """Yield one `_RuleOutcome` per rule until the watchdog trips."""
+        for rule in rules:
+            if flag.tripped:
+                break
+            yield self.run(rule, flag)
+
+    def run(self, rule: Any, flag: _TimeoutFlag, stderr: Any = None) -> _RuleOutcome:
+        from .cell_types import LogicalType
+        from .evaluator import EvalContext
+        from .exceptions import _AppError
+
+        try:
+            sr = self._resolve(rule.scope, self.wb, self.defaults, self.eval_opts)
+        except _AppError as e:
+            return _RuleOutcome(error=e)
+        ctx = EvalContext(
+            workbook=self.wb, rule=rule, aggregate_cache=self.cache,
+            defaults=self.defaults, eval_opts=self.eval_opts,
+            strict_aggregates=self.strict_aggregates,
+            regex_compile_cache=self.regex_cache,
+            regex_prefilter_cache=self.regex_prefilters,
+            stale_cache_warned=self.stale_warned, stderr=stderr,
+        )
+        out = _RuleOutcome()
+        counts = out.counts
+        for f in self._evaluate(rule, sr, ctx):
+            if flag.tripped:
+                break
+            out.findings.append(f)
+            key = f.severity + "s"  # "errors" / "warnings" / "infos"
+            if key in counts:
+                counts[key] += 1
+        # L2: honor `--visible-only` in the checked_cells tally.
+        visible_only = bool(self.eval_opts.get("visible_only", False))
+        if self.columnar:
+            counts["checked_cells"] = sr.count_checked(visible_only)
+        else:
+            counts["checked_cells"] = sum(
+                1 for c in sr.cells
+                if c.logical_type is not LogicalType.EMPTY
+                and not (visible_only and c.is_hidden)
+            )
+        counts["rules_evaluated"] = 1
+        counts["cell_errors"] = ctx.cell_errors
+        counts["skipped_in_aggregates"] = ctx.skipped_in_aggregates
+        counts["regex_timeouts"] = ctx.regex_timeouts
+        counts["regex_prefilter_skips"] = ctx.regex_prefilter_skips
+        counts["eval_errors"] = ctx.eval_errors
+        out.aggregate_cache_hits = ctx.aggregate_cache_hits
+        # L1: persist stale-cache "warned-once" state across rules.
+        self.stale_warned = self.stale_warned or ctx.stale_cache_warned
+        return out
+
+
+def _merge_outcome(outcome: _RuleOutcome, findings: list[Any],
+                   summary: dict[str, Any]) -> None:
+    findings.extend(outcome.findings)
+    for key, n in outcome.counts.items():
+        summary[key] += n
+    summary["aggregate_cache_hits"] = max(
+        summary["aggregate_cache_hits"], outcome.aggregate_cache_hits,
+    )
+
+
 def _emit_fatal(err: Any, args: Any | None) -> int:
     """cross-5 envelope wrap when `--json-errors` is set; otherwise plain
     stderr line. Returns the typed exit code (`err.code`).
@@ -402,17 +571,14 @@ def _run(args: Any) -> int:
     """End-to-end pipeline (architecture §2.1 F11)."""
     from openpyxl import load_workbook
 
-    from .aggregates import AggregateCache
-    from .cell_types import LogicalType
     from .dsl_parser import build_rule_spec
-    from .evaluator import EvalContext, Finding, eval_rule
+    from .evaluator import Finding
     from .exceptions import (
         CorruptInput, EncryptedInput, IOError as XlsxIOError,
         SelfOverwriteRefused, _AppError,
     )
     from .output import emit_findings
     from .rules_loader import load_rules_file
-    from .scope_resolver import resolve_scope
 
     # 1) cross-7 H1 same-path guard.
     if _check_same_path(args.input, args.output_path):
@@ -446,8 +612,13 @@ def _run(args: Any) -> int:
         except ImportError:  # pragma: no cover
             sys.stderr.write(f"WARNING: .xlsm input may carry macros: {args.input}\n")
 
+    streaming = bool(getattr(args, "streaming_input", False))
     try:
-        wb = load_workbook(args.input, data_only=True)
+        if streaming:
+            from .streaming import load_streaming_workbook, plan_rules
+            wb = load_streaming_workbook(args.input)
+        else:
+            wb = load_workbook(args.input, data_only=True)
     except FileNotFoundError as e:
         return _emit_fatal(XlsxIOError(f"workbook not found: {args.input}",
                                          input=args.input), args)
@@ -465,73 +636,66 @@ def _run(args: Any) -> int:
             defaults["header_row"] = args.header_row_override
         rule_specs = [build_rule_spec(r) for r in rules_data["rules"]]
     except _AppError as e:
+        if streaming:
+            wb.close()
         return _emit_fatal(e, args)
 
     # 5-7) Watchdog + per-rule eval loop.
     findings: list[Finding] = []
     summary = _new_summary()
-    cache = AggregateCache()
-    # P3: regex_compile_cache + stale_cache_warned hoisted to RUN scope so
-    # they survive across rules. Per-rule `EvalContext` reuses these
-    # objects via `regex_compile_cache=…` injection (one compile per
-    # unique pattern across the whole run; one stale-cache warning per
-    # workbook, not per rule).
-    run_regex_cache: dict[str, Any] = {}
-    run_stale_cache_state: list[bool] = [False]  # list-of-1 → mutable across contexts
     flag = _TimeoutFlag()
-    eval_opts = {
-        "strip_whitespace": not args.no_strip_whitespace,
-        "no_table_autodetect": args.no_table_autodetect,
-        "no_merge_info": args.no_merge_info,
-        "ignore_stale_cache": args.ignore_stale_cache,
-        "treat_numeric_as_date": set(args.treat_numeric_as_date or ()),
-        "treat_text_as_date": set(args.treat_text_as_date or ()),
-        "visible_only": args.visible_only,
-    }
+    baseline = None
+    todo = rule_specs
+    if args.baseline:
+        # Fingerprint + diff against FILE; only the dirty rules run.
+        from .baseline import Baseline
+        baseline = Baseline.prepare(args, wb, rule_specs, defaults)
+        todo = baseline.dirty_rules
+        summary["rules_carried"] = len(baseline.carried)
+    units: list[list[int]] = []
+    if args.workers > 1:
+        from .parallel import evaluate_parallel, plan_units
+        units = plan_units(todo)
     timer = _install_watchdog(args.timeout_seconds, flag)
     t0 = time.perf_counter()
+    done: list[_RuleOutcome] = []
     try:
-        for rule in rule_specs:
-            if flag.tripped:
-                break
-            try:
-                sr = resolve_scope(rule.scope, wb, defaults, eval_opts)
-            except _AppError as e:
-                _cleanup_watchdog(timer)
-                return _emit_fatal(e, args)
-            ctx = EvalContext(
-                workbook=wb, rule=rule, aggregate_cache=cache,
-                defaults=defaults, eval_opts=eval_opts,
-                strict_aggregates=args.strict_aggregates,
-                regex_compile_cache=run_regex_cache,
-                stale_cache_warned=run_stale_cache_state[0],
+        if len(units) > 1:
+            # Pool processes share the parent's loaded workbook via fork;
+            # a streaming workbook (open archive handle) is reopened.
+            source: Any = evaluate_parallel(
+                args, todo, defaults, None if streaming else wb,
+                units, flag,
             )
-            for f in eval_rule(rule, sr, ctx):
-                if flag.tripped:
-                    break
-                findings.append(f)
-                key = f.severity + "s"  # "errors" / "warnings" / "infos"
-                if key in summary:
-                    summary[key] += 1
-            # L2: honor `--visible-only` in the checked_cells tally.
-            visible_only = bool(eval_opts.get("visible_only", False))
-            summary["checked_cells"] += sum(
-                1 for c in sr.cells
-                if c.logical_type is not LogicalType.EMPTY
-                and not (visible_only and c.is_hidden)
-            )
-            summary["rules_evaluated"] += 1
-            summary["cell_errors"] += ctx.cell_errors
-            summary["skipped_in_aggregates"] += ctx.skipped_in_aggregates
-            summary["regex_timeouts"] += ctx.regex_timeouts
-            summary["eval_errors"] += ctx.eval_errors
-            summary["aggregate_cache_hits"] = max(
-                summary["aggregate_cache_hits"], ctx.aggregate_cache_hits,
-            )
-            # L1: persist stale-cache "warned-once" state across rules.
-            run_stale_cache_state[0] = run_stale_cache_state[0] or ctx.stale_cache_warned
+            outcomes = source.outcomes
+        else:
+            source = _RuleRunner(wb, defaults, args)
+            if streaming:
+                # Every scope is known up front, so each sheet is read once.
+                plan_rules(todo, wb, defaults, source.eval_opts)
+            outcomes = source.run_all(todo, flag)
+        if baseline is not None:
+            outcomes = baseline.merge(outcomes)
+        for outcome in outcomes:
+            if outcome is None:
+                continue  # `--workers` timeout gap
+            if outcome.error is not None:
+                return _emit_fatal(outcome.error, args)
+            _merge_outcome(outcome, findings, summary)
+            done.append(outcome)
     finally:
         _cleanup_watchdog(timer)
+        if streaming:
+            wb.close()
+    summary["column_cache_hits"] = source.column_cache_hits
+    if baseline is not None and not flag.tripped:
+        try:
+            baseline.write(done)
+        except OSError as e:
+            return _emit_fatal(XlsxIOError(
+                f"cannot write baseline: {args.baseline} ({e})",
+                path=args.baseline,
+            ), args)
     summary["elapsed_seconds"] = round(time.perf_counter() - t0, 3)
 
     # --require-data: synthesise a `no-data-checked` finding when nothing scanned.
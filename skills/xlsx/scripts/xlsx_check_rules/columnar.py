@@ -0,0 +1,578 @@
+"""F7-columnar — `--engine columnar`: column-at-a-time rule evaluation.
+
+The default `cell` engine classifies every scope cell into a
+`ClassifiedCell` (F6 → F5) and walks the rule AST once per cell (F7).
+This engine instead:
+
+  1. Classifies each `col:` / `cols:` scope column **once** (per run,
+     via F6's `ColumnCache`) into
+     parallel typed arrays (`ColumnBatch`: value, logical type,
+     hidden flag, stale-cache flag, anchor row/column). The common
+     openpyxl shapes (empty, shared-string text, plain number, bool,
+     date) take an inline fast path; anything else — error glyphs,
+     Decimals, `--treat-*-as-date` columns, merged-range members —
+     routes through the exact F5/F6 code (`classify`,
+     `_classify_cell_at`), so the arrays match the cell engine value
+     for value.
+  2. Compiles the rule's `check` / `when` AST into a **batch
+     predicate** (`_vectorise`) that maps a list of active row
+     indices to results in one pass per node. `and` / `or` keep
+     per-row short-circuit semantics by handing each later child
+     only the rows still undecided.
+
+Parity contract: findings, their order, and every `summary` counter
+are identical to the cell engine. Rules the batch compiler cannot
+express exactly fall back to F7's per-cell `eval_rule` over the same
+batch (materialised as a `ScopeResult`):
+
+  * `GroupByCheck` rules (F8 computes them over the scope anyway);
+  * any `BuiltinCall` operand — F8 drains its replayed findings into
+    `ctx.pending_findings` between cells, an ordering a batch pass
+    cannot reproduce;
+
+and individual AST nodes without a batch form (`DatePredicate`,
+`cell:` / `col:` / arithmetic operands, unary `-`) are evaluated
+per row with `eval_check` inside an otherwise batched tree.
+
+Honest scope: the watchdog (`--timeout`) is polled between findings,
+as with the cell engine, but a rule's batch pass runs to completion
+before its first finding is yielded.
+"""
+from __future__ import annotations
+
+import dataclasses
+import operator
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Iterator
+
+from openpyxl.utils import column_index_from_string
+
+from .ast_nodes import (
+    Between, BinaryOp, BuiltinCall, ColRef, GroupByCheck, In, LenPredicate,
+    Literal, Logical, MultiColRef, RegexPredicate, RuleSpec, StringPredicate,
+    TypePredicate, UnaryOp, ValueRef,
+)
+from .cell_types import ClassifiedCell, LogicalType, _column_in_set, classify
+from .evaluator import (
+    EvalContext, Finding, _is_required_predicate, _make_finding, eval_check,
+    eval_regex, eval_rule,
+)
+from .exceptions import CellError
+from .scope_resolver import (
+    ScopeResult, _build_merge_lookup, _classify_cell_at, _column_cache_key,
+    _data_range, resolve_header, resolve_scope, resolve_sheet,
+)
+
+__all__ = [
+    "ColumnBatch",
+    "resolve_batch",
+    "eval_rule_columnar",
+]
+
+_EMPTY = LogicalType.EMPTY
+_TEXT = LogicalType.TEXT
+_NUMBER = LogicalType.NUMBER
+_DATE = LogicalType.DATE
+_BOOL = LogicalType.BOOL
+_ERROR = LogicalType.ERROR
+
+
+# === Typed column arrays ==================================================
+
+@dataclass
+class ColumnBatch:
+    """Scope cells as parallel arrays; index `i` is the i-th scope cell.
+
+    `rows` / `cols` carry the *classified* location (a merged non-anchor
+    resolves to its anchor, exactly as `_classify_cell_at` reports it).
+    `exact` holds the F5/F6 `ClassifiedCell` for entries whose metadata
+    the arrays do not carry (merge members; every cell of a batch
+    built from a `ScopeResult`).
+    """
+    sheet_name: str
+    column_letter: str | None = None
+    is_table_resolved: bool = False
+    rows: list[int] = field(default_factory=list)
+    cols: list[str] = field(default_factory=list)
+    types: list[LogicalType] = field(default_factory=list)
+    values: list[Any] = field(default_factory=list)
+    hidden: list[bool] = field(default_factory=list)
+    stale: list[bool] = field(default_factory=list)
+    exact: dict[int, ClassifiedCell] = field(default_factory=dict)
+    info_findings: list[dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def append_cell(self, c: ClassifiedCell, keep: bool = False) -> None:
+        if keep:
+            self.exact[len(self.types)] = c
+        self.rows.append(c.row)
+        self.cols.append(c.col)
+        self.types.append(c.logical_type)
+        self.values.append(c.value)
+        self.hidden.append(c.is_hidden)
+        self.stale.append(c.has_formula_no_cache)
+
+    def extend(self, other: "ColumnBatch") -> None:
+        offset = len(self.types)
+        self.exact.update((offset + i, c) for i, c in other.exact.items())
+        self.rows.extend(other.rows)
+        self.cols.extend(other.cols)
+        self.types.extend(other.types)
+        self.values.extend(other.values)
+        self.hidden.extend(other.hidden)
+        self.stale.extend(other.stale)
+        self.info_findings.extend(other.info_findings)
+
+    def cell(self, i: int) -> ClassifiedCell:
+        """Materialise entry `i` as the `ClassifiedCell` F5 would build."""
+        c = self.exact.get(i)
+        if c is not None:
+            return c
+        return ClassifiedCell(
+            self.types[i], self.values[i], self.sheet_name,
+            self.rows[i], self.cols[i],
+            is_hidden=self.hidden[i], has_formula_no_cache=self.stale[i],
+        )
+
+    def to_scope_result(self) -> ScopeResult:
+        return ScopeResult(
+            self.sheet_name, [self.cell(i) for i in range(len(self))],
+            column_letter=self.column_letter,
+            is_table_resolved=self.is_table_resolved,
+            info_findings=self.info_findings,
+        )
+
+    def count_checked(self, visible_only: bool) -> int:
+        """`summary.checked_cells` contribution (non-empty, visible)."""
+        hidden = self.hidden
+        return sum(
+            1 for i, t in enumerate(self.types)
+            if t is not _EMPTY and not (visible_only and hidden[i])
+        )
+
+    @classmethod
+    def from_scope_result(cls, sr: ScopeResult) -> "ColumnBatch":
+        batch = cls(sr.sheet_name, column_letter=sr.column_letter,
+                    is_table_resolved=sr.is_table_resolved,
+                    info_findings=sr.info_findings)
+        for c in sr.cells:
+            batch.append_cell(c, keep=True)
+        return batch
+
+
+def _classify_column(ws: Any, col_letter: str, first: int, last: int,
+                      opts: dict[str, Any],
+                      merge_lookup: dict[tuple[int, str], tuple[Any, str]],
+                      batch: ColumnBatch) -> None:
+    """Append rows `first..last` of one column to `batch` (F5 parity).
+
+    Per-column invariants (`--treat-*-as-date` membership, whitespace
+    policy, the classify-opts dict) are hoisted out of the row loop;
+    the per-cell `dict(opts)` copy of `_classify_cell_at` is paid only
+    for merge members.
+    """
+    col_idx = column_index_from_string(col_letter)
+    base_opts = dict(opts)
+    base_opts["merge_range"] = None
+    base_opts["is_anchor_of_merge"] = False
+    strip_ws = bool(base_opts.get("strip_whitespace", True))
+    stale_all = bool(base_opts.get("has_formula_no_cache", False))
+    hidden_all = bool(base_opts.get("is_hidden", False))
+    fast_numbers = not _column_in_set(col_letter, base_opts.get("treat_numeric_as_date"))
+    fast_text = not _column_in_set(col_letter, base_opts.get("treat_text_as_date"))
+    merged_rows = {r for (r, c) in merge_lookup if c == col_letter}
+
+    rows, cols, types, values = batch.rows, batch.cols, batch.types, batch.values
+    hidden, stale = batch.hidden, batch.stale
+    cell_at = ws.cell
+    for r in range(first, last + 1):
+        if r in merged_rows:
+            batch.append_cell(
+                _classify_cell_at(ws, r, col_letter, opts, merge_lookup,
+                                  batch.info_findings),
+                keep=True,
+            )
+            continue
+        cell = cell_at(row=r, column=col_idx)
+        dt = cell.data_type
+        raw = cell.value
+        is_stale = False
+        if dt == "f" or stale_all:
+            lt, v, is_stale = _EMPTY, None, True
+        elif raw is None:
+            lt, v = _EMPTY, None
+        elif dt == "s" and type(raw) is str and fast_text:
+            lt, v = _TEXT, (raw.strip() if strip_ws else raw)
+        elif dt == "n" and (type(raw) is int or type(raw) is float) and fast_numbers:
+            lt, v = (_DATE if cell.is_date else _NUMBER), raw
+        elif dt == "b" and type(raw) is bool:
+            lt, v = _BOOL, raw
+        elif dt == "d" and isinstance(raw, (datetime, date)):
+            lt, v = _DATE, raw
+        else:
+            c = classify(cell, base_opts)
+            lt, v, is_stale = c.logical_type, c.value, c.has_formula_no_cache
+        rows.append(r)
+        cols.append(col_letter)
+        types.append(lt)
+        values.append(v)
+        hidden.append(hidden_all)
+        stale.append(is_stale)
+
+
+def resolve_batch(scope_node: Any, workbook: Any,
+                   defaults: dict[str, Any] | None = None,
+                   opts: dict[str, Any] | None = None) -> ColumnBatch:
+    """`resolve_scope` twin returning a `ColumnBatch`.
+
+    `col:` / `cols:` scopes are classified column-at-a-time; the other
+    eight forms resolve through F6 and are transposed into arrays.
+    Raises exactly what `resolve_scope` raises.
+    """
+    defaults = defaults or {}
+    opts = opts or {}
+    if not isinstance(scope_node, (ColRef, MultiColRef)):
+        return ColumnBatch.from_scope_result(
+            resolve_scope(scope_node, workbook, defaults, opts),
+        )
+    allow_tables = not bool(opts.get("no_table_autodetect", False))
+    ws = resolve_sheet(scope_node.sheet, workbook)
+    children = (scope_node,) if isinstance(scope_node, ColRef) else scope_node.children
+    letters: list[str] = []
+    any_table_resolved = False
+    for child in children:
+        if child.is_letter:
+            letters.append(child.name_or_letter)
+            continue
+        letter, used_tbl = resolve_header(
+            child.name_or_letter, ws, defaults, allow_table_fallback=allow_tables,
+        )
+        letters.append(letter)
+        any_table_resolved = any_table_resolved or used_tbl
+
+    merge_lookup = _build_merge_lookup(ws)
+    first, last = _data_range(ws, int(defaults.get("header_row", 1)))
+    batch = ColumnBatch(
+        ws.title,
+        column_letter=letters[0] if isinstance(scope_node, ColRef) else None,
+        is_table_resolved=any_table_resolved,
+    )
+    cache = opts.get("column_cache")
+    for letter in letters:
+        key = part = None
+        if cache is not None:
+            key = _column_cache_key("batch", ws, letter, first, last, opts)
+            part = cache.get(key)
+        if part is None:
+            part = ColumnBatch(ws.title)
+            _classify_column(ws, letter, first, last, opts, merge_lookup, part)
+            if key is not None:
+                cache.put(key, part)
+        if len(letters) == 1:
+            # Sole column: share the cached arrays (nothing mutates them).
+            return dataclasses.replace(
+                part, column_letter=batch.column_letter,
+                is_table_resolved=any_table_resolved,
+            )
+        batch.extend(part)
+    return batch
+
+
+# === Batch predicate compiler =============================================
+
+# fn(batch, idx, ctx) -> one result per index (True/False/Finding).
+_BatchFn = Callable[[ColumnBatch, list[int], EvalContext], list[Any]]
+
+_TYPE_TARGETS = {
+    "is_number": _NUMBER, "is_date": _DATE, "is_text": _TEXT,
+    "is_bool": _BOOL, "is_error": _ERROR,
+}
+_CMP_FUNCS = {
+    "==": operator.eq, "!=": operator.ne, "<": operator.lt,
+    "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+
+
+def _has_builtin_call(node: Any) -> bool:
+    if isinstance(node, BuiltinCall):
+        return True
+    if isinstance(node, tuple):
+        return any(_has_builtin_call(n) for n in node)
+    if dataclasses.is_dataclass(node) and not isinstance(node, type):
+        return any(_has_builtin_call(getattr(node, f.name))
+                   for f in dataclasses.fields(node))
+    return False
+
+
+def _needs_cell_engine(rule: RuleSpec) -> bool:
+    return (isinstance(rule.check, GroupByCheck)
+            or _has_builtin_call(rule.check) or _has_builtin_call(rule.when))
+
+
+def _per_row(node: Any) -> _BatchFn:
+    """Exact F7 semantics for nodes without a batch form."""
+    def run(batch: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+        return [eval_check(node, batch.cell(i), ctx) for i in idx]
+    return run
+
+
+def _operand(node: Any) -> tuple[bool, Any] | None:
+    """`(is_value_ref, constant)` for batchable operands, else None."""
+    if isinstance(node, ValueRef):
+        return True, None
+    if isinstance(node, Literal):
+        return False, node.value
+    return None
+
+
+def _is_plain_number(x: Any) -> bool:
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def _vectorise(node: Any) -> _BatchFn:  # noqa: C901 — flat dispatch over a closed AST
+    """Compile one check/when AST node into a `_BatchFn`."""
+    if isinstance(node, TypePredicate):
+        if node.name == "required":
+            return lambda b, idx, ctx: [b.types[i] is not _EMPTY for i in idx]
+        want = _TYPE_TARGETS.get(node.name)
+        if want is None:
+            return _per_row(node)
+        return lambda b, idx, ctx: [b.types[i] is want for i in idx]
+
+    if isinstance(node, StringPredicate):
+        tests: dict[str, Callable[[str], bool]] = {
+            "starts_with": lambda s: s.startswith(node.arg),
+            "ends_with": lambda s: s.endswith(node.arg),
+            "not_empty": bool,
+        }
+        test = tests.get(node.name)
+        if test is None:
+            return _per_row(node)
+
+        def run_string(b: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+            types, values = b.types, b.values
+            return [types[i] is _TEXT and test(values[i] or "") for i in idx]
+        return run_string
+
+    if isinstance(node, LenPredicate):
+        fn = _CMP_FUNCS.get(node.op)
+        if fn is None:
+            return _per_row(node)
+        n = node.n
+
+        def run_len(b: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+            types, values = b.types, b.values
+            return [types[i] is _TEXT and fn(len(values[i] or ""), n) for i in idx]
+        return run_len
+
+    if isinstance(node, RegexPredicate):
+        return _vectorise_regex(node)
+
+    if isinstance(node, In):
+        needle = _operand(node.needle)
+        if needle is None:
+            return _per_row(node)
+        haystack, negate = node.haystack, node.negate
+
+        def run_in(b: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+            values = b.values if needle[0] else None
+            out = []
+            for i in idx:
+                hit = (values[i] if values is not None else needle[1]) in haystack
+                out.append((not hit) if negate else hit)
+            return out
+        return run_in
+
+    if isinstance(node, Between):
+        operand = _operand(node.operand)
+        if operand is None:
+            return _per_row(node)
+        low, high, inclusive = node.low, node.high, node.inclusive
+
+        def run_between(b: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+            values = b.values if operand[0] else None
+            out = []
+            for i in idx:
+                v = values[i] if values is not None else operand[1]
+                if not _is_plain_number(v):
+                    out.append(False)
+                elif inclusive:
+                    out.append(low <= v <= high)
+                else:
+                    out.append(low < v < high)
+            return out
+        return run_between
+
+    if isinstance(node, BinaryOp):
+        return _vectorise_compare(node)
+
+    if isinstance(node, UnaryOp) and node.op == "not":
+        inner = _vectorise(node.operand)
+
+        def run_unary(b: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+            return [r if isinstance(r, Finding) else (not r)
+                    for r in inner(b, idx, ctx)]
+        return run_unary
+
+    if isinstance(node, Logical):
+        return _vectorise_logical(node)
+
+    return _per_row(node)
+
+
+def _vectorise_compare(node: BinaryOp) -> _BatchFn:
+    fn = _CMP_FUNCS.get(node.op)
+    left, right = _operand(node.left), _operand(node.right)
+    if fn is None or left is None or right is None:
+        return _per_row(node)  # arithmetic / non-literal operands
+    tolerant = node.op in ("==", "!=")
+    negate_equal = node.op == "!="
+
+    def run_compare(b: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+        values = b.values
+        tol = ctx.rule.tolerance if ctx.rule is not None else 1e-9
+        out = []
+        for i in idx:
+            lv = values[i] if left[0] else left[1]
+            rv = values[i] if right[0] else right[1]
+            if tolerant and _is_plain_number(lv) and _is_plain_number(rv):
+                equal = abs(float(lv) - float(rv)) <= tol
+                out.append((not equal) if negate_equal else equal)
+                continue
+            try:
+                out.append(fn(lv, rv))
+            except TypeError:
+                out.append(False)
+        return out
+    return run_compare
+
+
+def _vectorise_regex(node: RegexPredicate) -> _BatchFn:
+    pattern = node.pattern
+
+    def run_regex(b: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+        rule_id = ctx.rule.id if ctx.rule is not None else ""
+        timeout_ms = int(ctx.regex_timeout_seconds * 1000)
+        types, values = b.types, b.values
+        out: list[Any] = []
+        for i in idx:
+            if types[i] is not _TEXT:
+                out.append(False)
+                continue
+            r = eval_regex(pattern, values[i] or "", timeout_ms, ctx, rule_id)
+            if isinstance(r, Finding):
+                # Same re-stamp as `_eval_regex_predicate`.
+                r.sheet, r.row, r.column = b.sheet_name, b.rows[i], b.cols[i]
+                r.cell = f"{r.sheet}!{r.column}{r.row}"
+            out.append(r)
+        return out
+    return run_regex
+
+
+def _vectorise_logical(node: Logical) -> _BatchFn:
+    if node.op not in ("and", "or", "not"):
+        return _per_row(node)
+    if node.op == "not":
+        if not node.children:
+            return lambda b, idx, ctx: [True] * len(idx)
+        return _vectorise(UnaryOp("not", node.children[0]))
+    children = [_vectorise(c) for c in node.children]
+    # `and` stops on the first falsy child, `or` on the first truthy one.
+    stop_on_truthy = node.op == "or"
+
+    def run_logical(b: ColumnBatch, idx: list[int], ctx: EvalContext) -> list[Any]:
+        out: list[Any] = [not stop_on_truthy] * len(idx)
+        undecided = list(range(len(idx)))
+        for child in children:
+            if not undecided:
+                break
+            results = child(b, [idx[p] for p in undecided], ctx)
+            still: list[int] = []
+            for p, r in zip(undecided, results):
+                if isinstance(r, Finding):
+                    out[p] = r
+                elif bool(r) is stop_on_truthy:
+                    out[p] = stop_on_truthy
+                else:
+                    still.append(p)
+            undecided = still
+        return out
+    return run_logical
+
+
+# === Rule loop ============================================================
+
+_NOT_EVALUATED = object()
+
+
+def eval_rule_columnar(rule_spec: RuleSpec, batch: ColumnBatch,
+                        ctx: EvalContext) -> Iterator[Finding]:
+    """`eval_rule` over a `ColumnBatch`; same findings, same order."""
+    ctx.rule = rule_spec
+    if _needs_cell_engine(rule_spec):
+        yield from eval_rule(rule_spec, batch.to_scope_result(), ctx)
+        return
+    ctx.group_by_result = None
+    ctx.group_by_row_map = None
+
+    eval_opts = ctx.eval_opts or {}
+    visible_only = bool(eval_opts.get("visible_only", False))
+    ignore_stale = bool(eval_opts.get("ignore_stale_cache", False))
+    keep_empty = not rule_spec.skip_empty or _is_required_predicate(rule_spec.check)
+
+    # SPEC §5.0 triage, in scope order.
+    types, hidden, stale = batch.types, batch.hidden, batch.stale
+    order: list[int] = []
+    active: list[int] = []
+    error_findings: dict[int, Finding] = {}
+    for i, lt in enumerate(types):
+        if visible_only and hidden[i]:
+            continue
+        if stale[i] and not ctx.stale_cache_warned and not ignore_stale:
+            print(
+                "WARNING: workbook has formulas without cached values; "
+                "run xlsx_recalc.py before xlsx_check_rules.py for accurate "
+                "results.",
+                file=ctx.stderr or sys.stderr,
+            )
+            ctx.stale_cache_warned = True
+        if lt is _ERROR:
+            ctx.cell_errors += 1
+            v = batch.values[i]
+            err_value = v.code if isinstance(v, CellError) else str(v)
+            sheet, row, col = batch.sheet_name, batch.rows[i], batch.cols[i]
+            error_findings[i] = Finding(
+                cell=f"{sheet}!{col}{row}", sheet=sheet, row=row, column=col,
+                rule_id="cell-error", severity="error", value=err_value,
+                message=f"Cell contains Excel error: {err_value}",
+            )
+            order.append(i)
+            continue
+        if lt is _EMPTY and not keep_empty:
+            continue
+        order.append(i)
+        active.append(i)
+
+    if rule_spec.when is not None and active:
+        passed = _vectorise(rule_spec.when)(batch, active, ctx)
+        active = [i for i, r in zip(active, passed)
+                  if not isinstance(r, Finding) and r]
+    results = dict(zip(active, _vectorise(rule_spec.check)(batch, active, ctx)
+                       if active else []))
+
+    for i in order:
+        finding = error_findings.get(i)
+        if finding is not None:
+            yield finding
+            continue
+        r = results.get(i, _NOT_EVALUATED)
+        if r is _NOT_EVALUATED:
+            continue  # filtered by `when`
+        if isinstance(r, Finding):
+            yield r
+        elif not r:
+            yield _make_finding(rule_spec, batch.cell(i), ctx, value=batch.values[i])
@@ -20,6 +20,7 @@ from .ast_nodes import (
 from .cell_types import ClassifiedCell, LogicalType, classify
 from .constants import DEFAULT_REGEX_TIMEOUT_MS
 from .exceptions import CellError
+from .regex_prefilter import literal_prefilter
 
 __all__ = [
     "Finding",
@@ -53,8 +54,11 @@ class EvalContext:
     rule: RuleSpec | None = None
     aggregate_cache: Any = None  # F8 cache (003.12)
     regex_compile_cache: dict[str, Any] = field(default_factory=dict)
+    # pattern → `LiteralPrefilter | None`, filled alongside the compile cache.
+    regex_prefilter_cache: dict[str, Any] = field(default_factory=dict)
     stale_cache_warned: bool = False
     regex_timeouts: int = 0
+    regex_prefilter_skips: int = 0
     eval_errors: int = 0
     cell_errors: int = 0
     skipped_in_aggregates: int = 0
@@ -593,11 +597,18 @@ def _cmp(left: Any, op: str, right: Any) -> bool:
 
 def eval_regex(pattern: str, value: str, timeout_ms: int,
                 ctx: EvalContext, rule_id: str) -> bool | Finding:
-    """Compile-cached; per-cell timeout → `rule-eval-timeout` finding (R9.d)."""
+    """Compile-cached; per-cell timeout → `rule-eval-timeout` finding (R9.d).
+    Values missing a literal the pattern requires are rejected without
+    running the matcher (`regex_prefilter`)."""
     cached = ctx.regex_compile_cache.get(pattern)
     if cached is None:
         cached = regex_compile(pattern)
         ctx.regex_compile_cache[pattern] = cached
+        ctx.regex_prefilter_cache[pattern] = literal_prefilter(pattern)
+    prefilter = ctx.regex_prefilter_cache.get(pattern)
+    if prefilter is not None and not prefilter.may_match(value):
+        ctx.regex_prefilter_skips += 1
+        return False
     try:
         return bool(cached.fullmatch(value, timeout=timeout_ms / 1000.0))
     except TimeoutError:
@@ -0,0 +1,201 @@
+"""F11-parallel — `--workers N`: rule groups across a process pool.
+
+Rules are grouped into work units by (sheet, scope): rules over the
+same scope share one `ColumnCache` classification and one set of
+`AggregateCache` entries, so they stay together. Units go to a
+:class:`~concurrent.futures.ProcessPoolExecutor`; each pool process
+owns one `cli._RuleRunner` (its own `AggregateCache`, regex compile
+cache and `ColumnCache`, shared by every unit it runs) and evaluates
+its units' rules in rule order.
+
+Workbook: where the platform forks, pool processes inherit the
+parent's fully loaded workbook (no second parse). Otherwise — and
+always for `--streaming-input`, whose workbook holds an open archive
+handle — each process opens its own and, when streaming, plans every
+rule before its one pass per sheet.
+
+Parity with the serial run:
+
+* Findings — the parent merges per-rule outcomes in rule order, so the
+  stable `output._sort_key` sort sees the same input sequence.
+* Fatal errors — the first rule (in rule order) whose scope failed to
+  resolve wins, as in the serial loop.
+* Stale-cache warning — each process captures what its rules print;
+  the parent replays the first capture in rule order, once.
+* Summary — counters are summed per rule. `aggregate_cache_hits` and
+  `column_cache_hits` are per-process caches, so they can differ
+  from a serial run.
+
+Timeout: the parent keeps the `--timeout` watchdog and polls it while
+waiting. Every task also arms its own watchdog for the time left, so
+a tripped run stops evaluating everywhere at about the same moment;
+the parent cancels queued units, collects what the running ones
+produced and `_partial_flush`es that (rules that never started are
+absent, as they are from a serial partial run).
+"""
+from __future__ import annotations
+
+import io
+import math
+import multiprocessing
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from .ast_nodes import NamedRef, SheetRef, TableRef, to_canonical_str
+
+# Parent poll interval while units run (watchdog check granularity).
+_POLL_SECONDS = 0.05
+
+# Per-process state set by `_init_worker`: (runner, rule_specs).
+_STATE: tuple[Any, list[Any]] | None = None
+
+
+@dataclass
+class _UnitResult:
+    """What one pool task sends back for one unit."""
+
+    outcomes: list[tuple[int, Any]] = field(default_factory=list)
+    column_cache_hits: int = 0
+
+
+@dataclass
+class PooledRun:
+    """Merged result: per-rule outcomes (None for a gap) in rule order
+    + cache hits."""
+
+    outcomes: list[Any]
+    column_cache_hits: int
+
+
+def _sheet_key(scope: Any) -> str:
+    if isinstance(scope, SheetRef):
+        return scope.name
+    if isinstance(scope, (NamedRef, TableRef)):
+        return ""  # sheet known only after resolution
+    return getattr(scope, "sheet", None) or ""
+
+
+def plan_units(rule_specs: list[Any]) -> list[list[int]]:
+    """Group rule indices by (sheet, scope), in first-rule order."""
+    units: dict[tuple[str, str], list[int]] = {}
+    for i, rule in enumerate(rule_specs):
+        key = (_sheet_key(rule.scope), to_canonical_str(rule.scope))
+        units.setdefault(key, []).append(i)
+    return list(units.values())
+
+
+def _open_workbook(args: Any) -> Any:
+    if getattr(args, "streaming_input", False):
+        from .streaming import load_streaming_workbook
+        return load_streaming_workbook(args.input)
+    from openpyxl import load_workbook
+    return load_workbook(args.input, data_only=True)
+
+
+def _init_worker(args: Any, rule_specs: list[Any], defaults: dict[str, Any],
+                 wb: Any) -> None:
+    global _STATE
+    from .cli import _RuleRunner
+
+    if wb is None:
+        wb = _open_workbook(args)
+    runner = _RuleRunner(wb, defaults, args)
+    if getattr(args, "streaming_input", False):
+        from .streaming import plan_rules
+        plan_rules(rule_specs, wb, defaults, runner.eval_opts)
+    _STATE = (runner, rule_specs)
+
+
+def _eval_unit(indices: list[int], deadline: float | None) -> _UnitResult:
+    """Pool task: evaluate one unit's rules in order."""
+    from .cli import _cleanup_watchdog, _install_watchdog, _TimeoutFlag
+
+    assert _STATE is not None
+    runner, rule_specs = _STATE
+    flag = _TimeoutFlag()
+    timer = None
+    if deadline is not None:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            flag.trip()
+        else:
+            timer = _install_watchdog(math.ceil(remaining), flag)
+    result = _UnitResult()
+    hits = runner.column_cache_hits
+    try:
+        for i in indices:
+            if flag.tripped:
+                break
+            buf = io.StringIO()
+            outcome = runner.run(rule_specs[i], flag, stderr=buf)
+            outcome.stderr = buf.getvalue()
+            result.outcomes.append((i, outcome))
+            if outcome.error is not None:
+                break
+    finally:
+        _cleanup_watchdog(timer)
+    result.column_cache_hits = runner.column_cache_hits - hits
+    return result
+
+
+def _merge_results(results: list[_UnitResult], n_rules: int) -> PooledRun:
+    """Order outcomes by rule; replay the first captured stderr once.
+
+    Rules without an outcome (timeout gaps) hold None, so positions
+    stay aligned with `rule_specs`. A fatal error only counts while
+    every earlier rule has an outcome (after a timeout gap the serial
+    run might never have reached it)."""
+    by_rule: dict[int, Any] = {}
+    hits = 0
+    for r in results:
+        by_rule.update(r.outcomes)
+        hits += r.column_cache_hits
+    outcomes: list[Any] = []
+    complete = True
+    replayed = False
+    for i in range(n_rules):
+        outcome = by_rule.get(i)
+        if outcome is not None and outcome.error is not None and not complete:
+            outcome = None
+        if outcome is None:
+            complete = False
+            outcomes.append(None)
+            continue
+        if outcome.stderr and not replayed:
+            sys.stderr.write(outcome.stderr)
+            replayed = True
+        outcomes.append(outcome)
+        if outcome.error is not None:
+            break
+    return PooledRun(outcomes=outcomes, column_cache_hits=hits)
+
+
+def evaluate_parallel(args: Any, rule_specs: list[Any], defaults: dict[str, Any],
+                      wb: Any, units: list[list[int]], flag: Any) -> PooledRun:
+    """Run `units` across `args.workers` processes; see module doc."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
+    else:
+        mp_context, wb = None, None
+    deadline = (
+        time.time() + args.timeout_seconds if args.timeout_seconds > 0 else None
+    )
+    with ProcessPoolExecutor(
+        max_workers=min(args.workers, len(units)),
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(args, rule_specs, defaults, wb),
+    ) as pool:
+        futures = [pool.submit(_eval_unit, unit, deadline) for unit in units]
+        pending = set(futures)
+        while pending and not flag.tripped:
+            _, pending = wait(
+                pending, timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED,
+            )
+        for fut in pending:
+            fut.cancel()
+        results = [fut.result() for fut in futures if not fut.cancelled()]
+    return _merge_results(results, len(rule_specs))
@@ -0,0 +1,195 @@
+"""F7-prefilter — literal prefilter in front of `regex.fullmatch`.
+
+Every `regex:` check is a *full* match, so each unquantified literal
+at the top level of the pattern must appear in the cell text, in
+order: a leading run is a required prefix, a trailing run a required
+suffix, anything between a required substring. `literal_prefilter`
+extracts those runs once per pattern; `eval_regex` then rejects cells
+that miss one with `str.startswith` / `endswith` / `in` before paying
+for the timeout-guarded matcher (`summary.regex_prefilter_skips`).
+
+The prefilter is only ever a *necessary* condition — when in doubt it
+is not built. The tokenizer below gives up (returns None) on
+top-level alternation, inline flags (`(?i)`, `(?x)`, `(?V1)`, named
+groups), multi-character escapes (`\\x41`, `\\p{L}`, back-references)
+and unbalanced brackets, rather than model every `regex`-module
+extension.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+__all__ = ["LiteralPrefilter", "literal_prefilter"]
+
+# Single-character escapes that are not literals. Zero-width ones
+# break a literal run like any other atom.
+_SIMPLE_ESCAPES = set("dDwWsSbBAZztnrfv")
+_START_ANCHORS = ("^", "\\A")
+_END_ANCHORS = ("$", "\\Z", "\\z")
+
+
+@dataclass(frozen=True)
+class LiteralPrefilter:
+    """Literal runs a full match of the pattern must contain."""
+
+    prefix: str
+    suffix: str
+    infixes: tuple[str, ...]
+    min_len: int  # total length of the (disjoint) runs
+
+    def may_match(self, value: str) -> bool:
+        if len(value) < self.min_len:
+            return False
+        if not value.startswith(self.prefix) or not value.endswith(self.suffix):
+            return False
+        return all(s in value for s in self.infixes)
+
+
+class _GiveUp(Exception):
+    """Pattern uses syntax the tokenizer does not model."""
+
+
+def _skip_class(p: str, i: int) -> int:
+    """`p[i] == '['`; return the index just past the closing `]`."""
+    i += 1
+    if i < len(p) and p[i] == "^":
+        i += 1
+    if i < len(p) and p[i] == "]":
+        i += 1  # leading `]` is a literal member
+    while i < len(p):
+        c = p[i]
+        if c == "\\":
+            i += 2
+        elif p.startswith("[:", i):
+            end = p.find(":]", i + 2)
+            if end < 0:
+                raise _GiveUp
+            i = end + 2
+        elif c == "[":
+            raise _GiveUp  # nested set (V1)
+        elif c == "]":
+            return i + 1
+        else:
+            i += 1
+    raise _GiveUp
+
+
+def _skip_group(p: str, i: int) -> int:
+    """`p[i] == '('`; return the index just past the matching `)`."""
+    if p.startswith("(?", i) and i + 2 < len(p) and (
+        p[i + 2].isalpha() or p[i + 2] in "#|"
+    ):
+        raise _GiveUp  # inline flags, named / branch-reset groups, comments
+    depth = 0
+    while i < len(p):
+        c = p[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            i = _skip_class(p, i)
+            continue
+        if c == "(":
+            if p.startswith("(?", i) and i + 2 < len(p) and (
+                p[i + 2].isalpha() or p[i + 2] in "#|"
+            ):
+                raise _GiveUp
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise _GiveUp
+
+
+def _quantifier_end(p: str, i: int) -> int:
+    """Index past a quantifier starting at `p[i]`, or `i` if none."""
+    if i >= len(p):
+        return i
+    if p[i] in "*+?":
+        j = i + 1
+    elif p[i] == "{":
+        close = p.find("}", i)
+        if close < 0:
+            return i
+        lo, _, hi = p[i + 1:close].partition(",")
+        if not (lo or hi) or not all(x.isdigit() for x in (lo, hi) if x):
+            return i  # not a quantifier; `_tokens` gives up on the `{`
+        j = close + 1
+    else:
+        return i
+    if j < len(p) and p[j] in "?+":
+        j += 1  # lazy / possessive
+    return j
+
+
+def _tokens(p: str) -> list[tuple[str, str | None]]:
+    """Top-level atoms as `(text, literal-or-None)`; quantified atoms
+    and non-literals carry None."""
+    out: list[tuple[str, str | None]] = []
+    i = 0
+    while i < len(p):
+        c = p[i]
+        if c == "\\":
+            if i + 1 >= len(p):
+                raise _GiveUp
+            nxt = p[i + 1]
+            if nxt.isalnum():
+                if nxt not in _SIMPLE_ESCAPES:
+                    raise _GiveUp
+                lit = None
+            else:
+                lit = nxt
+            j = i + 2
+        elif c == "[":
+            j, lit = _skip_class(p, i), None
+        elif c == "(":
+            j, lit = _skip_group(p, i), None
+        elif c in "|)]}":
+            raise _GiveUp
+        elif c in "{*+?":
+            raise _GiveUp  # quantifier with nothing to repeat / literal `{`
+        elif c in ".^$":
+            j, lit = i + 1, None
+        else:
+            j, lit = i + 1, c
+        q = _quantifier_end(p, j)
+        if q != j:
+            j, lit = q, None
+        out.append((p[i:j], lit))
+        i = j
+    return out
+
+
+def literal_prefilter(pattern: str) -> LiteralPrefilter | None:
+    """Required literal runs of `pattern`, or None when there are none
+    (or the pattern is outside what the tokenizer models)."""
+    try:
+        toks = _tokens(pattern)
+    except _GiveUp:
+        return None
+    while toks and toks[0][0] in _START_ANCHORS:
+        toks = toks[1:]
+    while toks and toks[-1][0] in _END_ANCHORS:
+        toks = toks[:-1]
+    runs: list[str] = []
+    current: list[str] = []
+    starts_literal = bool(toks) and toks[0][1] is not None
+    ends_literal = bool(toks) and toks[-1][1] is not None
+    for _, lit in toks:
+        if lit is None:
+            if current:
+                runs.append("".join(current))
+                current = []
+        else:
+            current.append(lit)
+    if current:
+        runs.append("".join(current))
+    if not runs:
+        return None
+    min_len = sum(len(r) for r in runs)
+    prefix = runs.pop(0) if starts_literal else ""
+    suffix = runs.pop() if ends_literal and runs else ""
+    return LiteralPrefilter(prefix=prefix, suffix=suffix,
+                            infixes=tuple(runs), min_len=min_len)
@@ -45,6 +45,7 @@ from .exceptions import (
 
 __all__ = [
     "ScopeResult",
+    "ColumnCache",
     "parse_sheet_qualifier",
     "resolve_sheet",
     "resolve_header",
@@ -68,6 +69,47 @@ class ScopeResult:
     info_findings: list[dict[str, Any]] = field(default_factory=list)  # merged-cell-resolution etc.
 
 
+class ColumnCache:
+    """Run-scoped memo of classified data columns; one per `_run`.
+
+    Threaded to every `resolve_scope` call (rule scopes, F8 aggregate
+    scopes, group-by key columns) as ``opts["column_cache"]``, so N
+    rules over the same column pay for one classification pass. An
+    entry is keyed by sheet, column letter, data-row extent (header
+    row → ``ws.max_row``) and the classify-relevant options; the value
+    is whatever the builder produced (F6 cell list + merged-cell info
+    findings, or an F7-columnar batch — `kind` keeps them apart).
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[Any, ...], Any] = {}
+        self.hits = 0
+
+    def get(self, key: tuple[Any, ...]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+        return entry
+
+    def put(self, key: tuple[Any, ...], entry: Any) -> None:
+        self._entries[key] = entry
+
+
+def _column_cache_key(kind: str, ws: Any, col_letter: str, first: int, last: int,
+                     opts: dict[str, Any] | None) -> tuple[Any, ...]:
+    """`ColumnCache` key; covers every `opts` entry F5 `classify` reads."""
+    opts = opts or {}
+    return (
+        kind, ws.title, col_letter, first, last,
+        bool(opts.get("strip_whitespace", True)),
+        frozenset(opts.get("treat_numeric_as_date") or ()),
+        frozenset(opts.get("treat_text_as_date") or ()),
+        bool(opts.get("dayfirst", False)),
+        bool(opts.get("has_formula_no_cache", False)),
+        bool(opts.get("is_hidden", False)),
+    )
+
+
 # === Sheet qualifier ======================================================
 
 def parse_sheet_qualifier(text: str) -> tuple[str | None, str]:
@@ -340,9 +382,22 @@ def _collect_column(ws: Any, col_letter: str, defaults: dict[str, Any] | None,
                      info_sink: list[dict[str, Any]]) -> list[ClassifiedCell]:
     header_row = int((defaults or {}).get("header_row", 1))
     first, last = _data_range(ws, header_row)
+    cache = (opts or {}).get("column_cache")
+    key = None
+    if cache is not None:
+        key = _column_cache_key("cells", ws, col_letter, first, last, opts)
+        hit = cache.get(key)
+        if hit is not None:
+            cells, infos = hit
+            info_sink.extend(infos)
+            return cells
+    infos: list[dict[str, Any]] = []
     out: list[ClassifiedCell] = []
     for r in range(first, last + 1):
-        out.append(_classify_cell_at(ws, r, col_letter, opts, merge_lookup, info_sink))
+        out.append(_classify_cell_at(ws, r, col_letter, opts, merge_lookup, infos))
+    info_sink.extend(infos)
+    if key is not None:
+        cache.put(key, (out, infos))
     return out
 
 
@@ -350,7 +405,11 @@ def _collect_column(ws: Any, col_letter: str, defaults: dict[str, Any] | None,
 
 def resolve_scope(scope_node: Any, workbook: Any, defaults: dict[str, Any] | None = None,
                    opts: dict[str, Any] | None = None) -> ScopeResult:
-    """Top-level dispatch over the 10 scope-node types (SPEC §4)."""
+    """Top-level dispatch over the 10 scope-node types (SPEC §4).
+
+    ``opts["column_cache"]`` (a `ColumnCache`), when present, is shared
+    by the `col:` / `cols:` collectors.
+    """
     defaults = defaults or {}
     opts = opts or {}
     allow_tables = not bool(opts.get("no_table_autodetect", False))
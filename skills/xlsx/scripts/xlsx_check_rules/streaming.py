@@ -0,0 +1,613 @@
+"""F6-streaming — `--streaming-input`: plan every scope, then one pass per sheet.
+
+The default path opens the workbook with `load_workbook(data_only=True)`
+in full mode: every cell of every sheet becomes a resident `Cell`
+before the first rule runs, and F6 then reads them back one
+`ws.cell(row, col)` at a time. On 1M+ cell workbooks the DOM, not the
+rules, is what costs memory.
+
+This mode opens the workbook `read_only=True` and works in three steps:
+
+1. **Pre-scan** (per sheet, on demand) — one `lxml.iterparse` over the
+   sheet part for the metadata that sits *after* `<sheetData>`:
+   `<mergeCells>`, `<hyperlinks>` and `<tableParts>` (Excel Tables are
+   parsed with openpyxl's own `Table.from_tree`). Hyperlink and comment
+   refs are kept only for their bounds: full mode materialises a cell
+   for each, so they count towards `max_row` / `max_column`.
+2. **Plan** — `plan_rules` walks each rule's scope and `when` / `check`
+   trees (`cell:` operands, F8 aggregate scopes, group-by key columns)
+   and records the columns / rows / cells it will read on each sheet.
+   Header names resolve through F6's own `resolve_header` against the
+   header row (a bounded read that stops at that row) and the
+   pre-scanned Tables. Merge anchors and the header row are always kept.
+3. **One pass** — on first access a `StreamingWorksheet` runs a single
+   `iter_rows` over the read-only sheet and keeps only the planned
+   cells. The bounding box of *every* `<c>` is tracked on the way, so
+   `max_row` / `max_column` (and with them every data range) match full
+   mode exactly.
+
+`StreamingWorkbook` / `StreamingWorksheet` duck-type the subset of the
+openpyxl surface that F6 / F7 / F7-columnar / F8 consume (`sheetnames`,
+`wb[name]`, `defined_names`, `sheet_state`, `merged_cells.ranges`,
+`tables`, `max_row`, `max_column`, `cell`, `ws[key]`), so the rule loop
+runs unchanged on top of it — either engine, identical findings.
+
+Parity rules mirrored from openpyxl 3.1.x (full load):
+- Non-anchor merge members read as empty (openpyxl swaps in `MergedCell`).
+- `cell()` outside the current bounds materialises an empty cell and
+  grows `max_row` / `max_column`, as `Worksheet.cell` does.
+
+Honest scope:
+- A read the plan did not foresee is not an error: the sheet is read
+  once more with every column kept (`StreamingWorksheet.repasses`).
+  Correct, just slower.
+- Chartsheets are passed through untouched (no cell API, as in full mode).
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, Iterator
+
+from lxml import etree
+from openpyxl import load_workbook
+from openpyxl.cell.read_only import EMPTY_CELL
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.utils.cell import coordinate_from_string, range_boundaries
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.table import Table, TableList
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.xml.constants import COMMENTS_NS
+from openpyxl.xml.functions import fromstring
+
+from .ast_nodes import (
+    CellRef, ColRef, GroupByCheck, MultiColRef, NamedRef, RangeRef,
+    RowRef, RuleSpec, SheetRef, TableRef,
+)
+from .scope_resolver import (
+    parse_sheet_qualifier, resolve_header, resolve_named, resolve_sheet,
+)
+
+__all__ = [
+    "StreamingWorkbook",
+    "StreamingWorksheet",
+    "load_streaming_workbook",
+    "plan_rules",
+    "rule_footprint",
+]
+
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_TAG_ROW = f"{{{_NS_MAIN}}}row"
+_TAG_MERGE = f"{{{_NS_MAIN}}}mergeCell"
+_TAG_HYPERLINK = f"{{{_NS_MAIN}}}hyperlink"
+_TAG_TABLE_PART = f"{{{_NS_MAIN}}}tablePart"
+_TAG_COMMENT = f"{{{_NS_MAIN}}}comment"
+_ATTR_RID = f"{{{_NS_REL}}}id"
+
+# A `range:` scope up to this many cells is kept cell-by-cell; larger
+# ones keep their whole columns (cheaper to test per row).
+_SPOT_LIMIT = 4096
+
+# openpyxl `Worksheet._get_cell` bound.
+_MAX_ROW = 1048576
+
+
+def _iterparse(source: Any, **kwargs: Any) -> Any:
+    """Hardened `iterparse`: no entity expansion, no network, no DTD."""
+    return etree.iterparse(
+        source,
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        huge_tree=False,
+        **kwargs,
+    )
+
+
+def _release(elem: Any) -> None:
+    """Free a consumed element and every already-processed sibling."""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+class _EmptyCell:
+    """Stand-in for a cell absent from the XML (or a merge member)."""
+
+    __slots__ = ("parent", "row", "column")
+
+    value = None
+    data_type = "n"
+    is_date = False
+
+    def __init__(self, parent: Any, row: int, column: int) -> None:
+        self.parent = parent
+        self.row = row
+        self.column = column
+
+    @property
+    def column_letter(self) -> str:
+        return get_column_letter(self.column)
+
+    @property
+    def coordinate(self) -> str:
+        return f"{get_column_letter(self.column)}{self.row}"
+
+
+def _cell_range(ref: str) -> CellRange | None:
+    try:
+        return CellRange(ref)
+    except (TypeError, ValueError):
+        return None
+
+
+class _MergedCells:
+    """Holder exposing `.ranges` like openpyxl's `MultiCellRange`."""
+
+    __slots__ = ("ranges",)
+
+    def __init__(self, ranges: list[CellRange]) -> None:
+        self.ranges = ranges
+
+
+@dataclasses.dataclass
+class _Projection:
+    """What one sheet's pass keeps: whole columns, whole rows, spot cells."""
+
+    keep_all: bool = False
+    cols: set[int] = dataclasses.field(default_factory=set)
+    rows: set[int] = dataclasses.field(default_factory=set)
+    spots: dict[int, set[int]] = dataclasses.field(default_factory=dict)
+
+    def add_cell(self, row: int, col: int) -> None:
+        self.spots.setdefault(row, set()).add(col)
+
+    def covers(self, row: int, col: int) -> bool:
+        return (self.keep_all or col in self.cols or row in self.rows
+                or col in self.spots.get(row, ()))
+
+
+class StreamingWorksheet:
+    """One read-only sheet, materialised lazily from a single pass."""
+
+    # F6 / F7 read cells through the same entry points as on a full
+    # `Worksheet`; only `_get_cell` and the bounds differ.
+    cell = Worksheet.cell
+    iter_rows = Worksheet.iter_rows
+    iter_cols = Worksheet.iter_cols
+    _cells_by_row = Worksheet._cells_by_row
+    _cells_by_col = Worksheet._cells_by_col
+    __getitem__ = Worksheet.__getitem__
+
+    def __init__(self, book: StreamingWorkbook, source: ReadOnlyWorksheet) -> None:
+        self._book = book
+        self._source = source
+        source.reset_dimensions()  # trust the cells, not `<dimension>`
+        self.title = source.title
+        self.sheet_state = source.sheet_state
+        self.defined_names = source.defined_names
+        self.plan = _Projection()
+        self.repasses = 0
+        self._current_row = None
+        self._meta_loaded = False
+        self._merged = _MergedCells([])
+        self._tables = TableList()
+        self._meta_bounds = (0, 0)
+        self._cells: dict[tuple[int, int], Any] | None = None
+        self._xml_bounds = (0, 0)
+        self._max_row = self._max_col = 0
+
+    # -- metadata pre-scan ------------------------------------------------
+
+    def _load_meta(self) -> None:
+        """One forward pass over the part for what follows `<sheetData>`."""
+        if self._meta_loaded:
+            return
+        archive = self._book.archive
+        part = self._source._worksheet_path  # noqa: SLF001 — openpyxl read-only
+        merge_refs: list[str] = []
+        bound_refs: list[str] = []
+        table_rids: list[str] = []
+        with archive.open(part) as fh:
+            for _event, elem in _iterparse(
+                fh, events=("end",),
+                tag=(_TAG_ROW, _TAG_MERGE, _TAG_HYPERLINK, _TAG_TABLE_PART),
+            ):
+                tag = elem.tag
+                if tag == _TAG_MERGE:
+                    if elem.get("ref"):
+                        merge_refs.append(elem.get("ref"))
+                elif tag == _TAG_HYPERLINK:
+                    if elem.get("ref"):
+                        bound_refs.append(elem.get("ref"))
+                elif tag == _TAG_TABLE_PART:
+                    if elem.get(_ATTR_RID):
+                        table_rids.append(elem.get(_ATTR_RID))
+                _release(elem)
+
+        rels_path = get_rels_path(part)
+        rels = get_dependents(archive, rels_path) if rels_path in archive.namelist() else None
+        if rels is not None:
+            for rel in rels.find(COMMENTS_NS):
+                with archive.open(rel.Target) as fh:
+                    for _event, elem in _iterparse(fh, events=("end",), tag=_TAG_COMMENT):
+                        if elem.get("ref"):
+                            bound_refs.append(elem.get("ref"))
+                        _release(elem)
+            for rid in table_rids:
+                try:
+                    target = rels.get(rid).Target
+                except KeyError:
+                    continue
+                self._tables.add(Table.from_tree(fromstring(archive.read(target))))
+
+        ranges = [rng for rng in map(_cell_range, merge_refs) if rng is not None]
+        bounds = ranges + [rng for rng in map(_cell_range, bound_refs) if rng is not None]
+        self._merged = _MergedCells(ranges)
+        self._meta_bounds = (
+            max((rng.max_row for rng in bounds), default=0),
+            max((rng.max_col for rng in bounds), default=0),
+        )
+        self._meta_loaded = True
+
+    def header_row_cells(self, header_row: int) -> tuple[Any, ...]:
+        """Row `header_row` as read so far: a bounded read before the pass."""
+        if self._cells is not None:
+            return self[header_row]
+        for row in self._source.iter_rows(min_row=header_row, max_row=header_row):
+            return tuple(row)
+        return ()
+
+    # -- the single pass --------------------------------------------------
+
+    def _load(self) -> dict[tuple[int, int], Any]:
+        if self._cells is not None:
+            return self._cells
+        self._load_meta()
+        plan = self.plan
+        for rng in self._merged.ranges:
+            plan.add_cell(rng.min_row, rng.min_col)
+        cols = sorted(plan.cols)
+        rows, spots, keep_all = plan.rows, plan.spots, plan.keep_all
+        cells: dict[tuple[int, int], Any] = {}
+        max_row = max_col = 0
+        for r, row in enumerate(self._source.iter_rows(), start=1):
+            if not row:
+                continue
+            width = len(row)
+            max_row = r
+            if width > max_col:
+                max_col = width
+            if keep_all or r in rows:
+                for c, cell in enumerate(row, start=1):
+                    if cell is not EMPTY_CELL:
+                        cells[(r, c)] = cell
+                continue
+            for c in cols:
+                if c > width:
+                    break
+                cell = row[c - 1]
+                if cell is not EMPTY_CELL:
+                    cells[(r, c)] = cell
+            for c in spots.get(r, ()):
+                if c <= width and row[c - 1] is not EMPTY_CELL:
+                    cells[(r, c)] = row[c - 1]
+        for rng in self._merged.ranges:
+            for r in range(rng.min_row, rng.max_row + 1):
+                for c in range(rng.min_col, rng.max_col + 1):
+                    if (r, c) != (rng.min_row, rng.min_col):
+                        cells.pop((r, c), None)
+        self._xml_bounds = (max_row, max_col)
+        self._max_row = max(max_row, self._meta_bounds[0])
+        self._max_col = max(max_col, self._meta_bounds[1])
+        self._cells = cells
+        return cells
+
+    def _repass(self) -> None:
+        """Unplanned read: re-run the pass keeping every cell."""
+        self.plan.keep_all = True
+        self.repasses += 1
+        self._cells = None
+        self._load()
+
+    def _get_cell(self, row: int, column: int) -> Any:
+        if not 0 < row <= _MAX_ROW:
+            raise ValueError(
+                f"Row numbers must be between 1 and {_MAX_ROW}. Row number supplied was {row}"
+            )
+        cells = self._load()
+        cell = cells.get((row, column))
+        if cell is not None:
+            return cell
+        xml_rows, xml_cols = self._xml_bounds
+        if row <= xml_rows and column <= xml_cols and not self.plan.covers(row, column) \
+                and not self._is_merge_member(row, column):
+            self._repass()
+            return self._get_cell(row, column)
+        cell = _EmptyCell(self, row, column)
+        if row > self._max_row or column > self._max_col:
+            # Full mode keeps every created cell, so it widens the bounds.
+            cells[(row, column)] = cell
+            self._max_row = max(self._max_row, row)
+            self._max_col = max(self._max_col, column)
+        return cell
+
+    def _is_merge_member(self, row: int, column: int) -> bool:
+        return any(rng.min_row <= row <= rng.max_row and rng.min_col <= column <= rng.max_col
+                   for rng in self._merged.ranges)
+
+    def scan(self) -> Iterator[tuple[int, tuple[Any, ...]]]:
+        """Every row of the part in a pass of its own (`--baseline`
+        fingerprint); nothing is kept and the plan is not consulted."""
+        yield from enumerate(self._source.iter_rows(), start=1)
+
+    @property
+    def meta_bounds(self) -> tuple[int, int]:
+        """(max_row, max_column) of merges / hyperlinks / comments."""
+        self._load_meta()
+        return self._meta_bounds
+
+    # -- openpyxl-compatible surface -------------------------------------
+
+    @property
+    def merged_cells(self) -> _MergedCells:
+        self._load_meta()
+        return self._merged
+
+    @property
+    def tables(self) -> TableList:
+        self._load_meta()
+        return self._tables
+
+    @property
+    def max_row(self) -> int:
+        self._load()
+        return self._max_row or 1
+
+    @property
+    def max_column(self) -> int:
+        self._load()
+        return self._max_col or 1
+
+
+class StreamingWorkbook:
+    """Read-only workbook façade handing out `StreamingWorksheet`s."""
+
+    def __init__(self, wb: Any) -> None:
+        self._wb = wb
+        self._sheets: dict[str, StreamingWorksheet] = {}
+
+    @property
+    def archive(self) -> Any:
+        return self._wb._archive  # noqa: SLF001 — openpyxl read-only zip handle
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return self._wb.sheetnames
+
+    @property
+    def defined_names(self) -> Any:
+        return self._wb.defined_names
+
+    def __getitem__(self, name: str) -> Any:
+        ws = self._sheets.get(name)
+        if ws is not None:
+            return ws
+        source = self._wb[name]
+        if not isinstance(source, ReadOnlyWorksheet):
+            return source
+        ws = self._sheets[name] = StreamingWorksheet(self, source)
+        return ws
+
+    def close(self) -> None:
+        self._wb.close()
+
+
+def load_streaming_workbook(path: str) -> StreamingWorkbook:
+    """`load_workbook(read_only=True, data_only=True)`, wrapped; raises what it raises."""
+    return StreamingWorkbook(load_workbook(path, read_only=True, data_only=True))
+
+
+# === Planning =============================================================
+
+def _walk(node: Any) -> Iterator[Any]:
+    yield node
+    if isinstance(node, tuple):
+        for child in node:
+            yield from _walk(child)
+    elif dataclasses.is_dataclass(node) and not isinstance(node, type):
+        for f in dataclasses.fields(node):
+            yield from _walk(getattr(node, f.name))
+
+
+class _HeaderView:
+    """Just enough worksheet for `resolve_header` before the pass."""
+
+    def __init__(self, ws: Any, header_row: int) -> None:
+        self.title = ws.title
+        self.merged_cells = ws.merged_cells
+        self.tables = ws.tables
+        if header_row <= 0:
+            self._row: tuple[Any, ...] = ()
+        elif isinstance(ws, StreamingWorksheet):
+            self._row = ws.header_row_cells(header_row)
+        else:
+            self._row = ws[header_row]
+
+    def __getitem__(self, key: int) -> tuple[Any, ...]:
+        return self._row
+
+
+class _PlanError(Exception):
+    """A scope the planner could not resolve (strict mode only)."""
+
+
+class _Planner:
+    """Records, per sheet title, what resolving scopes will read.
+
+    `plan_rules` records into each `StreamingWorksheet.plan`; a rule
+    footprint (`rule_footprint`) records into fresh projections on any
+    workbook, streaming or full. Non-strict planning is best-effort: a
+    scope that fails to plan is skipped here and raises at eval time,
+    exactly where full mode raises it. Strict planning raises
+    `_PlanError` instead, so a caller can tell the footprint is partial.
+    """
+
+    def __init__(self, wb: Any, defaults: dict[str, Any] | None,
+                 opts: dict[str, Any] | None,
+                 projections: dict[str, _Projection] | None = None,
+                 strict: bool = False) -> None:
+        self.wb = wb
+        self.defaults = defaults or {}
+        self.opts = opts or {}
+        self.projections = {} if projections is None else projections
+        self.strict = strict
+        self._views: dict[str, _HeaderView] = {}
+
+    def _proj(self, ws: Any) -> _Projection:
+        proj = self.projections.get(ws.title)
+        if proj is None:
+            proj = self.projections[ws.title] = _Projection()
+            header_row = int(self.defaults.get("header_row", 1))
+            if header_row > 0:
+                proj.rows.add(header_row)
+        return proj
+
+    def _column(self, ws: Any, child: ColRef) -> None:
+        if child.is_letter:
+            self._proj(ws).cols.add(column_index_from_string(child.name_or_letter))
+            return
+        view = self._views.get(ws.title)
+        if view is None:
+            view = self._views[ws.title] = _HeaderView(
+                ws, int(self.defaults.get("header_row", 1)),
+            )
+        letter, _ = resolve_header(
+            child.name_or_letter, view, self.defaults,
+            allow_table_fallback=not bool(self.opts.get("no_table_autodetect", False)),
+        )
+        self._proj(ws).cols.add(column_index_from_string(letter))
+
+    def _area(self, ws: Any, min_col: int, min_row: int,
+              max_col: int, max_row: int) -> None:
+        proj = self._proj(ws)
+        if (max_col - min_col + 1) * (max_row - min_row + 1) <= _SPOT_LIMIT:
+            for r in range(min_row, max_row + 1):
+                for c in range(min_col, max_col + 1):
+                    proj.add_cell(r, c)
+        else:
+            proj.cols.update(range(min_col, max_col + 1))
+
+    def scope(self, node: Any) -> str | None:
+        """Record what resolving `node` will read; return its sheet title."""
+        wb = self.wb
+        if isinstance(node, CellRef):
+            ws = resolve_sheet(node.sheet, wb)
+            col_letter, row = coordinate_from_string(node.ref)
+            self._proj(ws).add_cell(row, column_index_from_string(col_letter))
+            return ws.title
+        if isinstance(node, RangeRef):
+            ws = resolve_sheet(node.sheet, wb)
+            self._area(ws, *range_boundaries(f"{node.start}:{node.end}"))
+            return ws.title
+        if isinstance(node, (ColRef, MultiColRef)):
+            ws = resolve_sheet(node.sheet, wb)
+            for child in (node.children if isinstance(node, MultiColRef) else (node,)):
+                try:
+                    self._column(ws, child)
+                except Exception as exc:  # noqa: BLE001 — F6 raises it again at eval time
+                    if self.strict:
+                        raise _PlanError(str(exc)) from exc
+            return ws.title
+        if isinstance(node, RowRef):
+            ws = resolve_sheet(node.sheet, wb)
+            self._proj(ws).rows.add(node.n)
+            return ws.title
+        if isinstance(node, SheetRef):
+            ws = wb[node.name] if node.name in wb.sheetnames else resolve_sheet(node.name, wb)
+            self._proj(ws).keep_all = True
+            return ws.title
+        if isinstance(node, NamedRef):
+            sheet, ref = parse_sheet_qualifier(resolve_named(node.name, wb))
+            cleaned = ref.replace("$", "")
+            if ":" in cleaned:
+                start, end = cleaned.split(":", 1)
+                return self.scope(RangeRef(sheet, start, end))
+            return self.scope(CellRef(sheet, cleaned))
+        if isinstance(node, TableRef):
+            for name in wb.sheetnames:
+                ws = wb[name]
+                if getattr(ws, "tables", None) is None:
+                    continue  # chartsheet
+                for table in ws.tables.values():
+                    if (table.displayName or table.name) != node.name:
+                        continue
+                    min_col, _, max_col, _ = range_boundaries(table.ref)
+                    proj = self._proj(ws)
+                    if node.column is None:
+                        proj.cols.update(range(min_col, max_col + 1))
+                    else:
+                        names = [tc.name for tc in (table.tableColumns or [])]
+                        if node.column in names:
+                            proj.cols.add(min_col + names.index(node.column))
+                    return ws.title
+            if self.strict:
+                raise _PlanError(f"table not found: {node.name}")
+        return None
+
+    def _plan(self, node: Any) -> str | None:
+        try:
+            return self.scope(node)
+        except Exception as exc:  # noqa: BLE001 — see class docstring
+            if self.strict:
+                raise _PlanError(str(exc)) from exc
+            return None
+
+    def rule(self, rule: RuleSpec) -> None:
+        home = self._plan(rule.scope)
+        if home is None and self.strict:
+            raise _PlanError(f"unplannable scope in rule {rule.id!r}")
+        for node in _walk((rule.check, rule.when)):
+            if isinstance(node, CellRef) and node.sheet is None and home is not None:
+                # A bare `cell:A1` operand reads the rule's own sheet.
+                self._plan(CellRef(home, node.ref))
+            if isinstance(node, GroupByCheck) and home is not None:
+                is_letter = node.key.isalpha() and node.key.isupper()
+                self._plan(ColRef(home, node.key, is_letter))
+            self._plan(node)
+
+
+def plan_rules(rule_specs: list[RuleSpec], wb: StreamingWorkbook,
+               defaults: dict[str, Any] | None, opts: dict[str, Any] | None) -> None:
+    """Fill each sheet's `plan` with every cell the rules will read
+    (best-effort — see `_Planner`)."""
+    projections: dict[str, _Projection] = {}
+    for name in wb.sheetnames:
+        ws = wb[name]
+        if isinstance(ws, StreamingWorksheet):
+            projections[name] = ws.plan
+    planner = _Planner(wb, defaults, opts, projections)
+    header_row = int(planner.defaults.get("header_row", 1))
+    if header_row > 0:
+        for proj in projections.values():
+            proj.rows.add(header_row)
+    for rule in rule_specs:
+        planner.rule(rule)
+
+
+def rule_footprint(rule: RuleSpec, wb: Any, defaults: dict[str, Any] | None,
+                   opts: dict[str, Any] | None) -> dict[str, _Projection] | None:
+    """Per-sheet projection of every cell `rule` reads (plus each
+    touched sheet's header row), or None when part of it cannot be
+    planned. Works on a full or a streaming workbook; records into
+    fresh projections, so no sheet's `plan` changes."""
+    planner = _Planner(wb, defaults, opts, strict=True)
+    try:
+        planner.rule(rule)
+    except _PlanError:
+        return None
+    return planner.projections
@@ -29,8 +29,7 @@ from lxml import etree  # type: ignore
 from _errors import add_json_errors_argument, report_error
 from office._encryption import EncryptedFileError, assert_not_encrypted
 from office._macros import warn_if_macros_will_be_dropped
-from office.pack import pack
-from office.unpack import unpack
+from office.package import Package
 
 # Package internals (sibling-relative per R4.b).
 from .batch import load_batch
@@ -651,12 +650,16 @@ def main(argv: list[str] | None = None) -> int:
         # Q5: stash resolved ISO-8601 date on args for downstream consumers.
         args.date_iso = _resolve_date(args.date)
 
-        # Both single-cell and batch paths share the unpack → mutate → pack
+        # Both single-cell and batch paths share the open → mutate → save
         # frame. Dispatch to the per-row handler inside the temp tree so
-        # the pack-failure cleanup (MAJ-2) covers both modes.
-        with _tempfile.TemporaryDirectory(prefix="xlsx_add_comment-") as td:
-            tree_root = Path(td) / "tree"
-            unpack(args.input, tree_root)
+        # the save-failure cleanup (MAJ-2) covers both modes. The editor
+        # works on a part tree (its scanners glob VML / comments parts),
+        # so the input is extracted as-is — no pretty-print pass — and
+        # folded back with `sync_from`: parts the handler left alone are
+        # copied raw from the source ZIP on save (office.package).
+        with _tempfile.TemporaryDirectory(prefix="xlsx_add_comment-") as td, \
+                Package.open(args.input) as package:
+            tree_root = package.extract(Path(td) / "tree")
             wb_root = etree.parse(
                 str(tree_root / "xl" / "workbook.xml")
             ).getroot()
@@ -667,13 +670,14 @@ def main(argv: list[str] | None = None) -> int:
                 rc = single_cell_main(args, tree_root, all_sheets)
             if rc != 0:
                 return rc
-            # MAJ-2 lock: if pack fails mid-write the output may be a
+            # MAJ-2 lock: if save fails mid-write the output may be a
             # corrupt half-zip. Mirror office_passwd.py's M1 cleanup
-            # pattern — if pack raises, unlink the partial output then
+            # pattern — if save raises, unlink the partial output then
             # re-raise so the user sees a clean exit-code path with no
             # orphan to debug. (TemporaryDirectory cleans tree_root.)
+            package.sync_from(tree_root)
             try:
-                pack(tree_root, args.output)
+                package.save(args.output)
             except Exception:
                 try:
                     args.output.unlink()
@@ -30,6 +30,9 @@ docs/ARCHITECTURE.md §10 for full rationale:
 - Public dataclasses are `frozen=True` at the outer level. Inner
   sequences (rows, headers, warnings) are mutable `list` — caller
   must not mutate; library does not deepcopy on read.
+- `open_workbook(..., engine="stream")` swaps openpyxl for a native
+  `lxml.iterparse` streamer (`_stream.py`): constant memory per row,
+  merges kept, `TableData` identical to the default engine.
 - **NOT thread-safe.** openpyxl `Workbook` is not thread-safe.
   Caller is responsible for per-thread / per-process `WorkbookReader`
   instances. No module-level mutable singletons live in this package.
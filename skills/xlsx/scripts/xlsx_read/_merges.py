@@ -14,6 +14,8 @@ Three concerns:
        - "anchor-only" — top-left carries the value; rest is `None`.
        - "fill"        — anchor value broadcast to every cell.
        - "blank"       — semantic alias of "anchor-only" in v1.
+   `iter_merge_policy` is its row-at-a-time twin (rolling window of
+   open merges) backing `WorkbookReader.iter_table`.
 
 3. `_overlapping_merges_check(ranges)` performs an O(n²) pairwise
    intersection test (M8 + D4 fix). openpyxl 3.1.5 was empirically
@@ -24,7 +26,7 @@ Three concerns:
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from ._exceptions import OverlappingMerges, TooManyMerges
 from ._types import MergePolicy
@@ -146,6 +148,58 @@ def apply_merge_policy(
     return out
 
 
+def iter_merge_policy(
+    rows: Iterable[list[Any]],
+    merges: MergeMap,
+    policy: MergePolicy,
+    *,
+    n_rows: int,
+    n_cols: int,
+    top_row: int = 1,
+    left_col: int = 1,
+) -> Iterator[list[Any]]:
+    """Streaming twin of `apply_merge_policy` — one row in, one row out.
+
+    `n_rows` / `n_cols` are the grid dimensions the batch function
+    would have derived from the materialised grid; they drive the same
+    "skip merges that leave the grid" rule. Merges are indexed by
+    anchor row and kept in an *active* window only while the current
+    row lies inside their span, so memory is O(row width + open
+    merges) instead of O(region). Every yielded row is a fresh list
+    padded to `n_cols`; output is identical to `apply_merge_policy`
+    for every non-overlapping merge map (overlaps are rejected earlier
+    by `_overlapping_merges_check`).
+    """
+    if policy not in ("anchor-only", "fill", "blank"):
+        raise ValueError(f"Unknown merge policy: {policy!r}")
+    by_anchor: dict[int, list[tuple[int, int, int]]] = {}
+    for (ar, ac), (br, bc) in merges.items():
+        ar0 = ar - top_row
+        ac0 = ac - left_col
+        br0 = br - top_row
+        bc0 = bc - left_col
+        if ar0 < 0 or ac0 < 0 or br0 >= n_rows or bc0 >= n_cols:
+            continue
+        by_anchor.setdefault(ar0, []).append((ac0, br0, bc0))
+
+    fill = policy == "fill"
+    # (anchor_row0, anchor_col0, bottom_row0, right_col0, anchor_value)
+    active: list[tuple[int, int, int, int, Any]] = []
+    for ri, row in enumerate(rows):
+        out = list(row) + [None] * (n_cols - len(row))
+        if active:
+            active = [m for m in active if m[2] >= ri]
+        for ac0, br0, bc0 in by_anchor.pop(ri, ()):
+            active.append((ri, ac0, br0, bc0, out[ac0]))
+        for ar0, ac0, _br0, bc0, anchor_value in active:
+            value = anchor_value if fill else None
+            for ci in range(ac0, bc0 + 1):
+                if ri == ar0 and ci == ac0:
+                    continue
+                out[ci] = value
+        yield out
+
+
 def _overlapping_merges_check(ranges: Iterable[Any]) -> None:
     """Raise `OverlappingMerges` on the first intersecting pair.
 
@@ -0,0 +1,786 @@
+"""F8 — native `iterparse` sheet streamer (`open_workbook(engine="stream")`).
+
+The default engine materialises the whole workbook through
+`openpyxl.load_workbook`, which builds one `Cell` object per cell and
+keeps the full sheet DOM resident. On 100 MB+ exports that costs
+minutes and gigabytes of RSS. This module reads the OPC parts straight
+from the zip with `lxml.etree.iterparse` and clears every `<row>` as
+soon as it has been consumed, so memory is bounded by one row plus the
+shared-string table.
+
+`StreamWorkbook` / `StreamWorksheet` duck-type the **subset** of the
+openpyxl surface that `_sheets`, `_tables`, `_merges`, `_headers` and
+`_values` consume (`sheetnames`, `wb[name]`, `sheet_state`,
+`merged_cells.ranges`, `tables`, `defined_names`, `dimensions`,
+`max_row`, `max_column`, `iter_rows`). The rest of the library runs
+unchanged on top of it, which is what keeps `TableData` identical
+between the two engines.
+
+Parity rules mirrored from openpyxl 3.1.x (non-read-only load):
+- Cell typing follows `WorksheetReader.parse_cell`: `t="n"` casts via
+  `_cast_number`, date-formatted styles go through `from_excel`
+  (workbook `date1904` honoured), `t="s"` / `t="inlineStr"` resolve to
+  plain text, `t="b"` → bool, `t="d"` → `from_ISO8601`.
+- Non-anchor cells of a `<mergeCell>` read as `None` (openpyxl swaps
+  them for `MergedCell`), and every merged cell counts towards
+  `dimensions` / `max_row` / `max_column`.
+- Sheet-scope `<definedName>` entries are bound per sheet with
+  openpyxl's own reserved-name filter (`DefinedName.is_reserved`).
+
+Unlike openpyxl's `ReadOnlyWorksheet`, merge data is **kept**: a
+metadata pre-scan per sheet collects `<mergeCells>`, `<hyperlinks>`,
+`<tableParts>` and the populated-cell bounding box (all of which sit
+after `<sheetData>` in the part, hence the separate pass). Each
+`iter_rows` call is one further forward pass that stops as soon as
+`max_row` has been emitted.
+
+Honest scope:
+- Worksheets only. Chartsheets / dialogsheets are not listed in
+  `sheetnames` (the openpyxl engine lists them but cannot read them).
+- Array formulas under `keep_formulas=True` surface as the `"=..."`
+  string rather than openpyxl's `ArrayFormula` wrapper.
+- Each `iter_rows` call re-reads the sheet part from the start; callers
+  that read many small regions from the same sheet pay one forward
+  pass per region.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import warnings
+import zipfile
+from pathlib import Path
+from typing import Any, Iterator
+
+from lxml import etree
+from openpyxl.formula.translate import Translator
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.cell import (
+    column_index_from_string,
+    get_column_letter,
+    range_boundaries,
+)
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    WINDOWS_EPOCH,
+    from_excel,
+    from_ISO8601,
+)
+from openpyxl.workbook.defined_name import DefinedName
+
+from ._exceptions import TooManyMerges
+
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_TAG_ROW = f"{{{_NS_MAIN}}}row"
+_TAG_C = f"{{{_NS_MAIN}}}c"
+_TAG_V = f"{{{_NS_MAIN}}}v"
+_TAG_F = f"{{{_NS_MAIN}}}f"
+_TAG_IS = f"{{{_NS_MAIN}}}is"
+_TAG_T = f"{{{_NS_MAIN}}}t"
+_TAG_R = f"{{{_NS_MAIN}}}r"
+_TAG_SI = f"{{{_NS_MAIN}}}si"
+_TAG_MERGE = f"{{{_NS_MAIN}}}mergeCell"
+_TAG_HYPERLINK = f"{{{_NS_MAIN}}}hyperlink"
+_TAG_TABLE_PART = f"{{{_NS_MAIN}}}tablePart"
+_ATTR_RID = f"{{{_NS_REL}}}id"
+
+_REL_OFFICE_DOCUMENT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+_REL_WORKSHEET_SUFFIX = "/worksheet"
+_REL_SHARED_STRINGS_SUFFIX = "/sharedStrings"
+_REL_STYLES_SUFFIX = "/styles"
+_REL_TABLE_SUFFIX = "/table"
+
+# Same `_MAX_MERGES` bound as `_merges.parse_merges` — enforced here as
+# well because the pre-scan materialises the ranges before
+# `parse_merges` ever sees them.
+_MAX_MERGES: int = 100_000
+
+
+def _iterparse(source: Any, **kwargs: Any) -> Any:
+    """Hardened `iterparse`: no entity expansion, no network, no DTD."""
+    return etree.iterparse(
+        source,
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        huge_tree=False,
+        **kwargs,
+    )
+
+
+def _parse_part(zf: zipfile.ZipFile, name: str) -> Any:
+    """Parse a small XML part (workbook / rels / styles / table) in full."""
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, load_dtd=False)
+    with zf.open(name) as fh:
+        return etree.parse(fh, parser).getroot()
+
+
+def _rels_path(part: str) -> str:
+    directory, base = posixpath.split(part)
+    return posixpath.join(directory, "_rels", f"{base}.rels")
+
+
+def _read_rels(zf: zipfile.ZipFile, part: str) -> dict[str, tuple[str, str, str]]:
+    """Map `rId` → `(type, resolved_target, target_mode)` for `part`."""
+    rels_name = _rels_path(part)
+    try:
+        root = _parse_part(zf, rels_name)
+    except KeyError:
+        return {}
+    base_dir = posixpath.dirname(part)
+    out: dict[str, tuple[str, str, str]] = {}
+    for rel in root.iter(f"{{{_NS_PKG_REL}}}Relationship"):
+        target = rel.get("Target", "")
+        mode = rel.get("TargetMode", "Internal")
+        if mode != "External":
+            if target.startswith("/"):
+                target = target.lstrip("/")
+            else:
+                target = posixpath.normpath(posixpath.join(base_dir, target))
+        out[rel.get("Id", "")] = (rel.get("Type", ""), target, mode)
+    return out
+
+
+def _text_content(node: Any) -> str:
+    """Plain text of an `<si>` / `<is>` node (openpyxl `Text.content`).
+
+    Concatenates the bare `<t>` and every rich-text run `<r><t>`;
+    phonetic `<rPh>` runs are excluded, as in openpyxl.
+    """
+    parts: list[str] = []
+    for child in node:
+        if child.tag == _TAG_T:
+            if child.text is not None:
+                parts.append(child.text)
+        elif child.tag == _TAG_R:
+            t = child.find(_TAG_T)
+            if t is not None and t.text is not None:
+                parts.append(t.text)
+    return "".join(parts)
+
+
+def _cast_number(value: str) -> int | float:
+    """Convert a numeric `<v>` to int or float (openpyxl `_cast_number`)."""
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+def _column_of(ref: str, memo: dict[str, int]) -> int:
+    """Column index of an A1 ref; `memo` caches the letter → index map."""
+    letters = ref.rstrip("0123456789$")
+    col = memo.get(letters)
+    if col is None:
+        col = memo[letters] = column_index_from_string(letters.lstrip("$"))
+    return col
+
+
+def _iter_row_cells(row: Any, memo: dict[str, int]) -> Iterator[tuple[int, Any]]:
+    """Yield `(column, <c>)` for one `<row>`; tolerates missing `r=`."""
+    col_counter = 0
+    for c in row.iterchildren(_TAG_C):
+        ref = c.get("r")
+        if ref:
+            col_counter = _column_of(ref, memo)
+        else:
+            col_counter += 1
+        yield col_counter, c
+
+
+def _row_col_span(row: Any, memo: dict[str, int]) -> tuple[int, int] | None:
+    """`(first_col, last_col)` of a `<row>`, or None when it has no cells.
+
+    Cells inside a row are stored in column order, so the first and
+    last `<c>` bound the span; only a row with `r=`-less cells needs
+    the full walk.
+    """
+    first = row.find(_TAG_C)
+    if first is None:
+        return None
+    last = row[-1] if row[-1].tag == _TAG_C else None
+    if first.get("r") and last is not None and last.get("r"):
+        return _column_of(first.get("r"), memo), _column_of(last.get("r"), memo)
+    cols = [col for col, _c in _iter_row_cells(row, memo)]
+    return min(cols), max(cols)
+
+
+def _merge_child(ranges: list[_StreamRange], row: int, col: int) -> bool:
+    """True iff `(row, col)` lies inside a merge but is not its anchor."""
+    for rng in ranges:
+        if (
+            rng.min_row <= row <= rng.max_row
+            and rng.min_col <= col <= rng.max_col
+            and (row != rng.min_row or col != rng.min_col)
+        ):
+            return True
+    return False
+
+
+def _hidden_cols(active: list[_StreamRange], row: int) -> set[int]:
+    """Columns of `row` that openpyxl would replace with `MergedCell`."""
+    out: set[int] = set()
+    for rng in active:
+        if row == rng.min_row:
+            out.update(range(rng.min_col + 1, rng.max_col + 1))
+        else:
+            out.update(range(rng.min_col, rng.max_col + 1))
+    return out
+
+
+def _release(elem: Any) -> None:
+    """Free a consumed element and every already-processed sibling."""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+class _StreamRange:
+    """Inclusive 1-based cell range; mirrors openpyxl `CellRange` fields."""
+
+    __slots__ = ("min_row", "min_col", "max_row", "max_col", "coord")
+
+    def __init__(self, ref: str) -> None:
+        min_col, min_row, max_col, max_row = range_boundaries(ref)
+        self.min_row = min_row
+        self.min_col = min_col
+        self.max_row = max_row
+        self.max_col = max_col
+        self.coord = ref
+
+    def __str__(self) -> str:
+        return self.coord
+
+    def __repr__(self) -> str:
+        return f"<_StreamRange {self.coord}>"
+
+
+class _StreamMergedCells:
+    """Holder exposing `.ranges` like openpyxl's `MultiCellRange`."""
+
+    __slots__ = ("ranges",)
+
+    def __init__(self, ranges: list[_StreamRange]) -> None:
+        self.ranges = ranges
+
+
+class _StreamHyperlink:
+    __slots__ = ("target", "location")
+
+    def __init__(self, target: str | None, location: str | None) -> None:
+        self.target = target
+        self.location = location
+
+
+class _StreamTable:
+    __slots__ = ("displayName", "ref", "headerRowCount")
+
+    def __init__(self, display_name: str, ref: str, header_row_count: int) -> None:
+        self.displayName = display_name
+        self.ref = ref
+        self.headerRowCount = header_row_count
+
+
+class _StreamCell:
+    """Slotted stand-in for `openpyxl.cell.Cell` (what `extract_cell` reads)."""
+
+    __slots__ = ("value", "data_type", "number_format", "coordinate", "hyperlink")
+
+    def __init__(
+        self,
+        value: Any,
+        data_type: str,
+        number_format: str,
+        coordinate: str,
+        hyperlink: _StreamHyperlink | None,
+    ) -> None:
+        self.value = value
+        self.data_type = data_type
+        self.number_format = number_format
+        self.coordinate = coordinate
+        self.hyperlink = hyperlink
+
+
+class StreamWorksheet:
+    """One worksheet part, read lazily from the workbook zip."""
+
+    def __init__(
+        self,
+        book: StreamWorkbook,
+        title: str,
+        part: str,
+        state: str,
+    ) -> None:
+        self._book = book
+        self.title = title
+        self.sheet_state = state
+        self._part = part
+        self.defined_names: dict[str, Any] = {}
+        self._meta_loaded = False
+        self._merged: _StreamMergedCells = _StreamMergedCells([])
+        self._hyperlinks: dict[tuple[int, int], _StreamHyperlink] = {}
+        self._tables: dict[str, _StreamTable] = {}
+        self._bbox: tuple[int, int, int, int] | None = None
+
+    # -- metadata pre-scan ------------------------------------------------
+
+    def _load_meta(self) -> None:
+        """One forward pass collecting everything that lives after `<sheetData>`."""
+        if self._meta_loaded:
+            return
+        zf = self._book._zf
+        min_row = min_col = max_row = max_col = 0
+        merge_refs: list[str] = []
+        link_nodes: list[tuple[str, str | None, str | None]] = []
+        table_rids: list[str] = []
+        memo: dict[str, int] = {}
+        with zf.open(self._part) as fh:
+            row_counter = 0
+            for _event, elem in _iterparse(
+                fh, events=("end",),
+                tag=(_TAG_ROW, _TAG_MERGE, _TAG_HYPERLINK, _TAG_TABLE_PART),
+            ):
+                tag = elem.tag
+                if tag == _TAG_ROW:
+                    r_attr = elem.get("r")
+                    row_counter = int(r_attr) if r_attr else row_counter + 1
+                    span = _row_col_span(elem, memo)
+                    if span is not None:
+                        if not min_row:
+                            min_row = row_counter
+                        max_row = row_counter
+                        if not min_col or span[0] < min_col:
+                            min_col = span[0]
+                        if span[1] > max_col:
+                            max_col = span[1]
+                    _release(elem)
+                elif tag == _TAG_MERGE:
+                    ref = elem.get("ref")
+                    if ref:
+                        merge_refs.append(ref)
+                        if len(merge_refs) > _MAX_MERGES:
+                            raise TooManyMerges(
+                                f"Worksheet {self.title!r}: more than "
+                                f"{_MAX_MERGES} merge ranges; aborting to protect memory."
+                            )
+                elif tag == _TAG_HYPERLINK:
+                    link_nodes.append(
+                        (elem.get("ref", ""), elem.get(_ATTR_RID), elem.get("location"))
+                    )
+                elif tag == _TAG_TABLE_PART:
+                    rid = elem.get(_ATTR_RID)
+                    if rid:
+                        table_rids.append(rid)
+
+        ranges: list[_StreamRange] = []
+        for ref in merge_refs:
+            rng = _StreamRange(ref)
+            ranges.append(rng)
+            # openpyxl creates a cell for every position of the merge
+            # (anchor via `start_cell`, the rest as `MergedCell`), so the
+            # whole rectangle counts towards the dimension bbox.
+            for r, c in ((rng.min_row, rng.min_col), (rng.max_row, rng.max_col)):
+                if not min_row or r < min_row:
+                    min_row = r
+                if r > max_row:
+                    max_row = r
+                if not min_col or c < min_col:
+                    min_col = c
+                if c > max_col:
+                    max_col = c
+        self._merged = _StreamMergedCells(ranges)
+
+        rels: dict[str, tuple[str, str, str]] = {}
+        if link_nodes or table_rids:
+            rels = _read_rels(zf, self._part)
+        for ref, rid, location in link_nodes:
+            target = rels[rid][1] if rid and rid in rels else None
+            link = _StreamHyperlink(target, location)
+            try:
+                min_c, min_r, max_c, max_r = range_boundaries(ref)
+            except (TypeError, ValueError):
+                continue
+            if ":" not in ref:
+                # A link on a merged child binds to the merge anchor.
+                for rng in ranges:
+                    if rng.min_row <= min_r <= rng.max_row and rng.min_col <= min_c <= rng.max_col:
+                        min_r, min_c = max_r, max_c = rng.min_row, rng.min_col
+                        break
+            for r in range(min_r, max_r + 1):
+                for c in range(min_c, max_c + 1):
+                    if _merge_child(ranges, r, c):
+                        continue
+                    self._hyperlinks[(r, c)] = link
+                    if not min_row or r < min_row:
+                        min_row = r
+                    if r > max_row:
+                        max_row = r
+                    if not min_col or c < min_col:
+                        min_col = c
+                    if c > max_col:
+                        max_col = c
+
+        for rid in table_rids:
+            rel = rels.get(rid)
+            if rel is None or not rel[0].endswith(_REL_TABLE_SUFFIX):
+                continue
+            try:
+                root = _parse_part(zf, rel[1])
+            except KeyError:
+                continue
+            name = root.get("displayName") or root.get("name") or ""
+            hrc_attr = root.get("headerRowCount")
+            self._tables[name] = _StreamTable(
+                name, root.get("ref", ""), int(hrc_attr) if hrc_attr is not None else 1
+            )
+
+        if max_row:
+            self._bbox = (min_row, min_col, max_row, max_col)
+        self._meta_loaded = True
+
+    # -- openpyxl-compatible surface -------------------------------------
+
+    @property
+    def merged_cells(self) -> _StreamMergedCells:
+        self._load_meta()
+        return self._merged
+
+    @property
+    def tables(self) -> dict[str, _StreamTable]:
+        self._load_meta()
+        return self._tables
+
+    @property
+    def max_row(self) -> int:
+        self._load_meta()
+        return self._bbox[2] if self._bbox else 1
+
+    @property
+    def max_column(self) -> int:
+        self._load_meta()
+        return self._bbox[3] if self._bbox else 1
+
+    @property
+    def dimensions(self) -> str:
+        self._load_meta()
+        if self._bbox is None:
+            return "A1:A1"
+        min_row, min_col, max_row, max_col = self._bbox
+        return (
+            f"{get_column_letter(min_col)}{min_row}:"
+            f"{get_column_letter(max_col)}{max_row}"
+        )
+
+    def iter_rows(
+        self,
+        min_row: int | None = None,
+        max_row: int | None = None,
+        min_col: int | None = None,
+        max_col: int | None = None,
+        values_only: bool = False,
+    ) -> Iterator[tuple[Any, ...]]:
+        """Yield one fully-padded tuple per row in `[min_row, max_row]`.
+
+        Same contract as openpyxl's non-read-only `iter_rows`: absent
+        rows and cells are materialised as empty (`None`) entries, so
+        every tuple has exactly `max_col - min_col + 1` items.
+        """
+        self._load_meta()
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        if max_row < min_row or max_col < min_col:
+            return
+        width = max_col - min_col + 1
+        book = self._book
+        # Sweep-line over merges sorted by top row: `active` holds the
+        # ranges covering the current row, so the per-row "which cells
+        # are merge children" lookup stays proportional to the handful
+        # of merges crossing that row rather than to the sheet total.
+        pending = sorted(
+            (
+                rng for rng in self._merged.ranges
+                if rng.max_row >= min_row and rng.min_row <= max_row
+                and rng.max_col >= min_col and rng.min_col <= max_col
+            ),
+            key=lambda rng: rng.min_row,
+        )
+        pending_idx = 0
+        active: list[_StreamRange] = []
+        links = self._hyperlinks
+        data_only = book._data_only
+        shared_formulae: dict[str, Translator] = {}
+        memo: dict[str, int] = {}
+
+        def _empty(row_idx: int) -> tuple[Any, ...]:
+            if values_only:
+                return (None,) * width
+            return tuple(
+                _StreamCell(
+                    None, "n", "General", f"{get_column_letter(c)}{row_idx}",
+                    links.get((row_idx, c)),
+                )
+                for c in range(min_col, max_col + 1)
+            )
+
+        next_row = min_row
+        with book._zf.open(self._part) as fh:
+            row_counter = 0
+            for _event, elem in _iterparse(fh, events=("end",), tag=_TAG_ROW):
+                r_attr = elem.get("r")
+                row_counter = int(r_attr) if r_attr else row_counter + 1
+                if row_counter < min_row:
+                    if not data_only:
+                        # Shared-formula masters above the window still
+                        # seed the translators of dependents inside it.
+                        for col, c in _iter_row_cells(elem, memo):
+                            book._decode(c, row_counter, col, shared_formulae)
+                    _release(elem)
+                    continue
+                if row_counter > max_row:
+                    _release(elem)
+                    break
+                while next_row < row_counter:
+                    yield _empty(next_row)
+                    next_row += 1
+                while pending_idx < len(pending) and pending[pending_idx].min_row <= row_counter:
+                    active.append(pending[pending_idx])
+                    pending_idx += 1
+                if active:
+                    active = [rng for rng in active if rng.max_row >= row_counter]
+                hidden = _hidden_cols(active, row_counter) if active else ()
+                slots: list[Any] = [None] * width
+                for col, c in _iter_row_cells(elem, memo):
+                    if col < min_col or col > max_col:
+                        continue
+                    if col in hidden:
+                        continue
+                    value, data_type, fmt = book._decode(
+                        c, row_counter, col, shared_formulae
+                    )
+                    if values_only:
+                        slots[col - min_col] = value
+                    else:
+                        slots[col - min_col] = _StreamCell(
+                            value, data_type, fmt,
+                            c.get("r") or f"{get_column_letter(col)}{row_counter}",
+                            links.get((row_counter, col)),
+                        )
+                _release(elem)
+                if not values_only:
+                    for i, slot in enumerate(slots):
+                        if slot is None:
+                            col = min_col + i
+                            slots[i] = _StreamCell(
+                                None, "n", "General",
+                                f"{get_column_letter(col)}{row_counter}",
+                                links.get((row_counter, col)),
+                            )
+                yield tuple(slots)
+                next_row = row_counter + 1
+        while next_row <= max_row:
+            yield _empty(next_row)
+            next_row += 1
+
+
+class StreamWorkbook:
+    """Zip-backed workbook façade; owns the open `ZipFile` handle."""
+
+    def __init__(self, path: Path, *, data_only: bool = True) -> None:
+        self._zf = zipfile.ZipFile(path, "r")
+        self._data_only = data_only
+        try:
+            self._load_workbook()
+        except BaseException:
+            self._zf.close()
+            raise
+        self._shared_strings: list[str] | None = None
+
+    def _load_workbook(self) -> None:
+        zf = self._zf
+        wb_part = "xl/workbook.xml"
+        for rel_type, target, _mode in _read_rels(zf, "").values():
+            if rel_type == _REL_OFFICE_DOCUMENT:
+                wb_part = target
+                break
+        root = _parse_part(zf, wb_part)
+        rels = _read_rels(zf, wb_part)
+
+        pr = root.find(f"{{{_NS_MAIN}}}workbookPr")
+        date1904 = pr is not None and pr.get("date1904") in ("1", "true")
+        self._epoch = CALENDAR_MAC_1904 if date1904 else WINDOWS_EPOCH
+
+        self._styles_part: str | None = None
+        self._strings_part: str | None = None
+        for rel_type, target, _mode in rels.values():
+            if rel_type.endswith(_REL_STYLES_SUFFIX):
+                self._styles_part = target
+            elif rel_type.endswith(_REL_SHARED_STRINGS_SUFFIX):
+                self._strings_part = target
+
+        # `localSheetId` indexes the full `<sheets>` list (chartsheets
+        # included), so keep that positional mapping separately.
+        self._sheets: dict[str, StreamWorksheet] = {}
+        by_position: list[StreamWorksheet | None] = []
+        sheets_el = root.find(f"{{{_NS_MAIN}}}sheets")
+        for sheet in (sheets_el if sheets_el is not None else ()):
+            rel = rels.get(sheet.get(_ATTR_RID, ""))
+            if rel is None or not rel[0].endswith(_REL_WORKSHEET_SUFFIX):
+                by_position.append(None)
+                continue
+            ws = StreamWorksheet(
+                self, sheet.get("name", ""), rel[1], sheet.get("state") or "visible"
+            )
+            self._sheets[ws.title] = ws
+            by_position.append(ws)
+
+        names_el = root.find(f"{{{_NS_MAIN}}}definedNames")
+        for dn_el in (names_el if names_el is not None else ()):
+            local_id = dn_el.get("localSheetId")
+            if local_id is None:
+                continue
+            defn = DefinedName(
+                name=dn_el.get("name", ""),
+                localSheetId=local_id,
+                attr_text=dn_el.text or "",
+            )
+            if defn.is_reserved is not None:
+                continue
+            try:
+                ws = by_position[int(local_id)]
+            except (IndexError, ValueError):
+                continue
+            if ws is not None:
+                ws.defined_names[defn.name] = defn
+
+        self._load_styles()
+
+    def _load_styles(self) -> None:
+        """Resolve `cellXfs` → number-format string + date / timedelta flags."""
+        self._style_formats: list[str] = []
+        self._date_styles: set[int] = set()
+        self._timedelta_styles: set[int] = set()
+        if self._styles_part is None:
+            return
+        try:
+            root = _parse_part(self._zf, self._styles_part)
+        except KeyError:
+            return
+        custom: dict[int, str] = {}
+        num_fmts = root.find(f"{{{_NS_MAIN}}}numFmts")
+        for nf in (num_fmts if num_fmts is not None else ()):
+            try:
+                custom[int(nf.get("numFmtId", ""))] = nf.get("formatCode", "")
+            except ValueError:
+                continue
+        cell_xfs = root.find(f"{{{_NS_MAIN}}}cellXfs")
+        for idx, xf in enumerate(cell_xfs if cell_xfs is not None else ()):
+            try:
+                fmt_id = int(xf.get("numFmtId", "0"))
+            except ValueError:
+                fmt_id = 0
+            fmt = custom.get(fmt_id)
+            if fmt is None:
+                fmt = BUILTIN_FORMATS.get(fmt_id)
+            self._style_formats.append(fmt or "General")
+            if fmt is not None and is_date_format(fmt):
+                self._date_styles.add(idx)
+            if fmt is not None and is_timedelta_format(fmt):
+                self._timedelta_styles.add(idx)
+
+    def _strings(self) -> list[str]:
+        """Shared-string table, iterparsed once and cleared as it goes."""
+        if self._shared_strings is None:
+            strings: list[str] = []
+            if self._strings_part is not None and self._strings_part in self._zf.namelist():
+                with self._zf.open(self._strings_part) as fh:
+                    for _event, si in _iterparse(fh, events=("end",), tag=_TAG_SI):
+                        strings.append(_text_content(si).replace("x005F_", ""))
+                        _release(si)
+            self._shared_strings = strings
+        return self._shared_strings
+
+    def _decode(
+        self,
+        c: Any,
+        row: int,
+        col: int,
+        shared_formulae: dict[str, Translator],
+    ) -> tuple[Any, str, str]:
+        """Return `(value, data_type, number_format)` for one `<c>` element."""
+        data_type = c.get("t", "n")
+        style_attr = c.get("s")
+        style_id = int(style_attr) if style_attr else 0
+        formats = self._style_formats
+        fmt = formats[style_id] if style_id < len(formats) else "General"
+
+        f_el = None if self._data_only else c.find(_TAG_F)
+        if f_el is not None:
+            value = "=" + (f_el.text or "")
+            if f_el.get("t") == "shared":
+                coordinate = c.get("r") or f"{get_column_letter(col)}{row}"
+                idx = f_el.get("si")
+                if idx in shared_formulae:
+                    value = shared_formulae[idx].translate_formula(coordinate)
+                elif value != "=":
+                    shared_formulae[idx] = Translator(value, coordinate)
+            return value, "f", fmt
+
+        if data_type == "inlineStr":
+            is_el = c.find(_TAG_IS)
+            if is_el is None:
+                return None, data_type, fmt
+            return _text_content(is_el), "s", fmt
+
+        value: Any = c.findtext(_TAG_V, None) or None
+        if value is None:
+            return None, data_type, fmt
+        if data_type == "n":
+            value = _cast_number(value)
+            if style_id in self._date_styles:
+                try:
+                    value = from_excel(
+                        value, self._epoch,
+                        timedelta=style_id in self._timedelta_styles,
+                    )
+                    data_type = "d"
+                except (OverflowError, ValueError):
+                    warnings.warn(
+                        f"Cell {get_column_letter(col)}{row} is marked as a date "
+                        f"but the serial value {value} is outside the limits for "
+                        f"dates. The cell will be treated as an error."
+                    )
+                    return "#VALUE!", "e", fmt
+        elif data_type == "s":
+            value = self._strings()[int(value)]
+        elif data_type == "b":
+            value = bool(int(value))
+        elif data_type == "str":
+            data_type = "s"
+        elif data_type == "d":
+            value = from_ISO8601(value)
+        return value, data_type, fmt
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return list(self._sheets)
+
+    def __getitem__(self, name: str) -> StreamWorksheet:
+        try:
+            return self._sheets[name]
+        except KeyError:
+            raise KeyError(f"Worksheet {name} does not exist.") from None
+
+    def close(self) -> None:
+        self._zf.close()
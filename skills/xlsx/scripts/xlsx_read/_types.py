@@ -15,6 +15,8 @@ without changing the public signatures or `__all__`.
 
 from __future__ import annotations
 
+import itertools
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -22,6 +24,9 @@ from typing import Any, Literal
 MergePolicy = Literal["anchor-only", "fill", "blank"]
 TableDetectMode = Literal["auto", "tables-only", "whole"]
 DateFmt = Literal["ISO", "excel-serial", "raw"]
+# Backend selected at `open_workbook` time. Not re-exported from the
+# package (the `__all__` lock); callers pass the literal string.
+ReaderEngine = Literal["openpyxl", "stream"]
 
 
 @dataclass(frozen=True)
@@ -76,6 +81,8 @@ class WorkbookReader:
     - `sheets()` → 009-03 wires to `_sheets.enumerate_sheets`.
     - `detect_tables()` → 009-05 wires to `_tables.detect_tables`.
     - `read_table()` → 009-08 wires F3 + F5 + F6 dispatch.
+    - `iter_table()` → streaming twin of `read_table()` (header
+      metadata first, then one row per item).
     - `close()` → 009-02 wires to `self._wb.close()`.
     """
 
@@ -83,6 +90,7 @@ class WorkbookReader:
     _wb: Any = None
     _read_only: bool = False
     _keep_formulas: bool = False
+    _engine: ReaderEngine = "openpyxl"
     _closed: bool = False
     # Per-sheet memo for `_overlapping_merges_check` (P-H1 / S-L3 fix).
     # An overlapping-merge detection is a static property of the sheet
@@ -149,21 +157,161 @@ class WorkbookReader:
         anchor a real header band), `smart` is equivalent to `auto`
         with `header_rows=1` fallback.
         """
-        from ._headers import (
-            _ambiguous_boundary_check,
-            detect_header_band,
-            flatten_headers,
-            synthetic_headers,
+        from ._headers import _ambiguous_boundary_check, flatten_headers
+        from ._merges import apply_merge_policy, parse_merges
+
+        if self._wb is None:
+            return TableData(region=region)
+
+        ws, region, header_rows, merged_ranges_attr = self._prepare_region(
+            region, header_rows,
         )
-        from ._merges import (
-            apply_merge_policy,
-            parse_merges,
-            _overlapping_merges_check,
+        merges = parse_merges(ws)
+
+        warnings_list: list[str] = []
+        values_grid = list(self._iter_region_values(
+            ws, region, warnings_list,
+            include_hyperlinks=include_hyperlinks,
+            include_formulas=include_formulas,
+            datetime_format=datetime_format,
+        ))
+        values_grid = apply_merge_policy(
+            values_grid, merges, merge_policy,
+            top_row=region.top_row, left_col=region.left_col,
         )
-        from ._values import extract_cell
+
+        hdr = self._resolve_header_count(ws, region, header_rows, warnings_list)
+        if hdr is None or hdr == 0:
+            from ._headers import synthetic_headers
+
+            headers = synthetic_headers(region.right_col - region.left_col + 1)
+            data_rows = values_grid
+        else:
+            # xlsx-8a-10 (R12): graceful no-merge fallback on
+            # ReadOnlyWorksheet — `.merged_cells` is absent.
+            # iter-3 (vdd-multi L1): re-use the `.ranges`-via-
+            # `getattr` probe from `_prepare_region` to stay
+            # hasattr-safe.
+            ambig_merges = (
+                list(merged_ranges_attr)
+                if merged_ranges_attr is not None
+                else []
+            )
+            ambig = _ambiguous_boundary_check(ambig_merges, region, hdr)
+            if ambig is not None:
+                warnings_list.append(ambig)
+            headers, hdr_warnings = flatten_headers(
+                values_grid[:hdr], hdr,
+                merges=merges,
+                region_top_row=region.top_row,
+                region_left_col=region.left_col,
+            )
+            warnings_list.extend(hdr_warnings)
+            data_rows = values_grid[hdr:]
+
+        return TableData(
+            region=region,
+            headers=headers,
+            rows=data_rows,
+            warnings=warnings_list,
+        )
+
+    def iter_table(
+        self,
+        region: TableRegion,
+        *,
+        header_rows: int | Literal["auto", "smart"] = "auto",
+        merge_policy: MergePolicy = "anchor-only",
+        include_hyperlinks: bool = False,
+        include_formulas: bool = False,
+        datetime_format: DateFmt = "ISO",
+    ) -> Iterator[Any]:
+        """Stream a region: header metadata first, then data rows lazily.
+
+        Same arguments and the same cell values as :meth:`read_table`,
+        but the region is never materialised. The **first** item is a
+        `TableData` carrying the (possibly `smart`-shifted) `region`,
+        the flattened `headers`, the header band itself as `rows`
+        (`len(rows)` is the number of header rows consumed; empty when
+        headers are synthetic) and the `warnings` list. Every later
+        item is one data row (`list`, padded to the region width).
+
+        The merge policy runs through `_merges.iter_merge_policy` — a
+        rolling window over the merges that span the current row — so
+        peak memory is O(row width + header band + open merges).
+
+        `warnings` is the live list the generator keeps appending to:
+        header-phase warnings are present on the first item, cell
+        warnings of data rows arrive as those rows are produced. Read
+        it again after exhausting the generator for the complete set
+        (same entries as `read_table`, header-phase first).
+        """
+        from ._headers import _ambiguous_boundary_check, flatten_headers
+        from ._merges import iter_merge_policy, parse_merges
 
         if self._wb is None:
-            return TableData(region=region)
+            yield TableData(region=region)
+            return
+
+        ws, region, header_rows, merged_ranges_attr = self._prepare_region(
+            region, header_rows,
+        )
+        merges = parse_merges(ws)
+
+        warnings_list: list[str] = []
+        rows = iter_merge_policy(
+            self._iter_region_values(
+                ws, region, warnings_list,
+                include_hyperlinks=include_hyperlinks,
+                include_formulas=include_formulas,
+                datetime_format=datetime_format,
+            ),
+            merges, merge_policy,
+            n_rows=region.bottom_row - region.top_row + 1,
+            n_cols=region.right_col - region.left_col + 1,
+            top_row=region.top_row, left_col=region.left_col,
+        )
+
+        hdr = self._resolve_header_count(ws, region, header_rows, warnings_list)
+        if hdr is None or hdr == 0:
+            from ._headers import synthetic_headers
+
+            headers = synthetic_headers(region.right_col - region.left_col + 1)
+            band: list[list[Any]] = []
+        else:
+            band = list(itertools.islice(rows, hdr))
+            ambig_merges = (
+                list(merged_ranges_attr)
+                if merged_ranges_attr is not None
+                else []
+            )
+            ambig = _ambiguous_boundary_check(ambig_merges, region, hdr)
+            if ambig is not None:
+                warnings_list.append(ambig)
+            headers, hdr_warnings = flatten_headers(
+                band, hdr,
+                merges=merges,
+                region_top_row=region.top_row,
+                region_left_col=region.left_col,
+            )
+            warnings_list.extend(hdr_warnings)
+
+        yield TableData(
+            region=region, headers=headers, rows=band, warnings=warnings_list,
+        )
+        yield from rows
+
+    def _prepare_region(
+        self,
+        region: TableRegion,
+        header_rows: int | Literal["auto", "smart"],
+    ) -> tuple[Any, TableRegion, int | Literal["auto"], Any]:
+        """Shared front half of `read_table` / `iter_table`.
+
+        Returns `(ws, region, header_rows, merged_ranges_attr)` after
+        the `smart` shift and the once-per-sheet overlap check.
+        """
+        from ._merges import _overlapping_merges_check
 
         ws = self._wb[region.sheet]
 
@@ -196,10 +344,10 @@ class WorkbookReader:
         # Excel's practical merge cap (typically < 100 per sheet).
         # xlsx-8a-10 (R12): `ReadOnlyWorksheet` (selected by openpyxl
         # when read_only=True) does NOT expose `.merged_cells`. Probe
-        # once per read_table call; reuse for both the overlap check
-        # and the ambiguous-boundary check below. The fail-loud
-        # contract for overlapping merges degrades to no-op in
-        # streaming mode (documented honest-scope).
+        # once per call; reuse for both the overlap check and the
+        # ambiguous-boundary check. The fail-loud contract for
+        # overlapping merges degrades to no-op in streaming mode
+        # (documented honest-scope).
         # **iter-3 fix (vdd-multi L1)**: probe `.ranges` via
         # `getattr` so a non-`None` `merged_cells_attr` with a
         # different proxy shape (future openpyxl) doesn't
@@ -210,15 +358,31 @@ class WorkbookReader:
             if merged_ranges_attr is not None:
                 _overlapping_merges_check(list(merged_ranges_attr))
             self._overlap_checked.add(region.sheet)
-        merges = parse_merges(ws)
+        return ws, region, header_rows, merged_ranges_attr
+
+    @staticmethod
+    def _iter_region_values(
+        ws: Any,
+        region: TableRegion,
+        warnings_list: list[str],
+        *,
+        include_hyperlinks: bool,
+        include_formulas: bool,
+        datetime_format: DateFmt,
+    ) -> Iterator[list[Any]]:
+        """Yield the region's extracted values row by row, fully padded.
+
+        Streams via `iter_rows(...)` (P-C2 fix). The historical nested
+        `ws.cell(r, c)` pattern is fatal in openpyxl `read_only=True`
+        mode (each call re-walks the sheet XML stream). `iter_rows` is
+        the documented streaming entry. Extraction warnings are
+        appended to `warnings_list` as rows are produced.
+        """
+        from ._values import extract_cell
 
-        # Stream the region via `iter_rows(...)` (P-C2 fix). The
-        # historical nested `ws.cell(r, c)` pattern is fatal in
-        # openpyxl `read_only=True` mode (each call re-walks the sheet
-        # XML stream). `iter_rows` is the documented streaming entry.
-        warnings_list: list[str] = []
-        values_grid: list[list[Any]] = []
         n_cols_expected = region.right_col - region.left_col + 1
+        n_rows_expected = region.bottom_row - region.top_row + 1
+        n_rows = 0
         for row_cells in ws.iter_rows(
             min_row=region.top_row, max_row=region.bottom_row,
             min_col=region.left_col, max_col=region.right_col,
@@ -238,73 +402,46 @@ class WorkbookReader:
             # Pad short rows (sparse streaming may yield fewer cells).
             if len(row_vals) < n_cols_expected:
                 row_vals.extend([None] * (n_cols_expected - len(row_vals)))
-            values_grid.append(row_vals)
+            n_rows += 1
+            yield row_vals
         # Pad missing rows (iter_rows skips entirely-empty rows in
         # read_only mode on some openpyxl versions).
-        n_rows_expected = region.bottom_row - region.top_row + 1
-        while len(values_grid) < n_rows_expected:
-            values_grid.append([None] * n_cols_expected)
-        values_grid = apply_merge_policy(
-            values_grid, merges, merge_policy,
-            top_row=region.top_row, left_col=region.left_col,
-        )
+        while n_rows < n_rows_expected:
+            n_rows += 1
+            yield [None] * n_cols_expected
+
+    @staticmethod
+    def _resolve_header_count(
+        ws: Any,
+        region: TableRegion,
+        header_rows: int | Literal["auto"],
+        warnings_list: list[str],
+    ) -> int | None:
+        """Number of header rows at the top of `region`.
+
+        `None` marks a ListObject declared with `headerRowCount=0` —
+        synthetic headers, with the warning already appended.
+        """
+        from ._headers import detect_header_band
 
-        # Header resolution.
         if (
             region.source == "listobject"
             and region.listobject_header_row_count == 0
         ):
             width = region.right_col - region.left_col + 1
-            headers = synthetic_headers(width)
             warnings_list.append(
                 f"Table {region.name!r} had no headers; "
                 f"emitted synthetic col_1..col_{width}"
             )
-            data_rows = values_grid
-        else:
-            if (
-                region.source == "listobject"
-                and region.listobject_header_row_count is not None
-                and region.listobject_header_row_count > 0
-                and header_rows == "auto"
-            ):
-                hdr = region.listobject_header_row_count
-            else:
-                hdr = detect_header_band(ws, region, header_rows)
-            if hdr == 0:
-                width = region.right_col - region.left_col + 1
-                headers = synthetic_headers(width)
-                data_rows = values_grid
-            else:
-                # xlsx-8a-10 (R12): graceful no-merge fallback on
-                # ReadOnlyWorksheet — `.merged_cells` is absent.
-                # iter-3 (vdd-multi L1): re-use the `.ranges`-via-
-                # `getattr` probe from above to stay hasattr-safe.
-                ambig_merges = (
-                    list(merged_ranges_attr)
-                    if merged_ranges_attr is not None
-                    else []
-                )
-                ambig = _ambiguous_boundary_check(
-                    ambig_merges, region, hdr
-                )
-                if ambig is not None:
-                    warnings_list.append(ambig)
-                headers, hdr_warnings = flatten_headers(
-                    values_grid[:hdr], hdr,
-                    merges=merges,
-                    region_top_row=region.top_row,
-                    region_left_col=region.left_col,
-                )
-                warnings_list.extend(hdr_warnings)
-                data_rows = values_grid[hdr:]
-
-        return TableData(
-            region=region,
-            headers=headers,
-            rows=data_rows,
-            warnings=warnings_list,
-        )
+            return None
+        if (
+            region.source == "listobject"
+            and region.listobject_header_row_count is not None
+            and region.listobject_header_row_count > 0
+            and header_rows == "auto"
+        ):
+            return region.listobject_header_row_count
+        return detect_header_band(ws, region, header_rows)
 
     def close(self) -> None:
         """Release the underlying openpyxl Workbook.
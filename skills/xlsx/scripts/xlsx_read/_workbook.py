@@ -31,7 +31,7 @@ from typing import TYPE_CHECKING
 import openpyxl
 
 from ._exceptions import EncryptedWorkbookError, MacroEnabledWarning
-from ._types import WorkbookReader
+from ._types import ReaderEngine, WorkbookReader
 
 if TYPE_CHECKING:
     pass
@@ -144,6 +144,7 @@ def open_workbook(
     read_only_mode: bool | None = None,
     size_threshold_bytes: int = _DEFAULT_READ_ONLY_THRESHOLD,
     keep_formulas: bool = False,
+    engine: ReaderEngine = "openpyxl",
 ) -> WorkbookReader:
     """Open an `.xlsx` / `.xlsm` workbook for read.
 
@@ -166,12 +167,22 @@ def open_workbook(
            each mode) — the cost is documented and intentional.
     6. Wrap in `WorkbookReader` with the resolved flags.
 
+    `engine="stream"` replaces steps 4–5 with `_stream.StreamWorkbook`:
+    sheet XML is `iterparse`d straight from the zip and cleared row by
+    row, so memory no longer scales with the sheet size. Merge ranges
+    are still honoured (unlike openpyxl's `read_only=True` mode);
+    `read_only_mode` / `size_threshold_bytes` are ignored on that path.
+    `TableData` output is identical to the default `"openpyxl"` engine.
+
     Raises:
+        ValueError: when `engine` is not `"openpyxl"` or `"stream"`.
         FileNotFoundError: when `path` does not exist.
         EncryptedWorkbookError: from `_probe_encryption`.
         zipfile.BadZipFile / openpyxl.utils.exceptions.InvalidFileException:
             propagated unchanged for corrupted-but-not-encrypted files.
     """
+    if engine not in ("openpyxl", "stream"):
+        raise ValueError(f"Unknown engine: {engine!r}")
     resolved = Path(path).resolve(strict=True)
     _probe_encryption(resolved)
     # **P-H3 fix:** macros are only legal in `.xlsm`/`.xltm` containers.
@@ -187,6 +198,16 @@ def open_workbook(
             category=MacroEnabledWarning,
             stacklevel=2,
         )
+    if engine == "stream":
+        from ._stream import StreamWorkbook
+
+        return WorkbookReader(
+            path=resolved,
+            _wb=StreamWorkbook(resolved, data_only=not keep_formulas),
+            _read_only=True,
+            _keep_formulas=keep_formulas,
+            _engine="stream",
+        )
     read_only = _decide_read_only(resolved, read_only_mode, size_threshold_bytes)
     wb = openpyxl.load_workbook(
         filename=str(resolved),
@@ -0,0 +1,160 @@
+"""`WorkbookReader.iter_table` — streaming twin of `read_table`.
+
+Workbooks are synthesised into a temp dir (the `fixtures/*.xlsx` set is
+gitignored). The contract is **parity**: header metadata + the lazily
+produced rows reassemble into exactly the `TableData` that
+`read_table` returns, on both reader engines.
+"""
+
+from __future__ import annotations
+
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+
+import openpyxl
+from openpyxl.worksheet.table import Table
+
+from xlsx_read import TableData, TableRegion, open_workbook
+
+
+def _build(path: Path) -> None:
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws["A1"] = "Report"
+    ws.merge_cells("A1:D1")
+    ws["A2"] = "Plan"
+    ws.merge_cells("A2:B2")
+    ws["C2"] = "Meta"
+    ws.merge_cells("C2:D2")
+    ws.append(["Q1", "Q2", "when", "ok"])
+    for i in range(4, 40):
+        ws.cell(i, 1, i)
+        ws.cell(i, 2, f"s{i % 3}")
+        ws.cell(i, 3, datetime.datetime(2024, 1, i % 28 + 1))
+        ws.cell(i, 4, "=A4*2" if i == 5 else i % 2 == 0)
+    ws.merge_cells("B10:C12")
+    ws.merge_cells("D20:D25")
+
+    ws2 = wb.create_sheet("T")
+    for i in range(6):
+        ws2.append([i, i * 2, f"t{i}"])
+    ws2.add_table(Table(displayName="NoHdr", ref="A1:C6", headerRowCount=0))
+    wb.save(path)
+
+
+def _collect(reader, region, **kwargs) -> TableData:
+    it = reader.iter_table(region, **kwargs)
+    head = next(it)
+    rows = list(it)
+    return TableData(
+        region=head.region, headers=head.headers, rows=rows,
+        warnings=head.warnings,
+    )
+
+
+class TestIterTableParity(unittest.TestCase):
+    """Head + rows == `read_table`, every mode, both engines."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "iter.xlsx"
+        _build(cls.path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
+
+    def test_parity_matrix(self) -> None:
+        for engine in ("openpyxl", "stream"):
+            with open_workbook(self.path, engine=engine) as reader:
+                for sheet in ("Data", "T"):
+                    for mode in ("auto", "whole"):
+                        for region in reader.detect_tables(sheet, mode=mode):
+                            for hr in ("auto", "smart", 0, 1, 2):
+                                for mp in ("anchor-only", "fill"):
+                                    kw = dict(header_rows=hr, merge_policy=mp)
+                                    with self.subTest(
+                                        engine=engine, region=region, **kw,
+                                    ):
+                                        expected = reader.read_table(region, **kw)
+                                        got = _collect(reader, region, **kw)
+                                        self.assertEqual(got.region, expected.region)
+                                        self.assertEqual(got.headers, expected.headers)
+                                        self.assertEqual(got.rows, expected.rows)
+                                        self.assertEqual(
+                                            sorted(got.warnings),
+                                            sorted(expected.warnings),
+                                        )
+
+    def test_head_carries_header_band(self) -> None:
+        with open_workbook(self.path) as reader:
+            region = reader.detect_tables("Data", mode="whole")[0]
+            head = next(reader.iter_table(region, header_rows="auto"))
+            self.assertEqual(len(head.rows), 3)
+            self.assertEqual(head.headers[0], "Report › Plan › Q1")
+            self.assertEqual(head.rows[0][0], "Report")
+
+    def test_synthetic_headers_have_empty_band(self) -> None:
+        with open_workbook(self.path) as reader:
+            region = reader.detect_tables("T", mode="tables-only")[0]
+            it = reader.iter_table(region)
+            head = next(it)
+            self.assertEqual(head.rows, [])
+            self.assertEqual(head.headers, ["col_1", "col_2", "col_3"])
+            self.assertEqual(len(list(it)), 6)
+            self.assertTrue(any("synthetic" in w for w in head.warnings))
+
+    def test_warnings_list_is_live(self) -> None:
+        """Cell warnings of data rows land on the head's list lazily."""
+        with open_workbook(self.path, keep_formulas=True) as reader:
+            region = reader.detect_tables("Data", mode="whole")[0]
+            expected = reader.read_table(region, header_rows=3)
+            it = reader.iter_table(region, header_rows=3)
+            head = next(it)
+            before = list(head.warnings)
+            list(it)
+            self.assertEqual(sorted(head.warnings), sorted(expected.warnings))
+            self.assertLessEqual(len(before), len(head.warnings))
+
+    def test_rows_are_lazy(self) -> None:
+        """Only the header band is read before the head is yielded."""
+        with open_workbook(self.path, engine="stream") as reader:
+            region = reader.detect_tables("Data", mode="whole")[0]
+            ws = reader._wb["Data"]
+            seen: list[int] = []
+            original = ws.iter_rows
+
+            def spy(*args, **kwargs):
+                for row in original(*args, **kwargs):
+                    seen.append(1)
+                    yield row
+
+            ws.iter_rows = spy
+            it = reader.iter_table(region, header_rows=1)
+            next(it)
+            self.assertEqual(len(seen), 1)
+            next(it)
+            self.assertEqual(len(seen), 2)
+
+    def test_closed_workbook_yields_bare_head(self) -> None:
+        with open_workbook(self.path) as reader:
+            region = TableRegion(
+                sheet="Data", top_row=1, left_col=1, bottom_row=1,
+                right_col=1, source="gap_detect",
+            )
+            wb, reader._wb = reader._wb, None
+            try:
+                self.assertEqual(
+                    list(reader.iter_table(region)),
+                    [TableData(region=region)],
+                )
+            finally:
+                reader._wb = wb
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
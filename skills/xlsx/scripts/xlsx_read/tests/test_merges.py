@@ -301,5 +301,74 @@ class TestParseMergesCap(unittest.TestCase):
         self.assertIn("100000", str(ctx.exception))
 
 
+class TestIterMergePolicy(unittest.TestCase):
+    """`iter_merge_policy` — row-at-a-time twin of `apply_merge_policy`."""
+
+    _GRID = [[f"r{r}c{c}" for c in range(1, 6)] for r in range(1, 8)]
+    _MERGES = {
+        (1, 1): (1, 5),   # full-width banner
+        (2, 2): (4, 3),   # rectangle
+        (3, 5): (7, 5),   # vertical, runs to the last row
+        (6, 1): (9, 2),   # leaves the grid → skipped
+    }
+
+    def _both(self, policy, *, top_row=1, left_col=1):
+        batch = _merges.apply_merge_policy(
+            self._GRID, self._MERGES, policy,
+            top_row=top_row, left_col=left_col,
+        )
+        streamed = list(_merges.iter_merge_policy(
+            iter(self._GRID), self._MERGES, policy,
+            n_rows=len(self._GRID), n_cols=5,
+            top_row=top_row, left_col=left_col,
+        ))
+        return batch, streamed
+
+    def test_parity_all_policies(self) -> None:
+        for policy in ("anchor-only", "fill", "blank"):
+            with self.subTest(policy=policy):
+                batch, streamed = self._both(policy)
+                self.assertEqual(streamed, batch)
+
+    def test_parity_offset_region(self) -> None:
+        batch, streamed = self._both("fill", top_row=2, left_col=2)
+        self.assertEqual(streamed, batch)
+
+    def test_short_rows_padded(self) -> None:
+        out = list(_merges.iter_merge_policy(
+            iter([["a"], []]), {}, "fill", n_rows=2, n_cols=3,
+        ))
+        self.assertEqual(out, [["a", None, None], [None, None, None]])
+
+    def test_lazy_one_row_at_a_time(self) -> None:
+        pulled: list[int] = []
+
+        def source():
+            for i, row in enumerate(self._GRID):
+                pulled.append(i)
+                yield row
+
+        it = _merges.iter_merge_policy(
+            source(), self._MERGES, "fill", n_rows=len(self._GRID), n_cols=5,
+        )
+        next(it)
+        next(it)
+        self.assertEqual(pulled, [0, 1])
+
+    def test_input_unchanged(self) -> None:
+        snapshot = copy.deepcopy(self._GRID)
+        list(_merges.iter_merge_policy(
+            iter(self._GRID), self._MERGES, "fill",
+            n_rows=len(self._GRID), n_cols=5,
+        ))
+        self.assertEqual(self._GRID, snapshot)
+
+    def test_invalid_policy_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            list(_merges.iter_merge_policy(
+                iter([]), {}, "bogus", n_rows=0, n_cols=0,  # type: ignore[arg-type]
+            ))
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
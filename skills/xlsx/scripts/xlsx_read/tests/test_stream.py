@@ -0,0 +1,294 @@
+"""F8 — `_stream.py` (`open_workbook(engine="stream")`) parity + unit tests.
+
+Workbooks are synthesised into a temp dir with openpyxl (or written as
+raw OOXML for the shapes openpyxl never emits) so the suite does not
+depend on the gitignored `fixtures/*.xlsx` set. The core contract is
+**parity**: every public call on the stream engine returns exactly what
+the default openpyxl engine returns for the same file.
+"""
+
+from __future__ import annotations
+
+import datetime
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+import openpyxl
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.table import Table
+
+from xlsx_read import OverlappingMerges, TableRegion, open_workbook
+
+
+def _build_mixed(path: Path) -> None:
+    """Merges, ListObject, sheet-scope name, dates, links, formulas, hidden."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws["A1"] = "Title"
+    ws.merge_cells("A1:D1")
+    ws["A2"] = "2026 plan"
+    ws.merge_cells("A2:B2")
+    ws["C2"] = "other"
+    ws.append(["Q1", "Q2", "when", "ok"])
+    for i in range(4, 30):
+        ws.cell(i, 1, i * 1.5)
+        ws.cell(i, 2, f"s{i % 5}")
+        ws.cell(i, 3, datetime.datetime(2024, 1, i % 28 + 1, 10, 30))
+        ws.cell(i, 4, i % 2 == 0)
+    ws.cell(5, 1).number_format = "0.00%"
+    ws.cell(6, 1).number_format = "#,##0.00"
+    ws.cell(7, 2).hyperlink = "https://example.com/x"
+    ws.merge_cells("C10:C12")
+    ws["A40"] = "x"
+    ws["B40"] = "y"
+    ws["A41"] = 1
+    ws["B41"] = "=A41*2"
+
+    ws2 = wb.create_sheet("T")
+    ws2.append(["a", "b", "c"])
+    for i in range(5):
+        ws2.append([i, i * 2, f"t{i}"])
+    ws2.add_table(Table(displayName="Revenue", ref="A1:C6"))
+    ws2["F1"] = "k"
+    ws2["G1"] = "v"
+    ws2["F2"] = 1
+    ws2["G2"] = 2
+    ws2.defined_names["KPI"] = DefinedName("KPI", attr_text="T!$F$1:$G$2")
+
+    wb.create_sheet("Empty")
+    hidden = wb.create_sheet("Hid")
+    hidden.sheet_state = "hidden"
+    hidden["B3"] = "z"
+    wb.save(path)
+
+
+_SHEET_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>{rows}</sheetData>{tail}</worksheet>"
+)
+
+
+def _write_raw(path: Path, rows: str, *, tail: str = "", date1904: bool = False) -> None:
+    """Hand-rolled single-sheet package (inline strings, `r=`-less cells)."""
+    wb_pr = '<workbookPr date1904="1"/>' if date1904 else ""
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            "</Types>"
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+            "</Relationships>"
+        ),
+        "xl/workbook.xml": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f"{wb_pr}"
+            '<sheets><sheet name="Raw" sheetId="1" r:id="rId1"/></sheets></workbook>'
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+            '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+            "</Relationships>"
+        ),
+        "xl/styles.xml": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            '<fonts count="1"><font/></fonts>'
+            '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+            '<borders count="1"><border/></borders>'
+            '<cellStyleXfs count="1"><xf/></cellStyleXfs>'
+            '<cellXfs count="2"><xf numFmtId="0"/><xf numFmtId="14"/></cellXfs>'
+            "</styleSheet>"
+        ),
+        "xl/worksheets/sheet1.xml": _SHEET_XML.format(rows=rows, tail=tail),
+    }
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+
+
+class _TmpDirCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+
+class TestStreamParity(_TmpDirCase):
+    """Every public call returns the same payload on both engines."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.path = self.tmp / "mixed.xlsx"
+        _build_mixed(self.path)
+
+    def _assert_parity(self, **open_kwargs) -> None:
+        with open_workbook(self.path, **open_kwargs) as a, open_workbook(
+            self.path, engine="stream", **open_kwargs
+        ) as b:
+            self.assertEqual(a.sheets(), b.sheets())
+            for info in a.sheets():
+                for mode in ("auto", "tables-only", "whole"):
+                    regions = a.detect_tables(info.name, mode=mode)
+                    self.assertEqual(regions, b.detect_tables(info.name, mode=mode))
+                    for region in regions:
+                        for header_rows in ("auto", "smart", 0, 1):
+                            for merge_policy in ("anchor-only", "fill"):
+                                kwargs = dict(
+                                    header_rows=header_rows,
+                                    merge_policy=merge_policy,
+                                    include_hyperlinks=True,
+                                    include_formulas=True,
+                                )
+                                with self.subTest(
+                                    sheet=info.name, mode=mode, region=region.name,
+                                    **{k: str(v) for k, v in kwargs.items()},
+                                ):
+                                    self.assertEqual(
+                                        a.read_table(region, **kwargs),
+                                        b.read_table(region, **kwargs),
+                                    )
+
+    def test_parity_cached_values(self) -> None:
+        self._assert_parity()
+
+    def test_parity_keep_formulas(self) -> None:
+        self._assert_parity(keep_formulas=True)
+
+    def test_datetime_formats_match(self) -> None:
+        region = TableRegion(
+            sheet="Data", top_row=3, left_col=1, bottom_row=29, right_col=4,
+            source="gap_detect",
+        )
+        with open_workbook(self.path) as a, open_workbook(self.path, engine="stream") as b:
+            for fmt in ("ISO", "excel-serial", "raw"):
+                self.assertEqual(
+                    a.read_table(region, datetime_format=fmt),
+                    b.read_table(region, datetime_format=fmt),
+                )
+
+
+class TestStreamKeepsMerges(_TmpDirCase):
+    """Unlike openpyxl `read_only=True`, the stream engine keeps merge data."""
+
+    def test_merged_ranges_exposed(self) -> None:
+        path = self.tmp / "mixed.xlsx"
+        _build_mixed(path)
+        with open_workbook(path, engine="stream") as r:
+            ranges = sorted(str(m) for m in r._wb["Data"].merged_cells.ranges)
+        self.assertEqual(ranges, ["A1:D1", "A2:B2", "C10:C12"])
+
+    def test_merge_children_read_as_none(self) -> None:
+        # A value stored under a merge child is dropped, exactly as
+        # openpyxl's `MergedCell` replacement does.
+        path = self.tmp / "raw.xlsx"
+        _write_raw(
+            path,
+            '<row r="1"><c r="A1" t="inlineStr"><is><t>a</t></is></c>'
+            '<c r="B1" t="inlineStr"><is><t>ghost</t></is></c></row>',
+            tail='<mergeCells count="1"><mergeCell ref="A1:B1"/></mergeCells>',
+        )
+        with open_workbook(path, engine="stream") as r:
+            rows = list(r._wb["Raw"].iter_rows(1, 1, 1, 2, values_only=True))
+        self.assertEqual(rows, [("a", None)])
+
+    def test_overlapping_merges_fail_loud(self) -> None:
+        path = self.tmp / "overlap.xlsx"
+        _write_raw(
+            path,
+            '<row r="1"><c r="A1"><v>1</v></c></row>',
+            tail=(
+                '<mergeCells count="2"><mergeCell ref="A1:B2"/>'
+                '<mergeCell ref="B2:C3"/></mergeCells>'
+            ),
+        )
+        with open_workbook(path, engine="stream") as r:
+            region = r.detect_tables("Raw", mode="whole")[0]
+            with self.assertRaises(OverlappingMerges):
+                r.read_table(region)
+
+
+class TestStreamRawShapes(_TmpDirCase):
+    """OOXML shapes openpyxl never writes but other producers do."""
+
+    def test_rowless_refs_and_inline_strings(self) -> None:
+        path = self.tmp / "raw.xlsx"
+        _write_raw(
+            path,
+            '<row><c t="inlineStr"><is><t>h1</t></is></c>'
+            '<c t="inlineStr"><is><r><t>h</t></r><r><t>2</t></r></is></c></row>'
+            "<row><c><v>1</v></c><c><v>2.5</v></c></row>"
+            '<row r="5"><c r="B5" t="b"><v>1</v></c></row>',
+        )
+        with open_workbook(path, engine="stream") as r:
+            ws = r._wb["Raw"]
+            self.assertEqual(ws.dimensions, "A1:B5")
+            rows = list(ws.iter_rows(1, 5, 1, 2, values_only=True))
+        self.assertEqual(
+            rows,
+            [("h1", "h2"), (1, 2.5), (None, None), (None, None), (None, True)],
+        )
+        with open_workbook(path) as r:
+            self.assertEqual(
+                rows, list(r._wb["Raw"].iter_rows(1, 5, 1, 2, values_only=True))
+            )
+
+    def test_date1904_epoch(self) -> None:
+        path = self.tmp / "mac.xlsx"
+        _write_raw(path, '<row r="1"><c r="A1" s="1"><v>1</v></c></row>', date1904=True)
+        with open_workbook(path, engine="stream") as r:
+            (row,) = list(r._wb["Raw"].iter_rows(1, 1, 1, 1, values_only=True))
+        self.assertEqual(row, (datetime.datetime(1904, 1, 2),))
+        with open_workbook(path) as r:
+            self.assertEqual(r._wb["Raw"]["A1"].value, row[0])
+
+    def test_window_stops_early_and_pads(self) -> None:
+        path = self.tmp / "raw.xlsx"
+        _write_raw(path, "".join(
+            f'<row r="{i}"><c r="A{i}"><v>{i}</v></c></row>' for i in range(1, 50)
+        ))
+        with open_workbook(path, engine="stream") as r:
+            rows = list(r._wb["Raw"].iter_rows(3, 4, 1, 3, values_only=True))
+        self.assertEqual(rows, [(3, None, None), (4, None, None)])
+
+
+class TestEngineArgument(_TmpDirCase):
+    def test_unknown_engine_rejected(self) -> None:
+        path = self.tmp / "mixed.xlsx"
+        _build_mixed(path)
+        with self.assertRaises(ValueError):
+            open_workbook(path, engine="pandas")
+
+    def test_stream_reader_flags(self) -> None:
+        path = self.tmp / "mixed.xlsx"
+        _build_mixed(path)
+        reader = open_workbook(path, engine="stream")
+        try:
+            self.assertEqual(reader._engine, "stream")
+            self.assertTrue(reader._read_only)
+        finally:
+            reader.close()
+        reader.close()  # idempotent, releases the zip handle once
+        self.assertTrue(reader._closed)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()